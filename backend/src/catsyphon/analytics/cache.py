@@ -1,35 +1,121 @@
 """
-Lightweight TTL cache for project analytics responses.
+Shared analytics result cache with version-based invalidation.
 
-Used to avoid recalculating expensive aggregates on hot paths. The cache is
-in-process only and should be invalidated after ingestion jobs complete to
-keep live analytics fresh.
+Caches expensive analytics responses (project analytics, health reports,
+overview stats). Cache keys embed a version counter per scope (project or
+workspace); ingestion bumps the version, so every API worker stops serving
+the old results at once instead of waiting for a TTL.
+
+Backends:
+- ``database`` (default): PostgreSQL tables shared by all uvicorn workers.
+  Reads and writes go through the request's session inside a savepoint.
+  Ingestion bumps versions after its transaction commits, in a short
+  transaction of its own, so concurrent ingests never wait on a scope's
+  version row.
+- ``memory``: per-process dict, for single-worker deployments and tests.
+
+Cache failures are logged and treated as misses; they never fail a request.
 """
 
 from __future__ import annotations
 
+import logging
 import time
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
 from threading import Lock
-from typing import Any, Optional, Tuple
+from typing import Any, Optional
 from uuid import UUID
 
+from sqlalchemy import delete, event, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from catsyphon.config import settings
+from catsyphon.models.db import AnalyticsCacheEntry, AnalyticsCacheVersion
+
+logger = logging.getLogger(__name__)
+
+# Session.info keys for scopes waiting on the session's commit
+_PENDING_SCOPES = "analytics_cache_pending_scopes"
+_LISTENING = "analytics_cache_listening"
+
+# Expired entries are deleted by at most one write per interval per process
+_SWEEP_INTERVAL_SECONDS = 300.0
+
+
+def project_scope(project_id: UUID) -> str:
+    """Cache scope for results derived from a single project."""
+    return f"project:{project_id}"
+
+
+def workspace_scope(workspace_id: UUID) -> str:
+    """Cache scope for results aggregated across a workspace."""
+    return f"workspace:{workspace_id}"
+
+
+@dataclass(frozen=True)
+class CacheKey:
+    """A versioned cache key bound to the scope that invalidates it."""
+
+    scope: str
+    key: str
+    # False when the scope version could not be read; such keys are never
+    # read from or written to, so a stale version can't be served.
+    cacheable: bool = True
+
+
+class AnalyticsCacheBackend(ABC):
+    """Storage for cached values and per-scope version counters."""
+
+    @abstractmethod
+    def get_version(self, session: Session, scope: str) -> int:
+        """Return the current version of a scope (0 if never bumped)."""
+
+    @abstractmethod
+    def bump_version(self, session: Session, scope: str) -> None:
+        """Increment a scope's version and drop its cached entries."""
+
+    @abstractmethod
+    def get(self, session: Session, key: str) -> Optional[Any]:
+        """Fetch a cached value if it exists and is not expired."""
+
+    @abstractmethod
+    def set(
+        self, session: Session, key: CacheKey, value: Any, ttl_seconds: float
+    ) -> None:
+        """Store a value with TTL."""
+
 
 @dataclass
 class _CacheEntry:
+    scope: str
     value: Any
     expires_at: float
 
 
-class ProjectAnalyticsCache:
-    def __init__(self, ttl_seconds: float):
-        self._ttl = ttl_seconds
-        self._data: dict[Tuple[str, Optional[str]], _CacheEntry] = {}
+class MemoryCacheBackend(AnalyticsCacheBackend):
+    """Per-process backend; invalidation only reaches the current process."""
+
+    def __init__(self) -> None:
+        self._data: dict[str, _CacheEntry] = {}
+        self._versions: dict[str, int] = {}
         self._lock = Lock()
 
-    def get(self, project_id: UUID, date_range: Optional[str]) -> Optional[Any]:
-        """Fetch a cached value if it exists and is not expired."""
-        key = (str(project_id), date_range)
+    def get_version(self, session: Session, scope: str) -> int:
+        with self._lock:
+            return self._versions.get(scope, 0)
+
+    def bump_version(self, session: Session, scope: str) -> None:
+        with self._lock:
+            self._versions[scope] = self._versions.get(scope, 0) + 1
+            stale = [k for k, entry in self._data.items() if entry.scope == scope]
+            for k in stale:
+                self._data.pop(k, None)
+
+    def get(self, session: Session, key: str) -> Optional[Any]:
         now = time.time()
         with self._lock:
             entry = self._data.get(key)
@@ -40,29 +126,207 @@ class ProjectAnalyticsCache:
                 return None
             return entry.value
 
-    def set(self, project_id: UUID, date_range: Optional[str], value: Any) -> None:
-        """Store a value with TTL."""
-        key = (str(project_id), date_range)
-        expires_at = time.time() + self._ttl
+    def set(
+        self, session: Session, key: CacheKey, value: Any, ttl_seconds: float
+    ) -> None:
+        expires_at = time.time() + ttl_seconds
         with self._lock:
-            self._data[key] = _CacheEntry(value=value, expires_at=expires_at)
+            self._data[key.key] = _CacheEntry(
+                scope=key.scope, value=value, expires_at=expires_at
+            )
 
-    def invalidate(self, project_id: Optional[UUID] = None) -> None:
-        """
-        Invalidate cached entries.
 
-        If project_id is provided, only entries for that project are cleared;
-        otherwise the entire cache is flushed.
+class DatabaseCacheBackend(AnalyticsCacheBackend):
+    """Backend storing entries and versions in database tables.
+
+    Works with PostgreSQL (production) and SQLite (tests) via the dialect's
+    INSERT ... ON CONFLICT support.
+    """
+
+    def __init__(self) -> None:
+        self._next_sweep = 0.0
+
+    def get_version(self, session: Session, scope: str) -> int:
+        version = session.execute(
+            select(AnalyticsCacheVersion.version).where(
+                AnalyticsCacheVersion.scope == scope
+            )
+        ).scalar_one_or_none()
+        return version or 0
+
+    def bump_version(self, session: Session, scope: str) -> None:
+        stmt = self._insert(session, AnalyticsCacheVersion).values(
+            scope=scope, version=1
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnalyticsCacheVersion.scope],
+            set_={"version": AnalyticsCacheVersion.version + 1},
+        )
+        with session.begin_nested():
+            session.execute(stmt)
+            # Entries for the scope are unreachable now
+            session.execute(
+                delete(AnalyticsCacheEntry).where(AnalyticsCacheEntry.scope == scope)
+            )
+
+    def get(self, session: Session, key: str) -> Optional[Any]:
+        return session.execute(
+            select(AnalyticsCacheEntry.value).where(
+                AnalyticsCacheEntry.cache_key == key,
+                AnalyticsCacheEntry.expires_at > _utc_now(),
+            )
+        ).scalar_one_or_none()
+
+    def set(
+        self, session: Session, key: CacheKey, value: Any, ttl_seconds: float
+    ) -> None:
+        expires_at = _utc_now() + timedelta(seconds=ttl_seconds)
+        stmt = self._insert(session, AnalyticsCacheEntry).values(
+            cache_key=key.key, scope=key.scope, value=value, expires_at=expires_at
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[AnalyticsCacheEntry.cache_key],
+            set_={"value": stmt.excluded.value, "expires_at": expires_at},
+        )
+        with session.begin_nested():
+            session.execute(stmt)
+
+        # Cache misses are rare next to reads, so they also keep expired
+        # entries from accumulating (throttled per process)
+        now = time.monotonic()
+        if now >= self._next_sweep:
+            self._next_sweep = now + _SWEEP_INTERVAL_SECONDS
+            with session.begin_nested():
+                session.execute(
+                    delete(AnalyticsCacheEntry).where(
+                        AnalyticsCacheEntry.expires_at <= _utc_now()
+                    )
+                )
+
+    @staticmethod
+    def _insert(session: Session, model: Any) -> Any:
+        if session.get_bind().dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
+
+
+def _utc_now() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class AnalyticsCache:
+    """Versioned analytics cache in front of a pluggable backend.
+
+    Usage from a route::
+
+        key = ANALYTICS_CACHE.key(session, "overview", workspace_scope(ws), params)
+        cached = ANALYTICS_CACHE.get(session, key)
+        if cached is None:
+            cached = compute()
+            ANALYTICS_CACHE.set(session, key, cached)
+
+    The key is built (and the scope version read) before computing, so a
+    result computed while ingestion bumps the version is stored under the
+    old version and never served.
+    """
+
+    def __init__(self, backend: AnalyticsCacheBackend, ttl_seconds: float):
+        self.backend = backend
+        self._ttl = ttl_seconds
+
+    def key(self, session: Session, name: str, scope: str, *params: Any) -> CacheKey:
+        """Build a versioned key for ``name`` within ``scope``."""
+        param_str = ":".join("" if p is None else str(p) for p in params)
+        try:
+            version = self.backend.get_version(session, scope)
+        except Exception as e:
+            logger.warning(f"Analytics cache version lookup failed: {e}")
+            return CacheKey(scope=scope, key=f"{name}:{scope}", cacheable=False)
+        return CacheKey(scope=scope, key=f"{name}:{scope}:v{version}:{param_str}")
+
+    def get(self, session: Session, key: CacheKey) -> Optional[Any]:
+        """Return the cached value for ``key``, or None on miss."""
+        if not key.cacheable:
+            return None
+        try:
+            return self.backend.get(session, key.key)
+        except Exception as e:
+            logger.warning(f"Analytics cache read failed: {e}")
+            return None
+
+    def set(self, session: Session, key: CacheKey, value: Any) -> None:
+        """Store a JSON-serializable value under ``key``."""
+        if not key.cacheable:
+            return
+        try:
+            self.backend.set(session, key, value, self._ttl)
+        except Exception as e:
+            logger.warning(f"Analytics cache write failed: {e}")
+
+    def invalidate(self, session: Session, *scopes: str) -> None:
+        """Bump the version of each scope, invalidating all its keys."""
+        for scope in scopes:
+            try:
+                self.backend.bump_version(session, scope)
+            except Exception as e:
+                logger.warning(f"Analytics cache invalidation failed for {scope}: {e}")
+
+    def invalidate_after_commit(
+        self, session: Session, workspace_id: UUID, project_id: Optional[UUID]
+    ) -> None:
+        """Invalidate results affected by a change to a workspace's project.
+
+        The bump is deferred until ``session`` commits and then runs in its
+        own short transaction. Bumping inside the caller's transaction would
+        hold the scope's version row lock until commit, serializing every
+        concurrent ingest into the same workspace. Scopes requested several
+        times before a commit are bumped once; a rollback discards them.
         """
-        with self._lock:
-            if project_id is None:
-                self._data.clear()
-                return
-            pid_str = str(project_id)
-            keys = [k for k in self._data if k[0] == pid_str]
-            for k in keys:
-                self._data.pop(k, None)
+        pending: set[str] = session.info.setdefault(_PENDING_SCOPES, set())
+        pending.add(workspace_scope(workspace_id))
+        if project_id is not None:
+            pending.add(project_scope(project_id))
+
+        if not session.info.get(_LISTENING):
+            session.info[_LISTENING] = True
+            event.listen(session, "after_commit", self._bump_pending)
+            event.listen(session, "after_rollback", self._discard_pending)
+
+    def _bump_pending(self, session: Session) -> None:
+        # Savepoint releases also fire after_commit
+        if session.in_nested_transaction():
+            return
+        scopes = session.info.pop(_PENDING_SCOPES, None)
+        if not scopes:
+            return
+        with Session(bind=session.get_bind()) as bump_session:
+            # Fixed order so concurrent bumps can't deadlock
+            for scope in sorted(scopes):
+                try:
+                    self.backend.bump_version(bump_session, scope)
+                    bump_session.commit()
+                except Exception as e:
+                    bump_session.rollback()
+                    logger.warning(
+                        f"Analytics cache invalidation failed for {scope}: {e}"
+                    )
+
+    def _discard_pending(self, session: Session) -> None:
+        if not session.in_nested_transaction():
+            session.info.pop(_PENDING_SCOPES, None)
+
+
+def create_backend(name: str) -> AnalyticsCacheBackend:
+    """Create a cache backend by its configured name."""
+    if name == "database":
+        return DatabaseCacheBackend()
+    if name == "memory":
+        return MemoryCacheBackend()
+    raise ValueError(f"Unknown analytics cache backend: {name!r}")
 
 
 # Singleton cache instance used by API routes and ingestion invalidation hooks.
-PROJECT_ANALYTICS_CACHE = ProjectAnalyticsCache(ttl_seconds=300.0)
+ANALYTICS_CACHE = AnalyticsCache(
+    backend=create_backend(settings.analytics_cache_backend),
+    ttl_seconds=settings.analytics_cache_ttl_seconds,
+)
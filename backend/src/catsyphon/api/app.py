@@ -7,6 +7,7 @@ Main API application for querying conversation data and insights.
 import logging
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
@@ -26,6 +27,7 @@ from catsyphon.api.routes import (
     projects,
     recaps,
     recommendations,
+    search,
     setup,
     stats,
     upload,
@@ -36,6 +38,7 @@ from catsyphon.daemon_manager import DaemonManager
 from catsyphon.logging_config import setup_logging
 from catsyphon.startup import run_all_startup_checks
 from catsyphon.scanner import start_scanner, stop_scanner
+from catsyphon.services.streaming_upload import shutdown_streaming_uploads
 from catsyphon.tagging import start_worker as start_tagging_worker
 from catsyphon.tagging import stop_worker as stop_tagging_worker
 
@@ -54,6 +57,12 @@ async def lifespan(app: FastAPI):
     # Initialize logging first
     setup_logging(context="api")
 
+    # Route handlers that touch the database are plain `def` functions, which
+    # FastAPI runs in the anyio threadpool; size it alongside the DB pool.
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.api_threadpool_size
+    )
+
     # Startup: Run all dependency checks
     logger.info("Running startup checks...")
     run_all_startup_checks()
@@ -148,6 +157,13 @@ async def lifespan(app: FastAPI):
     except Exception as e:
         logger.error(f"Error stopping tagging worker: {e}", exc_info=True)
 
+    # Stop streaming upload workers
+    try:
+        shutdown_streaming_uploads()
+        logger.info("✓ Streaming upload workers shutdown complete")
+    except Exception as e:
+        logger.error(f"Error stopping streaming upload workers: {e}", exc_info=True)
+
     # Stop daemon manager
     try:
         daemon_manager.shutdown(timeout=10)
@@ -188,7 +204,7 @@ async def root() -> dict[str, str]:
 
 
 @app.get("/health")
-async def health() -> dict[str, str]:
+def health() -> dict[str, str]:
     """Health check endpoint."""
     from catsyphon.db.connection import check_connection
 
@@ -201,7 +217,7 @@ async def health() -> dict[str, str]:
 
 
 @app.get("/ready")
-async def ready() -> dict:
+def ready() -> dict:
     """
     Readiness probe endpoint for Kubernetes/load balancers.
 
@@ -236,6 +252,7 @@ app.include_router(insights.router, prefix="/conversations", tags=["insights"])
 app.include_router(metadata.router, prefix="", tags=["metadata"])
 app.include_router(plans.router, prefix="/plans", tags=["plans"])
 app.include_router(projects.router, prefix="/projects", tags=["projects"])
+app.include_router(search.router, prefix="/search", tags=["search"])
 app.include_router(stats.router, prefix="/stats", tags=["stats"])
 app.include_router(upload.router, prefix="/upload", tags=["upload"])
 app.include_router(watch.router, prefix="", tags=["watch"])
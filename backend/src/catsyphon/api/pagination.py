@@ -0,0 +1,38 @@
+"""
+Opaque cursors for keyset-paginated endpoints.
+
+A cursor is the sort key of the last item on a page, JSON-encoded and
+base64url'd so clients treat it as a token rather than building their own.
+"""
+
+import base64
+import json
+from typing import Any
+
+from fastapi import HTTPException
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode sort-key values (datetimes and UUIDs as strings) as a cursor."""
+    raw = json.dumps(
+        [v.isoformat() if hasattr(v, "isoformat") else v for v in values],
+        default=str,
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> list[Any]:
+    """
+    Decode a cursor made by encode_cursor() into its values.
+
+    Raises:
+        HTTPException: 400 if the cursor is malformed or has the wrong size
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
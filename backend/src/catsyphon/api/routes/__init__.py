@@ -15,6 +15,7 @@ from catsyphon.api.routes import (
     plans,
     projects,
     recaps,
+    search,
     setup,
     stats,
     upload,
@@ -34,6 +35,7 @@ __all__ = [
     "patterns",
     "projects",
     "recaps",
+    "search",
     "setup",
     "stats",
     "upload",
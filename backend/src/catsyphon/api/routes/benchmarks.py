@@ -104,7 +104,7 @@ def _run_benchmarks_async(run_id: str) -> None:
 
 
 @router.get("/status", response_model=BenchmarkStatusResponse)
-async def get_benchmark_status(
+def get_benchmark_status(
     x_benchmark_token: str | None = Header(default=None),
 ) -> BenchmarkStatusResponse:
     _require_benchmark_access(x_benchmark_token)
@@ -119,7 +119,7 @@ async def get_benchmark_status(
 
 
 @router.post("/run", response_model=BenchmarkStatusResponse)
-async def run_benchmark_suite(
+def run_benchmark_suite(
     x_benchmark_token: str | None = Header(default=None),
 ) -> BenchmarkStatusResponse:
     _require_benchmark_access(x_benchmark_token)
@@ -155,7 +155,7 @@ async def run_benchmark_suite(
 
 
 @router.get("/results/latest", response_model=BenchmarkResultResponse)
-async def get_latest_benchmark_results(
+def get_latest_benchmark_results(
     x_benchmark_token: str | None = Header(default=None),
 ) -> BenchmarkResultResponse:
     _require_benchmark_access(x_benchmark_token)
@@ -171,7 +171,7 @@ async def get_latest_benchmark_results(
 
 
 @router.get("/results/{run_id}", response_model=BenchmarkResultResponse)
-async def get_benchmark_results(
+def get_benchmark_results(
     run_id: str,
     x_benchmark_token: str | None = Header(default=None),
 ) -> BenchmarkResultResponse:
@@ -8,14 +8,17 @@ Implements the collector events protocol for aiobscura and watcher integration:
 - POST /collectors/sessions/{session_id}/complete - Complete session
 """
 
+import asyncio
 import hashlib
 import hmac
 import logging
 import secrets
 import uuid
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import APIRouter, Depends, Header, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 from sqlalchemy.orm import Session
 
 from catsyphon.api.schemas import (
@@ -44,10 +47,35 @@ from catsyphon.services.ingestion_service import (
 from catsyphon.services.ingestion_service import (
     IngestionService,
 )
+from catsyphon.utils.wire_format import (
+    PayloadTooLargeError,
+    UnsupportedWireFormatError,
+    decode_body,
+    supported_content_types,
+    supported_encodings,
+)
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/collectors", tags=["collectors"])
+
+def _wire_format_headers() -> dict[str, str]:
+    """Headers advertising the event batch formats this server decodes."""
+    return {
+        "Accept-Post": ", ".join(supported_content_types()),
+        "Accept-Encoding": ", ".join(supported_encodings()),
+    }
+
+
+def advertise_wire_formats(response: Response) -> None:
+    """Let collectors discover compressed/binary formats on any response."""
+    response.headers.update(_wire_format_headers())
+
+
+router = APIRouter(
+    prefix="/collectors",
+    tags=["collectors"],
+    dependencies=[Depends(advertise_wire_formats)],
+)
 
 
 def _convert_pydantic_event(event: PydanticCollectorEvent) -> InternalCollectorEvent:
@@ -235,14 +263,101 @@ def register_collector(
     )
 
 
+def _decode_events_request(
+    body: bytes, content_type: str | None, content_encoding: str | None
+) -> CollectorEventsRequest:
+    """Decompress, decode and validate an event batch body."""
+    try:
+        payload: Any = decode_body(
+            body,
+            content_type,
+            content_encoding,
+            max_bytes=settings.collector_max_payload_bytes,
+        )
+    except UnsupportedWireFormatError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail=str(exc),
+            headers=_wire_format_headers(),
+        ) from exc
+    except PayloadTooLargeError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_413_CONTENT_TOO_LARGE,
+            detail=str(exc),
+        ) from exc
+    except ValueError as exc:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Malformed request body: {exc}",
+        ) from exc
+
+    try:
+        return CollectorEventsRequest.model_validate(payload)
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**error, "loc": ("body", *error["loc"])}
+                for error in exc.errors(include_url=False)
+            ]
+        ) from exc
+
+
+def _inline_refs(node: Any, defs: dict[str, Any]) -> Any:
+    """Replace local ``#/$defs/...`` references with the definitions."""
+    if isinstance(node, dict):
+        ref = node.get("$ref", "")
+        if ref.startswith("#/$defs/"):
+            return _inline_refs(defs[ref.removeprefix("#/$defs/")], defs)
+        return {key: _inline_refs(value, defs) for key, value in node.items()}
+    if isinstance(node, list):
+        return [_inline_refs(item, defs) for item in node]
+    return node
+
+
+def _events_request_body() -> dict[str, Any]:
+    """
+    OpenAPI requestBody for /events.
+
+    The body is decoded by read_events_request rather than a typed body
+    parameter, so FastAPI cannot derive the schema itself.
+    """
+    schema = CollectorEventsRequest.model_json_schema()
+    defs = schema.pop("$defs", {})
+    schema = _inline_refs(schema, defs)
+    return {
+        "required": True,
+        "content": {
+            content_type: {"schema": schema}
+            for content_type in supported_content_types()
+        },
+    }
+
+
+async def read_events_request(request: Request) -> CollectorEventsRequest:
+    """
+    Read an event batch in any advertised wire format.
+
+    Bodies may be JSON or msgpack, optionally gzip/zstd compressed; decoding
+    runs in a worker thread so large batches do not block the event loop.
+    """
+    body = await request.body()
+    return await asyncio.to_thread(
+        _decode_events_request,
+        body,
+        request.headers.get("content-type"),
+        request.headers.get("content-encoding"),
+    )
+
+
 @router.post(
     "/events",
     response_model=CollectorEventsResponse,
     status_code=status.HTTP_202_ACCEPTED,
     summary="Submit event batch",
+    openapi_extra={"requestBody": _events_request_body()},
 )
 def submit_events(
-    request: CollectorEventsRequest,
+    request: Annotated[CollectorEventsRequest, Depends(read_events_request)],
     authorization: Annotated[str, Header()],
     x_collector_id: Annotated[str, Header()],
     db: Session = Depends(get_db),
@@ -252,6 +367,11 @@ def submit_events(
 
     Events are deduplicated by content hash (event_hash field).
     Duplicate events are silently ignored, making re-ingestion idempotent.
+
+    The body is a ``CollectorEventsRequest`` as JSON or msgpack
+    (``Content-Type``), optionally gzip/zstd compressed
+    (``Content-Encoding``). Supported formats are advertised in the
+    ``Accept-Post`` and ``Accept-Encoding`` response headers.
     """
     # Authenticate collector
     collector = get_collector_from_auth(authorization, x_collector_id, db)
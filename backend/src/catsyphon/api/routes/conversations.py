@@ -6,13 +6,14 @@ Endpoints for querying and retrieving conversation data.
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 
 from catsyphon.api.auth import AuthContext, get_auth_context
+from catsyphon.api.pagination import decode_cursor, encode_cursor
 from catsyphon.api.schemas import (
     ConversationDetail,
     ConversationListItem,
@@ -250,7 +251,7 @@ def _conversation_to_detail(conv: Conversation) -> ConversationDetail:
 
 
 @router.get("", response_model=ConversationListResponse)
-async def list_conversations(
+def list_conversations(
     project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
     developer_id: Optional[UUID] = Query(None, description="Filter by developer ID"),
     agent_type: Optional[str] = Query(None, description="Filter by agent type"),
@@ -264,6 +265,14 @@ async def list_conversations(
     success: Optional[bool] = Query(None, description="Filter by success status"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(
+        None,
+        description="Paginate by cursor instead of page: pass an empty value "
+        "for the first page, then each response's next_cursor",
+    ),
+    count: Literal["exact", "approximate", "none"] = Query(
+        "exact", description="How to compute total"
+    ),
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> ConversationListResponse:
@@ -272,9 +281,14 @@ async def list_conversations(
 
     Returns paginated list of conversations with basic metadata.
     For full conversation details including messages, use GET /conversations/{id}.
+
+    Page numbers use OFFSET, which gets slower the deeper the page. With
+    ``cursor`` each page continues from the last parent conversation of the
+    previous one (ordered by last activity, then id). ``count=approximate``
+    uses the database's row estimate and ``count=none`` skips counting.
     """
     # Parse date filters first (for validation)
-    filters = {}
+    filters: dict[str, Any] = {}
     if start_date:
         try:
             filters["start_date"] = datetime.fromisoformat(
@@ -305,15 +319,30 @@ async def list_conversations(
     if success is not None:
         filters["success"] = success
 
+    keyset = cursor is not None
+    after = None
+    if cursor:
+        last_activity, conversation_id = decode_cursor(cursor, 2)
+        try:
+            after = (datetime.fromisoformat(last_activity), UUID(conversation_id))
+        except (ValueError, TypeError):
+            raise HTTPException(status_code=400, detail="Invalid cursor")
+
     # Get total count for pagination
-    total = repo.count_by_filters(workspace_id=workspace_id, **filters)
+    total: Optional[int] = None
+    if count == "exact":
+        total = repo.count_by_filters(workspace_id=workspace_id, **filters)
+    elif count == "approximate":
+        total = repo.estimate_count_by_filters(workspace_id=workspace_id, **filters)
 
     # Get conversations WITH counts in hierarchical order (parents followed by children)
     results = repo.get_with_counts_hierarchical(
         workspace_id=workspace_id,
         **filters,
         limit=page_size,
-        offset=(page - 1) * page_size,
+        offset=0 if keyset else (page - 1) * page_size,
+        keyset=keyset,
+        after=after,
     )
 
     # Convert to response schema using pre-computed counts
@@ -338,17 +367,28 @@ async def list_conversations(
         ) in results
     ]
 
+    next_cursor = None
+    parents = [row[0] for row in results if row[-1] == 0]
+    if keyset and len(parents) == page_size:
+        last = parents[-1]
+        next_cursor = encode_cursor(last.end_time or last.start_time, last.id)
+
     return ConversationListResponse(
         items=items,
         total=total,
         page=page,
         page_size=page_size,
-        pages=(total + page_size - 1) // page_size,  # Ceiling division
+        pages=(
+            (total + page_size - 1) // page_size  # Ceiling division
+            if total is not None
+            else None
+        ),
+        next_cursor=next_cursor,
     )
 
 
 @router.get("/{conversation_id}", response_model=ConversationDetail)
-async def get_conversation(
+def get_conversation(
     conversation_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -370,17 +410,22 @@ async def get_conversation(
 
 
 @router.get("/{conversation_id}/messages", response_model=list[MessageResponse])
-async def get_conversation_messages(
+def get_conversation_messages(
     conversation_id: UUID,
     limit: int = Query(100, ge=1, le=1000, description="Maximum messages to return"),
     offset: int = Query(0, ge=0, description="Number of messages to skip"),
+    after: Optional[UUID] = Query(
+        None, description="Return messages after this message ID (cursor)"
+    ),
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> list[MessageResponse]:
     """
     Get messages for a specific conversation.
 
-    Supports pagination for large conversations.
+    Supports pagination for large conversations: pass the ID of the last
+    message received as ``after`` to fetch the next page without the cost
+    of a deep ``offset``.
     Messages are returned in chronological order.
     """
     # Verify conversation exists and belongs to workspace
@@ -392,17 +437,25 @@ async def get_conversation_messages(
 
     # Get messages
     msg_repo = MessageRepository(session)
+    after_message = None
+    if after:
+        after_message = msg_repo.get(after)
+        if not after_message or after_message.conversation_id != conversation_id:
+            raise HTTPException(
+                status_code=400, detail="after is not a message in this conversation"
+            )
     messages = msg_repo.get_by_conversation(
         conversation_id=conversation_id,
         limit=limit,
         offset=offset,
+        after=after_message,
     )
 
     return [MessageResponse.model_validate(m) for m in messages]
 
 
 @router.post("/{conversation_id}/tag", response_model=ConversationDetail)
-async def tag_conversation(
+def tag_conversation(
     conversation_id: UUID,
     force: bool = Query(
         False, description="Force retagging even if tags already exist"
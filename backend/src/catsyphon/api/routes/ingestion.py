@@ -31,7 +31,7 @@ router = APIRouter()
 
 
 @router.get("/ingestion/jobs", response_model=list[IngestionJobResponse])
-async def list_ingestion_jobs(
+def list_ingestion_jobs(
     source_type: Optional[str] = None,
     status: Optional[str] = None,
     page: int = 1,
@@ -69,7 +69,7 @@ async def list_ingestion_jobs(
 
 
 @router.get("/ingestion/jobs/{job_id}", response_model=IngestionJobResponse)
-async def get_ingestion_job(
+def get_ingestion_job(
     job_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -96,7 +96,7 @@ async def get_ingestion_job(
 
 
 @router.get("/ingestion/stats", response_model=IngestionStatsResponse)
-async def get_ingestion_stats(
+def get_ingestion_stats(
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> IngestionStatsResponse:
@@ -163,7 +163,7 @@ async def get_ingestion_stats(
     "/ingestion/jobs/conversation/{conversation_id}",
     response_model=list[IngestionJobResponse],
 )
-async def get_conversation_ingestion_jobs(
+def get_conversation_ingestion_jobs(
     conversation_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -198,7 +198,7 @@ async def get_conversation_ingestion_jobs(
     "/ingestion/jobs/watch-config/{config_id}",
     response_model=list[IngestionJobResponse],
 )
-async def get_watch_config_ingestion_jobs(
+def get_watch_config_ingestion_jobs(
     config_id: UUID,
     page: int = 1,
     page_size: int = 50,
@@ -235,7 +235,7 @@ async def get_watch_config_ingestion_jobs(
 
 
 @router.get("/ingestion/tagging-queue", response_model=TaggingQueueStatsResponse)
-async def get_tagging_queue_stats(
+def get_tagging_queue_stats(
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> TaggingQueueStatsResponse:
@@ -28,7 +28,7 @@ _RECENT_SESSIONS_LIMIT = 3
 
 
 @router.get("/projects", response_model=list[ProjectListItem])
-async def list_projects(
+def list_projects(
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> list[ProjectListItem]:
@@ -152,7 +152,7 @@ async def list_projects(
 
 
 @router.get("/developers", response_model=list[DeveloperResponse])
-async def list_developers(
+def list_developers(
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> list[DeveloperResponse]:
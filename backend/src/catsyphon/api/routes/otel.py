@@ -7,8 +7,10 @@ normalized event records.
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
+from uuid import UUID
 
 from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
@@ -54,34 +56,17 @@ def _normalize_body_payload(value: Any | None) -> dict[str, Any] | None:
     return {"value": value}
 
 
-@router.post("/v1/logs")
-async def ingest_otel_logs(
-    request: Request,
-    auth: AuthContext = Depends(get_auth_context),
-    session: Session = Depends(get_db),
-    content_type: str | None = Header(default=None, alias="Content-Type"),
-    authorization: str | None = Header(default=None),
-    x_catsyphon_otel_token: str | None = Header(
-        default=None, alias="X-Catsyphon-Otel-Token"
-    ),
-) -> Response:
-    """Ingest OTLP log records for a workspace."""
-    token = _extract_token(authorization, x_catsyphon_otel_token)
-    _require_otel_access(token)
-
-    payload = await request.body()
-    if not payload:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Empty OTLP payload",
-        )
-
-    if len(payload) > settings.otel_ingest_max_payload_bytes:
-        raise HTTPException(
-            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
-            detail="OTLP payload exceeds max size",
-        )
+def _store_otel_payload(
+    session: Session,
+    workspace_id: UUID,
+    payload: bytes,
+    content_type: str | None,
+) -> int:
+    """Decode, normalize and store an OTLP payload; returns events stored.
 
+    Runs in a worker thread so protobuf decoding and the synchronous insert
+    do not block the event loop.
+    """
     try:
         export_request = decode_otlp_request(payload, content_type=content_type)
     except ValueError as exc:
@@ -92,12 +77,12 @@ async def ingest_otel_logs(
 
     normalized = normalize_logs(export_request)
     if not normalized:
-        return Response(status_code=status.HTTP_204_NO_CONTENT)
+        return 0
 
     repo = OtelEventRepository(session)
     records = [
         {
-            "workspace_id": auth.workspace_id,
+            "workspace_id": workspace_id,
             "source_conversation_id": event.source_conversation_id,
             "event_name": event.event_name,
             "event_timestamp": event.event_timestamp,
@@ -117,14 +102,50 @@ async def ingest_otel_logs(
     logger.info(
         "Ingested %d OTEL events for workspace %s",
         len(records),
-        auth.workspace_id,
+        workspace_id,
+    )
+    return len(records)
+
+
+@router.post("/v1/logs")
+async def ingest_otel_logs(
+    request: Request,
+    auth: AuthContext = Depends(get_auth_context),
+    session: Session = Depends(get_db),
+    content_type: str | None = Header(default=None, alias="Content-Type"),
+    authorization: str | None = Header(default=None),
+    x_catsyphon_otel_token: str | None = Header(
+        default=None, alias="X-Catsyphon-Otel-Token"
+    ),
+) -> Response:
+    """Ingest OTLP log records for a workspace."""
+    token = _extract_token(authorization, x_catsyphon_otel_token)
+    _require_otel_access(token)
+
+    payload = await request.body()
+    if not payload:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Empty OTLP payload",
+        )
+
+    if len(payload) > settings.otel_ingest_max_payload_bytes:
+        raise HTTPException(
+            status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+            detail="OTLP payload exceeds max size",
+        )
+
+    stored = await asyncio.to_thread(
+        _store_otel_payload, session, auth.workspace_id, payload, content_type
     )
+    if not stored:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
 
     return Response(status_code=status.HTTP_200_OK)
 
 
 @router.get("/otel/stats", response_model=OtelStatsResponse)
-async def get_otel_stats(
+def get_otel_stats(
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> OtelStatsResponse:
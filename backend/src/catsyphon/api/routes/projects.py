@@ -10,10 +10,11 @@ from typing import Any, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy import func, text
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from catsyphon.analytics.cache import PROJECT_ANALYTICS_CACHE
+from catsyphon.analytics.cache import ANALYTICS_CACHE, project_scope
 from catsyphon.analytics.thinking_time import (
     aggregate_thinking_time,
     pair_user_assistant,
@@ -39,10 +40,12 @@ from catsyphon.db.connection import get_db
 from catsyphon.db.repositories import (
     ConversationRepository,
     ProjectRepository,
+    TokenLedgerRepository,
 )
 from catsyphon.models.db import (
     ArtifactSnapshot,
     Conversation,
+    ConversationRollup,
     Developer,
     Epoch,
     FileTouched,
@@ -84,7 +87,7 @@ def _categorize_error(msg: Optional[str]) -> str:
 
 
 @router.get("/{project_id}/stats", response_model=ProjectStats)
-async def get_project_stats(
+def get_project_stats(
     project_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -333,7 +336,7 @@ async def get_project_stats(
 
 
 @router.get("/{project_id}/analytics", response_model=ProjectAnalytics)
-async def get_project_analytics(
+def get_project_analytics(
     project_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -347,16 +350,19 @@ async def get_project_analytics(
     import statistics
     from datetime import datetime, timedelta
 
-    # Cache lookup
-    cached = PROJECT_ANALYTICS_CACHE.get(project_id, date_range)
-    if cached:
-        return cached
-
     project_repo = ProjectRepository(session)
     project = project_repo.get_by_id_workspace(project_id, auth.workspace_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
+    # Cache lookup (versioned per project, shared across workers)
+    cache_key = ANALYTICS_CACHE.key(
+        session, "project_analytics", project_scope(project_id), date_range
+    )
+    cached = ANALYTICS_CACHE.get(session, cache_key)
+    if cached is not None:
+        return ProjectAnalytics.model_validate(cached)
+
     # Calculate date cutoff
     cutoff_date = None
     if date_range:
@@ -411,56 +417,29 @@ async def get_project_analytics(
         else {}
     )
 
-    # ===== DATABASE AGGREGATIONS FOR MESSAGES =====
-    # Instead of loading all messages, aggregate counts in database
-    from sqlalchemy import case
-
-    msg_agg = (
-        session.query(
-            Message.conversation_id,
-            func.count(case((Message.role == "assistant", 1))).label("assistant_count"),
-            func.count(case((Message.role == "user", 1))).label("user_count"),
-            func.count(case((Message.role == "assistant", Message.tool_calls))).label(
-                "assistant_tool_count"
-            ),
-            func.count(case((Message.role == "user", Message.tool_calls))).label(
-                "user_tool_count"
-            ),
-        )
-        .filter(Message.conversation_id.in_(conv_ids))
-        .group_by(Message.conversation_id)
+    # ===== ROLLUPS (maintained at ingest, one row per conversation) =====
+    rollups = (
+        session.query(ConversationRollup)
+        .join(Conversation, Conversation.id == ConversationRollup.conversation_id)
+        .filter(conv_filter)
         .all()
     )
     msg_counts_by_conv: dict[UUID, dict[str, int]] = {
-        row.conversation_id: {
-            "assistant": row.assistant_count or 0,
-            "user": row.user_count or 0,
-            "assistant_tool": row.assistant_tool_count or 0,
-            "user_tool": row.user_tool_count or 0,
+        r.conversation_id: {
+            "assistant": r.assistant_message_count,
+            "user": r.user_message_count,
+            "assistant_tool": r.assistant_tool_call_count,
+            "user_tool": r.user_tool_call_count,
         }
-        for row in msg_agg
+        for r in rollups
     }
-
-    # ===== DATABASE AGGREGATIONS FOR FILES =====
-    # Aggregate file stats per conversation in database
-    file_agg = (
-        session.query(
-            FileTouched.conversation_id,
-            func.sum(FileTouched.lines_added).label("total_added"),
-            func.sum(FileTouched.lines_deleted).label("total_deleted"),
-            func.min(FileTouched.timestamp).label("first_change"),
-        )
-        .filter(FileTouched.conversation_id.in_(conv_ids))
-        .group_by(FileTouched.conversation_id)
-        .all()
-    )
     file_stats_by_conv: dict[UUID, dict[str, Any]] = {
-        row.conversation_id: {
-            "lines_added": row.total_added or 0,
-            "lines_deleted": row.total_deleted or 0,
-            "first_change": row.first_change,
+        r.conversation_id: {
+            "lines_added": r.lines_added,
+            "lines_deleted": r.lines_deleted,
+            "first_change": r.first_change_at,
         }
-        for row in file_agg
+        for r in rollups
     }
 
     # ===== THINKING TIME (load minimal message data, capped for performance) =====
@@ -801,12 +780,12 @@ async def get_project_analytics(
     )
 
     # Cache set
-    PROJECT_ANALYTICS_CACHE.set(project_id, date_range, result)
+    ANALYTICS_CACHE.set(session, cache_key, result.model_dump(mode="json"))
     return result
 
 
 @router.get("/{project_id}/insights")
-async def get_project_insights(
+def get_project_insights(
     project_id: UUID,
     date_range: str = Query(
         "30d",
@@ -917,7 +896,7 @@ async def get_project_insights(
 
 
 @router.get("/{project_id}/health-report")
-async def get_project_health_report(
+def get_project_health_report(
     project_id: UUID,
     date_range: str = Query(
         "30d",
@@ -961,6 +940,17 @@ async def get_project_health_report(
     if not project:
         raise HTTPException(status_code=404, detail=f"Project {project_id} not found")
 
+    cache_key = ANALYTICS_CACHE.key(
+        session,
+        "project_health_report",
+        project_scope(project_id),
+        date_range,
+        developer,
+    )
+    cached: Optional[dict[str, Any]] = ANALYTICS_CACHE.get(session, cache_key)
+    if cached is not None:
+        return cached
+
     # Generate health report
     generator = HealthReportGenerator(
         api_key=settings.get_llm_api_key() or "",
@@ -993,11 +983,12 @@ async def get_project_health_report(
         )
         report["provenance"] = run_to_provenance_dict(run)
 
+    ANALYTICS_CACHE.set(session, cache_key, jsonable_encoder(report))
     return report
 
 
 @router.get("/{project_id}/sessions", response_model=ProjectSessionsResponse)
-async def list_project_sessions(
+def list_project_sessions(
     project_id: UUID,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
@@ -1043,7 +1034,7 @@ async def list_project_sessions(
         raise HTTPException(status_code=404, detail="Project not found")
 
     # Build filters
-    filters = {"project_id": project_id}
+    filters: dict[str, Any] = {"project_id": project_id}
 
     # Developer filter (need to get developer_id from username)
     if developer:
@@ -1153,7 +1144,7 @@ async def list_project_sessions(
 
 
 @router.get("/{project_id}/files", response_model=list[ProjectFileAggregation])
-async def get_project_files(
+def get_project_files(
     project_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -1226,7 +1217,7 @@ async def get_project_files(
 
 
 @router.get("/{project_id}/costs")
-async def get_project_costs(
+def get_project_costs(
     project_id: UUID,
     date_range: str = Query("30d", pattern="^(7d|30d|90d|all)$"),
     auth: AuthContext = Depends(get_auth_context),
@@ -1252,118 +1243,42 @@ async def get_project_costs(
     else:
         cutoff = None
 
-    # Query message token_usage from JSONB
-    # Try PostgreSQL JSONB aggregation first
+    # Count conversations + files in period
+    conv_query = session.query(
+        func.count(Conversation.id),
+        func.coalesce(func.sum(Conversation.files_count), 0),
+    ).filter(
+        Conversation.project_id == project_id,
+        Conversation.workspace_id == workspace_id,
+    )
+    if cutoff:
+        conv_query = conv_query.filter(Conversation.start_time >= cutoff)
+    conversation_count, total_files_changed = conv_query.first() or (0, 0)
+    conversation_count = conversation_count or 0
+    total_files_changed = total_files_changed or 0
+
+    # Token totals per model per day from the ingest-time ledger, priced now
     cost_by_model: dict[str, float] = {}
-    daily_costs: list[dict] = []
+    daily_cost_map: dict[str, float] = {}
     total_input = 0
-    total_output = 0
     total_cache_read = 0
-    conversation_count = 0
-    total_files_changed = 0
-
-    try:
-        # Count conversations + files in period
-        conv_query = session.query(
-            func.count(Conversation.id),
-            func.coalesce(func.sum(Conversation.files_count), 0),
-        ).filter(
-            Conversation.project_id == project_id,
-            Conversation.workspace_id == workspace_id,
-        )
-        if cutoff:
-            conv_query = conv_query.filter(Conversation.start_time >= cutoff)
-        result = conv_query.first()
-        conversation_count = result[0] or 0
-        total_files_changed = result[1] or 0
-
-        # Aggregate tokens per model per day using PostgreSQL JSONB
-        token_query = text("""
-            SELECT
-                m.extra_data->>'model' as model,
-                date_trunc('day', m.timestamp)::date as day,
-                SUM(COALESCE((m.extra_data->'token_usage'->>'input_tokens')::bigint, 0)) as input_tokens,
-                SUM(COALESCE((m.extra_data->'token_usage'->>'output_tokens')::bigint, 0)) as output_tokens,
-                SUM(COALESCE((m.extra_data->'token_usage'->>'cache_read_input_tokens')::bigint, 0)) as cache_read
-            FROM messages m
-            JOIN conversations c ON m.conversation_id = c.id
-            WHERE c.project_id = :project_id
-              AND c.workspace_id = :ws_id
-              AND m.extra_data->>'model' IS NOT NULL
-              AND m.extra_data->'token_usage' IS NOT NULL
-        """)
-        params: dict[str, Any] = {
-            "project_id": str(project_id),
-            "ws_id": str(workspace_id),
-        }
-        if cutoff:
-            token_query = text(
-                str(token_query.text) + " AND c.start_time >= :cutoff"
-            )
-            params["cutoff"] = cutoff
-        token_query = text(
-            str(token_query.text) + " GROUP BY model, day ORDER BY day"
-        )
-
-        rows = session.execute(token_query, params).mappings().all()
-
-        daily_cost_map: dict[str, float] = {}
-        for row in rows:
-            model = row["model"]
-            inp = int(row["input_tokens"])
-            out = int(row["output_tokens"])
-            cache = int(row["cache_read"])
-            total_input += inp
-            total_output += out
-            total_cache_read += cache
-            cost = estimate_cost_from_model(model, inp, out)
-            if cost is not None:
-                cost_by_model[model] = cost_by_model.get(model, 0.0) + cost
-                day_str = str(row["day"])
-                daily_cost_map[day_str] = (
-                    daily_cost_map.get(day_str, 0.0) + cost
-                )
-
-        daily_costs = [
-            {"date": d, "cost": round(c, 4)}
-            for d, c in sorted(daily_cost_map.items())
-        ]
-
-    except Exception:
-        # SQLite fallback: Python-side aggregation
-        import logging
-
-        logging.getLogger(__name__).debug(
-            "PostgreSQL JSONB query failed, using Python fallback"
-        )
-
-        msg_query = (
-            session.query(Message.extra_data, Message.timestamp)
-            .join(Conversation)
-            .filter(
-                Conversation.project_id == project_id,
-                Conversation.workspace_id == workspace_id,
-            )
-        )
-        if cutoff:
-            msg_query = msg_query.filter(Conversation.start_time >= cutoff)
-
-        for extra_data, ts in msg_query.limit(50000).all():
-            if not extra_data:
-                continue
-            model = extra_data.get("model")
-            tu = extra_data.get("token_usage")
-            if not model or not tu:
-                continue
-            inp = tu.get("input_tokens", 0) or 0
-            out = tu.get("output_tokens", 0) or 0
-            cache = tu.get("cache_read_input_tokens", 0) or 0
-            total_input += inp
-            total_output += out
-            total_cache_read += cache
-            cost = estimate_cost_from_model(model, inp, out)
-            if cost is not None:
-                cost_by_model[model] = cost_by_model.get(model, 0.0) + cost
+    rows = TokenLedgerRepository(session).totals(
+        workspace_id,
+        project_id=project_id,
+        since=cutoff.date() if cutoff else None,
+    )
+    for row in rows:
+        total_input += row.input_tokens
+        total_cache_read += row.cache_read_tokens
+        cost = estimate_cost_from_model(row.model, row.input_tokens, row.output_tokens)
+        if cost is not None:
+            cost_by_model[row.model] = cost_by_model.get(row.model, 0.0) + cost
+            day_str = str(row.day)
+            daily_cost_map[day_str] = daily_cost_map.get(day_str, 0.0) + cost
+
+    daily_costs = [
+        {"date": d, "cost": round(c, 4)} for d, c in sorted(daily_cost_map.items())
+    ]
 
     total_cost = round(sum(cost_by_model.values()), 4)
     cost_by_model = {
@@ -1396,7 +1311,7 @@ async def get_project_costs(
 
 
 @router.get("/{project_id}/memory")
-async def get_project_memory(
+def get_project_memory(
     project_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -0,0 +1,87 @@
+"""
+Search API routes.
+
+Full-text search over message content, tool-call parameters and thinking
+content, ranked and paged with an opaque keyset cursor.
+"""
+
+from datetime import datetime
+from typing import Literal, Optional, Union
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.orm import Session
+
+from catsyphon.api.auth import AuthContext, get_auth_context
+from catsyphon.api.pagination import decode_cursor, encode_cursor
+from catsyphon.api.schemas import MessageSearchHit, MessageSearchResponse
+from catsyphon.db.connection import get_db
+from catsyphon.db.repositories import MessageSearchRepository
+
+router = APIRouter()
+
+
+def _decode_search_cursor(
+    cursor: str, sort: str
+) -> tuple[Union[float, datetime], UUID]:
+    cursor_sort, value, message_id = decode_cursor(cursor, 3)
+    try:
+        if cursor_sort != sort:
+            raise ValueError("cursor belongs to a different sort")
+        key = datetime.fromisoformat(value) if sort == "recent" else float(value)
+        return key, UUID(message_id)
+    except (ValueError, TypeError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+@router.get("", response_model=MessageSearchResponse)
+def search_messages(
+    q: str = Query(..., min_length=1, max_length=500, description="Search terms"),
+    project_id: Optional[UUID] = Query(None, description="Filter by project"),
+    sort: Literal["relevance", "recent"] = Query(
+        "relevance", description="Order by relevance or newest first"
+    ),
+    cursor: Optional[str] = Query(None, description="next_cursor of previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    auth: AuthContext = Depends(get_auth_context),
+    session: Session = Depends(get_db),
+) -> MessageSearchResponse:
+    """
+    Search messages across the workspace's conversations.
+
+    Matches message content, tool-call parameters and thinking content.
+    Quoted phrases, ``or`` and ``-term`` are supported on PostgreSQL.
+
+    Requires X-Workspace-Id header.
+    """
+    after = _decode_search_cursor(cursor, sort) if cursor else None
+
+    # One extra row tells us whether there is a next page
+    rows = MessageSearchRepository(session).search(
+        auth.workspace_id,
+        q,
+        project_id=project_id,
+        sort=sort,
+        after=after,
+        limit=limit + 1,
+    )
+    items = [
+        MessageSearchHit(
+            message_id=row.message_id,
+            conversation_id=row.conversation_id,
+            project_id=row.project_id,
+            role=row.role,
+            timestamp=row.timestamp,
+            rank=row.rank,
+            snippet=row.snippet or "",
+        )
+        for row in rows[:limit]
+    ]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        key = last.timestamp if sort == "recent" else last.rank
+        next_cursor = encode_cursor(sort, key, last.message_id)
+
+    return MessageSearchResponse(items=items, next_cursor=next_cursor)
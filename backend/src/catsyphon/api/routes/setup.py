@@ -54,7 +54,7 @@ def _generate_slug(name: str) -> str:
 
 
 @router.get("/status", response_model=SetupStatusResponse)
-async def get_setup_status(
+def get_setup_status(
     session: Session = Depends(get_db),
 ) -> SetupStatusResponse:
     """
@@ -80,7 +80,7 @@ async def get_setup_status(
 
 
 @router.post("/organizations", response_model=OrganizationResponse, status_code=201)
-async def create_organization(
+def create_organization(
     org_data: OrganizationCreate,
     session: Session = Depends(get_db),
 ) -> OrganizationResponse:
@@ -113,7 +113,7 @@ async def create_organization(
 
 
 @router.get("/organizations", response_model=list[OrganizationResponse])
-async def list_organizations(
+def list_organizations(
     session: Session = Depends(get_db),
 ) -> list[OrganizationResponse]:
     """
@@ -128,7 +128,7 @@ async def list_organizations(
 
 
 @router.get("/organizations/{org_id}", response_model=OrganizationResponse)
-async def get_organization(
+def get_organization(
     org_id: UUID,
     session: Session = Depends(get_db),
 ) -> OrganizationResponse:
@@ -145,7 +145,7 @@ async def get_organization(
 
 
 @router.post("/workspaces", response_model=WorkspaceResponse, status_code=201)
-async def create_workspace(
+def create_workspace(
     workspace_data: WorkspaceCreate,
     session: Session = Depends(get_db),
 ) -> WorkspaceResponse:
@@ -191,7 +191,7 @@ async def create_workspace(
 
 
 @router.get("/workspaces", response_model=list[WorkspaceResponse])
-async def list_workspaces(
+def list_workspaces(
     organization_id: Optional[UUID] = None,
     session: Session = Depends(get_db),
 ) -> list[WorkspaceResponse]:
@@ -211,7 +211,7 @@ async def list_workspaces(
 
 
 @router.get("/workspaces/{workspace_id}", response_model=WorkspaceResponse)
-async def get_workspace(
+def get_workspace(
     workspace_id: UUID,
     session: Session = Depends(get_db),
 ) -> WorkspaceResponse:
@@ -12,13 +12,16 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 
+from catsyphon.analytics.cache import ANALYTICS_CACHE, workspace_scope
 from catsyphon.api.auth import AuthContext, get_auth_context
 from catsyphon.api.schemas import OverviewStats
 from catsyphon.db.connection import get_db
 from catsyphon.db.repositories import (
     ConversationRepository,
     DeveloperRepository,
+    PlanRepository,
     ProjectRepository,
+    TokenLedgerRepository,
 )
 from catsyphon.models.db import ArtifactSnapshot, Conversation, Message
 
@@ -28,7 +31,7 @@ router = APIRouter()
 
 
 @router.get("/overview", response_model=OverviewStats)
-async def get_overview_stats(
+def get_overview_stats(
     auth: AuthContext = Depends(get_auth_context),
     start_date: Optional[datetime] = Query(None, description="Filter start date"),
     end_date: Optional[datetime] = Query(None, description="Filter end date"),
@@ -42,10 +45,25 @@ async def get_overview_stats(
 
     Requires X-Workspace-Id header.
     """
+    workspace_id = auth.workspace_id
+
+    # Cache lookup (versioned per workspace). The current minute is part of
+    # the key because recent-activity figures are relative to now.
+    cache_key = ANALYTICS_CACHE.key(
+        session,
+        "overview_stats",
+        workspace_scope(workspace_id),
+        start_date.isoformat() if start_date else None,
+        end_date.isoformat() if end_date else None,
+        datetime.now(timezone.utc).strftime("%Y%m%d%H%M"),
+    )
+    cached = ANALYTICS_CACHE.get(session, cache_key)
+    if cached is not None:
+        return OverviewStats.model_validate(cached)
+
     conv_repo = ConversationRepository(session)
     proj_repo = ProjectRepository(session)
     dev_repo = DeveloperRepository(session)
-    workspace_id = auth.workspace_id
 
     # Build date filter
     date_filter = {"workspace_id": workspace_id}
@@ -129,94 +147,10 @@ async def get_overview_stats(
         workspace_id=workspace_id, start_date=seven_days_ago
     )
 
-    # Plan statistics (extracted from extra_data JSONB)
-    # ===== OPTIMIZED: Use database aggregation instead of loading all into memory =====
-    total_plans = 0
-    plans_by_status: dict[str, int] = {}
-    conversations_with_plans = 0
-
-    # Try PostgreSQL JSONB aggregation first (production), fall back to limited scan
-    try:
-        # PostgreSQL: Use JSONB operators to count plans at database level
-        # Count conversations with plans
-        conversations_with_plans = (
-            session.query(func.count(Conversation.id))
-            .filter(Conversation.workspace_id == workspace_id)
-            .filter(Conversation.extra_data.isnot(None))
-            .filter(
-                func.jsonb_array_length(
-                    func.coalesce(Conversation.extra_data["plans"], "[]")
-                )
-                > 0
-            )
-            .scalar()
-            or 0
-        )
-
-        # Count total plans across all conversations
-        # Use subquery to sum JSONB array lengths
-        total_plans = (
-            session.query(
-                func.coalesce(
-                    func.sum(
-                        func.jsonb_array_length(
-                            func.coalesce(Conversation.extra_data["plans"], "[]")
-                        )
-                    ),
-                    0,
-                )
-            )
-            .filter(Conversation.workspace_id == workspace_id)
-            .filter(Conversation.extra_data.isnot(None))
-            .scalar()
-            or 0
-        )
-
-        # Plan status breakdown using jsonb_array_elements() — fully in SQL
-        status_rows = (
-            session.execute(
-                text(
-                    """
-                    SELECT
-                        COALESCE(plan_elem->>'status', 'active') AS plan_status,
-                        COUNT(*) AS cnt
-                    FROM conversations,
-                         jsonb_array_elements(
-                             COALESCE(metadata->'plans', '[]'::jsonb)
-                         ) AS plan_elem
-                    WHERE workspace_id = :ws
-                      AND metadata IS NOT NULL
-                      AND jsonb_array_length(COALESCE(metadata->'plans', '[]'::jsonb)) > 0
-                    GROUP BY plan_status
-                    """
-                ),
-                {"ws": workspace_id},
-            )
-            .mappings()
-            .all()
-        )
-        for row in status_rows:
-            plans_by_status[row["plan_status"]] = row["cnt"]
-
-    except Exception:
-        # SQLite fallback: Use limited scan (less efficient but compatible)
-        plans_query = (
-            session.query(Conversation.extra_data)
-            .filter(Conversation.workspace_id == workspace_id)
-            .filter(Conversation.extra_data.isnot(None))
-            .limit(5000)  # Cap to prevent OOM
-        )
-
-        for (extra_data,) in plans_query.all():
-            if not extra_data:
-                continue
-            plans = extra_data.get("plans", [])
-            if plans and isinstance(plans, list) and len(plans) > 0:
-                conversations_with_plans += 1
-                total_plans += len(plans)
-                for plan in plans:
-                    status = plan.get("status", "active")
-                    plans_by_status[status] = plans_by_status.get(status, 0) + 1
+    # Plan statistics (indexed plans table)
+    total_plans, plans_by_status, conversations_with_plans = PlanRepository(
+        session
+    ).stats(workspace_id)
 
     # Success rate (workspace scoped)
     total_with_success = (
@@ -270,7 +204,7 @@ async def get_overview_stats(
         # SQLite doesn't support to_timestamp - skip sparkline data
         pass
 
-    return OverviewStats(
+    result = OverviewStats(
         total_conversations=total_conversations,
         total_messages=total_messages,
         total_projects=total_projects,
@@ -287,6 +221,8 @@ async def get_overview_stats(
         conversations_with_plans=conversations_with_plans,
         message_activity_60m=message_activity_60m,
     )
+    ANALYTICS_CACHE.set(session, cache_key, result.model_dump(mode="json"))
+    return result
 
 
 # ── Cost Analytics ──────────────────────────────────────────────────
@@ -297,27 +233,17 @@ def _period_to_days(period: str) -> int:
 
 
 @router.get("/costs")
-async def get_workspace_costs(
+def get_workspace_costs(
     period: str = Query("30d", pattern="^(7d|30d|90d)$"),
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
 ) -> dict[str, Any]:
-    """Workspace-level cost summary from token analytics + message data."""
+    """Workspace-level cost summary from the token ledger or token analytics."""
     from catsyphon.llm.pricing import estimate_cost_from_model
 
     workspace_id = auth.workspace_id
     days = _period_to_days(period)
-
-    # Source 1: Artifact snapshot for pre-aggregated totals
-    snapshot = (
-        session.query(ArtifactSnapshot)
-        .filter(
-            ArtifactSnapshot.workspace_id == workspace_id,
-            ArtifactSnapshot.source_type == "token_analytics",
-            ArtifactSnapshot.scan_status == "ok",
-        )
-        .first()
-    )
+    since = (datetime.now(timezone.utc) - timedelta(days=days)).date()
 
     cost_by_model: dict[str, float] = {}
     daily_costs: list[dict[str, Any]] = []
@@ -325,7 +251,40 @@ async def get_workspace_costs(
     total_output = 0
     total_cache_read = 0
 
-    if snapshot and snapshot.body:
+    # Source 1: ingest-time token ledger, exact per model and day
+    ledger_rows = TokenLedgerRepository(session).totals(workspace_id, since=since)
+
+    # Source 2: Artifact snapshot for pre-aggregated totals
+    snapshot = None
+    if not ledger_rows:
+        snapshot = (
+            session.query(ArtifactSnapshot)
+            .filter(
+                ArtifactSnapshot.workspace_id == workspace_id,
+                ArtifactSnapshot.source_type == "token_analytics",
+                ArtifactSnapshot.scan_status == "ok",
+            )
+            .first()
+        )
+
+    if ledger_rows:
+        daily_cost_map: dict[str, float] = {}
+        for row in ledger_rows:
+            total_input += row.input_tokens
+            total_output += row.output_tokens
+            total_cache_read += row.cache_read_tokens
+            cost = estimate_cost_from_model(
+                row.model, row.input_tokens, row.output_tokens
+            )
+            if cost is not None:
+                cost_by_model[row.model] = cost_by_model.get(row.model, 0.0) + cost
+                day_str = str(row.day)
+                daily_cost_map[day_str] = daily_cost_map.get(day_str, 0.0) + cost
+        daily_costs = [
+            {"date": d, "cost": round(c, 4)} for d, c in sorted(daily_cost_map.items())
+        ]
+
+    elif snapshot and snapshot.body:
         body = snapshot.body
 
         # Use modelUsage for accurate per-model costs (has input/output breakdown)
@@ -390,7 +349,7 @@ async def get_workspace_costs(
 
 
 @router.get("/timeline")
-async def get_activity_timeline(
+def get_activity_timeline(
     days: int = Query(7, ge=1, le=90),
     limit: int = Query(100, ge=1, le=500),
     auth: AuthContext = Depends(get_auth_context),
@@ -4,23 +4,44 @@ Upload API routes.
 Endpoints for uploading and ingesting conversation log files.
 """
 
+import asyncio
+import concurrent.futures
+import shutil
 import tempfile
 from pathlib import Path
 
-from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile
+from fastapi import (
+    APIRouter,
+    Depends,
+    File,
+    HTTPException,
+    Query,
+    Request,
+    UploadFile,
+    status,
+)
 from sqlalchemy.orm import Session
+from starlette.requests import ClientDisconnect
 
 from catsyphon.api.auth import AuthContext, get_auth_context
-from catsyphon.api.schemas import UploadResponse, UploadResult
+from catsyphon.api.schemas import (
+    StreamingUploadResponse,
+    UploadResponse,
+    UploadResult,
+)
 from catsyphon.db.connection import get_db
 from catsyphon.db.repositories import ConversationRepository
 from catsyphon.services import IngestionService
+from catsyphon.services.streaming_upload import (
+    StreamingUpload,
+    start_streaming_upload,
+)
 
 router = APIRouter()
 
 
 @router.post("/", response_model=UploadResponse)
-async def upload_conversation_logs(
+def upload_conversation_logs(
     auth: AuthContext = Depends(get_auth_context),
     files: list[UploadFile] = File(...),
     update_mode: str = Query(
@@ -71,14 +92,13 @@ async def upload_conversation_logs(
             continue
 
         try:
-            # Read file content
-            content = await uploaded_file.read()
-
-            # Save to temporary file for parsing
+            # Copy the spooled upload to a temporary file for parsing. This
+            # handler is sync (run in the threadpool), so blocking I/O and
+            # ingestion below do not stall the event loop.
             with tempfile.NamedTemporaryFile(
                 mode="wb", suffix=".jsonl", delete=False
             ) as temp_file:
-                temp_file.write(content)
+                shutil.copyfileobj(uploaded_file.file, temp_file)
                 temp_path = Path(temp_file.name)
 
             try:
@@ -185,3 +205,92 @@ async def upload_conversation_logs(
         skipped_count=skipped_count,
         results=results,
     )
+
+
+@router.post(
+    "/stream",
+    response_model=StreamingUploadResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def stream_conversation_log(
+    request: Request,
+    filename: str = Query(..., description="Name of the .jsonl file being uploaded"),
+    wait: bool = Query(
+        False, description="Hold the response until ingestion has finished"
+    ),
+    auth: AuthContext = Depends(get_auth_context),
+    session: Session = Depends(get_db),
+) -> StreamingUploadResponse:
+    """
+    Stream a single conversation log as the raw request body.
+
+    The body is spooled to disk as it arrives and ingested chunk by chunk
+    while the upload is still in progress, so memory stays bounded
+    regardless of file size. Returns once the body has been received and
+    the first chunk is committed; poll ``GET /ingestion/jobs/{job_id}``
+    for progress and the final status.
+
+    Parameters:
+    - filename: Name of the uploaded .jsonl file
+    - wait: Respond only after ingestion has finished
+
+    Requires X-Workspace-Id header.
+    """
+    if not filename.endswith(".jsonl"):
+        raise HTTPException(
+            status_code=400,
+            detail="Invalid file type. Only .jsonl files are supported.",
+        )
+
+    # This handler stays async to read the body incrementally; everything
+    # that touches the database or the spool lock is pushed to threads.
+    upload = await asyncio.to_thread(
+        start_streaming_upload, session, auth.workspace_id, filename
+    )
+    spool = upload.spool
+    try:
+        async for chunk in request.stream():
+            if not await asyncio.to_thread(spool.write, chunk):
+                break  # Ingestion already failed; stop reading
+    except ClientDisconnect:
+        await asyncio.to_thread(spool.abort)
+        raise
+    await asyncio.to_thread(spool.close)
+
+    if wait:
+        future = upload.future
+        assert future is not None  # Submitted by start_streaming_upload
+        await asyncio.to_thread(concurrent.futures.wait, [future])
+    else:
+        await asyncio.to_thread(upload.started.wait)
+
+    return _streaming_upload_response(upload, filename)
+
+
+def _streaming_upload_response(
+    upload: StreamingUpload, filename: str
+) -> StreamingUploadResponse:
+    """Summarize a streaming upload from its in-memory progress."""
+    response = StreamingUploadResponse(
+        job_id=upload.job_id,
+        filename=filename,
+        status="processing",
+        conversation_id=upload.conversation_id,
+        messages_added=upload.messages_added,
+    )
+    if not upload.done or upload.future is None:
+        return response
+
+    if upload.future.cancelled():
+        response.status = "failed"
+        response.error = "Ingestion was cancelled"
+    elif upload.future.exception() is not None:
+        response.status = "failed"
+        response.error = str(upload.future.exception())
+    else:
+        outcome = upload.future.result()
+        response.status = "success" if outcome.success else "failed"
+        response.error = outcome.error_message
+        response.conversation_id = outcome.conversation_id or response.conversation_id
+        response.messages_added = outcome.messages_added
+    return response
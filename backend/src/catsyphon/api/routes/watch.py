@@ -30,7 +30,7 @@ router = APIRouter()
 
 
 @router.get("/watch/suggested-paths", response_model=list[SuggestedPath])
-async def get_suggested_paths(
+def get_suggested_paths(
     auth: AuthContext = Depends(get_auth_context),
 ) -> list[SuggestedPath]:
     """
@@ -76,7 +76,7 @@ async def get_suggested_paths(
 
 
 @router.post("/watch/validate-path", response_model=PathValidationResponse)
-async def validate_path(
+def validate_path(
     request: PathValidationRequest,
     auth: AuthContext = Depends(get_auth_context),
 ) -> PathValidationResponse:
@@ -112,7 +112,7 @@ async def validate_path(
 
 
 @router.get("/watch/configs", response_model=list[WatchConfigurationResponse])
-async def list_watch_configs(
+def list_watch_configs(
     auth: AuthContext = Depends(get_auth_context),
     active_only: bool = False,
     session: Session = Depends(get_db),
@@ -140,7 +140,7 @@ async def list_watch_configs(
 
 
 @router.get("/watch/configs/{config_id}", response_model=WatchConfigurationResponse)
-async def get_watch_config(
+def get_watch_config(
     config_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -173,7 +173,7 @@ async def get_watch_config(
 @router.post(
     "/watch/configs", response_model=WatchConfigurationResponse, status_code=201
 )
-async def create_watch_config(
+def create_watch_config(
     config: WatchConfigurationCreate,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -228,7 +228,7 @@ async def create_watch_config(
 
 
 @router.put("/watch/configs/{config_id}", response_model=WatchConfigurationResponse)
-async def update_watch_config(
+def update_watch_config(
     config_id: UUID,
     config: WatchConfigurationUpdate,
     auth: AuthContext = Depends(get_auth_context),
@@ -271,7 +271,7 @@ async def update_watch_config(
 
 
 @router.delete("/watch/configs/{config_id}", status_code=204)
-async def delete_watch_config(
+def delete_watch_config(
     config_id: UUID,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -308,7 +308,7 @@ async def delete_watch_config(
 @router.post(
     "/watch/configs/{config_id}/start", response_model=WatchConfigurationResponse
 )
-async def start_watching(
+def start_watching(
     config_id: UUID,
     request: Request,
     auth: AuthContext = Depends(get_auth_context),
@@ -331,8 +331,6 @@ async def start_watching(
 
     Requires X-Workspace-Id header.
     """
-    import asyncio
-
     repo = WatchConfigurationRepository(session)
     workspace_id = auth.workspace_id
 
@@ -351,15 +349,17 @@ async def start_watching(
     # Mark as active in database
     updated_config = repo.activate(config_id)
     session.commit()
+    # Looked up above, so activation found it
+    assert updated_config is not None
 
     # Get DaemonManager from app state
     daemon_manager: DaemonManager = request.app.state.daemon_manager
 
-    # Start the daemon in a thread pool to avoid blocking the event loop
+    # Sync handlers run in the threadpool, so the event loop stays free.
     # This is important because start_daemon makes HTTP requests that need
     # to be handled by the same uvicorn instance
     try:
-        await asyncio.to_thread(daemon_manager.start_daemon, updated_config)
+        daemon_manager.start_daemon(updated_config)
         logger.info(f"Started daemon for config {config_id}")
     except Exception as e:
         logger.error(
@@ -384,7 +384,7 @@ async def start_watching(
 @router.post(
     "/watch/configs/{config_id}/stop", response_model=WatchConfigurationResponse
 )
-async def stop_watching(
+def stop_watching(
     config_id: UUID,
     request: Request,
     auth: AuthContext = Depends(get_auth_context),
@@ -407,8 +407,6 @@ async def stop_watching(
 
     Requires X-Workspace-Id header.
     """
-    import asyncio
-
     repo = WatchConfigurationRepository(session)
     workspace_id = auth.workspace_id
 
@@ -427,9 +425,9 @@ async def stop_watching(
     # Get DaemonManager from app state
     daemon_manager: DaemonManager = request.app.state.daemon_manager
 
-    # Stop the daemon in a thread pool to avoid blocking the event loop
+    # Stop the daemon (runs in the threadpool like the rest of this handler)
     try:
-        await asyncio.to_thread(daemon_manager.stop_daemon, config_id, True)
+        daemon_manager.stop_daemon(config_id, True)
         logger.info(f"Stopped daemon for config {config_id}")
     except Exception as e:
         logger.error(
@@ -445,7 +443,7 @@ async def stop_watching(
 
 
 @router.get("/watch/status")
-async def get_watch_status(
+def get_watch_status(
     request: Request,
     auth: AuthContext = Depends(get_auth_context),
     session: Session = Depends(get_db),
@@ -483,7 +481,7 @@ async def get_watch_status(
 
 
 @router.get("/watch/daemon/status")
-async def get_all_daemon_status(
+def get_all_daemon_status(
     request: Request,
 ) -> dict:
     """
@@ -497,7 +495,7 @@ async def get_all_daemon_status(
 
 
 @router.get("/watch/daemon/status/{config_id}")
-async def get_daemon_status(
+def get_daemon_status(
     config_id: UUID,
     request: Request,
 ) -> dict:
@@ -462,10 +462,15 @@ class ConversationListResponse(BaseModel):
     """Response schema for paginated conversation list."""
 
     items: list[ConversationListItem]
-    total: int
+    total: Optional[int] = Field(
+        None, description="Matching conversations (approximate or omitted per count)"
+    )
     page: int
     page_size: int
-    pages: int
+    pages: Optional[int] = None
+    next_cursor: Optional[str] = Field(
+        None, description="Cursor for the next page when paginating by cursor"
+    )
 
 
 # ===== Stats Schemas =====
@@ -574,6 +579,21 @@ class UploadResponse(BaseModel):
     results: list[UploadResult]
 
 
+class StreamingUploadResponse(BaseModel):
+    """Response schema for a streaming upload.
+
+    Ingestion continues after the response; poll
+    ``GET /ingestion/jobs/{job_id}`` for progress and the final status.
+    """
+
+    job_id: UUID
+    filename: str
+    status: str  # "processing", "success", or "failed"
+    conversation_id: Optional[UUID] = None
+    messages_added: int = 0
+    error: Optional[str] = None
+
+
 # ===== Watch Configuration Schemas =====
 
 
@@ -1210,6 +1230,34 @@ class PlanDetailResponse(PlanResponse):
     )
 
 
+# ===== Search Schemas =====
+
+
+class MessageSearchHit(BaseModel):
+    """A message matching a full-text search."""
+
+    message_id: UUID
+    conversation_id: UUID
+    project_id: Optional[UUID] = None
+    role: Optional[str] = None
+    timestamp: datetime
+    rank: float = Field(..., description="Relevance score (higher is better)")
+    snippet: str = Field(
+        ...,
+        description="Matching excerpt with matched terms wrapped in <mark> tags "
+        "(message text is not HTML-escaped)",
+    )
+
+
+class MessageSearchResponse(BaseModel):
+    """A page of search hits."""
+
+    items: list[MessageSearchHit]
+    next_cursor: Optional[str] = Field(
+        None, description="Pass as cursor to fetch the next page; null on the last"
+    )
+
+
 class HealthReportResponse(BaseModel):
     """Response schema for project health report."""
 
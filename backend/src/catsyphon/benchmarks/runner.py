@@ -7,18 +7,39 @@ for the web UI to display.
 
 from __future__ import annotations
 
+import asyncio
+import difflib
 import json
+import random
+import re
+import statistics
+import tempfile
+import threading
 import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from datetime import UTC, datetime
+from datetime import UTC, datetime, timedelta
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Iterator
 from uuid import uuid4
 
+import httpx
+from fastapi import FastAPI
+from sqlalchemy import Engine, create_engine
+from sqlalchemy.dialects.sqlite.base import SQLiteTypeCompiler
+from sqlalchemy.orm import Session, sessionmaker
+
+from catsyphon.collector_client import CollectorClient, CollectorConfig
 from catsyphon.config import settings
+from catsyphon.db.connection import get_db
+from catsyphon.db.repositories.collector_session import CollectorSessionRepository
+from catsyphon.models.db import Base, Organization, Workspace
 from catsyphon.parsers.claude_code import ClaudeCodeParser
 from catsyphon.parsers.codex import CodexParser
 from catsyphon.parsers.registry import ParserRegistry
+from catsyphon.parsers.utils import ORJSON_AVAILABLE, JsonlReader, loads_json
+from catsyphon.utils.line_diff import diff_line_counts
 
 
 @dataclass
@@ -59,6 +80,288 @@ def _fixture_paths() -> list[Path]:
     return [path for path in paths if path.exists()]
 
 
+class _BenchmarkTypeCompiler(SQLiteTypeCompiler):
+    def visit_JSONB(self, type_: Any, **kw: Any) -> str:  # noqa: N802
+        return "JSON"
+
+
+def _create_benchmark_schema(engine: Engine) -> None:
+    """Create the schema in a throwaway SQLite DB.
+
+    JSONB columns are rendered as JSON through this engine's dialect only, so
+    DDL compiled elsewhere in the process is unaffected.
+    """
+    engine.dialect.type_compiler_instance = _BenchmarkTypeCompiler(engine.dialect)
+    Base.metadata.create_all(engine)
+
+
+def _collector_events(
+    count: int,
+) -> list[tuple[str, datetime, datetime, dict[str, Any], str]]:
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    events = []
+    for i in range(count):
+        emitted_at = base + timedelta(milliseconds=i)
+        if i % 2:
+            event_type = "tool_call"
+            data: dict[str, Any] = {
+                "tool_name": "Read",
+                "tool_use_id": f"tool-{i}",
+                "parameters": {"file_path": f"/src/module_{i % 50}.py"},
+            }
+        else:
+            event_type = "message"
+            data = {
+                "author_role": "assistant",
+                "message_type": "response",
+                "content": f"Benchmark message {i} " + "x" * 200,
+                "model": "claude-sonnet-4",
+                "token_usage": {"input_tokens": 120, "output_tokens": 80},
+            }
+        events.append((event_type, emitted_at, emitted_at, data, f"{i:032x}"))
+    return events
+
+
+def benchmark_collector_message_insert() -> BenchmarkResult:
+    """Compare per-event ORM inserts with the bulk collector insert path."""
+    event_count = 2000
+    events = _collector_events(event_count)
+    engine = create_engine("sqlite:///:memory:")
+    try:
+        _create_benchmark_schema(engine)
+        with Session(engine) as session:
+            organization = Organization(name="Benchmark", slug="benchmark")
+            session.add(organization)
+            session.flush()
+            workspace = Workspace(
+                organization_id=organization.id, name="Benchmark", slug="benchmark"
+            )
+            session.add(workspace)
+            session.flush()
+            repo = CollectorSessionRepository(session)
+
+            per_event_conversation, _ = repo.get_or_create_session(
+                collector_session_id="benchmark-per-event",
+                workspace_id=workspace.id,
+            )
+            start = time.perf_counter()
+            for event_type, emitted_at, observed_at, data, event_hash in events:
+                repo.add_message(
+                    conversation=per_event_conversation,
+                    event_type=event_type,
+                    emitted_at=emitted_at,
+                    observed_at=observed_at,
+                    data=data,
+                    event_hash=event_hash,
+                )
+            session.flush()
+            per_event_seconds = time.perf_counter() - start
+
+            bulk_conversation, _ = repo.get_or_create_session(
+                collector_session_id="benchmark-bulk",
+                workspace_id=workspace.id,
+            )
+            start = time.perf_counter()
+            inserted = repo.add_messages_bulk(bulk_conversation, events)
+            bulk_seconds = time.perf_counter() - start
+            session.rollback()
+    except Exception as exc:  # pragma: no cover - defensive
+        return BenchmarkResult(
+            name="collector_message_insert",
+            status="failed",
+            data={"events": event_count},
+            error=str(exc),
+        )
+    finally:
+        engine.dispose()
+
+    return BenchmarkResult(
+        name="collector_message_insert",
+        status="ok",
+        data={
+            "events": event_count,
+            "database": "sqlite-memory",
+            "per_event_seconds": per_event_seconds,
+            "bulk_seconds": bulk_seconds,
+            "bulk_inserted": inserted,
+            "per_event_events_per_second": (
+                event_count / per_event_seconds if per_event_seconds > 0 else None
+            ),
+            "bulk_events_per_second": (
+                inserted / bulk_seconds if bulk_seconds > 0 else None
+            ),
+            "speedup": (per_event_seconds / bulk_seconds if bulk_seconds > 0 else None),
+        },
+    )
+
+
+def _latency_summary(samples: list[float]) -> dict[str, Any]:
+    if not samples:
+        return {"requests": 0}
+    ordered = sorted(samples)
+    p95_index = max(0, int(round(0.95 * len(ordered))) - 1)
+    return {
+        "requests": len(ordered),
+        "p50_ms": statistics.median(ordered) * 1000,
+        "p95_ms": ordered[p95_index] * 1000,
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def benchmark_api_mixed_load() -> BenchmarkResult:
+    """Concurrent request latency for a mixed analytics and ingest workload.
+
+    Drives the stats, conversations and upload routers in-process over ASGI
+    against a throwaway SQLite database, while a trivial async probe route
+    measures how responsive the event loop stays under that load.
+    """
+    # Imported lazily: the benchmarks route module imports this runner
+    from catsyphon.api.routes import conversations, stats, upload
+
+    fixtures = _fixture_paths()
+    if not fixtures:
+        return BenchmarkResult(
+            name="api_mixed_load",
+            status="skipped",
+            data={"reason": "No parser fixtures found"},
+        )
+
+    analytics_workers = 4
+    analytics_requests = 10
+    ingest_workers = 2
+    ingest_requests = 5
+    fixture_text = fixtures[0].read_text(encoding="utf-8")
+    session_match = re.search(r'"sessionId":\s*"([^"]+)"', fixture_text)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{tmp_dir}/benchmark.db",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        try:
+            _create_benchmark_schema(engine)
+            session_factory = sessionmaker(bind=engine)
+            with session_factory() as session:
+                organization = Organization(name="Benchmark", slug="benchmark")
+                session.add(organization)
+                session.flush()
+                workspace = Workspace(
+                    organization_id=organization.id,
+                    name="Benchmark",
+                    slug="benchmark",
+                )
+                session.add(workspace)
+                session.commit()
+                workspace_id = str(workspace.id)
+
+            def benchmark_db() -> Iterator[Session]:
+                session = session_factory()
+                try:
+                    yield session
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+                finally:
+                    session.close()
+
+            # Private app so the benchmark never touches the served database
+            app = FastAPI()
+            app.include_router(conversations.router, prefix="/conversations")
+            app.include_router(stats.router, prefix="/stats")
+            app.include_router(upload.router, prefix="/upload")
+            app.dependency_overrides[get_db] = benchmark_db
+
+            @app.get("/probe")
+            async def probe() -> dict[str, str]:
+                return {"status": "ok"}
+
+            latencies: dict[str, list[float]] = {
+                "analytics": [],
+                "ingest": [],
+                "probe": [],
+                "loop_lag": [],
+            }
+
+            async def timed(kind: str, request: Any) -> None:
+                start = time.perf_counter()
+                response = await request
+                latencies[kind].append(time.perf_counter() - start)
+                response.raise_for_status()
+
+            async def analytics_worker(client: httpx.AsyncClient) -> None:
+                for i in range(analytics_requests):
+                    path = "/stats/overview" if i % 2 == 0 else "/conversations"
+                    await timed("analytics", client.get(path))
+
+            async def ingest_worker(client: httpx.AsyncClient, worker: int) -> None:
+                for i in range(ingest_requests):
+                    content = fixture_text
+                    if session_match:
+                        content = content.replace(
+                            session_match.group(1), f"benchmark-{worker}-{i}"
+                        )
+                    files = {"files": (f"bench-{worker}-{i}.jsonl", content)}
+                    await timed("ingest", client.post("/upload/", files=files))
+
+            async def probe_worker(
+                client: httpx.AsyncClient, done: asyncio.Event
+            ) -> None:
+                while not done.is_set():
+                    await timed("probe", client.get("/probe"))
+                    # Oversleep is time the loop spent blocked by a handler
+                    start = time.perf_counter()
+                    await asyncio.sleep(0.01)
+                    latencies["loop_lag"].append(time.perf_counter() - start - 0.01)
+
+            async def drive() -> float:
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(
+                    transport=transport,
+                    base_url="http://benchmark",
+                    headers={"X-Workspace-Id": workspace_id},
+                    timeout=120,
+                ) as client:
+                    done = asyncio.Event()
+                    prober = asyncio.create_task(probe_worker(client, done))
+                    start = time.perf_counter()
+                    await asyncio.gather(
+                        *(analytics_worker(client) for _ in range(analytics_workers)),
+                        *(ingest_worker(client, w) for w in range(ingest_workers)),
+                    )
+                    elapsed = time.perf_counter() - start
+                    done.set()
+                    await prober
+                    return elapsed
+
+            wall_seconds = asyncio.run(drive())
+        except Exception as exc:  # pragma: no cover - defensive
+            return BenchmarkResult(
+                name="api_mixed_load",
+                status="failed",
+                data={"fixture": str(fixtures[0])},
+                error=str(exc),
+            )
+        finally:
+            engine.dispose()
+
+    return BenchmarkResult(
+        name="api_mixed_load",
+        status="ok",
+        data={
+            "database": "sqlite-file",
+            "fixture": fixtures[0].name,
+            "analytics_concurrency": analytics_workers,
+            "ingest_concurrency": ingest_workers,
+            "wall_seconds": wall_seconds,
+            "analytics": _latency_summary(latencies["analytics"]),
+            "ingest": _latency_summary(latencies["ingest"]),
+            "event_loop_probe": _latency_summary(latencies["probe"]),
+            "event_loop_lag": _latency_summary(latencies["loop_lag"]),
+        },
+    )
+
+
 def benchmark_parser_registry_overhead() -> BenchmarkResult:
     fixtures = _fixture_paths()
     if not fixtures:
@@ -125,22 +428,585 @@ def benchmark_parser_registry_overhead() -> BenchmarkResult:
     )
 
 
+def _synthetic_session_jsonl(session_id: str, pairs: int) -> bytes:
+    """Claude Code session log with ``pairs`` user/assistant exchanges."""
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    padding = "x" * 400
+    lines = []
+    parent = "00000000-0000-0000-0000-000000000000"
+    for i in range(pairs * 2):
+        uuid = f"{session_id}-{i:06d}"
+        common = {
+            "parentUuid": parent,
+            "isSidechain": False,
+            "userType": "external",
+            "cwd": "/benchmark/project",
+            "sessionId": session_id,
+            "version": "2.0.17",
+            "gitBranch": "main",
+            "uuid": uuid,
+            "timestamp": (base + timedelta(seconds=i)).isoformat(),
+        }
+        if i % 2 == 0:
+            record = {
+                **common,
+                "type": "user",
+                "message": {"role": "user", "content": f"Question {i} {padding}"},
+            }
+        else:
+            record = {
+                **common,
+                "type": "assistant",
+                "message": {
+                    "model": "claude-sonnet-4",
+                    "id": f"msg_{i}",
+                    "type": "message",
+                    "role": "assistant",
+                    "content": [{"type": "text", "text": f"Answer {i} {padding}"}],
+                    "usage": {"input_tokens": 120, "output_tokens": 80},
+                },
+            }
+        lines.append(json.dumps(record))
+        parent = uuid
+    return ("\n".join(lines) + "\n").encode()
+
+
 def benchmark_upload_streaming_vs_batch() -> BenchmarkResult:
+    """Compare the multipart upload with the streaming upload endpoint.
+
+    Uploads the same synthetic session through ``POST /upload/`` and
+    ``POST /upload/stream`` in-process over ASGI against a throwaway SQLite
+    database, recording wall time and peak Python heap for each.
+    """
+    # Imported lazily: the benchmarks route module imports this runner
+    from catsyphon.api.routes import upload
+
+    pairs = 2500
+    chunk_size = 64 * 1024
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        engine = create_engine(
+            f"sqlite:///{tmp_dir}/benchmark.db",
+            connect_args={"check_same_thread": False, "timeout": 30},
+        )
+        try:
+            _create_benchmark_schema(engine)
+            session_factory = sessionmaker(bind=engine)
+            with session_factory() as session:
+                organization = Organization(name="Benchmark", slug="benchmark")
+                session.add(organization)
+                session.flush()
+                workspace = Workspace(
+                    organization_id=organization.id,
+                    name="Benchmark",
+                    slug="benchmark",
+                )
+                session.add(workspace)
+                session.commit()
+                workspace_id = str(workspace.id)
+
+            def benchmark_db() -> Iterator[Session]:
+                session = session_factory()
+                try:
+                    yield session
+                    session.commit()
+                except Exception:
+                    session.rollback()
+                    raise
+                finally:
+                    session.close()
+
+            app = FastAPI()
+            app.include_router(upload.router, prefix="/upload")
+            app.dependency_overrides[get_db] = benchmark_db
+
+            batch_body = _synthetic_session_jsonl("benchmark-batch", pairs)
+            stream_body = _synthetic_session_jsonl("benchmark-stream", pairs)
+
+            async def body_chunks() -> Any:
+                for i in range(0, len(stream_body), chunk_size):
+                    yield stream_body[i : i + chunk_size]
+
+            async def measure(send: Callable[[], Any]) -> dict[str, Any]:
+                tracemalloc.start()
+                start = time.perf_counter()
+                response = await send()
+                elapsed = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+                response.raise_for_status()
+                return {
+                    "seconds": elapsed,
+                    "peak_heap_mb": peak / (1024 * 1024),
+                    "response": response.json(),
+                }
+
+            async def drive() -> tuple[dict[str, Any], dict[str, Any]]:
+                transport = httpx.ASGITransport(app=app)
+                async with httpx.AsyncClient(
+                    transport=transport,
+                    base_url="http://benchmark",
+                    headers={"X-Workspace-Id": workspace_id},
+                    timeout=600,
+                ) as client:
+                    batch = await measure(
+                        lambda: client.post(
+                            "/upload/",
+                            files={"files": ("batch.jsonl", batch_body)},
+                        )
+                    )
+                    streaming = await measure(
+                        lambda: client.post(
+                            "/upload/stream",
+                            params={"filename": "stream.jsonl", "wait": "true"},
+                            content=body_chunks(),
+                        )
+                    )
+                    return batch, streaming
+
+            batch, streaming = asyncio.run(drive())
+        except Exception as exc:  # pragma: no cover - defensive
+            return BenchmarkResult(
+                name="upload_streaming_vs_batch",
+                status="failed",
+                data={"messages": pairs * 2},
+                error=str(exc),
+            )
+        finally:
+            engine.dispose()
+
+    if streaming["response"].get("status") != "success":
+        return BenchmarkResult(
+            name="upload_streaming_vs_batch",
+            status="failed",
+            data={"messages": pairs * 2, "streaming": streaming["response"]},
+            error=streaming["response"].get("error"),
+        )
+
     return BenchmarkResult(
         name="upload_streaming_vs_batch",
-        status="skipped",
+        status="ok",
         data={
-            "reason": "Requires streaming upload endpoint and a running server",
+            "database": "sqlite-file",
+            "messages": pairs * 2,
+            "file_mb": len(stream_body) / (1024 * 1024),
+            "stream_chunk_bytes": chunk_size,
+            "batch_seconds": batch["seconds"],
+            "streaming_seconds": streaming["seconds"],
+            "batch_peak_heap_mb": batch["peak_heap_mb"],
+            "streaming_peak_heap_mb": streaming["peak_heap_mb"],
+            "peak_heap_ratio": (
+                batch["peak_heap_mb"] / streaming["peak_heap_mb"]
+                if streaming["peak_heap_mb"] > 0
+                else None
+            ),
         },
     )
 
 
 def benchmark_daemon_throughput() -> BenchmarkResult:
+    """Collector client send throughput: legacy sequential vs pipelined.
+
+    Several sessions are pushed from a small thread pool, as the watch
+    daemon's startup scan does, to a mock Collector Events API that charges
+    a fixed round trip plus a per-event cost for each request.
+    """
+    sessions = 8
+    events_per_session = 1000
+    workers = 4
+    round_trip_seconds = 0.005
+    per_event_seconds = 0.00005
+
+    def reply(request: httpx.Request) -> tuple[float, httpx.Response]:
+        count = len(json.loads(request.content)["events"])
+        response = httpx.Response(
+            202, json={"accepted": count, "conversation_id": str(uuid4())}
+        )
+        return round_trip_seconds + per_event_seconds * count, response
+
+    def sync_handler(request: httpx.Request) -> httpx.Response:
+        delay, response = reply(request)
+        time.sleep(delay)
+        return response
+
+    async def async_handler(request: httpx.Request) -> httpx.Response:
+        delay, response = reply(request)
+        await asyncio.sleep(delay)
+        return response
+
+    base = datetime(2026, 1, 1, tzinfo=UTC)
+    workload = {
+        f"benchmark-session-{s}": [
+            {
+                "type": "message",
+                "emitted_at": (base + timedelta(milliseconds=i)).isoformat(),
+                "observed_at": base.isoformat(),
+                "event_hash": f"{s:08x}{i:024x}",
+                "data": {
+                    "author_role": "assistant",
+                    "message_type": "response",
+                    "content": f"Benchmark message {i} " + "x" * 400,
+                },
+            }
+            for i in range(events_per_session)
+        ]
+        for s in range(sessions)
+    }
+
+    def run(config: CollectorConfig) -> dict[str, Any]:
+        requests = 0
+        lock = threading.Lock()
+
+        def counting(handler: Callable[[httpx.Request], Any]) -> Any:
+            def wrapped(request: httpx.Request) -> Any:
+                nonlocal requests
+                with lock:
+                    requests += 1
+                return handler(request)
+
+            return wrapped
+
+        client = CollectorClient(
+            config,
+            transport=httpx.MockTransport(counting(sync_handler)),
+            async_transport=httpx.MockTransport(counting(async_handler)),
+        )
+        try:
+            start = time.perf_counter()
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                accepted = sum(
+                    result["accepted"]
+                    for result in pool.map(
+                        lambda item: client._send_events(*item), workload.items()
+                    )
+                )
+            elapsed = time.perf_counter() - start
+        finally:
+            client.close()
+        return {
+            "seconds": elapsed,
+            "requests": requests,
+            "accepted": accepted,
+            "events_per_second": accepted / elapsed if elapsed > 0 else None,
+        }
+
+    common: dict[str, Any] = {
+        "server_url": "http://benchmark",
+        "api_key": "benchmark",
+        "collector_id": "benchmark",
+    }
+    try:
+        sequential = run(
+            CollectorConfig(
+                **common, batch_size=20, max_batch_bytes=2**31, pipelined=False
+            )
+        )
+        pipelined = run(CollectorConfig(**common, pipelined=True))
+    except Exception as exc:  # pragma: no cover - defensive
+        return BenchmarkResult(
+            name="daemon_throughput",
+            status="failed",
+            data={"sessions": sessions, "events_per_session": events_per_session},
+            error=str(exc),
+        )
+
     return BenchmarkResult(
         name="daemon_throughput",
-        status="skipped",
+        status="ok",
+        data={
+            "sessions": sessions,
+            "events_per_session": events_per_session,
+            "workers": workers,
+            "mock_round_trip_ms": round_trip_seconds * 1000,
+            "mock_per_event_ms": per_event_seconds * 1000,
+            "sequential": sequential,
+            "pipelined": pipelined,
+            "speedup": (
+                sequential["seconds"] / pipelined["seconds"]
+                if pipelined["seconds"] > 0
+                else None
+            ),
+        },
+    )
+
+
+def _fixture_edit_payloads() -> list[tuple[str, str]]:
+    """(old_string, new_string) of every Edit tool call in the fixtures."""
+    fixture_dir = _repo_root() / "backend/tests/test_parsers/fixtures"
+    payloads: list[tuple[str, str]] = []
+    for path in sorted(fixture_dir.glob("*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                content = json.loads(line).get("message", {}).get("content")
+            except (json.JSONDecodeError, AttributeError):
+                continue
+            for item in content if isinstance(content, list) else []:
+                if isinstance(item, dict) and item.get("name") == "Edit":
+                    tool_input = item.get("input") or {}
+                    payloads.append(
+                        (
+                            tool_input.get("old_string") or "",
+                            tool_input.get("new_string") or "",
+                        )
+                    )
+    return payloads
+
+
+def _source_edit_payloads(count: int) -> list[tuple[str, str]]:
+    """Large Edit-style rewrites of blocks of CatSyphon's own source files."""
+    rng = random.Random(0)
+    sources = sorted((_repo_root() / "backend/src/catsyphon").rglob("*.py"))
+    payloads: list[tuple[str, str]] = []
+    for path in sources:
+        lines = path.read_text(encoding="utf-8").splitlines()
+        if len(lines) < 400:
+            continue
+        start = rng.randrange(len(lines) - 300)
+        old = lines[start : start + rng.choice((100, 300, 600))]
+        new = list(old)
+        for _ in range(rng.randint(2, 12)):
+            i = rng.randrange(len(new))
+            op = rng.random()
+            if op < 0.4:
+                new[i] = new[i].replace("self", "this") + "  # edited"
+            elif op < 0.7:
+                new[i:i] = [
+                    f"    inserted_{i}_{n} = {n}" for n in range(rng.randint(1, 8))
+                ]
+            else:
+                del new[i : i + rng.randint(1, 6)]
+        payloads.append(("\n".join(old), "\n".join(new)))
+        if len(payloads) >= count:
+            break
+    return payloads
+
+
+def _ndiff_counts(old_text: str, new_text: str) -> tuple[int, int]:
+    """Previous Edit accounting: count +/- lines of difflib.ndiff."""
+    added = deleted = 0
+    for line in difflib.ndiff(old_text.splitlines(), new_text.splitlines()):
+        if line.startswith("+ "):
+            added += 1
+        elif line.startswith("- "):
+            deleted += 1
+    return added, deleted
+
+
+def benchmark_edit_line_diff() -> BenchmarkResult:
+    """Edit line counting: difflib.ndiff vs the Myers-based line diff.
+
+    Uses the Edit tool calls found in the parser fixtures plus large block
+    rewrites of CatSyphon source files, which is where ndiff's quadratic
+    intraline matching dominated parse time.
+    """
+    iterations = max(1, settings.benchmarks_iterations)
+    cases: list[dict[str, Any]] = []
+    for label, payloads in (
+        ("fixture_edits", _fixture_edit_payloads()),
+        ("large_source_edits", _source_edit_payloads(20)),
+    ):
+        if not payloads:
+            continue
+        ndiff_results = [_ndiff_counts(old, new) for old, new in payloads]
+        myers_results = [diff_line_counts(old, new) for old, new in payloads]
+        ndiff_time = _time_call(
+            lambda: [_ndiff_counts(old, new) for old, new in payloads], iterations
+        )
+        myers_time = _time_call(
+            lambda: [diff_line_counts(old, new) for old, new in payloads], iterations
+        )
+        cases.append(
+            {
+                "payloads": label,
+                "edits": len(payloads),
+                "total_lines": sum(
+                    old.count("\n") + new.count("\n") + 2 for old, new in payloads
+                ),
+                "ndiff_seconds": ndiff_time,
+                "myers_seconds": myers_time,
+                "speedup": ndiff_time / myers_time if myers_time > 0 else None,
+                "identical_counts": sum(
+                    a == b for a, b in zip(ndiff_results, myers_results)
+                ),
+                # ndiff is not minimal; it never reports fewer changed lines
+                "ndiff_extra_lines": sum(
+                    sum(a) - sum(b) for a, b in zip(ndiff_results, myers_results)
+                ),
+            }
+        )
+
+    if not cases:
+        return BenchmarkResult(
+            name="edit_line_diff",
+            status="skipped",
+            data={"reason": "No Edit payloads found"},
+        )
+    return BenchmarkResult(
+        name="edit_line_diff",
+        status="ok",
+        data={"iterations": iterations, "cases": cases},
+    )
+
+
+def benchmark_format_detection() -> BenchmarkResult:
+    """Format detection: per-parser probes vs shared sample, cache and hint.
+
+    ``per_parser_probe`` calls each parser's own ``probe()`` (every parser
+    opens and scans the file itself); ``shared_sample`` is a cold registry;
+    ``cached`` re-detects a known file and ``cached_after_append`` one that
+    has grown since; ``parser_hint`` passes the parser recorded on RawLog.
+    """
+    iterations = max(1, settings.benchmarks_iterations) * 20
+    parsers: list[CodexParser | ClaudeCodeParser] = [CodexParser(), ClaudeCodeParser()]
+
+    def fresh_registry() -> ParserRegistry:
+        registry = ParserRegistry()
+        for parser in parsers:
+            registry.register(parser)
+        return registry
+
+    def per_parser_probe(path: Path) -> None:
+        for parser in parsers:
+            if parser.probe(path).can_parse:
+                return
+
+    cases: list[dict[str, Any]] = []
+    with tempfile.TemporaryDirectory(prefix="catsyphon-bench-") as tmp:
+        files = list(_fixture_paths())
+        synthetic = Path(tmp) / "synthetic-session.jsonl"
+        synthetic.write_bytes(_synthetic_session_jsonl("bench-detect", 2000))
+        files.append(synthetic)
+
+        for path in files:
+            registry = fresh_registry()
+            if registry.find_chunked_parser(path) is None:
+                continue
+            probe_time = _time_call(lambda: per_parser_probe(path), iterations)
+            cold_time = _time_call(
+                lambda: fresh_registry().find_chunked_parser(path), iterations
+            )
+            cached_time = _time_call(
+                lambda: registry.find_chunked_parser(path), iterations
+            )
+            hinted_time = _time_call(
+                lambda: fresh_registry().find_chunked_parser(
+                    path, parser_hint="claude-code"
+                ),
+                iterations,
+            )
+            cases.append(
+                {
+                    "file": path.name,
+                    "size_bytes": path.stat().st_size,
+                    "iterations": iterations,
+                    "per_parser_probe_seconds": probe_time,
+                    "shared_sample_seconds": cold_time,
+                    "cached_seconds": cached_time,
+                    "parser_hint_seconds": hinted_time,
+                }
+            )
+
+        # Appends keep hitting the cache (validated by a head fingerprint)
+        registry = fresh_registry()
+        registry.find_chunked_parser(synthetic)
+        extra = _synthetic_session_jsonl("bench-detect", 1).splitlines(True)[0]
+
+        def append_and_detect() -> None:
+            with synthetic.open("ab") as f:
+                f.write(extra)
+            registry.find_chunked_parser(synthetic)
+
+        append_time = _time_call(append_and_detect, iterations)
+
+    if not cases:
+        return BenchmarkResult(
+            name="format_detection",
+            status="skipped",
+            data={"reason": "No detectable log files"},
+        )
+    return BenchmarkResult(
+        name="format_detection",
+        status="ok",
         data={
-            "reason": "Requires async daemon implementation for comparison",
+            "cases": cases,
+            "cached_after_append_seconds": append_time,
+        },
+    )
+
+
+def _text_readline_records(path: Path) -> int:
+    """Previous parser read loop: text mode, ``readline()`` and ``tell()``."""
+    count = 0
+    with path.open("r", encoding="utf-8") as f:
+        while True:
+            line = f.readline()
+            if not line:
+                break
+            f.tell()
+            stripped = line.strip()
+            if stripped:
+                json.loads(stripped)
+                count += 1
+    return count
+
+
+def _jsonl_reader_records(path: Path, decode: Callable[[bytes], Any]) -> int:
+    count = 0
+    with JsonlReader(path) as reader:
+        for line in reader:
+            if line.text:
+                decode(line.text)
+                count += 1
+    return count
+
+
+def benchmark_jsonl_read_throughput() -> BenchmarkResult:
+    """JSONL read throughput (MB/s): text readline vs the byte reader.
+
+    ``bytes_stdlib_json`` isolates the reader change from the decoder;
+    ``bytes_fast_json`` uses orjson when it is installed.
+    """
+    iterations = max(1, settings.benchmarks_iterations)
+    with tempfile.TemporaryDirectory(prefix="catsyphon-bench-") as tmp:
+        path = Path(tmp) / "session.jsonl"
+        path.write_bytes(_synthetic_session_jsonl("bench-read", 10_000))
+        size_mb = path.stat().st_size / (1024 * 1024)
+
+        expected = _text_readline_records(path)
+        variants: dict[str, Callable[[], int]] = {
+            "text_readline": lambda: _text_readline_records(path),
+            "bytes_stdlib_json": lambda: _jsonl_reader_records(path, json.loads),
+            "bytes_fast_json": lambda: _jsonl_reader_records(path, loads_json),
+        }
+        results: dict[str, Any] = {}
+        for name, func in variants.items():
+            if func() != expected:
+                return BenchmarkResult(
+                    name="jsonl_read_throughput",
+                    status="failed",
+                    data={"variant": name},
+                    error="Record count mismatch",
+                )
+            seconds = _time_call(func, iterations)
+            results[name] = {
+                "seconds": seconds,
+                "mb_per_second": size_mb / seconds if seconds > 0 else None,
+            }
+
+    baseline = results["text_readline"]["seconds"]
+    return BenchmarkResult(
+        name="jsonl_read_throughput",
+        status="ok",
+        data={
+            "iterations": iterations,
+            "file_mb": size_mb,
+            "records": expected,
+            "orjson_available": ORJSON_AVAILABLE,
+            "variants": results,
+            "speedup": {
+                name: baseline / r["seconds"] if r["seconds"] > 0 else None
+                for name, r in results.items()
+            },
         },
     )
 
@@ -151,8 +1017,13 @@ def run_benchmarks(run_id: str | None = None) -> dict[str, Any]:
 
     benchmarks = [
         benchmark_parser_registry_overhead(),
+        benchmark_collector_message_insert(),
+        benchmark_api_mixed_load(),
         benchmark_upload_streaming_vs_batch(),
         benchmark_daemon_throughput(),
+        benchmark_edit_line_diff(),
+        benchmark_format_detection(),
+        benchmark_jsonl_read_throughput(),
     ]
 
     completed_at = datetime.now(UTC)
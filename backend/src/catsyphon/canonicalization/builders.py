@@ -3,9 +3,13 @@
 import logging
 from typing import Optional
 
-from catsyphon.canonicalization.models import CanonicalConfig, CanonicalConversation
+from catsyphon.canonicalization.models import (
+    CanonicalConfig,
+    CanonicalConversation,
+    FileSummary,
+)
 from catsyphon.canonicalization.samplers import SampledMessage
-from catsyphon.models.db import Conversation, FileTouched
+from catsyphon.models.db import Conversation
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +36,7 @@ class PlayFormatBuilder:
         self,
         conversation: Conversation,
         sampled_messages: list[SampledMessage],
-        files_touched: list[FileTouched],
+        files_touched: list[FileSummary],
         children: Optional[list[CanonicalConversation]] = None,
     ) -> str:
         """Build play format narrative.
@@ -96,7 +100,7 @@ class PlayFormatBuilder:
         return "\n".join(lines)
 
     def _build_header(
-        self, conversation: Conversation, files_touched: list[FileTouched]
+        self, conversation: Conversation, files_touched: list[FileSummary]
     ) -> str:
         """Build conversation header."""
         duration = None
@@ -340,7 +344,7 @@ class JSONBuilder:
         self,
         conversation: Conversation,
         sampled_messages: list[SampledMessage],
-        files_touched: list[FileTouched],
+        files_touched: list[FileSummary],
         children: Optional[list[CanonicalConversation]] = None,
     ) -> dict:
         """Build JSON representation.
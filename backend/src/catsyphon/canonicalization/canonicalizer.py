@@ -2,22 +2,32 @@
 
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from sqlalchemy import inspect, select
+from sqlalchemy.orm import object_session
 
 from catsyphon.canonicalization.builders import JSONBuilder, PlayFormatBuilder
 from catsyphon.canonicalization.models import (
     CanonicalConfig,
     CanonicalConversation,
     CanonicalType,
+    FileSummary,
 )
 from catsyphon.canonicalization.samplers import (
     ChronologicalSampler,
     EpochSampler,
+    MessageSummary,
+    SampledMessage,
+    SamplerState,
     SemanticSampler,
 )
-from catsyphon.canonicalization.tokens import BudgetAllocator, TokenCounter
+from catsyphon.canonicalization.tokens import BudgetAllocator, get_token_counter
 from catsyphon.canonicalization.version import CANONICAL_VERSION
-from catsyphon.models.db import Conversation
+from catsyphon.models.db import Conversation, FileTouched
+
+if TYPE_CHECKING:
+    from catsyphon.db.repositories.message import MessageRepository
 
 logger = logging.getLogger(__name__)
 
@@ -53,8 +63,9 @@ class Canonicalizer:
         self.sampling_strategy = sampling_strategy
         self.model = model
 
-        # Initialize components
-        self.token_counter = TokenCounter(model=model)
+        # Initialize components (the counter and its encoding are shared
+        # process-wide, so child canonicalizers don't reload them)
+        self.token_counter = get_token_counter(model)
         self.budget_allocator = BudgetAllocator(self.config.token_budget)
 
         # Initialize sampler
@@ -83,12 +94,16 @@ class Canonicalizer:
         self,
         conversation: Conversation,
         children: Optional[list[Conversation]] = None,
+        sampler_state: Optional[dict[str, Any]] = None,
     ) -> CanonicalConversation:
         """Canonicalize a conversation into narrative form.
 
         Args:
             conversation: Main conversation from database
             children: Child conversations (agents, MCP, etc.)
+            sampler_state: Sampler state of an earlier canonical of this
+                conversation; if it still applies, only messages appended
+                since are sampled
 
         Returns:
             CanonicalConversation with narrative and metadata
@@ -100,11 +115,7 @@ class Canonicalizer:
 
         # Sample messages for main conversation
         main_budget = self.budget_allocator.remaining("main_messages")
-        sampled_messages = self.sampler.sample(
-            messages=list(conversation.messages),
-            epochs=list(conversation.epochs),
-            token_budget=main_budget,
-        )
+        sampled_messages, state = self._sample(conversation, main_budget, sampler_state)
 
         # Canonicalize children (if included)
         canonical_children: list[CanonicalConversation] = []
@@ -139,10 +150,11 @@ class Canonicalizer:
                 )
 
         # Build narrative
+        touched = self._files_touched(conversation)
         narrative = self.play_builder.build(
             conversation=conversation,
             sampled_messages=sampled_messages,
-            files_touched=list(conversation.files_touched),
+            files_touched=touched,
             children=canonical_children,
         )
 
@@ -151,7 +163,7 @@ class Canonicalizer:
 
         # Extract structured metadata
         tools_used = self._extract_tools_used(sampled_messages)
-        files_touched = [f.file_path for f in conversation.files_touched]
+        files_touched = [f.file_path for f in touched]
         has_errors = self._detect_errors(sampled_messages)
         code_changes_summary = self._summarize_code_changes(sampled_messages)
 
@@ -181,7 +193,7 @@ class Canonicalizer:
             duration_seconds=duration_seconds,
             message_count=conversation.message_count,
             epoch_count=conversation.epoch_count,
-            files_count=len(conversation.files_touched),
+            files_count=len(touched),
             tool_calls_count=tool_calls_count,
             narrative=narrative,
             token_count=token_count,
@@ -199,6 +211,7 @@ class Canonicalizer:
             config=self.config,
             canonical_version=CANONICAL_VERSION,
             generated_at=datetime.now(),
+            sampler_state=state.to_dict() if state else None,
         )
 
         logger.info(
@@ -230,6 +243,128 @@ class Canonicalizer:
         """
         return canonical.to_dict()
 
+    def _sample(
+        self,
+        conversation: Conversation,
+        token_budget: int,
+        sampler_state: Optional[dict[str, Any]] = None,
+    ) -> tuple[list[SampledMessage], Optional[SamplerState]]:
+        """Sample a conversation's messages within the token budget.
+
+        Semantic sampling of a conversation whose messages are not loaded
+        streams lightweight summaries from the database and fetches only the
+        sampled messages, so memory does not grow with session length. Given
+        the state of an earlier streamed sample, only messages appended
+        since are scanned. Otherwise the loaded messages are sampled in
+        memory.
+
+        Args:
+            conversation: Conversation to sample
+            token_budget: Maximum tokens for its messages
+            sampler_state: Stored SamplerState of an earlier canonical
+
+        Returns:
+            Sampled messages in sequence order, and the state to extend them
+            from later (None when sampled in memory)
+        """
+        session = object_session(conversation)
+        if (
+            session is None
+            or not isinstance(self.sampler, SemanticSampler)
+            or "messages" not in inspect(conversation).unloaded
+        ):
+            sampled = self.sampler.sample(
+                messages=list(conversation.messages),
+                epochs=list(conversation.epochs),
+                token_budget=token_budget,
+            )
+            return sampled, None
+
+        # Imported here: the repositories package imports this module
+        from catsyphon.db.repositories.message import MessageRepository
+
+        repo = MessageRepository(session)
+
+        if sampler_state is not None:
+            extended = self._extend(conversation, repo, token_budget, sampler_state)
+            if extended is not None:
+                return extended
+            logger.info(
+                f"Conversation {conversation.id} was rewritten since its last "
+                f"canonical; sampling from scratch"
+            )
+
+        epoch_bounds = repo.epoch_message_bounds(conversation.id)
+        summaries = (
+            MessageSummary(**row._mapping)
+            for row in repo.iter_sampling_summaries(
+                conversation.id, SemanticSampler.ERROR_PATTERNS
+            )
+        )
+        return self.sampler.sample_stream(
+            summaries=summaries,
+            epoch_bounds={
+                epoch_id: (first, last)
+                for epoch_id, (first, last, _) in epoch_bounds.items()
+            },
+            message_count=sum(count for _, _, count in epoch_bounds.values()),
+            token_budget=token_budget,
+            load_messages=repo.get_for_rendering,
+        )
+
+    def _extend(
+        self,
+        conversation: Conversation,
+        repo: "MessageRepository",
+        token_budget: int,
+        sampler_state: dict[str, Any],
+    ) -> Optional[tuple[list[SampledMessage], SamplerState]]:
+        """Extend a stored sample with the messages appended after it.
+
+        Returns:
+            Sampled messages and the new state, or None when the stored state
+            cannot be extended (budget changed, state stored in an older
+            format, or messages at or before the watermark were added,
+            removed or replaced)
+        """
+        try:
+            state = SamplerState.from_dict(sampler_state)
+        except (KeyError, TypeError, ValueError):
+            return None
+        if state.token_budget != token_budget:
+            return None
+        if state.watermark is not None and (
+            repo.count_through(conversation.id, state.watermark) != state.message_count
+        ):
+            return None
+
+        new_summaries = (
+            MessageSummary(**row._mapping)
+            for row in repo.iter_sampling_summaries(
+                conversation.id, SemanticSampler.ERROR_PATTERNS, after=state.watermark
+            )
+        )
+        return self.sampler.extend(state, new_summaries, repo.get_for_rendering)
+
+    def _files_touched(self, conversation: Conversation) -> list[FileSummary]:
+        """Path and change type of each file the conversation touched.
+
+        Unless the relationship is already loaded, only these two columns
+        are queried instead of materializing FileTouched objects.
+        """
+        session = object_session(conversation)
+        if session is None or "files_touched" not in inspect(conversation).unloaded:
+            return [
+                FileSummary(file_path=f.file_path, change_type=f.change_type)
+                for f in conversation.files_touched
+            ]
+        rows = session.execute(
+            select(FileTouched.file_path, FileTouched.change_type).where(
+                FileTouched.conversation_id == conversation.id
+            )
+        )
+        return [FileSummary(**row._mapping) for row in rows]
+
     def _allocate_budget(self, num_children: int) -> None:
         """Allocate token budget across components.
 
@@ -3,7 +3,7 @@
 import enum
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
+from typing import Any, Optional
 
 
 class CanonicalType(str, enum.Enum):
@@ -94,6 +94,14 @@ class CanonicalConfig:
         }
 
 
+@dataclass(slots=True)
+class FileSummary:
+    """What canonicalization needs to know about a touched file."""
+
+    file_path: str
+    change_type: Optional[str] = None
+
+
 @dataclass
 class CanonicalConversation:
     """Unified canonical representation of a conversation."""
@@ -139,6 +147,7 @@ class CanonicalConversation:
     config: Optional[CanonicalConfig] = None
     canonical_version: int = 1
     generated_at: Optional[datetime] = None
+    sampler_state: Optional[dict[str, Any]] = None  # For incremental regeneration
 
     def to_dict(self) -> dict:
         """Convert to dictionary for storage."""
@@ -1,8 +1,11 @@
 """Message sampling strategies for canonicalization."""
 
+import heapq
 import logging
-from dataclasses import dataclass
-from typing import Any
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Callable, Iterable, Optional, TypeVar
 
 from catsyphon.canonicalization.models import CanonicalConfig
 from catsyphon.canonicalization.tokens import TokenCounter
@@ -10,6 +13,8 @@ from catsyphon.models.db import Epoch, Message
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 @dataclass
 class SampledMessage:
@@ -21,6 +26,161 @@ class SampledMessage:
     estimated_tokens: int
 
 
+@dataclass(slots=True)
+class MessageSummary:
+    """What sampling needs to know about a message, without its payload.
+
+    ``content`` and ``thinking_content`` are only needed when the matching
+    token count was not stored at ingest.
+    """
+
+    id: Any
+    epoch_id: Any
+    sequence: int
+    has_error: bool
+    tool_call_count: int
+    code_change_count: int
+    content_length: int
+    content_tokens: Optional[int]
+    thinking_length: int
+    thinking_tokens: Optional[int]
+    content: Optional[str] = None
+    thinking_content: Optional[str] = None
+    timestamp: Optional[datetime] = None
+
+
+# Stream position of a message: (sequence, timestamp, id), the order
+# conversation messages are listed in
+Watermark = tuple[int, datetime, uuid.UUID]
+
+
+@dataclass
+class SamplerState:
+    """Resumable state of streamed semantic sampling.
+
+    Holds the candidates the bounded heap kept, as (stream index, estimated
+    tokens, summary), and the watermark of the last message scanned, so a
+    grown conversation can be sampled by scanning only the messages after
+    it. Positional priorities (first/last, epoch boundaries) are recomputed
+    on every resume, so candidates store scoring inputs only. Epoch bounds
+    are the ids of each epoch's first and last message: collector batches
+    can share sequence values, so a sequence does not identify a message.
+    """
+
+    token_budget: int
+    message_count: int
+    watermark: Optional[Watermark]
+    epoch_bounds: dict[Any, tuple[Any, Any]]
+    candidates: list[tuple[int, int, MessageSummary]] = field(default_factory=list)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for storage."""
+        return {
+            "token_budget": self.token_budget,
+            "message_count": self.message_count,
+            "watermark": (
+                [
+                    self.watermark[0],
+                    self.watermark[1].isoformat(),
+                    str(self.watermark[2]),
+                ]
+                if self.watermark
+                else None
+            ),
+            "epoch_bounds": {
+                str(epoch_id): [str(first), str(last)]
+                for epoch_id, (first, last) in self.epoch_bounds.items()
+            },
+            "candidates": [
+                [
+                    str(summary.id),
+                    str(summary.epoch_id),
+                    summary.sequence,
+                    index,
+                    estimated_tokens,
+                    summary.has_error,
+                    summary.tool_call_count,
+                    summary.code_change_count,
+                    summary.thinking_length,
+                ]
+                for index, estimated_tokens, summary in self.candidates
+            ],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "SamplerState":
+        """Create from dictionary."""
+        watermark = data.get("watermark")
+        return cls(
+            token_budget=data["token_budget"],
+            message_count=data["message_count"],
+            watermark=(
+                (
+                    watermark[0],
+                    datetime.fromisoformat(watermark[1]),
+                    uuid.UUID(watermark[2]),
+                )
+                if watermark
+                else None
+            ),
+            epoch_bounds={
+                uuid.UUID(epoch_id): (uuid.UUID(first), uuid.UUID(last))
+                for epoch_id, (first, last) in data["epoch_bounds"].items()
+            },
+            candidates=[
+                (
+                    index,
+                    estimated_tokens,
+                    MessageSummary(
+                        id=uuid.UUID(message_id),
+                        epoch_id=uuid.UUID(epoch_id),
+                        sequence=sequence,
+                        has_error=has_error,
+                        tool_call_count=tool_call_count,
+                        code_change_count=code_change_count,
+                        content_length=0,
+                        content_tokens=None,
+                        thinking_length=thinking_length,
+                        thinking_tokens=None,
+                    ),
+                )
+                for (
+                    message_id,
+                    epoch_id,
+                    sequence,
+                    index,
+                    estimated_tokens,
+                    has_error,
+                    tool_call_count,
+                    code_change_count,
+                    thinking_length,
+                ) in data["candidates"]
+            ],
+        )
+
+
+def _watermark(summary: MessageSummary) -> Watermark:
+    """Stream position of a summary streamed from the database."""
+    assert summary.timestamp is not None
+    return summary.sequence, summary.timestamp, summary.id
+
+
+def _fit_to_budget(
+    ranked: Iterable[tuple[int, _T]], token_budget: int
+) -> tuple[list[_T], int]:
+    """Take (tokens, item) pairs in rank order while they fit the budget.
+
+    Always takes at least 2 items.
+    """
+    chosen: list[_T] = []
+    total_tokens = 0
+    for tokens, item in ranked:
+        if total_tokens + tokens <= token_budget or len(chosen) < 2:
+            chosen.append(item)
+            total_tokens += tokens
+    return chosen, total_tokens
+
+
 class SemanticSampler:
     """Sample messages based on semantic importance.
 
@@ -41,6 +201,23 @@ class SemanticSampler:
     PRIORITY_CODE_CHANGE = 500
     PRIORITY_NORMAL = 100
 
+    # Role + timestamp structure; the least any message costs
+    MESSAGE_OVERHEAD_TOKENS = 10
+
+    # Lowercase substrings marking a message as an error
+    ERROR_PATTERNS = (
+        "error",
+        "exception",
+        "failed",
+        "failure",
+        "traceback",
+        "warning",
+        "⚠️",
+        "❌",
+        "[error]",
+        "[warning]",
+    )
+
     def __init__(self, config: CanonicalConfig, token_counter: TokenCounter):
         """Initialize sampler.
 
@@ -77,16 +254,9 @@ class SemanticSampler:
         prioritized.sort(key=lambda sm: (-sm.priority, sm.message.sequence))
 
         # Fit messages into budget
-        sampled: list[SampledMessage] = []
-        total_tokens = 0
-
-        for sm in prioritized:
-            if total_tokens + sm.estimated_tokens <= token_budget:
-                sampled.append(sm)
-                total_tokens += sm.estimated_tokens
-            elif len(sampled) < 2:  # Always include at least 2 messages
-                sampled.append(sm)
-                total_tokens += sm.estimated_tokens
+        sampled, total_tokens = _fit_to_budget(
+            ((sm.estimated_tokens, sm) for sm in prioritized), token_budget
+        )
 
         # Re-sort by sequence for chronological order
         sampled.sort(key=lambda sm: sm.message.sequence)
@@ -98,6 +268,181 @@ class SemanticSampler:
 
         return sampled
 
+    def sample_stream(
+        self,
+        summaries: Iterable[MessageSummary],
+        epoch_bounds: dict[Any, tuple[Any, Any]],
+        message_count: int,
+        token_budget: int,
+        load_messages: Callable[[list[Any]], dict[Any, Message]],
+    ) -> tuple[list[SampledMessage], SamplerState]:
+        """Sample within token budget from a stream of message summaries.
+
+        Memory is bounded by the budget rather than the conversation length:
+        a heap keeps only the best ``token_budget // MESSAGE_OVERHEAD_TOKENS
+        + 2`` candidates (more than could ever fit), and full messages are
+        loaded for the sampled ones only.
+
+        Args:
+            summaries: Message summaries in sequence order
+            epoch_bounds: Ids of the first and last message of each epoch
+            message_count: Number of summaries in the stream
+            token_budget: Maximum tokens to use
+            load_messages: Loads full messages for a list of ids, keyed by id
+
+        Returns:
+            Sampled messages with priority info, and the state to resume
+            sampling from once the conversation grows
+        """
+        watermark: Optional[Watermark] = None
+
+        def candidates() -> Iterable[tuple[int, int, MessageSummary]]:
+            nonlocal watermark
+            for index, summary in enumerate(summaries):
+                watermark = _watermark(summary)
+                yield index, self._estimate_summary_tokens(summary), summary
+
+        kept, sampled = self._select(
+            candidates(), epoch_bounds, message_count, token_budget, load_messages
+        )
+        state = SamplerState(
+            token_budget=token_budget,
+            message_count=message_count,
+            watermark=watermark,
+            epoch_bounds=epoch_bounds,
+            candidates=kept,
+        )
+        return sampled, state
+
+    def extend(
+        self,
+        state: SamplerState,
+        new_summaries: Iterable[MessageSummary],
+        load_messages: Callable[[list[Any]], dict[Any, Message]],
+    ) -> Optional[tuple[list[SampledMessage], SamplerState]]:
+        """Resume streamed sampling with messages appended after the watermark.
+
+        The new messages are scored and merged with the kept candidates,
+        positional priorities are recomputed for the grown conversation, and
+        the merged set is fitted to the budget again.
+
+        Args:
+            state: State returned by sample_stream() or a previous extend()
+            new_summaries: Summaries of messages after the watermark, in order
+            load_messages: Loads full messages for a list of ids, keyed by id
+
+        Returns:
+            Sampled messages and the new state, or None if a kept candidate
+            no longer exists (the conversation was rewritten)
+        """
+        epoch_bounds = dict(state.epoch_bounds)
+        watermark = state.watermark
+        appended: list[tuple[int, int, MessageSummary]] = []
+        for summary in new_summaries:
+            # Appended messages follow every scanned one, so each becomes
+            # the last of its epoch
+            first, _ = epoch_bounds.get(summary.epoch_id, (summary.id, summary.id))
+            epoch_bounds[summary.epoch_id] = (first, summary.id)
+            appended.append(
+                (
+                    state.message_count + len(appended),
+                    self._estimate_summary_tokens(summary),
+                    summary,
+                )
+            )
+            watermark = _watermark(summary)
+
+        message_count = state.message_count + len(appended)
+        chosen_ids: list[Any] = []
+
+        def load_checked(message_ids: list[Any]) -> dict[Any, Message]:
+            chosen_ids.extend(message_ids)
+            return load_messages(message_ids)
+
+        kept, sampled = self._select(
+            state.candidates + appended,
+            epoch_bounds,
+            message_count,
+            state.token_budget,
+            load_checked,
+        )
+        if len(sampled) < len(chosen_ids):
+            return None
+
+        logger.info(f"Extended sampling with {len(appended)} appended messages")
+        return sampled, SamplerState(
+            token_budget=state.token_budget,
+            message_count=message_count,
+            watermark=watermark,
+            epoch_bounds=epoch_bounds,
+            candidates=kept,
+        )
+
+    def _select(
+        self,
+        candidates: Iterable[tuple[int, int, MessageSummary]],
+        epoch_bounds: dict[Any, tuple[Any, Any]],
+        message_count: int,
+        token_budget: int,
+        load_messages: Callable[[list[Any]], dict[Any, Message]],
+    ) -> tuple[list[tuple[int, int, MessageSummary]], list[SampledMessage]]:
+        """Score candidates into a bounded heap and fit the best to the budget.
+
+        Returns:
+            Candidates kept by the heap, and the sampled messages
+        """
+        capacity = token_budget // self.MESSAGE_OVERHEAD_TOKENS + 2
+        # Min-heap whose root is the worst kept candidate: lowest priority,
+        # then latest in the conversation
+        heap: list[tuple[int, int, int, int, str, MessageSummary]] = []
+
+        for index, estimated_tokens, summary in candidates:
+            bounds = epoch_bounds.get(summary.epoch_id, ())
+            priority, reason = self._score(
+                summary, index, message_count, summary.id in bounds
+            )
+            entry = (
+                priority,
+                -summary.sequence,
+                -index,
+                estimated_tokens,
+                reason,
+                summary,
+            )
+            if len(heap) < capacity:
+                heapq.heappush(heap, entry)
+            elif entry > heap[0]:
+                heapq.heapreplace(heap, entry)
+
+        kept = [(-entry[2], entry[3], entry[5]) for entry in heap]
+        if not heap:
+            return kept, []
+
+        # Best first: priority descending, then sequence ascending
+        chosen, total_tokens = _fit_to_budget(
+            ((entry[3], entry) for entry in sorted(heap, reverse=True)), token_budget
+        )
+        messages = load_messages([entry[5].id for entry in chosen])
+
+        sampled = [
+            SampledMessage(
+                message=messages[summary.id],
+                priority=priority,
+                reason=reason,
+                estimated_tokens=estimated_tokens,
+            )
+            for priority, _, _, estimated_tokens, reason, summary in chosen
+            if summary.id in messages
+        ]
+        sampled.sort(key=lambda sm: sm.message.sequence)
+
+        logger.info(
+            f"Sampled {len(sampled)}/{message_count} messages "
+            f"({total_tokens}/{token_budget} tokens, streamed)"
+        )
+
+        return kept, sampled
+
     def _prioritize_messages(
         self, messages: list[Message], epochs: list[Epoch]
     ) -> list[SampledMessage]:
@@ -106,64 +451,93 @@ class SemanticSampler:
         epoch_boundaries = self._get_epoch_boundaries(messages, epochs)
 
         for i, msg in enumerate(messages):
-            priority = self.PRIORITY_NORMAL
-            reasons: list[str] = []
-
-            # First/last messages (always include)
-            if i == 0:
-                priority = max(priority, self.PRIORITY_FIRST_LAST)
-                reasons.append("first")
-            elif i == len(messages) - 1:
-                priority = max(priority, self.PRIORITY_FIRST_LAST)
-                reasons.append("last")
-
-            # Messages in configurable first/last N
-            elif i < self.config.always_include_first_n:
-                priority = max(priority, self.PRIORITY_FIRST_LAST - 100)
-                reasons.append(f"first-{self.config.always_include_first_n}")
-            elif i >= len(messages) - self.config.always_include_last_n:
-                priority = max(priority, self.PRIORITY_FIRST_LAST - 100)
-                reasons.append(f"last-{self.config.always_include_last_n}")
-
-            # Error detection
-            if self._has_error(msg):
-                priority = max(priority, self.PRIORITY_ERROR)
-                reasons.append("error")
-
-            # Tool calls
-            if msg.tool_calls:
-                priority = max(priority, self.PRIORITY_TOOL_CALL)
-                reasons.append(f"tools:{len(msg.tool_calls)}")
-
-            # Thinking content
-            if msg.thinking_content and self.config.include_thinking:
-                priority = max(priority, self.PRIORITY_THINKING)
-                reasons.append("thinking")
-
-            # Code changes
-            if msg.code_changes:
-                priority = max(priority, self.PRIORITY_CODE_CHANGE)
-                reasons.append(f"code:{len(msg.code_changes)}")
-
-            # Epoch boundaries
-            if msg.id in epoch_boundaries:
-                priority = max(priority, self.PRIORITY_EPOCH_BOUNDARY)
-                reasons.append("epoch-boundary")
-
-            # Estimate token count
-            estimated_tokens = self._estimate_message_tokens(msg)
-
+            summary = self._summarize(msg)
+            priority, reason = self._score(
+                summary, i, len(messages), msg.id in epoch_boundaries
+            )
             prioritized.append(
                 SampledMessage(
                     message=msg,
                     priority=priority,
-                    reason=", ".join(reasons) if reasons else "normal",
-                    estimated_tokens=estimated_tokens,
+                    reason=reason,
+                    estimated_tokens=self._estimate_summary_tokens(summary),
                 )
             )
 
         return prioritized
 
+    def _score(
+        self,
+        summary: MessageSummary,
+        index: int,
+        count: int,
+        is_epoch_boundary: bool,
+    ) -> tuple[int, str]:
+        """Priority and reason for the message at ``index`` of ``count``."""
+        priority = self.PRIORITY_NORMAL
+        reasons: list[str] = []
+
+        # First/last messages (always include)
+        if index == 0:
+            priority = max(priority, self.PRIORITY_FIRST_LAST)
+            reasons.append("first")
+        elif index == count - 1:
+            priority = max(priority, self.PRIORITY_FIRST_LAST)
+            reasons.append("last")
+
+        # Messages in configurable first/last N
+        elif index < self.config.always_include_first_n:
+            priority = max(priority, self.PRIORITY_FIRST_LAST - 100)
+            reasons.append(f"first-{self.config.always_include_first_n}")
+        elif index >= count - self.config.always_include_last_n:
+            priority = max(priority, self.PRIORITY_FIRST_LAST - 100)
+            reasons.append(f"last-{self.config.always_include_last_n}")
+
+        # Error detection
+        if summary.has_error:
+            priority = max(priority, self.PRIORITY_ERROR)
+            reasons.append("error")
+
+        # Tool calls
+        if summary.tool_call_count:
+            priority = max(priority, self.PRIORITY_TOOL_CALL)
+            reasons.append(f"tools:{summary.tool_call_count}")
+
+        # Thinking content
+        if summary.thinking_length and self.config.include_thinking:
+            priority = max(priority, self.PRIORITY_THINKING)
+            reasons.append("thinking")
+
+        # Code changes
+        if summary.code_change_count:
+            priority = max(priority, self.PRIORITY_CODE_CHANGE)
+            reasons.append(f"code:{summary.code_change_count}")
+
+        # Epoch boundaries
+        if is_epoch_boundary:
+            priority = max(priority, self.PRIORITY_EPOCH_BOUNDARY)
+            reasons.append("epoch-boundary")
+
+        return priority, ", ".join(reasons) if reasons else "normal"
+
+    def _summarize(self, message: Message) -> MessageSummary:
+        """Summarize a loaded message for scoring and token estimation."""
+        return MessageSummary(
+            id=message.id,
+            epoch_id=message.epoch_id,
+            sequence=message.sequence,
+            has_error=self._has_error(message),
+            tool_call_count=len(message.tool_calls or []),
+            code_change_count=len(message.code_changes or []),
+            content_length=len(message.content or ""),
+            content_tokens=message.content_tokens,
+            thinking_length=len(message.thinking_content or ""),
+            thinking_tokens=message.thinking_tokens,
+            content=message.content,
+            thinking_content=message.thinking_content,
+            timestamp=message.timestamp,
+        )
+
     def _get_epoch_boundaries(
         self, messages: list[Message], epochs: list[Epoch]
     ) -> set[Any]:
@@ -190,53 +564,66 @@ class SemanticSampler:
     def _has_error(self, message: Message) -> bool:
         """Check if message contains error indicators."""
         content_lower = (message.content or "").lower()
-
-        # Error keywords
-        error_patterns = [
-            "error",
-            "exception",
-            "failed",
-            "failure",
-            "traceback",
-            "warning",
-            "⚠️",
-            "❌",
-            "[error]",
-            "[warning]",
-        ]
-
-        return any(pattern in content_lower for pattern in error_patterns)
+        return any(pattern in content_lower for pattern in self.ERROR_PATTERNS)
 
     def _estimate_message_tokens(self, message: Message) -> int:
         """Estimate token count for a message."""
-        tokens = 0
+        return self._estimate_summary_tokens(self._summarize(message))
 
-        # Role + timestamp structure
-        tokens += 10
+    def _estimate_summary_tokens(self, summary: MessageSummary) -> int:
+        """Estimate token count for a summarized message."""
+        tokens = self.MESSAGE_OVERHEAD_TOKENS
 
         # Content
-        content = message.content or ""
-        if len(content) > self.config.max_message_chars:
-            content = content[: self.config.max_message_chars] + "..."
-        tokens += self.token_counter.count(content)
+        tokens += self._text_tokens(
+            summary.content,
+            summary.content_length,
+            summary.content_tokens,
+            self.config.max_message_chars,
+        )
 
         # Thinking content (if included)
-        if message.thinking_content and self.config.include_thinking:
-            thinking = message.thinking_content
-            if len(thinking) > self.config.max_thinking_chars:
-                thinking = thinking[: self.config.max_thinking_chars] + "..."
-            tokens += self.token_counter.count(thinking)
+        if summary.thinking_length and self.config.include_thinking:
+            tokens += self._text_tokens(
+                summary.thinking_content,
+                summary.thinking_length,
+                summary.thinking_tokens,
+                self.config.max_thinking_chars,
+            )
 
         # Tool calls (if included)
-        if message.tool_calls and self.config.include_tool_details:
-            tokens += len(message.tool_calls) * 50  # Estimate per tool call
+        if self.config.include_tool_details:
+            tokens += summary.tool_call_count * 50  # Estimate per tool call
 
         # Code changes (if included)
-        if message.code_changes and self.config.include_code_changes:
-            tokens += len(message.code_changes) * 30  # Estimate per code change
+        if self.config.include_code_changes:
+            tokens += summary.code_change_count * 30  # Estimate per code change
 
         return tokens
 
+    def _text_tokens(
+        self,
+        text: Optional[str],
+        length: int,
+        stored_tokens: Optional[int],
+        max_chars: int,
+    ) -> int:
+        """Tokens of text as rendered (truncated to max_chars).
+
+        Uses the count stored at ingest when there is one, scaled by the
+        kept fraction for truncated text; only rows ingested before counts
+        were stored are encoded here.
+        """
+        if stored_tokens is None:
+            text = text or ""
+            if len(text) > max_chars:
+                text = text[:max_chars] + "..."
+            return self.token_counter.count(text)
+
+        if length > max_chars:
+            return stored_tokens * max_chars // length + 1
+        return stored_tokens
+
 
 class EpochSampler:
     """Sample messages based on epoch boundaries.
@@ -254,6 +641,8 @@ class EpochSampler:
         """
         self.config = config
         self.token_counter = token_counter
+        # Reuse SemanticSampler's estimation logic
+        self._estimator = SemanticSampler(config, token_counter)
 
     def sample(
         self,
@@ -361,9 +750,7 @@ class EpochSampler:
 
     def _estimate_message_tokens(self, message: Message) -> int:
         """Estimate token count for a message."""
-        # Reuse SemanticSampler's estimation logic
-        sampler = SemanticSampler(self.config, self.token_counter)
-        return sampler._estimate_message_tokens(message)
+        return self._estimator._estimate_message_tokens(message)
 
 
 class ChronologicalSampler:
@@ -391,6 +778,8 @@ class ChronologicalSampler:
         """
         self.config = config
         self.token_counter = token_counter
+        # Reuse SemanticSampler's estimation logic
+        self._estimator = SemanticSampler(config, token_counter)
 
     def sample(
         self,
@@ -440,6 +829,4 @@ class ChronologicalSampler:
 
     def _estimate_message_tokens(self, message: Message) -> int:
         """Estimate token count for a message."""
-        # Reuse SemanticSampler's estimation logic
-        sampler = SemanticSampler(self.config, self.token_counter)
-        return sampler._estimate_message_tokens(message)
+        return self._estimator._estimate_message_tokens(message)
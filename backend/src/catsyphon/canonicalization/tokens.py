@@ -1,7 +1,8 @@
 """Token counting and budget allocation for canonicalization."""
 
 import logging
-from typing import Optional
+from functools import lru_cache
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +19,33 @@ except ImportError:
     )
 
 
+@lru_cache(maxsize=None)
+def _encoding_for_model(model: str) -> Optional[Any]:
+    """Load the tiktoken encoding for a model once per process."""
+    if not TIKTOKEN_AVAILABLE:
+        return None
+
+    try:
+        # Get encoding for model
+        if "gpt-4o" in model:
+            encoding = tiktoken.encoding_for_model("gpt-4o")
+        elif "gpt-4" in model:
+            encoding = tiktoken.encoding_for_model("gpt-4")
+        else:
+            # Default to cl100k_base (used by GPT-4 family)
+            encoding = tiktoken.get_encoding("cl100k_base")
+
+        logger.debug(f"Using tiktoken encoding for {model}")
+        return encoding
+    except Exception as e:
+        logger.warning(f"Failed to load tiktoken encoding: {e}")
+        return None
+
+
+# Characters encoded by TokenCounter.estimate before extrapolating by length
+ESTIMATE_PREFIX_CHARS = 4096
+
+
 class TokenCounter:
     """Count tokens for different models with fallback estimation."""
 
@@ -37,23 +65,7 @@ class TokenCounter:
             model: Model name (e.g., "gpt-4o-mini", "gpt-4o")
         """
         self.model = model
-        self.encoding: Optional[object] = None
-
-        if TIKTOKEN_AVAILABLE:
-            try:
-                # Get encoding for model
-                if "gpt-4o" in model:
-                    self.encoding = tiktoken.encoding_for_model("gpt-4o")
-                elif "gpt-4" in model:
-                    self.encoding = tiktoken.encoding_for_model("gpt-4")
-                else:
-                    # Default to cl100k_base (used by GPT-4 family)
-                    self.encoding = tiktoken.get_encoding("cl100k_base")
-
-                logger.debug(f"Using tiktoken encoding for {model}")
-            except Exception as e:
-                logger.warning(f"Failed to load tiktoken encoding: {e}")
-                self.encoding = None
+        self.encoding: Optional[Any] = _encoding_for_model(model)
 
     def count(self, text: str) -> int:
         """Count tokens in text.
@@ -81,6 +93,25 @@ class TokenCounter:
         )
         return int(len(text) / chars_per_token)
 
+    def estimate(self, text: str) -> int:
+        """Estimate tokens in text without encoding all of it.
+
+        Text up to ESTIMATE_PREFIX_CHARS is counted exactly; longer text is
+        counted over that prefix and extrapolated by length, so the cost
+        stays bounded however large a tool output is.
+
+        Args:
+            text: Text to estimate tokens for
+
+        Returns:
+            Estimated number of tokens
+        """
+        if len(text) <= ESTIMATE_PREFIX_CHARS:
+            return self.count(text)
+
+        prefix_tokens = self.count(text[:ESTIMATE_PREFIX_CHARS])
+        return round(prefix_tokens * len(text) / ESTIMATE_PREFIX_CHARS)
+
     def truncate_to_budget(self, text: str, token_budget: int) -> tuple[str, int]:
         """Truncate text to fit within token budget.
 
@@ -116,6 +147,37 @@ class TokenCounter:
         return truncated_text, self.count(truncated_text)
 
 
+@lru_cache(maxsize=None)
+def get_token_counter(model: str = "gpt-4o-mini") -> TokenCounter:
+    """Shared TokenCounter for a model (counters are stateless and thread-safe)."""
+    return TokenCounter(model=model)
+
+
+def message_token_counts(
+    content: Optional[str], thinking_content: Optional[str], exact: bool = False
+) -> dict[str, Optional[int]]:
+    """Token counts stored on a Message.
+
+    Estimated with the default counter at ingest, where encoding every full
+    text would dominate the write path; samplers scale them when they
+    truncate a message rather than re-encoding it.
+
+    Args:
+        content: Message content
+        thinking_content: Message thinking content, if any
+        exact: Encode the full texts instead of estimating (backfill)
+
+    Returns:
+        Dict with content_tokens and thinking_tokens (None if no thinking)
+    """
+    counter = get_token_counter()
+    count = counter.count if exact else counter.estimate
+    return {
+        "content_tokens": count(content or ""),
+        "thinking_tokens": count(thinking_content) if thinking_content else None,
+    }
+
+
 class BudgetAllocator:
     """Allocate token budget across conversation components."""
 
@@ -5,11 +5,16 @@ Minimal CLI providing essential commands for automation and server management.
 For interactive features, use the web UI.
 """
 
+from typing import TYPE_CHECKING
+
 import typer
 from rich.console import Console
 
 from catsyphon.logging_config import setup_logging
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
 app = typer.Typer(
     name="catsyphon",
     help="CatSyphon - Coding agent conversation analysis tool",
@@ -40,6 +45,18 @@ def ingest(
         "--enable-tagging",
         help="Enable LLM-based tagging (uses configured LLM provider)",
     ),
+    workers: int = typer.Option(
+        1,
+        "--workers",
+        min=1,
+        help="Parser processes for multi-file ingest (1 = one file at a time)",
+    ),
+    writers: int = typer.Option(
+        2,
+        "--writers",
+        min=1,
+        help="Concurrent database writers when --workers > 1",
+    ),
 ) -> None:
     """
     Ingest conversation logs into the database.
@@ -86,6 +103,7 @@ def ingest(
     console.print(f"  Update mode: {update_mode}")
     console.print(f"  Skip duplicates: {skip_duplicates}")
     console.print(f"  LLM tagging: {enable_tagging}")
+    console.print(f"  Workers: {workers}")
     console.print()
 
     # Validate tagging configuration if enabled
@@ -136,6 +154,17 @@ def ingest(
     failed = 0
     skipped = 0
 
+    if workers > 1 and not dry_run and len(files_to_process) > 1:
+        successful, skipped, failed = _ingest_parallel(
+            files_to_process,
+            workers=workers,
+            writers=writers,
+            project=project,
+            developer=developer,
+            enable_tagging=enable_tagging,
+        )
+        files_to_process = []
+
     for log_file in files_to_process:
         try:
             console.print(f"[blue]Ingesting:[/blue] {log_file.name}... ", end="")
@@ -255,6 +284,128 @@ def ingest(
         raise typer.Exit(1)
 
 
+def _ingest_parallel(
+    files: list["Path"],
+    workers: int,
+    writers: int,
+    project: str | None,
+    developer: str | None,
+    enable_tagging: bool,
+) -> tuple[int, int, int]:
+    """Ingest files with parser processes and DB writers, showing progress.
+
+    Returns:
+        Tuple of (successful, skipped, failed) file counts
+    """
+    import time
+
+    from rich.progress import (
+        BarColumn,
+        MofNCompleteColumn,
+        Progress,
+        TextColumn,
+        TimeElapsedColumn,
+    )
+
+    from catsyphon.db.connection import db_session
+    from catsyphon.pipeline.ingestion import _get_or_create_default_workspace
+    from catsyphon.services.batch_ingest import FileResult, ingest_files_parallel
+
+    with db_session() as session:
+        workspace_id = _get_or_create_default_workspace(session)
+
+    successful = skipped = failed = 0
+    events = 0
+    start = time.monotonic()
+
+    with Progress(
+        TextColumn("[blue]Ingesting[/blue]"),
+        BarColumn(),
+        MofNCompleteColumn(),
+        TextColumn("{task.fields[files_rate]:.1f} files/s"),
+        TextColumn("{task.fields[events_rate]:.0f} events/s"),
+        TextColumn("[red]{task.fields[failed]} failed[/red]"),
+        TimeElapsedColumn(),
+        console=console,
+    ) as progress:
+        task = progress.add_task(
+            "ingest", total=len(files), files_rate=0.0, events_rate=0.0, failed=0
+        )
+
+        def _on_result(result: FileResult) -> None:
+            nonlocal successful, skipped, failed, events
+            status = result.outcome.status
+            if status == "error":
+                failed += 1
+                progress.console.print(
+                    f"[red]✗[/red] {result.file_path.name}: "
+                    f"{result.outcome.error_message}"
+                )
+            else:
+                events += result.events
+                if status in {"duplicate", "skipped"}:
+                    skipped += 1
+                else:
+                    successful += 1
+
+            elapsed = max(time.monotonic() - start, 1e-6)
+            done = successful + skipped + failed
+            progress.update(
+                task,
+                completed=done,
+                files_rate=done / elapsed,
+                events_rate=events / elapsed,
+                failed=failed,
+            )
+
+        ingest_files_parallel(
+            files,
+            workspace_id=workspace_id,
+            session_factory=db_session,
+            workers=workers,
+            writers=writers,
+            project_name=project,
+            developer_username=developer,
+            enable_tagging=enable_tagging,
+            on_result=_on_result,
+        )
+
+    return successful, skipped, failed
+
+
+@app.command("backfill-token-counts")
+def backfill_token_counts(
+    batch_size: int = typer.Option(
+        1000, "--batch-size", min=1, help="Messages counted per transaction"
+    ),
+) -> None:
+    """
+    Store token counts on messages ingested before counts were kept.
+
+    Canonicalization reads per-message token counts computed at ingest;
+    older rows are counted on every regeneration until backfilled.
+    """
+    from catsyphon.db.connection import db_session
+    from catsyphon.db.repositories import MessageRepository
+
+    # Initialize logging (fallback to console if file logging not permitted)
+    try:
+        setup_logging(context="cli")
+    except PermissionError:
+        import logging
+
+        logging.basicConfig(level=logging.INFO)
+
+    total = 0
+    with db_session() as session:
+        for updated in MessageRepository(session).backfill_token_counts(batch_size):
+            session.commit()
+            total += updated
+            console.print(f"  Counted {total} messages...")
+
+    console.print(f"[green]✓ Backfilled token counts for {total} messages[/green]")
+
+
 @app.command()
 def serve(
     host: str = typer.Option("0.0.0.0", help="Host to bind to"),
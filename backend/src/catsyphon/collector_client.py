@@ -3,24 +3,44 @@ HTTP Collector Client for CatSyphon.
 
 This module provides a client for pushing events to CatSyphon via the
 Collector Events API. Used by the watcher when --use-api is enabled.
+
+Batches are sized by encoded payload bytes (capped at the API's per-request
+event limit). In pipelined mode, batches are sent from an asyncio loop on a
+background thread while the caller keeps converting and encoding the next
+ones. Batches of one session are always posted one after another, in order,
+because the server derives message sequence and counters from arrival
+order; batches of different sessions are sent concurrently.
+
+Bodies start out as plain JSON. Once a server response advertises
+msgpack (``Accept-Post``) or gzip/zstd (``Accept-Encoding``), later batches
+are encoded with the most compact format both sides support; a 415 drops
+back to plain JSON.
 """
 
+import asyncio
 import hashlib
 import json
 import logging
+import threading
 import time
+from collections import deque
+from concurrent.futures import Future
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import Any, Iterable, Iterator, Optional
 from uuid import UUID
 
 import httpx
 
 from catsyphon.config import settings
 from catsyphon.models.parsed import ParsedConversation, ParsedMessage
+from catsyphon.utils.wire_format import WireFormat, reencode_as_json
 
 logger = logging.getLogger(__name__)
 
+# Maximum events per request accepted by POST /collectors/events
+MAX_BATCH_EVENTS = 50
+
 
 def _serialize_for_json(obj: Any) -> Any:
     """
@@ -46,9 +66,16 @@ class CollectorConfig:
     Configuration for the collector client.
 
     Defaults are loaded from settings (environment variables):
-    - batch_size: CATSYPHON_COLLECTOR_BATCH_SIZE (default: 20)
+    - batch_size: CATSYPHON_COLLECTOR_BATCH_SIZE (default: 50)
+    - max_batch_bytes: CATSYPHON_COLLECTOR_BATCH_BYTES (default: 256 KiB)
     - max_retries: CATSYPHON_COLLECTOR_MAX_RETRIES (default: 3)
     - timeout: CATSYPHON_COLLECTOR_HTTP_TIMEOUT (default: 30)
+    - pipelined: CATSYPHON_COLLECTOR_PIPELINED (default: True)
+    - max_in_flight: CATSYPHON_COLLECTOR_MAX_IN_FLIGHT (default: 4)
+
+    batch_size is an upper bound; batches are closed earlier once their
+    encoded size would exceed max_batch_bytes. max_in_flight bounds how many
+    encoded batches per session may be queued behind the one being sent.
     """
 
     server_url: str
@@ -57,15 +84,26 @@ class CollectorConfig:
     batch_size: int | None = None
     max_retries: int | None = None
     timeout: float | None = None
+    max_batch_bytes: int | None = None
+    pipelined: bool | None = None
+    max_in_flight: int | None = None
 
     def __post_init__(self) -> None:
         """Apply settings defaults for None values."""
         if self.batch_size is None:
             self.batch_size = settings.collector_batch_size
+        self.batch_size = max(1, min(self.batch_size, MAX_BATCH_EVENTS))
         if self.max_retries is None:
             self.max_retries = settings.collector_max_retries
         if self.timeout is None:
             self.timeout = float(settings.collector_http_timeout)
+        if self.max_batch_bytes is None:
+            self.max_batch_bytes = settings.collector_batch_bytes
+        if self.pipelined is None:
+            self.pipelined = settings.collector_pipelined
+        if self.max_in_flight is None:
+            self.max_in_flight = settings.collector_max_in_flight
+        self.max_in_flight = max(1, self.max_in_flight)
 
 
 @dataclass
@@ -99,22 +137,52 @@ class CollectorClient:
 
     Converts parsed conversations to events and sends them to the server.
     Handles batching and retries. Uses content-based hashing for deduplication.
+    Safe to share between threads.
     """
 
-    def __init__(self, config: CollectorConfig):
+    def __init__(
+        self,
+        config: CollectorConfig,
+        transport: Optional[httpx.BaseTransport] = None,
+        async_transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
         self.config = config
+        self._headers = {
+            "Authorization": f"Bearer {config.api_key}",
+            "X-Collector-ID": config.collector_id,
+        }
+        # Upgraded from plain JSON once the server advertises what it accepts
+        self._wire_format = WireFormat()
         self._client = httpx.Client(
             base_url=config.server_url,
-            headers={
-                "Authorization": f"Bearer {config.api_key}",
-                "X-Collector-ID": config.collector_id,
-                "Content-Type": "application/json",
-            },
+            headers=self._headers,
             timeout=config.timeout,
+            transport=transport,
         )
 
+        # Pipelined mode: started lazily on the first send
+        self._async_transport = async_transport
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_thread: Optional[threading.Thread] = None
+        self._loop_lock = threading.Lock()
+        self._async_client: Optional[httpx.AsyncClient] = None
+        # Last queued batch per session; only touched on the loop thread
+        self._session_tails: dict[str, asyncio.Future[bool]] = {}
+
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP clients and stop the pipeline loop."""
+        with self._loop_lock:
+            loop, thread = self._loop, self._loop_thread
+            self._loop = None
+            self._loop_thread = None
+        if loop is not None and thread is not None:
+            if self._async_client is not None:
+                asyncio.run_coroutine_threadsafe(
+                    self._async_client.aclose(), loop
+                ).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
         self._client.close()
 
     def __enter__(self) -> "CollectorClient":
@@ -347,30 +415,130 @@ class CollectorClient:
     def _send_events(
         self,
         session_id: str,
-        events: list[dict[str, Any]],
+        events: Iterable[dict[str, Any]],
     ) -> dict[str, Any]:
-        """Send events in batches with retry logic."""
+        """Send events in size-bounded batches with retry logic.
+
+        ``events`` is consumed lazily, so peak memory is bounded by the
+        batches queued for sending rather than the whole event stream.
+        """
         total_accepted = 0
+        total_events = 0
         conversation_id = None
-        batch_size = self.config.batch_size
 
-        for i in range(0, len(events), batch_size):
-            batch = events[i : i + batch_size]
-            result = self._send_batch_with_retry(session_id, batch)
+        def collect(result: dict[str, Any], count: int) -> None:
+            nonlocal total_accepted, total_events, conversation_id
             total_accepted += result.get("accepted", 0)
+            total_events += count
             if result.get("conversation_id"):
                 conversation_id = result["conversation_id"]
 
+        batches = self._encode_batches(session_id, events)
+        if not self.config.pipelined:
+            for body, headers, count in batches:
+                collect(self._send_batch_with_retry(body, headers), count)
+        else:
+            # Keep up to max_in_flight batches queued on the loop while the
+            # next one is encoded; the loop posts them in order
+            window: deque[tuple[Future[dict[str, Any]], int]] = deque()
+            failed = threading.Event()
+            max_in_flight = self.config.max_in_flight
+            assert max_in_flight is not None
+            try:
+                for body, headers, count in batches:
+                    future = self._submit_batch(session_id, body, headers, failed)
+                    window.append((future, count))
+                    if len(window) >= max_in_flight:
+                        future, sent = window.popleft()
+                        collect(future.result(), sent)
+                while window:
+                    future, sent = window.popleft()
+                    collect(future.result(), sent)
+            finally:
+                # On failure, later batches of the session fail fast on the
+                # loop; wait for them so nothing is left in flight
+                for future, _ in window:
+                    future.exception()
+
         return {
             "accepted": total_accepted,
             "conversation_id": conversation_id,
-            "total_events": len(events),
+            "total_events": total_events,
         }
 
-    def _send_batch_with_retry(
+    def _encode_batches(
         self,
         session_id: str,
-        events: list[dict[str, Any]],
+        events: Iterable[dict[str, Any]],
+    ) -> Iterator[tuple[bytes, dict[str, str], int]]:
+        """Encode events into request bodies bounded by count and bytes.
+
+        Yields (body, headers, event_count). The byte budget applies to the
+        uncompressed body, which is what the server has to hold. An event
+        larger than max_batch_bytes is sent in a batch of its own.
+        """
+        max_bytes = self.config.max_batch_bytes
+        batch_size = self.config.batch_size
+        assert max_bytes is not None and batch_size is not None
+        encoded: list[bytes] = []
+        wire_format = self._wire_format
+        overhead = wire_format.frame_overhead(session_id)
+        size = overhead
+
+        def flush() -> tuple[bytes, dict[str, str], int]:
+            body, headers = wire_format.compress(wire_format.frame(session_id, encoded))
+            return body, headers, len(encoded)
+
+        for event in events:
+            item = wire_format.encode_item(event)
+            if encoded and (
+                len(encoded) >= batch_size or size + len(item) + 1 > max_bytes
+            ):
+                yield flush()
+                encoded = []
+                if self._wire_format != wire_format:
+                    # A response negotiated a different format meanwhile
+                    wire_format = self._wire_format
+                    overhead = wire_format.frame_overhead(session_id)
+                    item = wire_format.encode_item(event)
+                size = overhead
+            encoded.append(item)
+            size += len(item) + 1
+
+        if encoded:
+            yield flush()
+
+    def _note_wire_formats(self, response: httpx.Response) -> None:
+        """Adopt the most compact format the server advertises."""
+        accept_post = response.headers.get("accept-post")
+        accept_encoding = response.headers.get("accept-encoding")
+        if accept_post is None and accept_encoding is None:
+            return
+        negotiated = WireFormat.negotiate(accept_post, accept_encoding)
+        if negotiated != self._wire_format:
+            logger.debug(
+                f"Collector wire format: {negotiated.content_type}, "
+                f"{negotiated.content_encoding}"
+            )
+            self._wire_format = negotiated
+
+    @staticmethod
+    def _needs_fallback(response: httpx.Response, headers: dict[str, str]) -> bool:
+        return response.status_code == 415 and headers != WireFormat().headers
+
+    def _fall_back_to_json(
+        self, body: bytes, headers: dict[str, str]
+    ) -> tuple[bytes, dict[str, str]]:
+        """Re-encode a batch the server refused (415) as plain JSON."""
+        logger.warning(
+            f"Server rejected {headers.get('Content-Type')} "
+            f"({headers.get('Content-Encoding', 'identity')}); using plain JSON"
+        )
+        self._wire_format = WireFormat()
+        return reencode_as_json(body, headers), WireFormat().headers
+
+    def _send_batch_with_retry(
+        self, body: bytes, headers: dict[str, str]
     ) -> dict[str, Any]:
         """Send a batch with exponential backoff retry.
 
@@ -378,19 +546,24 @@ class CollectorClient:
         Retries only on network errors and 5xx server errors.
         """
         last_error: Optional[Exception] = None
+        max_retries = self.config.max_retries
+        assert max_retries is not None
 
-        for attempt in range(self.config.max_retries):
+        for attempt in range(max_retries):
             try:
                 response = self._client.post(
-                    "/collectors/events",
-                    json={
-                        "session_id": session_id,
-                        "events": events,
-                    },
+                    "/collectors/events", content=body, headers=headers
                 )
+                self._note_wire_formats(response)
+                if self._needs_fallback(response, headers):
+                    body, headers = self._fall_back_to_json(body, headers)
+                    response = self._client.post(
+                        "/collectors/events", content=body, headers=headers
+                    )
 
                 if response.status_code == 202:
-                    return response.json()
+                    result: dict[str, Any] = response.json()
+                    return result
 
                 if response.status_code >= 500:
                     # Server error - retry with backoff
@@ -411,15 +584,133 @@ class CollectorClient:
                 time.sleep(wait_time)
 
         raise RuntimeError(
-            f"Failed to send events after {self.config.max_retries} retries: {last_error}"
+            f"Failed to send events after {max_retries} retries: {last_error}"
+        )
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        """Start the pipeline event loop thread if it is not running."""
+        with self._loop_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._async_client = httpx.AsyncClient(
+                    base_url=self.config.server_url,
+                    headers=self._headers,
+                    timeout=self.config.timeout,
+                    transport=self._async_transport,
+                )
+                thread = threading.Thread(
+                    target=loop.run_forever,
+                    name="catsyphon-collector-pipeline",
+                    daemon=True,
+                )
+                thread.start()
+                self._loop = loop
+                self._loop_thread = thread
+            return self._loop
+
+    def _submit_batch(
+        self,
+        session_id: str,
+        body: bytes,
+        headers: dict[str, str],
+        failed: threading.Event,
+    ) -> Future[dict[str, Any]]:
+        """Queue a batch on the pipeline loop behind the session's earlier ones."""
+        return asyncio.run_coroutine_threadsafe(
+            self._send_in_order(session_id, body, headers, failed),
+            self._ensure_loop(),
+        )
+
+    async def _send_in_order(
+        self,
+        session_id: str,
+        body: bytes,
+        headers: dict[str, str],
+        failed: threading.Event,
+    ) -> dict[str, Any]:
+        """Post a batch once every earlier batch of its session has succeeded.
+
+        Coroutines start in submission order, so chaining on the session's
+        tail before the first await preserves per-session ordering.
+        ``failed`` is shared by the batches of one send, so none is posted
+        after an earlier one has failed.
+        """
+        previous = self._session_tails.get(session_id)
+        done: asyncio.Future[bool] = asyncio.get_running_loop().create_future()
+        self._session_tails[session_id] = done
+        ok = False
+        try:
+            previous_ok = previous is None or await previous
+            if not previous_ok or failed.is_set():
+                raise RuntimeError(
+                    f"Not sending batch for session {session_id}: "
+                    "an earlier batch failed"
+                )
+            try:
+                result = await self._send_batch_with_retry_async(body, headers)
+            except Exception:
+                failed.set()
+                raise
+            ok = True
+            return result
+        finally:
+            done.set_result(ok)
+            if self._session_tails.get(session_id) is done:
+                del self._session_tails[session_id]
+
+    async def _send_batch_with_retry_async(
+        self, body: bytes, headers: dict[str, str]
+    ) -> dict[str, Any]:
+        """Async counterpart of _send_batch_with_retry for pipelined mode."""
+        assert self._async_client is not None
+        last_error: Optional[Exception] = None
+        max_retries = self.config.max_retries
+        assert max_retries is not None
+
+        for attempt in range(max_retries):
+            try:
+                response = await self._async_client.post(
+                    "/collectors/events", content=body, headers=headers
+                )
+                self._note_wire_formats(response)
+                if self._needs_fallback(response, headers):
+                    body, headers = self._fall_back_to_json(body, headers)
+                    response = await self._async_client.post(
+                        "/collectors/events", content=body, headers=headers
+                    )
+
+                if response.status_code == 202:
+                    result: dict[str, Any] = response.json()
+                    return result
+
+                if response.status_code >= 500:
+                    wait_time = 2**attempt
+                    logger.warning(
+                        f"Server error {response.status_code}, retrying in {wait_time}s"
+                    )
+                    await asyncio.sleep(wait_time)
+                    continue
+
+                response.raise_for_status()
+
+            except httpx.RequestError as e:
+                last_error = e
+                wait_time = 2**attempt
+                logger.warning(f"Network error: {e}, retrying in {wait_time}s")
+                await asyncio.sleep(wait_time)
+
+        raise RuntimeError(
+            f"Failed to send events after {max_retries} retries: {last_error}"
         )
 
     def _get_session_status(self, session_id: str) -> Optional[dict[str, Any]]:
         """Get session status for resumption."""
         try:
             response = self._client.get(f"/collectors/sessions/{session_id}")
+            self._note_wire_formats(response)
             if response.status_code == 200:
-                return response.json()
+                result: dict[str, Any] = response.json()
+                return result
             return None
         except httpx.RequestError:
             return None
@@ -486,7 +777,8 @@ class CollectorClient:
                 },
             )
             if response.status_code == 200:
-                return response.json()
+                result: dict[str, Any] = response.json()
+                return result
             logger.warning(f"Failed to complete session: {response.status_code}")
             return {}
         except httpx.RequestError as e:
@@ -502,7 +794,8 @@ class CollectorClient:
         Ingest only new messages for an existing session (incremental update).
 
         Streams events in bounded batches to avoid materializing the full
-        events list.  Peak memory is O(batch_size) instead of O(all_events).
+        events list.  Peak memory is O(batch bytes × max_in_flight) instead
+        of O(all_events).
 
         Unlike ingest_conversation, this method:
         - Does NOT send session_start event (session already exists)
@@ -519,40 +812,16 @@ class CollectorClient:
         if not messages:
             return {"accepted": 0, "conversation_id": None, "total_events": 0}
 
-        batch_size = self.config.batch_size or 20
-        total_accepted = 0
-        total_events = 0
-        conversation_id = None
-        batch: list[dict[str, Any]] = []
-
-        for msg in messages:
-            for event in self._message_to_events(msg):
-                batch.append(event)
-                if len(batch) >= batch_size:
-                    result = self._send_batch_with_retry(session_id, batch)
-                    total_accepted += result.get("accepted", 0)
-                    if result.get("conversation_id"):
-                        conversation_id = result["conversation_id"]
-                    total_events += len(batch)
-                    batch = []
-
-        # Flush remaining events
-        if batch:
-            result = self._send_batch_with_retry(session_id, batch)
-            total_accepted += result.get("accepted", 0)
-            if result.get("conversation_id"):
-                conversation_id = result["conversation_id"]
-            total_events += len(batch)
+        result = self._send_events(
+            session_id,
+            (event for msg in messages for event in self._message_to_events(msg)),
+        )
 
         logger.debug(
-            f"Incremental ingest: {len(messages)} messages → {total_accepted} events"
+            f"Incremental ingest: {len(messages)} messages → {result['accepted']} events"
         )
 
-        return {
-            "accepted": total_accepted,
-            "conversation_id": conversation_id,
-            "total_events": total_events,
-        }
+        return result
 
 
 def compute_ingestion_fingerprint(
@@ -629,4 +898,5 @@ def register_collector(
             },
         )
         response.raise_for_status()
-        return response.json()
+        result: dict[str, Any] = response.json()
+        return result
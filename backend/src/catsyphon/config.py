@@ -95,6 +95,20 @@ class Settings(BaseSettings):
     db_pool_recycle: int = Field(
         default=300, alias="CATSYPHON_DB_POOL_RECYCLE"
     )  # Recycle connections after N seconds
+    api_threadpool_size: int = Field(
+        default=40, alias="CATSYPHON_API_THREADPOOL_SIZE"
+    )  # Threads per worker for sync route handlers (DB access)
+    upload_stream_workers: int = Field(
+        default=4, alias="CATSYPHON_UPLOAD_STREAM_WORKERS"
+    )  # Streaming uploads ingested concurrently per worker
+
+    # Analytics cache (project analytics, health reports, overview stats)
+    analytics_cache_backend: str = Field(
+        default="database", alias="CATSYPHON_ANALYTICS_CACHE_BACKEND"
+    )  # 'database' (shared across workers) or 'memory' (per process)
+    analytics_cache_ttl_seconds: float = Field(
+        default=3600.0, alias="CATSYPHON_ANALYTICS_CACHE_TTL_SECONDS"
+    )  # Backstop TTL; ingestion invalidates entries via version bumps
 
     # Benchmarks
     benchmarks_enabled: bool = Field(
@@ -141,6 +155,9 @@ class Settings(BaseSettings):
     llm_model: str = Field(default="", alias="LLM_MODEL")
     llm_max_tokens: int = Field(default=0, alias="LLM_MAX_TOKENS")
     llm_timeout_s: float = Field(default=60.0, alias="LLM_TIMEOUT_S")
+    llm_requests_per_minute: int = Field(
+        default=0, alias="CATSYPHON_LLM_REQUESTS_PER_MINUTE"
+    )  # Per provider/model request rate limit (0 = provider default)
 
     # Provider API keys
     anthropic_api_key: str = ""
@@ -163,6 +180,12 @@ class Settings(BaseSettings):
     )
     tagging_cache_ttl_days: int = 30  # Cache time-to-live in days
     tagging_enable_cache: bool = True  # Enable caching (reduces OpenAI costs)
+    tagging_worker_concurrency: int = Field(
+        default=1, alias="CATSYPHON_TAGGING_WORKER_CONCURRENCY"
+    )  # Tagging jobs with an LLM call in flight at once
+    tagging_worker_db_sessions: int = Field(
+        default=2, alias="CATSYPHON_TAGGING_WORKER_DB_SESSIONS"
+    )  # Max DB connections the tagging worker holds at once
 
     # Supplemental scanner
     scanner_enabled: bool = True
@@ -197,6 +220,15 @@ class Settings(BaseSettings):
     watch_stats_interval: int = Field(
         default=30, alias="CATSYPHON_WATCH_STATS_INTERVAL"
     )  # Stats push interval in seconds
+    watch_scan_workers: int = Field(
+        default=4, alias="CATSYPHON_WATCH_SCAN_WORKERS"
+    )  # Files processed concurrently during the startup scan
+    watch_scan_memory_budget_mb: int = Field(
+        default=1024, alias="CATSYPHON_WATCH_SCAN_MEMORY_BUDGET_MB"
+    )  # Daemon RSS above which the startup scan stops admitting new files
+    watch_scan_quiet_seconds: float = Field(
+        default=60.0, alias="CATSYPHON_WATCH_SCAN_QUIET_SECONDS"
+    )  # Files unmodified this long skip the per-file debounce wait during scans
 
     # Daemon Manager Settings
     daemon_stats_sync_interval: int = Field(
@@ -214,14 +246,26 @@ class Settings(BaseSettings):
 
     # Collector/API Ingestion Settings
     collector_batch_size: int = Field(
-        default=20, alias="CATSYPHON_COLLECTOR_BATCH_SIZE"
-    )  # Messages per batch for API ingestion
+        default=50, alias="CATSYPHON_COLLECTOR_BATCH_SIZE"
+    )  # Max events per batch for API ingestion (server accepts up to 50)
+    collector_batch_bytes: int = Field(
+        default=262_144, alias="CATSYPHON_COLLECTOR_BATCH_BYTES"
+    )  # Batches close early once their encoded payload would exceed this
+    collector_pipelined: bool = Field(
+        default=True, alias="CATSYPHON_COLLECTOR_PIPELINED"
+    )  # Send batches from a background async loop while encoding the next
+    collector_max_in_flight: int = Field(
+        default=4, alias="CATSYPHON_COLLECTOR_MAX_IN_FLIGHT"
+    )  # Batches per session queued for sending in pipelined mode
     collector_http_timeout: int = Field(
         default=30, alias="CATSYPHON_COLLECTOR_HTTP_TIMEOUT"
     )  # HTTP request timeout in seconds
     collector_max_retries: int = Field(
         default=3, alias="CATSYPHON_COLLECTOR_MAX_RETRIES"
     )  # Max retry attempts for failed requests
+    collector_max_payload_bytes: int = Field(
+        default=16_777_216, alias="CATSYPHON_COLLECTOR_MAX_PAYLOAD_BYTES"
+    )  # Max decompressed size of an event batch accepted by the server
 
     # OTEL Ingestion
     otel_ingest_enabled: bool = Field(
@@ -355,7 +355,7 @@ class DaemonManager:
         api_url = extra_config.get("api_url", "http://localhost:8000")
         api_key = extra_config.get("api_key", "")
         collector_id = extra_config.get("collector_id", "")
-        api_batch_size = extra_config.get("api_batch_size", 20)
+        api_batch_size = extra_config.get("api_batch_size")
 
         # Always fetch builtin credentials if not provided
         if not api_key or not collector_id:
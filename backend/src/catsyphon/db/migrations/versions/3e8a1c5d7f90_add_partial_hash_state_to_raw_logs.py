@@ -0,0 +1,37 @@
+"""Add partial_hash_state column to raw_logs.
+
+Stores the chained-hash state for ``partial_hash`` so appends and chunked
+parses resume hashing at the last block boundary instead of byte 0. NULL
+means ``partial_hash`` is a plain SHA-256 of the prefix (pre-existing rows).
+
+Revision ID: 3e8a1c5d7f90
+Revises: f2a3b4c5d6e7
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects.postgresql import JSONB
+
+revision = "3e8a1c5d7f90"
+down_revision = "f2a3b4c5d6e7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "raw_logs",
+        sa.Column(
+            "partial_hash_state",
+            JSONB,
+            nullable=True,
+            comment="Chained-hash state for partial_hash (NULL = plain SHA-256)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("raw_logs", "partial_hash_state")
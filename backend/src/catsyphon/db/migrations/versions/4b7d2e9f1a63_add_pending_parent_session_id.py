@@ -0,0 +1,53 @@
+"""Add pending_parent_session_id to conversations.
+
+Collector sessions whose parent had not arrived yet record the parent's
+collector session_id in an indexed column, so orphan linking can resolve the
+children of a newly created session with one indexed UPDATE instead of
+scanning every parentless conversation in the workspace.
+
+Revision ID: 4b7d2e9f1a63
+Revises: 3e8a1c5d7f90
+Create Date: 2026-10-16 10:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "4b7d2e9f1a63"
+down_revision = "3e8a1c5d7f90"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # 1. Add column
+    op.add_column(
+        "conversations",
+        sa.Column("pending_parent_session_id", sa.String(length=255), nullable=True),
+    )
+
+    # 2. Backfill from the parent_session_id stored in metadata for
+    #    collector sessions that are still waiting on their parent.
+    op.execute(sa.text("""
+            UPDATE conversations
+            SET pending_parent_session_id = metadata->>'parent_session_id'
+            WHERE parent_conversation_id IS NULL
+              AND permanently_orphaned IS NOT TRUE
+              AND collector_session_id IS NOT NULL
+              AND metadata->>'parent_session_id' IS NOT NULL
+        """))
+
+    # 3. Partial index: only conversations still waiting on a parent
+    op.create_index(
+        "ix_conversations_pending_parent",
+        "conversations",
+        ["workspace_id", "pending_parent_session_id"],
+        postgresql_where=sa.text("pending_parent_session_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_conversations_pending_parent", table_name="conversations")
+    op.drop_column("conversations", "pending_parent_session_id")
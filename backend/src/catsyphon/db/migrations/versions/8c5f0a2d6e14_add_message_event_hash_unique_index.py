@@ -0,0 +1,83 @@
+"""Add unique (conversation_id, event_hash) index on messages.
+
+Gives the collector bulk insert path an ON CONFLICT target so duplicate
+events are dropped by the database instead of per-row ORM inserts.
+Duplicates that slipped past the application-level check are removed
+first, keeping the earliest row. The cleanup walks messages in id-ordered
+batches each committed on its own and the index is built CONCURRENTLY, so
+ingestion keeps writing to messages throughout.
+
+Revision ID: 8c5f0a2d6e14
+Revises: 4b7d2e9f1a63
+Create Date: 2026-10-16 12:00:00.000000
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "8c5f0a2d6e14"
+down_revision = "4b7d2e9f1a63"
+branch_labels = None
+depends_on = None
+
+DEDUPE_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # 1. Remove duplicate collector events, keeping the first inserted row.
+    #    Each batch probes ix_messages_event_hash for an earlier twin.
+    dedupe = sa.text("""
+            WITH batch AS (
+                SELECT id FROM messages
+                WHERE id > :after
+                ORDER BY id
+                LIMIT :batch_size
+            ), removed AS (
+                DELETE FROM messages m
+                USING batch
+                WHERE m.id = batch.id
+                  AND m.event_hash IS NOT NULL
+                  AND EXISTS (
+                      SELECT 1 FROM messages d
+                      WHERE d.event_hash = m.event_hash
+                        AND d.conversation_id = m.conversation_id
+                        AND (d.created_at, d.id) < (m.created_at, m.id)
+                  )
+            )
+            SELECT max(id) FROM batch
+            """)
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        after = uuid.UUID(int=0)
+        while True:
+            last = connection.execute(
+                dedupe, {"after": after, "batch_size": DEDUPE_BATCH_SIZE}
+            ).scalar()
+            if last is None:
+                break
+            after = last
+
+        # 2. Partial unique index: conflict target for bulk inserts
+        op.create_index(
+            "uq_messages_conversation_event_hash",
+            "messages",
+            ["conversation_id", "event_hash"],
+            unique=True,
+            postgresql_where=sa.text("event_hash IS NOT NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "uq_messages_conversation_event_hash",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -0,0 +1,116 @@
+"""Add token_ledger table.
+
+Per-(conversation, model, day) token totals maintained at ingest time so cost
+endpoints no longer scan message metadata JSON. Backfilled here from existing
+messages' metadata->'token_usage'.
+
+Revision ID: a8c6e0f4b2d7
+Revises: f7b5d9e3a1c8
+Create Date: 2026-10-16 21:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "a8c6e0f4b2d7"
+down_revision = "f7b5d9e3a1c8"
+branch_labels = None
+depends_on = None
+
+# token_usage key spellings per counter, parser output first (mirrors
+# TokenLedgerRepository)
+_USAGE_KEYS = {
+    "input_tokens": ("input_tokens",),
+    "output_tokens": ("output_tokens",),
+    "cache_read_tokens": (
+        "cache_read_tokens",
+        "cache_read_input_tokens",
+        "cached_input_tokens",
+    ),
+    "cache_creation_tokens": ("cache_creation_tokens", "cache_creation_input_tokens"),
+}
+
+
+def _counter_sum(keys: tuple[str, ...]) -> str:
+    # First non-zero numeric value among the spellings, else 0
+    values = ", ".join(
+        f"CASE WHEN tu->>'{key}' ~ '^[0-9]+(\\.[0-9]+)?$' "
+        f"THEN NULLIF((tu->>'{key}')::numeric, 0) END"
+        for key in keys
+    )
+    return f"SUM(COALESCE({values}, 0))::bigint"
+
+
+def upgrade() -> None:
+    op.create_table(
+        "token_ledger",
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("model", sa.String(100), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("message_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("input_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column("output_tokens", sa.BigInteger(), nullable=False, server_default="0"),
+        sa.Column(
+            "cache_read_tokens", sa.BigInteger(), nullable=False, server_default="0"
+        ),
+        sa.Column(
+            "cache_creation_tokens",
+            sa.BigInteger(),
+            nullable=False,
+            server_default="0",
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"], ["conversations.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("conversation_id", "model", "day"),
+    )
+    op.create_index(
+        "ix_token_ledger_workspace_day", "token_ledger", ["workspace_id", "day"]
+    )
+
+    counters = ",\n                ".join(
+        _counter_sum(keys) for keys in _USAGE_KEYS.values()
+    )
+    op.execute(sa.text(f"""
+            INSERT INTO token_ledger (
+                conversation_id, model, day, workspace_id, message_count,
+                input_tokens, output_tokens, cache_read_tokens,
+                cache_creation_tokens
+            )
+            SELECT
+                m.conversation_id,
+                left(m.metadata->>'model', 100),
+                (m.timestamp AT TIME ZONE 'UTC')::date,
+                c.workspace_id,
+                COUNT(*),
+                {counters}
+            FROM messages m
+            JOIN conversations c ON c.id = m.conversation_id
+            CROSS JOIN LATERAL (SELECT m.metadata->'token_usage' AS tu) u
+            WHERE m.metadata->>'model' IS NOT NULL
+              AND m.metadata->>'model' <> ''
+              AND jsonb_typeof(m.metadata->'token_usage') = 'object'
+            GROUP BY
+                m.conversation_id,
+                left(m.metadata->>'model', 100),
+                (m.timestamp AT TIME ZONE 'UTC')::date,
+                c.workspace_id
+            """))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_token_ledger_workspace_day", table_name="token_ledger")
+    op.drop_table("token_ledger")
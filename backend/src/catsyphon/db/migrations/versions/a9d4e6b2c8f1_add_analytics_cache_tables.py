@@ -0,0 +1,70 @@
+"""Add shared analytics cache tables.
+
+Stores analytics responses (project analytics, health reports, overview
+stats) in PostgreSQL so every API worker shares one cache, and keeps a
+version counter per scope that ingestion bumps to invalidate them.
+
+Revision ID: a9d4e6b2c8f1
+Revises: 8c5f0a2d6e14
+Create Date: 2026-10-16 14:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "a9d4e6b2c8f1"
+down_revision = "8c5f0a2d6e14"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "analytics_cache_versions",
+        sa.Column("scope", sa.String(length=100), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("scope"),
+    )
+
+    op.create_table(
+        "analytics_cache_entries",
+        sa.Column("cache_key", sa.String(length=512), nullable=False),
+        sa.Column("scope", sa.String(length=100), nullable=False),
+        sa.Column("value", postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("cache_key"),
+    )
+    op.create_index(
+        "ix_analytics_cache_entries_scope", "analytics_cache_entries", ["scope"]
+    )
+    op.create_index(
+        "ix_analytics_cache_entries_expires_at",
+        "analytics_cache_entries",
+        ["expires_at"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "ix_analytics_cache_entries_expires_at", table_name="analytics_cache_entries"
+    )
+    op.drop_index(
+        "ix_analytics_cache_entries_scope", table_name="analytics_cache_entries"
+    )
+    op.drop_table("analytics_cache_entries")
+    op.drop_table("analytics_cache_versions")
@@ -0,0 +1,169 @@
+"""Add conversation and project-day rollup tables.
+
+conversation_rollups holds per-conversation role counts, tool-call counts,
+line totals and the first change timestamp; project_daily_rollups holds
+per-project activity buckets keyed by the UTC start date of each
+conversation. Both are maintained at ingest time and backfilled here from
+existing messages and files_touched.
+
+Revision ID: b3e7f1c9d2a4
+Revises: a9d4e6b2c8f1
+Create Date: 2026-10-16 16:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "b3e7f1c9d2a4"
+down_revision = "a9d4e6b2c8f1"
+branch_labels = None
+depends_on = None
+
+
+def _count_column(name: str) -> sa.Column[int]:
+    return sa.Column(name, sa.Integer(), nullable=False, server_default="0")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "conversation_rollups",
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=True),
+        sa.Column("day", sa.Date(), nullable=False),
+        _count_column("message_count"),
+        _count_column("user_message_count"),
+        _count_column("assistant_message_count"),
+        _count_column("user_tool_call_count"),
+        _count_column("assistant_tool_call_count"),
+        _count_column("lines_added"),
+        _count_column("lines_deleted"),
+        sa.Column("first_change_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("first_change_latency_seconds", sa.Float(), nullable=True),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"], ["conversations.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="SET NULL"),
+        sa.PrimaryKeyConstraint("conversation_id"),
+    )
+    op.create_index(
+        "ix_conversation_rollups_project_id", "conversation_rollups", ["project_id"]
+    )
+
+    op.create_table(
+        "project_daily_rollups",
+        sa.Column("project_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        _count_column("session_count"),
+        _count_column("message_count"),
+        _count_column("user_message_count"),
+        _count_column("assistant_message_count"),
+        _count_column("tool_call_count"),
+        _count_column("lines_added"),
+        _count_column("lines_deleted"),
+        sa.Column(
+            "first_change_latency_seconds",
+            sa.Float(),
+            nullable=False,
+            server_default="0",
+        ),
+        _count_column("first_change_sessions"),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(["project_id"], ["projects.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("project_id", "day"),
+    )
+
+    # Backfill per-conversation totals in one pass over messages/files_touched
+    op.execute(sa.text("""
+            INSERT INTO conversation_rollups (
+                conversation_id, project_id, day,
+                message_count, user_message_count, assistant_message_count,
+                user_tool_call_count, assistant_tool_call_count,
+                lines_added, lines_deleted,
+                first_change_at, first_change_latency_seconds
+            )
+            SELECT
+                c.id,
+                c.project_id,
+                (c.start_time AT TIME ZONE 'UTC')::date,
+                COALESCE(m.total, 0),
+                COALESCE(m.user_count, 0),
+                COALESCE(m.assistant_count, 0),
+                COALESCE(m.user_tool_count, 0),
+                COALESCE(m.assistant_tool_count, 0),
+                COALESCE(f.lines_added, 0),
+                COALESCE(f.lines_deleted, 0),
+                f.first_change,
+                CASE
+                    WHEN f.first_change IS NOT NULL THEN GREATEST(
+                        EXTRACT(EPOCH FROM (f.first_change - c.start_time)), 0
+                    )
+                END
+            FROM conversations c
+            LEFT JOIN (
+                SELECT
+                    conversation_id,
+                    count(*) AS total,
+                    count(*) FILTER (WHERE role = 'user') AS user_count,
+                    count(*) FILTER (WHERE role = 'assistant') AS assistant_count,
+                    count(tool_calls) FILTER (WHERE role = 'user') AS user_tool_count,
+                    count(tool_calls) FILTER (WHERE role = 'assistant')
+                        AS assistant_tool_count
+                FROM messages
+                GROUP BY conversation_id
+            ) m ON m.conversation_id = c.id
+            LEFT JOIN (
+                SELECT
+                    conversation_id,
+                    sum(lines_added) AS lines_added,
+                    sum(lines_deleted) AS lines_deleted,
+                    min(timestamp) AS first_change
+                FROM files_touched
+                GROUP BY conversation_id
+            ) f ON f.conversation_id = c.id
+            """))
+
+    op.execute(sa.text("""
+            INSERT INTO project_daily_rollups (
+                project_id, day, session_count,
+                message_count, user_message_count, assistant_message_count,
+                tool_call_count, lines_added, lines_deleted,
+                first_change_latency_seconds, first_change_sessions
+            )
+            SELECT
+                r.project_id,
+                r.day,
+                count(*),
+                sum(r.message_count),
+                sum(r.user_message_count),
+                sum(r.assistant_message_count),
+                sum(r.user_tool_call_count + r.assistant_tool_call_count),
+                sum(r.lines_added),
+                sum(r.lines_deleted),
+                COALESCE(sum(r.first_change_latency_seconds), 0),
+                count(r.first_change_latency_seconds)
+            FROM conversation_rollups r
+            WHERE r.project_id IS NOT NULL
+            GROUP BY r.project_id, r.day
+            """))
+
+
+def downgrade() -> None:
+    op.drop_table("project_daily_rollups")
+    op.drop_index(
+        "ix_conversation_rollups_project_id", table_name="conversation_rollups"
+    )
+    op.drop_table("conversation_rollups")
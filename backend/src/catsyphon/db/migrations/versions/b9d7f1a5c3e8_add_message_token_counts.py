@@ -0,0 +1,31 @@
+"""Add per-message token counts.
+
+content_tokens and thinking_tokens are counted once at ingest so
+canonicalization samplers no longer re-encode every message on each
+regeneration. Existing rows stay NULL (samplers count them on the fly)
+until ``catsyphon backfill-token-counts`` is run.
+
+Revision ID: b9d7f1a5c3e8
+Revises: a8c6e0f4b2d7
+Create Date: 2026-10-16 22:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "b9d7f1a5c3e8"
+down_revision = "a8c6e0f4b2d7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("messages", sa.Column("content_tokens", sa.Integer(), nullable=True))
+    op.add_column("messages", sa.Column("thinking_tokens", sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("messages", "thinking_tokens")
+    op.drop_column("messages", "content_tokens")
@@ -0,0 +1,33 @@
+"""Add sampler_state to conversation_canonical.
+
+Stores the streamed sampler's kept candidates and message watermark so a
+canonical of an append-only conversation can be extended with the new
+messages instead of being regenerated from scratch. NULL for existing rows,
+which are rebuilt in full on their next regeneration.
+
+Revision ID: c2e8a4f6b0d9
+Revises: b9d7f1a5c3e8
+Create Date: 2026-10-16 23:30:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "c2e8a4f6b0d9"
+down_revision = "b9d7f1a5c3e8"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "conversation_canonical",
+        sa.Column("sampler_state", postgresql.JSONB(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("conversation_canonical", "sampler_state")
@@ -0,0 +1,36 @@
+"""Add parser_name column to raw_logs.
+
+Records which parser handled each log file so the watcher can hand appends
+straight to that parser instead of re-probing the file format. NULL for
+pre-existing rows (they are probed once more on their next change).
+
+Revision ID: c4d8a2e6f1b3
+Revises: b3e7f1c9d2a4
+Create Date: 2026-10-16 17:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "c4d8a2e6f1b3"
+down_revision = "b3e7f1c9d2a4"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "raw_logs",
+        sa.Column(
+            "parser_name",
+            sa.String(50),
+            nullable=True,
+            comment="Parser that handled the file (NULL = not yet recorded)",
+        ),
+    )
+
+
+def downgrade() -> None:
+    op.drop_column("raw_logs", "parser_name")
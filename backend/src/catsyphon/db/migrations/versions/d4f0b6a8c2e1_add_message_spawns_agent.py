@@ -0,0 +1,90 @@
+"""Add spawns_agent flag and partial index to messages.
+
+Marks messages with a sub-agent spawning tool call (Task) at ingest, so
+finding the call that spawned an agent conversation is one indexed
+"latest spawn before T" lookup instead of loading the parent's messages
+and scanning their tool_calls JSON.
+
+The column is committed before the backfill, which then runs in id-ordered
+batches each committed on its own, and the index is built CONCURRENTLY, so
+ingestion keeps writing to messages throughout.
+
+Revision ID: d4f0b6a8c2e1
+Revises: c2e8a4f6b0d9
+Create Date: 2026-10-17 00:30:00.000000
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "d4f0b6a8c2e1"
+down_revision = "c2e8a4f6b0d9"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+
+def upgrade() -> None:
+    # 1. Add column
+    op.add_column(
+        "messages",
+        sa.Column(
+            "spawns_agent",
+            sa.Boolean(),
+            nullable=False,
+            server_default="false",
+        ),
+    )
+
+    # 2. Backfill from existing tool calls, one committed batch at a time
+    backfill = sa.text("""
+            WITH batch AS (
+                SELECT id FROM messages
+                WHERE id > :after
+                ORDER BY id
+                LIMIT :batch_size
+            ), flagged AS (
+                UPDATE messages AS m
+                SET spawns_agent = true
+                FROM batch
+                WHERE m.id = batch.id
+                  AND m.tool_calls @> '[{"tool_name": "Task"}]'::jsonb
+            )
+            SELECT max(id) FROM batch
+            """)
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        after = uuid.UUID(int=0)
+        while True:
+            last = connection.execute(
+                backfill, {"after": after, "batch_size": BACKFILL_BATCH_SIZE}
+            ).scalar()
+            if last is None:
+                break
+            after = last
+
+        # 3. Partial index: spawning messages per conversation by time
+        op.create_index(
+            "ix_messages_agent_spawns",
+            "messages",
+            ["conversation_id", "timestamp"],
+            postgresql_where=sa.text("spawns_agent IS TRUE"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_messages_agent_spawns",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.drop_column("messages", "spawns_agent")
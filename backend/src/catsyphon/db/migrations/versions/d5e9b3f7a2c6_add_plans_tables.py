@@ -0,0 +1,151 @@
+"""Add plans and plan_iterations tables.
+
+Indexed copy of the plan dicts in conversations.metadata->'plans' so plan
+listing, status filters and counts no longer scan conversation JSONB. Both
+tables are maintained at ingest time and backfilled here from existing
+conversation metadata.
+
+Revision ID: d5e9b3f7a2c6
+Revises: c4d8a2e6f1b3
+Create Date: 2026-10-16 18:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "d5e9b3f7a2c6"
+down_revision = "c4d8a2e6f1b3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "plans",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("workspace_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("conversation_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("plan_index", sa.Integer(), nullable=False),
+        sa.Column("plan_file_path", sa.Text(), nullable=False),
+        sa.Column("status", sa.String(20), nullable=False, server_default="active"),
+        sa.Column("iteration_count", sa.Integer(), nullable=False, server_default="1"),
+        sa.Column("initial_content", sa.Text(), nullable=True),
+        sa.Column("final_content", sa.Text(), nullable=True),
+        sa.Column("entry_message_index", sa.Integer(), nullable=True),
+        sa.Column("exit_message_index", sa.Integer(), nullable=True),
+        sa.Column(
+            "related_agent_session_ids",
+            postgresql.JSONB(),
+            nullable=False,
+            server_default="[]",
+        ),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.ForeignKeyConstraint(
+            ["workspace_id"], ["workspaces.id"], ondelete="CASCADE"
+        ),
+        sa.ForeignKeyConstraint(
+            ["conversation_id"], ["conversations.id"], ondelete="CASCADE"
+        ),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint(
+            "conversation_id", "plan_index", name="uq_plans_conversation_index"
+        ),
+    )
+    op.create_index("ix_plans_workspace_status", "plans", ["workspace_id", "status"])
+
+    op.create_table(
+        "plan_iterations",
+        sa.Column("id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("plan_id", postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column("sequence", sa.Integer(), nullable=False),
+        sa.Column("operation_type", sa.String(20), nullable=False),
+        sa.Column("file_path", sa.Text(), nullable=False),
+        sa.Column("content", sa.Text(), nullable=True),
+        sa.Column("old_content", sa.Text(), nullable=True),
+        sa.Column("new_content", sa.Text(), nullable=True),
+        sa.Column("timestamp", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("message_index", sa.Integer(), nullable=False, server_default="0"),
+        sa.ForeignKeyConstraint(["plan_id"], ["plans.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_plan_iterations_plan_id", "plan_iterations", ["plan_id"])
+
+    # Backfill from conversation metadata, keeping list positions as indexes
+    op.execute(sa.text("""
+            INSERT INTO plans (
+                id, workspace_id, conversation_id, plan_index, plan_file_path,
+                status, iteration_count, initial_content, final_content,
+                entry_message_index, exit_message_index, related_agent_session_ids
+            )
+            SELECT
+                gen_random_uuid(),
+                c.workspace_id,
+                c.id,
+                p.ord - 1,
+                COALESCE(p.plan->>'plan_file_path', ''),
+                COALESCE(p.plan->>'status', 'active'),
+                COALESCE((p.plan->>'iteration_count')::int, 1),
+                p.plan->>'initial_content',
+                p.plan->>'final_content',
+                (p.plan->>'entry_message_index')::int,
+                (p.plan->>'exit_message_index')::int,
+                CASE
+                    WHEN jsonb_typeof(p.plan->'related_agent_session_ids') = 'array'
+                    THEN p.plan->'related_agent_session_ids'
+                    ELSE '[]'::jsonb
+                END
+            FROM conversations c,
+                 jsonb_array_elements(
+                     CASE
+                         WHEN jsonb_typeof(c.metadata->'plans') = 'array'
+                         THEN c.metadata->'plans'
+                         ELSE '[]'::jsonb
+                     END
+                 ) WITH ORDINALITY AS p(plan, ord)
+            WHERE jsonb_typeof(p.plan) = 'object'
+            """))
+
+    op.execute(sa.text("""
+            INSERT INTO plan_iterations (
+                id, plan_id, sequence, operation_type, file_path,
+                content, old_content, new_content, timestamp, message_index
+            )
+            SELECT
+                gen_random_uuid(),
+                pl.id,
+                o.ord - 1,
+                COALESCE(o.op->>'operation_type', ''),
+                COALESCE(o.op->>'file_path', ''),
+                o.op->>'content',
+                o.op->>'old_content',
+                o.op->>'new_content',
+                (o.op->>'timestamp')::timestamptz,
+                COALESCE((o.op->>'message_index')::int, 0)
+            FROM plans pl
+            JOIN conversations c ON c.id = pl.conversation_id,
+                 jsonb_array_elements(
+                     CASE
+                         WHEN jsonb_typeof(
+                             c.metadata->'plans'->pl.plan_index->'operations'
+                         ) = 'array'
+                         THEN c.metadata->'plans'->pl.plan_index->'operations'
+                         ELSE '[]'::jsonb
+                     END
+                 ) WITH ORDINALITY AS o(op, ord)
+            WHERE jsonb_typeof(o.op) = 'object'
+            """))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_plan_iterations_plan_id", table_name="plan_iterations")
+    op.drop_table("plan_iterations")
+    op.drop_index("ix_plans_workspace_status", table_name="plans")
+    op.drop_table("plans")
@@ -0,0 +1,29 @@
+"""Add file_mtime to raw_logs.
+
+Records the log file's mtime alongside file_size_bytes whenever parsing
+state is saved, so the watch daemon's startup scan can skip files whose
+size and mtime are unchanged without re-hashing them. Existing rows stay
+NULL and are filled in by the next scan that finds them unchanged.
+
+Revision ID: e6a2c8d0f4b3
+Revises: d4f0b6a8c2e1
+Create Date: 2026-10-17 01:30:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "e6a2c8d0f4b3"
+down_revision = "d4f0b6a8c2e1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("raw_logs", sa.Column("file_mtime", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("raw_logs", "file_mtime")
@@ -0,0 +1,113 @@
+"""Add full-text search vector to messages.
+
+tsvector over message content (weight A), tool-call parameters (B) and
+thinking content (C), with a GIN index, backing the /search endpoint. A
+BEFORE INSERT/UPDATE trigger keeps it current on every insert path.
+
+The column is added as plain nullable (no table rewrite), existing rows are
+backfilled in id-ordered batches, each committed on its own, and the index
+is built CONCURRENTLY, so ingestion keeps writing to messages throughout.
+
+Revision ID: e6a4c8d2f9b1
+Revises: d5e9b3f7a2c6
+Create Date: 2026-10-16 19:00:00.000000
+"""
+
+from __future__ import annotations
+
+import uuid
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql
+
+revision = "e6a4c8d2f9b1"
+down_revision = "d5e9b3f7a2c6"
+branch_labels = None
+depends_on = None
+
+BACKFILL_BATCH_SIZE = 5000
+
+# Every input, tool call parameters included, is truncated so a huge tool
+# output or Write/Edit payload can't exceed the 1MB tsvector limit and fail
+# the write. {row} is "NEW." in the trigger, "m." in backfill.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector('english'::regconfig,
+        left(coalesce({row}content, ''), 100000)), 'A')
+    || setweight(to_tsvector('english'::regconfig,
+        left(jsonb_path_query_array(coalesce({row}tool_calls, '[]'::jsonb),
+            '$[*].parameters')::text, 100000)), 'B')
+    || setweight(to_tsvector('english'::regconfig,
+        left(coalesce({row}thinking_content, ''), 100000)), 'C')
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "messages",
+        sa.Column("search_vector", postgresql.TSVECTOR(), nullable=True),
+    )
+    op.execute(sa.text(f"""
+            CREATE OR REPLACE FUNCTION messages_search_vector_update()
+            RETURNS trigger AS $$
+            BEGIN
+                NEW.search_vector := {SEARCH_VECTOR_SQL.format(row="NEW.")};
+                RETURN NEW;
+            END
+            $$ LANGUAGE plpgsql
+            """))
+    op.execute(sa.text("""
+            CREATE TRIGGER messages_search_vector_trigger
+            BEFORE INSERT OR UPDATE OF content, tool_calls, thinking_content
+            ON messages
+            FOR EACH ROW EXECUTE FUNCTION messages_search_vector_update()
+            """))
+
+    backfill = sa.text(f"""
+            WITH batch AS (
+                SELECT id FROM messages
+                WHERE id > :after
+                ORDER BY id
+                LIMIT :batch_size
+            )
+            UPDATE messages AS m
+            SET search_vector = {SEARCH_VECTOR_SQL.format(row="m.")}
+            FROM batch
+            WHERE m.id = batch.id
+            RETURNING m.id
+            """)
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        after = uuid.UUID(int=0)
+        while True:
+            ids = connection.execute(
+                backfill, {"after": after, "batch_size": BACKFILL_BATCH_SIZE}
+            ).scalars()
+            last = max(ids, default=None)
+            if last is None:
+                break
+            after = last
+
+        op.create_index(
+            "ix_messages_search_vector",
+            "messages",
+            ["search_vector"],
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_messages_search_vector",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+    op.execute(
+        sa.text("DROP TRIGGER IF EXISTS messages_search_vector_trigger ON messages")
+    )
+    op.execute(sa.text("DROP FUNCTION IF EXISTS messages_search_vector_update()"))
+    op.drop_column("messages", "search_vector")
@@ -0,0 +1,61 @@
+"""Add indexes for keyset pagination of conversations and messages.
+
+Conversation listings page top-level conversations by
+(coalesce(end_time, start_time), id) and message listings by
+(sequence, timestamp, id) within a conversation; these indexes let each page
+start at the cursor instead of scanning past all earlier rows. Both are built
+CONCURRENTLY so ingestion keeps writing to these tables during the build.
+
+Revision ID: f7b5d9e3a1c8
+Revises: e6a4c8d2f9b1
+Create Date: 2026-10-16 20:00:00.000000
+"""
+
+from __future__ import annotations
+
+import sqlalchemy as sa
+from alembic import op
+
+revision = "f7b5d9e3a1c8"
+down_revision = "e6a4c8d2f9b1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_conversations_workspace_last_activity",
+            "conversations",
+            [
+                "workspace_id",
+                sa.literal_column("coalesce(end_time, start_time)"),
+                "id",
+            ],
+            postgresql_where=sa.text("parent_conversation_id IS NULL"),
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_messages_conversation_sequence",
+            "messages",
+            ["conversation_id", "sequence", "timestamp", "id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_messages_conversation_sequence",
+            table_name="messages",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
+        op.drop_index(
+            "ix_conversations_workspace_last_activity",
+            table_name="conversations",
+            postgresql_concurrently=True,
+            if_exists=True,
+        )
@@ -17,12 +17,16 @@ from catsyphon.db.repositories.epoch import EpochRepository
 from catsyphon.db.repositories.ingestion_job import IngestionJobRepository
 from catsyphon.db.repositories.insights import InsightsRepository
 from catsyphon.db.repositories.message import MessageRepository
+from catsyphon.db.repositories.search import MessageSearchRepository
 from catsyphon.db.repositories.organization import OrganizationRepository
 from catsyphon.db.repositories.otel_event import OtelEventRepository
+from catsyphon.db.repositories.plan import PlanRepository
 from catsyphon.db.repositories.project import ProjectRepository
 from catsyphon.db.repositories.raw_log import RawLogRepository
 from catsyphon.db.repositories.recap import RecapRepository
 from catsyphon.db.repositories.recommendation import RecommendationRepository
+from catsyphon.db.repositories.rollup import RollupRepository
+from catsyphon.db.repositories.token_ledger import TokenLedgerRepository
 from catsyphon.db.repositories.watch_config import WatchConfigurationRepository
 from catsyphon.db.repositories.workspace import WorkspaceRepository
 
@@ -40,12 +44,16 @@ __all__ = [
     "IngestionJobRepository",
     "InsightsRepository",
     "MessageRepository",
+    "MessageSearchRepository",
     "OtelEventRepository",
     "OrganizationRepository",
+    "PlanRepository",
     "ProjectRepository",
     "RawLogRepository",
     "RecapRepository",
     "RecommendationRepository",
+    "RollupRepository",
+    "TokenLedgerRepository",
     "WatchConfigurationRepository",
     "WorkspaceRepository",
 ]
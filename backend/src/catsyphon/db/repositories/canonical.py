@@ -37,10 +37,13 @@ def _build_postgres_upsert_stmt(data: dict):
     # parameters, causing "can't adapt type 'dict'" errors.
     metadata_val = data["canonical_metadata"]
     config_val = data["config"]
+    sampler_state_val = data.get("sampler_state")
     if isinstance(metadata_val, dict):
         metadata_val = json.dumps(metadata_val)
     if isinstance(config_val, dict):
         config_val = json.dumps(config_val)
+    if isinstance(sampler_state_val, dict):
+        sampler_state_val = json.dumps(sampler_state_val)
 
     insert_values = {
         "conversation_id": data["conversation_id"],
@@ -52,6 +55,7 @@ def _build_postgres_upsert_stmt(data: dict):
         "config": config_val,
         "source_message_count": data["source_message_count"],
         "source_token_estimate": data["source_token_estimate"],
+        "sampler_state": sampler_state_val,
         "generated_at": data["generated_at"],
     }
 
@@ -71,6 +75,7 @@ def _build_postgres_upsert_stmt(data: dict):
                 table.c.config: insert_values["config"],
                 table.c.source_message_count: insert_values["source_message_count"],
                 table.c.source_token_estimate: insert_values["source_token_estimate"],
+                table.c.sampler_state: insert_values["sampler_state"],
                 table.c.generated_at: insert_values["generated_at"],
             },
         )
@@ -84,7 +89,8 @@ class CanonicalRepository(BaseRepository[ConversationCanonical]):
     Provides cache-first pattern with window-based regeneration:
     1. Check for cached canonical form
     2. If exists and fresh, return it
-    3. If stale or missing, generate new one
+    3. If stale, extend it with the messages appended since (when its
+       sampler state still applies), else generate a new one
     4. Cache and return
     """
 
@@ -144,9 +150,20 @@ class CanonicalRepository(BaseRepository[ConversationCanonical]):
         if canonicalizer is None:
             canonicalizer = Canonicalizer(canonical_type=canonical_type)
 
+        # Same algorithm and config: only messages after the cached sample's
+        # watermark need sampling (the canonicalizer verifies the watermark)
+        sampler_state = None
+        if (
+            cached
+            and cached.version == CANONICAL_VERSION
+            and cached.config == canonicalizer.config.to_dict()
+        ):
+            sampler_state = cached.sampler_state
+
         canonical = canonicalizer.canonicalize(
             conversation=conversation,
             children=children,
+            sampler_state=sampler_state,
         )
 
         # Save to database
@@ -279,6 +296,7 @@ class CanonicalRepository(BaseRepository[ConversationCanonical]):
             "config": canonical.config.to_dict() if canonical.config else {},
             "source_message_count": canonical.message_count,
             "source_token_estimate": estimated_source_tokens,
+            "sampler_state": canonical.sampler_state,
             "generated_at": canonical.generated_at or datetime.now(),
         }
 
@@ -16,12 +16,20 @@ import logging
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
+from sqlalchemy import func, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from catsyphon.canonicalization.tokens import message_token_counts
 from catsyphon.db.repositories.base import BaseRepository
+from catsyphon.db.repositories.message import MessageRepository, spawns_agent
+from catsyphon.db.repositories.plan import PlanRepository
+from catsyphon.db.repositories.rollup import RollupRepository
+from catsyphon.db.repositories.token_ledger import TokenLedgerRepository
 from catsyphon.models.db import (
     AuthorRole,
     Conversation,
@@ -33,6 +41,7 @@ from catsyphon.models.db import (
     MessageType,
     Project,
 )
+from catsyphon.utils.line_diff import diff_line_counts
 
 logger = logging.getLogger(__name__)
 
@@ -62,6 +71,42 @@ def _to_naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
     return dt
 
 
+def tool_call_line_counts(
+    tool_name: Optional[str], params: dict[str, Any]
+) -> tuple[int, int]:
+    """
+    Lines added and deleted by a file-modifying tool call.
+
+    Mirrors the parser's CodeChange accounting (ClaudeCodeParser) so that
+    collector-ingested FileTouched rows carry the same counts.
+
+    Args:
+        tool_name: Tool name from the tool_call event
+        params: Tool call parameters
+
+    Returns:
+        Tuple of (lines_added, lines_deleted)
+    """
+    if tool_name == "Edit":
+        return diff_line_counts(
+            params.get("old_string") or "", params.get("new_string") or ""
+        )
+    if tool_name == "MultiEdit":
+        added = deleted = 0
+        for edit in params.get("edits") or []:
+            if isinstance(edit, dict):
+                edit_added, edit_deleted = diff_line_counts(
+                    edit.get("old_string") or "", edit.get("new_string") or ""
+                )
+                added += edit_added
+                deleted += edit_deleted
+        return added, deleted
+    if tool_name == "Write":
+        content = params.get("content")
+        return (len(content.splitlines()) if isinstance(content, str) else 0), 0
+    return 0, 0
+
+
 def _extract_username_from_path(path: Optional[str]) -> Optional[str]:
     """
     Extract username from a file path.
@@ -368,6 +413,9 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
             last_event_sequence=0,
             server_received_at=now,
             parent_conversation_id=parent_conversation_id,
+            pending_parent_session_id=(
+                parent_session_id if parent_conversation_id is None else None
+            ),
             context_semantics=context_semantics or {},
             agent_metadata=resolved_agent_metadata,  # Never None - always a dict
             extra_data=extra_data,
@@ -502,6 +550,8 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
             if plans:
                 extra["plans"] = plans
             conversation.extra_data = extra
+        if plans:
+            PlanRepository(self.session).replace_for_conversation(conversation, plans)
 
         # Create FileTouched records for files not already tracked
         if files_touched:
@@ -535,99 +585,192 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
             conversation.end_time = event_ts
         self.session.flush()
 
-    def link_orphaned_collectors(self, workspace_id: uuid.UUID) -> int:
+    def link_orphaned_collectors(
+        self,
+        workspace_id: uuid.UUID,
+        parent_session_id: Optional[str] = None,
+    ) -> int:
         """
         Link orphaned collector sessions to their parents.
 
-        Finds sessions that have parent_session_id in extra_data but no
-        parent_conversation_id set (parent wasn't created yet when child was).
+        Orphans are sessions created before their parent arrived; they carry
+        the parent's collector session_id in ``pending_parent_session_id``,
+        which is backed by a partial index.
 
-        Also updates conversation_type and inherits project/developer from parent
-        for full semantic parity with direct ingestion.
+        With ``parent_session_id``, only orphans waiting on that parent are
+        touched: if the parent exists they are linked with a single UPDATE,
+        otherwise a failed attempt is recorded on each of them. Without it,
+        every pending parent in the workspace is retried.
+
+        Linking also updates conversation_type and inherits project/developer
+        from the parent for full semantic parity with direct ingestion.
 
         Orphans that meet the permanent-orphan policy are marked
         ``permanently_orphaned=True`` and excluded from future queries.
 
         Args:
             workspace_id: Workspace to process
+            parent_session_id: Collector session_id of a parent that may have
+                just arrived (None to retry all pending parents)
 
         Returns:
             Number of sessions linked
         """
+        if parent_session_id is not None:
+            parent_session_ids = [parent_session_id]
+        else:
+            parent_session_ids = [
+                pending_id
+                for (pending_id,) in self.session.query(
+                    Conversation.pending_parent_session_id
+                )
+                .filter(
+                    Conversation.workspace_id == workspace_id,
+                    Conversation.pending_parent_session_id.isnot(None),
+                    Conversation.permanently_orphaned.is_(False),
+                )
+                .distinct()
+                if pending_id is not None
+            ]
+
+        linked_count = 0
+        marked_permanent_count = 0
+        for pending_id in parent_session_ids:
+            parent = self.get_by_collector_session_id(pending_id)
+            if parent:
+                linked_count += self._link_pending_children(
+                    workspace_id, pending_id, parent
+                )
+            else:
+                marked_permanent_count += self._record_pending_attempts(
+                    workspace_id, pending_id
+                )
+
+        if marked_permanent_count:
+            self.session.flush()
+            logger.info(
+                "Collector linking: linked %d, marked %d permanently orphaned",
+                linked_count,
+                marked_permanent_count,
+            )
+
+        return linked_count
+
+    def _link_pending_children(
+        self,
+        workspace_id: uuid.UUID,
+        parent_session_id: str,
+        parent: Conversation,
+    ) -> int:
+        """Link every orphan waiting on ``parent`` with one set-based UPDATE.
+
+        Linked children may inherit the parent's project, so their rollups
+        are refreshed to move them into the right project-day bucket.
+        """
+        result = self.session.execute(
+            update(Conversation)
+            .where(
+                Conversation.workspace_id == workspace_id,
+                Conversation.pending_parent_session_id == parent_session_id,
+                Conversation.parent_conversation_id.is_(None),
+                Conversation.permanently_orphaned.is_(False),
+                Conversation.id != parent.id,
+            )
+            .values(
+                parent_conversation_id=parent.id,
+                # A session with a parent is an agent (semantic parity)
+                conversation_type=ConversationType.AGENT,
+                # Inherit project and developer from parent if not set
+                project_id=func.coalesce(Conversation.project_id, parent.project_id),
+                developer_id=func.coalesce(
+                    Conversation.developer_id, parent.developer_id
+                ),
+                pending_parent_session_id=None,
+            )
+            .returning(Conversation.id, Conversation.start_time)
+            .execution_options(synchronize_session="fetch")
+        )
+        linked_children = result.all()
+        if linked_children:
+            self._attach_spawning_messages(parent, linked_children)
+            children = [
+                self.session.get(Conversation, child_id)
+                for child_id, _ in linked_children
+            ]
+            RollupRepository(self.session).refresh_many(
+                child for child in children if child is not None
+            )
+            logger.debug(
+                f"Linked {len(linked_children)} orphaned sessions to parent "
+                f"{parent.id} (parent_session_id={parent_session_id})"
+            )
+        return len(linked_children)
+
+    def _attach_spawning_messages(
+        self, parent: Conversation, children: Sequence[tuple[uuid.UUID, datetime]]
+    ) -> None:
+        """Record the parent message whose Task call spawned each child.
+
+        Mirrors parent_message_id in direct ingestion's agent_metadata.
+        """
+        message_repo = MessageRepository(self.session)
+        for child_id, start_time in children:
+            message_id = message_repo.find_spawning_message(parent.id, start_time)
+            if message_id is None:
+                continue
+            child = self.session.get(Conversation, child_id)
+            if child is None:
+                continue
+            metadata = child.agent_metadata or {}
+            if "parent_message_id" not in metadata:
+                child.agent_metadata = {
+                    **metadata,
+                    "parent_message_id": str(message_id),
+                }
+
+    def _record_pending_attempts(
+        self, workspace_id: uuid.UUID, parent_session_id: str
+    ) -> int:
+        """Record a failed linking attempt on orphans waiting on a missing parent.
+
+        Returns:
+            Number of orphans marked permanently orphaned
+        """
         from catsyphon.pipeline.orphan_policy import (
             record_failed_attempt,
             should_mark_permanent,
         )
 
-        linked_count = 0
-        marked_permanent_count = 0
-
-        # Find sessions without parent_conversation_id that have extra_data
-        # We check parent_session_id in Python to be DB-agnostic (SQLite vs PostgreSQL)
         orphans = (
             self.session.query(Conversation)
             .filter(
                 Conversation.workspace_id == workspace_id,
+                Conversation.pending_parent_session_id == parent_session_id,
                 Conversation.parent_conversation_id.is_(None),
                 Conversation.permanently_orphaned.is_(False),
-                Conversation.extra_data.isnot(None),
             )
             .all()
         )
 
+        marked_permanent_count = 0
         for orphan in orphans:
-            if not orphan.extra_data:
-                continue
-            parent_session_id = orphan.extra_data.get("parent_session_id")
-            if not parent_session_id:
-                continue
-
-            # Look up parent
-            parent = self.get_by_collector_session_id(parent_session_id)
-            if parent:
-                orphan.parent_conversation_id = parent.id
-
-                # Update conversation_type to AGENT since it has a parent (semantic parity)
-                if orphan.conversation_type != ConversationType.AGENT:
-                    orphan.conversation_type = ConversationType.AGENT
-                    logger.debug(f"Updated conversation_type to AGENT for {orphan.id}")
-
-                # Inherit project and developer from parent if not set (semantic parity)
-                if orphan.project_id is None and parent.project_id:
-                    orphan.project_id = parent.project_id
-                    logger.debug(f"Inherited project_id from parent for {orphan.id}")
-                if orphan.developer_id is None and parent.developer_id:
-                    orphan.developer_id = parent.developer_id
-                    logger.debug(f"Inherited developer_id from parent for {orphan.id}")
-
-                linked_count += 1
-            else:
-                # Track failed attempt and check permanent-orphan policy
-                updated = record_failed_attempt(orphan.extra_data)
-                orphan.extra_data = updated
-
-                if should_mark_permanent(updated):
-                    orphan.permanently_orphaned = True
-                    marked_permanent_count += 1
-                    logger.warning(
-                        "Marked collector orphan %s as permanently orphaned "
-                        "(parent_session_id=%s, attempts=%d)",
-                        orphan.id,
-                        parent_session_id,
-                        updated.get("_linking_attempts", 0),
-                    )
-
-        if linked_count > 0 or marked_permanent_count > 0:
-            self.session.flush()
-
-        if marked_permanent_count:
-            logger.info(
-                "Collector linking: linked %d, marked %d permanently orphaned",
-                linked_count,
-                marked_permanent_count,
-            )
+            # Track failed attempt and check permanent-orphan policy
+            updated = record_failed_attempt(orphan.extra_data or {})
+            orphan.extra_data = updated
+
+            if should_mark_permanent(updated):
+                orphan.permanently_orphaned = True
+                orphan.pending_parent_session_id = None
+                marked_permanent_count += 1
+                logger.warning(
+                    "Marked collector orphan %s as permanently orphaned "
+                    "(parent_session_id=%s, attempts=%d)",
+                    orphan.id,
+                    parent_session_id,
+                    updated.get("_linking_attempts", 0),
+                )
 
-        return linked_count
+        return marked_permanent_count
 
     def _get_default_epoch(self, conversation: Conversation) -> Epoch:
         """Get or create the default epoch for a conversation.
@@ -748,6 +891,132 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
         """
         epoch = self._get_default_epoch(conversation)
 
+        # Compute sequence from existing message count (for ordering)
+        sequence = (conversation.message_count or 0) + 1
+
+        row = self._build_message_row(
+            conversation=conversation,
+            epoch_id=epoch.id,
+            sequence=sequence,
+            event_type=event_type,
+            emitted_at=emitted_at,
+            observed_at=observed_at,
+            data=data,
+            event_hash=event_hash,
+        )
+        message = Message(**row)
+        self.session.add(message)
+        TokenLedgerRepository(self.session).record(
+            conversation, [(row["extra_data"], row["timestamp"])]
+        )
+        return message
+
+    def add_messages_bulk(
+        self,
+        conversation: Conversation,
+        events: Sequence[tuple[str, datetime, datetime, dict[str, Any], Optional[str]]],
+    ) -> int:
+        """
+        Insert messages for a batch of collector events.
+
+        See insert_messages_bulk().
+
+        Returns:
+            Number of messages actually inserted
+        """
+        return len(self.insert_messages_bulk(conversation, events))
+
+    def insert_messages_bulk(
+        self,
+        conversation: Conversation,
+        events: Sequence[tuple[str, datetime, datetime, dict[str, Any], Optional[str]]],
+    ) -> list[uuid.UUID]:
+        """
+        Insert messages for a batch of collector events in one statement.
+
+        Builds the same columns as add_message() as plain dicts and writes
+        them with a multi-row INSERT ... ON CONFLICT DO NOTHING against the
+        (conversation_id, event_hash) unique index, so no ORM Message objects
+        are created and events that raced in from a concurrent batch are
+        skipped by the database. For a 2,000-event batch this is a handful
+        of statements instead of 2,000 unit-of-work inserts.
+
+        Args:
+            conversation: Parent conversation
+            events: (event_type, emitted_at, observed_at, data, event_hash)
+                tuples in insertion order
+
+        Returns:
+            IDs of the messages actually inserted, in insertion order
+        """
+        if not events:
+            return []
+
+        epoch = self._get_default_epoch(conversation)
+
+        # Same sequence derivation as add_message (message_count is only
+        # bumped by update_sequence once the batch is processed)
+        sequence = (conversation.message_count or 0) + 1
+
+        rows: list[dict[str, Any]] = []
+        seen_hashes: set[str] = set()
+        for event_type, emitted_at, observed_at, data, event_hash in events:
+            # Duplicates inside the batch would conflict with each other
+            if event_hash is not None:
+                if event_hash in seen_hashes:
+                    continue
+                seen_hashes.add(event_hash)
+            rows.append(
+                self._build_message_row(
+                    conversation=conversation,
+                    epoch_id=epoch.id,
+                    sequence=sequence,
+                    event_type=event_type,
+                    emitted_at=emitted_at,
+                    observed_at=observed_at,
+                    data=data,
+                    event_hash=event_hash,
+                )
+            )
+
+        insert = (
+            pg_insert
+            if self.session.get_bind().dialect.name == "postgresql"
+            else sqlite_insert
+        )
+        stmt = (
+            insert(Message)
+            .on_conflict_do_nothing(
+                index_elements=[Message.conversation_id, Message.event_hash],
+                index_where=Message.event_hash.isnot(None),
+            )
+            .returning(Message.id)
+        )
+
+        inserted = {row_id for (row_id,) in self.session.execute(stmt, rows).all()}
+        inserted_rows = [row for row in rows if row["id"] in inserted]
+        TokenLedgerRepository(self.session).record(
+            conversation,
+            ((row["extra_data"], row["timestamp"]) for row in inserted_rows),
+        )
+        return [row["id"] for row in inserted_rows]
+
+    def _build_message_row(
+        self,
+        conversation: Conversation,
+        epoch_id: uuid.UUID,
+        sequence: int,
+        event_type: str,
+        emitted_at: datetime,
+        observed_at: datetime,
+        data: dict[str, Any],
+        event_hash: Optional[str],
+    ) -> dict[str, Any]:
+        """Build Message column values for a collector event.
+
+        Shared by add_message() and add_messages_bulk() so both paths write
+        identical rows.
+        """
         # Map event types to message roles
         role = self._derive_role(event_type, data)
         content = self._derive_content(event_type, data)
@@ -794,32 +1063,30 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
         if data.get("thinking_metadata"):
             extra_data["thinking_metadata"] = data["thinking_metadata"]
 
-        # Compute sequence from existing message count (for ordering)
-        sequence = (conversation.message_count or 0) + 1
-
         # Normalize timestamps to naive UTC for database storage
         emitted_at_naive = _to_naive_utc(emitted_at)
         observed_at_naive = _to_naive_utc(observed_at)
 
-        message = Message(
-            epoch_id=epoch.id,
-            conversation_id=conversation.id,
-            sequence=sequence,
-            role=role,
-            content=content,
-            timestamp=emitted_at_naive,
-            emitted_at=emitted_at_naive,
-            observed_at=observed_at_naive,
-            author_role=author_role,
-            message_type=message_type,
-            thinking_content=data.get("thinking_content"),
-            tool_calls=tool_calls,
-            extra_data=extra_data if extra_data else None,
-            event_hash=event_hash,  # Content-based deduplication
-            raw_data=data,  # Store full event data for reference
-        )
-        self.session.add(message)
-        return message
+        return {
+            "id": uuid.uuid4(),
+            "epoch_id": epoch_id,
+            "conversation_id": conversation.id,
+            "sequence": sequence,
+            "role": role,
+            "content": content,
+            "timestamp": emitted_at_naive,
+            "emitted_at": emitted_at_naive,
+            "observed_at": observed_at_naive,
+            "author_role": author_role,
+            "message_type": message_type,
+            "thinking_content": data.get("thinking_content"),
+            **message_token_counts(content, data.get("thinking_content")),
+            "tool_calls": tool_calls,
+            "spawns_agent": spawns_agent(tool_calls),
+            "extra_data": extra_data if extra_data else None,
+            "event_hash": event_hash,  # Content-based deduplication
+            "raw_data": data,  # Store full event data for reference
+        }
 
     def add_file_touched(
         self,
@@ -867,8 +1134,21 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
     def add_file_touches_batch(
         self,
         conversation: Conversation,
-        touches: list[tuple[str, str, datetime]],
+        touches: list[tuple[str, str, datetime, int, int]],
     ) -> int:
+        """
+        Batch-insert file touched records; see insert_file_touches_batch().
+
+        Returns:
+            Number of records added
+        """
+        return len(self.insert_file_touches_batch(conversation, touches))
+
+    def insert_file_touches_batch(
+        self,
+        conversation: Conversation,
+        touches: list[tuple[str, str, datetime, int, int]],
+    ) -> list[FileTouched]:
         """
         Batch-insert multiple file touched records in a single operation.
 
@@ -878,32 +1158,36 @@ class CollectorSessionRepository(BaseRepository[Conversation]):
 
         Args:
             conversation: Parent conversation
-            touches: List of (file_path, change_type, timestamp) tuples
+            touches: List of (file_path, change_type, timestamp, lines_added,
+                lines_deleted) tuples; see tool_call_line_counts()
 
         Returns:
-            Number of records added
+            The added FileTouched records
         """
         if not touches:
-            return 0
+            return []
 
         epoch = self._get_default_epoch(conversation)
 
         records = [
             FileTouched(
+                id=uuid.uuid4(),
                 conversation_id=conversation.id,
                 epoch_id=epoch.id,
                 file_path=file_path,
                 change_type=change_type,
                 timestamp=_to_naive_utc(timestamp),
+                lines_added=lines_added,
+                lines_deleted=lines_deleted,
             )
-            for file_path, change_type, timestamp in touches
+            for file_path, change_type, timestamp, lines_added, lines_deleted in touches
         ]
         self.session.add_all(records)
 
         # Update denormalized count
         conversation.files_count = (conversation.files_count or 0) + len(records)
 
-        return len(records)
+        return records
 
     def _add_batch_files_touched(
         self,
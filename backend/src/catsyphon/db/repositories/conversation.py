@@ -4,10 +4,10 @@ Conversation repository.
 
 import uuid
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, aliased, joinedload, selectinload
+from sqlalchemy import func, select, tuple_
+from sqlalchemy.orm import Query, Session, aliased, joinedload, selectinload
 
 from catsyphon.db.repositories.base import BaseRepository
 from catsyphon.models.db import Conversation
@@ -483,6 +483,76 @@ class ConversationRepository(BaseRepository[Conversation]):
 
         return query.all()
 
+    @staticmethod
+    def _filter_top_level(
+        query: Query[Any],
+        project_id: Optional[uuid.UUID] = None,
+        developer_id: Optional[uuid.UUID] = None,
+        agent_type: Optional[str] = None,
+        status: Optional[str] = None,
+        success: Optional[bool] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        collector_id: Optional[uuid.UUID] = None,
+    ) -> Query[Any]:
+        """Apply the conversation list filters to a top-level query."""
+        if project_id:
+            query = query.filter(Conversation.project_id == project_id)
+        if developer_id:
+            query = query.filter(Conversation.developer_id == developer_id)
+        if agent_type:
+            query = query.filter(Conversation.agent_type.ilike(f"%{agent_type}%"))
+        if status:
+            query = query.filter(Conversation.status == status)
+        if success is not None:
+            query = query.filter(Conversation.success == success)
+        if start_date:
+            # Conversations with activity on or after start_date
+            query = query.filter(
+                func.coalesce(Conversation.end_time, Conversation.start_time)
+                >= start_date
+            )
+        if end_date:
+            query = query.filter(Conversation.start_time <= end_date)
+        if collector_id:
+            query = query.filter(Conversation.collector_id == collector_id)
+        return query
+
+    def estimate_count_by_filters(self, workspace_id: uuid.UUID, **filters: Any) -> int:
+        """
+        Approximate count of top-level conversations matching list filters.
+
+        On PostgreSQL this is the planner's row estimate for the filtered
+        query, read from EXPLAIN without scanning any rows, so it stays
+        constant-time on large workspaces; it is only as accurate as the
+        table statistics. Other databases return an exact count.
+
+        Args:
+            workspace_id: Workspace UUID (required)
+            **filters: Same filters as get_with_counts_hierarchical()
+
+        Returns:
+            Estimated number of matching parent conversations
+        """
+        query = self._filter_top_level(
+            self.session.query(Conversation.id).filter(
+                Conversation.workspace_id == workspace_id,
+                Conversation.parent_conversation_id.is_(None),
+            ),
+            **filters,
+        )
+        bind = self.session.get_bind()
+        if bind.dialect.name != "postgresql":
+            return query.count()
+
+        compiled = query.statement.compile(dialect=bind.dialect)
+        plan: Any = (
+            self.session.connection()
+            .exec_driver_sql(f"EXPLAIN (FORMAT JSON) {compiled}", compiled.params)
+            .scalar()
+        )
+        return int(plan[0]["Plan"]["Plan Rows"])
+
     def get_with_counts_hierarchical(
         self,
         workspace_id: uuid.UUID,
@@ -498,6 +568,8 @@ class ConversationRepository(BaseRepository[Conversation]):
         order_dir: str = "desc",
         limit: Optional[int] = None,
         offset: int = 0,
+        keyset: bool = False,
+        after: Optional[Tuple[datetime, uuid.UUID]] = None,
     ) -> List[Tuple[Conversation, int, int, int, int, Optional[datetime], int]]:
         """
         Get conversations with hierarchical ordering (parents followed by children).
@@ -524,6 +596,12 @@ class ConversationRepository(BaseRepository[Conversation]):
             order_dir: Order direction for parents ('asc' or 'desc')
             limit: Maximum number of parent conversations (children not counted)
             offset: Number of parent conversations to skip
+            keyset: Order parents by (last_activity, id) instead of
+                (last_activity, message_count) so pages can be continued
+                with ``after``; requires order_by='last_activity'
+            after: (last_activity, id) of the last parent on the previous
+                page; implies keyset. Only parents past it are returned, so
+                deep pages cost the same as the first one
 
         Returns:
             List of (Conversation, message_count, epoch_count, files_count,
@@ -559,33 +637,17 @@ class ConversationRepository(BaseRepository[Conversation]):
             )
         )
 
-        # Apply filters
-        if project_id:
-            parent_query = parent_query.filter(Conversation.project_id == project_id)
-        if developer_id:
-            parent_query = parent_query.filter(
-                Conversation.developer_id == developer_id
-            )
-        if agent_type:
-            parent_query = parent_query.filter(
-                Conversation.agent_type.ilike(f"%{agent_type}%")
-            )
-        if status:
-            parent_query = parent_query.filter(Conversation.status == status)
-        if success is not None:
-            parent_query = parent_query.filter(Conversation.success == success)
-        if start_date:
-            # Conversations with activity on or after start_date
-            parent_query = parent_query.filter(
-                func.coalesce(Conversation.end_time, Conversation.start_time)
-                >= start_date
-            )
-        if end_date:
-            parent_query = parent_query.filter(Conversation.start_time <= end_date)
-        if collector_id:
-            parent_query = parent_query.filter(
-                Conversation.collector_id == collector_id
-            )
+        parent_query = self._filter_top_level(
+            parent_query,
+            project_id=project_id,
+            developer_id=developer_id,
+            agent_type=agent_type,
+            status=status,
+            success=success,
+            start_date=start_date,
+            end_date=end_date,
+            collector_id=collector_id,
+        )
 
         # Order parents with secondary sort by message_count
         if order_by == "last_activity":
@@ -594,7 +656,26 @@ class ConversationRepository(BaseRepository[Conversation]):
         else:
             order_col = getattr(Conversation, order_by, Conversation.start_time)
 
-        if order_dir == "desc":
+        if keyset or after is not None:
+            if order_by != "last_activity":
+                raise ValueError("Keyset pagination requires order_by='last_activity'")
+            # Unique (last_activity, id) order so a cursor marks an exact position
+            key = tuple_(order_col, Conversation.id)
+            if after is not None:
+                parent_query = parent_query.filter(
+                    key < tuple_(*after)
+                    if order_dir == "desc"
+                    else key > tuple_(*after)
+                )
+            if order_dir == "desc":
+                parent_query = parent_query.order_by(
+                    order_col.desc(), Conversation.id.desc()
+                )
+            else:
+                parent_query = parent_query.order_by(
+                    order_col.asc(), Conversation.id.asc()
+                )
+        elif order_dir == "desc":
             parent_query = parent_query.order_by(
                 order_col.desc(),
                 Conversation.message_count.desc(),
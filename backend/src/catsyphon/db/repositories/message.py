@@ -4,13 +4,27 @@ Message repository.
 
 import uuid
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Iterator, List, Optional, Sequence
 
-from sqlalchemy.orm import Session
+from sqlalchemy import Row, case, func, or_, select, tuple_
+from sqlalchemy.orm import Session, defer
 
+from catsyphon.canonicalization.tokens import message_token_counts
 from catsyphon.db.repositories.base import BaseRepository
 from catsyphon.models.db import Message
 
+# Tools whose calls spawn a sub-agent conversation
+AGENT_SPAWNING_TOOLS = frozenset({"Task"})
+
+
+def spawns_agent(tool_calls: Optional[list[Any]]) -> bool:
+    """Whether any of a message's tool calls spawns a sub-agent."""
+    return any(
+        isinstance(tool_call, dict)
+        and tool_call.get("tool_name") in AGENT_SPAWNING_TOOLS
+        for tool_call in tool_calls or ()
+    )
+
 
 class MessageRepository(BaseRepository[Message]):
     """Repository for Message model."""
@@ -23,24 +37,35 @@ class MessageRepository(BaseRepository[Message]):
         conversation_id: uuid.UUID,
         limit: Optional[int] = None,
         offset: int = 0,
+        after: Optional[Message] = None,
     ) -> List[Message]:
         """
         Get messages for a conversation.
 
+        Messages are ordered by (sequence, timestamp, id); sequence alone is
+        not unique since collector batches share one.
+
         Args:
             conversation_id: Conversation UUID
             limit: Maximum number of results
             offset: Number of results to skip
+            after: Return only messages after this one (keyset pagination;
+                unlike offset, cost does not grow with the page depth)
 
         Returns:
             List of messages ordered by sequence
         """
-        query = (
-            self.session.query(Message)
-            .filter(Message.conversation_id == conversation_id)
-            .order_by(Message.sequence.asc())
-            .offset(offset)
+        key = tuple_(Message.sequence, Message.timestamp, Message.id)
+        query = self.session.query(Message).filter(
+            Message.conversation_id == conversation_id
         )
+        if after is not None:
+            query = query.filter(
+                key > tuple_(after.sequence, after.timestamp, after.id)
+            )
+        query = query.order_by(
+            Message.sequence.asc(), Message.timestamp.asc(), Message.id.asc()
+        ).offset(offset)
         if limit:
             query = query.limit(limit)
         return query.all()
@@ -151,6 +176,250 @@ class MessageRepository(BaseRepository[Message]):
             **kwargs,
         )
 
+    def find_spawning_message(
+        self, conversation_id: uuid.UUID, before: datetime
+    ) -> Optional[uuid.UUID]:
+        """
+        Find the latest agent-spawning message at or before a time.
+
+        Uses the partial index on spawning messages, so the cost does not
+        grow with the length of the conversation.
+
+        Args:
+            conversation_id: Parent conversation UUID
+            before: When the agent conversation started
+
+        Returns:
+            Message ID of the closest preceding spawning call, or None
+        """
+        message_id: Optional[uuid.UUID] = (
+            self.session.query(Message.id)
+            .filter(
+                Message.conversation_id == conversation_id,
+                Message.spawns_agent.is_(True),
+                Message.timestamp <= before,
+            )
+            .order_by(Message.timestamp.desc())
+            .limit(1)
+            .scalar()
+        )
+        return message_id
+
+    def epoch_message_bounds(
+        self, conversation_id: uuid.UUID
+    ) -> dict[uuid.UUID, tuple[uuid.UUID, uuid.UUID, int]]:
+        """
+        Get the first message id, last message id and message count per epoch.
+
+        Messages are ordered by (sequence, timestamp, id), the order
+        ``iter_sampling_summaries`` streams them in; ids rather than
+        sequences identify the bounds since collector batches can share
+        sequence values.
+
+        Args:
+            conversation_id: Conversation UUID
+
+        Returns:
+            Mapping of epoch id to (first message id, last message id, count)
+        """
+        order = (Message.sequence, Message.timestamp, Message.id)
+        ranked = (
+            select(
+                Message.epoch_id,
+                Message.id,
+                func.row_number()
+                .over(partition_by=Message.epoch_id, order_by=order)
+                .label("from_first"),
+                func.row_number()
+                .over(
+                    partition_by=Message.epoch_id,
+                    order_by=[column.desc() for column in order],
+                )
+                .label("from_last"),
+                func.count().over(partition_by=Message.epoch_id).label("count"),
+            )
+            .where(Message.conversation_id == conversation_id)
+            .subquery()
+        )
+        rows = self.session.execute(
+            select(ranked).where(or_(ranked.c.from_first == 1, ranked.c.from_last == 1))
+        )
+
+        bounds: dict[uuid.UUID, tuple[uuid.UUID, uuid.UUID, int]] = {}
+        for epoch_id, message_id, from_first, _, count in rows:
+            first, last, _ = bounds.get(epoch_id, (message_id, message_id, count))
+            if from_first == 1:
+                first = message_id
+            else:
+                last = message_id
+            bounds[epoch_id] = (first, last, count)
+        return bounds
+
+    def iter_sampling_summaries(
+        self,
+        conversation_id: uuid.UUID,
+        error_patterns: Sequence[str],
+        batch_size: int = 1000,
+        after: Optional[tuple[int, datetime, uuid.UUID]] = None,
+    ) -> Iterator[Row[Any]]:
+        """
+        Stream lightweight per-message summaries for canonical sampling.
+
+        Rows are computed in the database and fetched ``batch_size`` at a
+        time, so content, tool call and raw JSON payloads are never loaded.
+        Text is only returned for content not token-counted at ingest.
+
+        Args:
+            conversation_id: Conversation UUID
+            error_patterns: Lowercase substrings that mark an error message
+            batch_size: Rows fetched per round trip
+            after: Only stream messages after this (sequence, timestamp, id)
+
+        Yields:
+            Rows ordered by sequence, with the fields of
+            ``canonicalization.samplers.MessageSummary``
+        """
+        if self.session.get_bind().dialect.name == "postgresql":
+            array_length = func.jsonb_array_length
+        else:
+            array_length = func.json_array_length
+
+        content_lower = func.lower(Message.content)
+        stmt = (
+            select(
+                Message.id,
+                Message.epoch_id,
+                Message.sequence,
+                Message.timestamp,
+                or_(
+                    *(
+                        content_lower.contains(pattern, autoescape=True)
+                        for pattern in error_patterns
+                    )
+                ).label("has_error"),
+                func.coalesce(array_length(Message.tool_calls), 0).label(
+                    "tool_call_count"
+                ),
+                func.coalesce(array_length(Message.code_changes), 0).label(
+                    "code_change_count"
+                ),
+                func.coalesce(func.length(Message.content), 0).label("content_length"),
+                Message.content_tokens,
+                func.coalesce(func.length(Message.thinking_content), 0).label(
+                    "thinking_length"
+                ),
+                Message.thinking_tokens,
+                case((Message.content_tokens.is_(None), Message.content)).label(
+                    "content"
+                ),
+                case(
+                    (Message.thinking_tokens.is_(None), Message.thinking_content)
+                ).label("thinking_content"),
+            )
+            .where(Message.conversation_id == conversation_id)
+            .order_by(Message.sequence.asc(), Message.timestamp.asc(), Message.id.asc())
+            .execution_options(yield_per=batch_size)
+        )
+        if after is not None:
+            stmt = stmt.where(
+                tuple_(Message.sequence, Message.timestamp, Message.id) > tuple_(*after)
+            )
+        yield from self.session.execute(stmt)
+
+    def count_through(
+        self, conversation_id: uuid.UUID, through: tuple[int, datetime, uuid.UUID]
+    ) -> int:
+        """
+        Count a conversation's messages up to and including a position.
+
+        Args:
+            conversation_id: Conversation UUID
+            through: Last (sequence, timestamp, id) to count
+
+        Returns:
+            Number of messages ordered at or before ``through``
+        """
+        count: int = (
+            self.session.query(func.count(Message.id))
+            .filter(
+                Message.conversation_id == conversation_id,
+                tuple_(Message.sequence, Message.timestamp, Message.id)
+                <= tuple_(*through),
+            )
+            .scalar()
+        )
+        return count
+
+    def get_for_rendering(
+        self, message_ids: Sequence[uuid.UUID], chunk_size: int = 500
+    ) -> dict[uuid.UUID, Message]:
+        """
+        Load full messages by id, without the payloads narratives never show.
+
+        Args:
+            message_ids: Message UUIDs
+            chunk_size: Ids per IN query
+
+        Returns:
+            Mapping of message id to message
+        """
+        messages: dict[uuid.UUID, Message] = {}
+        for start in range(0, len(message_ids), chunk_size):
+            chunk = message_ids[start : start + chunk_size]
+            for message in (
+                self.session.query(Message)
+                .options(
+                    defer(Message.raw_data),
+                    defer(Message.tool_results),
+                    defer(Message.entities),
+                )
+                .filter(Message.id.in_(chunk))
+            ):
+                messages[message.id] = message
+        return messages
+
+    def backfill_token_counts(self, batch_size: int = 1000) -> Iterator[int]:
+        """
+        Store token counts on messages ingested before they were counted.
+
+        Walks messages with NULL content_tokens in id order, flushing one
+        batch of updates at a time. Counts are exact, encoding the full
+        texts, where ingest stores prefix-based estimates.
+
+        Args:
+            batch_size: Messages counted per batch
+
+        Yields:
+            Number of messages updated in each flushed batch; callers may
+            commit between batches
+        """
+        last_id: Optional[uuid.UUID] = None
+        while True:
+            query = self.session.query(
+                Message.id, Message.content, Message.thinking_content
+            ).filter(Message.content_tokens.is_(None))
+            if last_id is not None:
+                query = query.filter(Message.id > last_id)
+            rows = query.order_by(Message.id).limit(batch_size).all()
+            if not rows:
+                return
+
+            self.session.bulk_update_mappings(
+                Message,
+                [
+                    {
+                        "id": row.id,
+                        **message_token_counts(
+                            row.content, row.thinking_content, exact=True
+                        ),
+                    }
+                    for row in rows
+                ],
+            )
+            self.session.flush()
+            last_id = rows[-1].id
+            yield len(rows)
+
     def bulk_create(self, messages: List[dict]) -> List[Message]:
         """
         Bulk create messages for efficiency.
@@ -175,8 +444,20 @@ class MessageRepository(BaseRepository[Message]):
             ]
             created = repo.bulk_create(messages)
         """
-        # Create Message instances
-        instances = [Message(**msg_data) for msg_data in messages]
+        # Create Message instances, counting tokens and flagging spawning
+        # calls once here so later readers never rescan stored messages
+        instances = [
+            Message(
+                **{
+                    **message_token_counts(
+                        msg_data.get("content"), msg_data.get("thinking_content")
+                    ),
+                    "spawns_agent": spawns_agent(msg_data.get("tool_calls")),
+                    **msg_data,
+                }
+            )
+            for msg_data in messages
+        ]
 
         # Bulk insert
         self.session.bulk_save_objects(instances, return_defaults=True)
@@ -0,0 +1,183 @@
+"""
+Plan repository.
+
+Maintains the plans and plan_iterations tables, an indexed copy of the plan
+dicts stored in ``Conversation.extra_data["plans"]`` (see
+``PlanInfo.to_dict()``). They are rewritten whenever a conversation's plans
+are set at ingest, so plan listing, status filters and counts never scan
+conversation JSONB.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from catsyphon.db.repositories.base import BaseRepository
+from catsyphon.models.db import Conversation, Plan, PlanIteration, Project
+
+logger = logging.getLogger(__name__)
+
+
+def _parse_timestamp(value: Any) -> Optional[datetime]:
+    if isinstance(value, datetime):
+        return value
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class PlanRepository(BaseRepository[Plan]):
+    """Repository for plans extracted from conversations."""
+
+    def __init__(self, session: Session):
+        super().__init__(Plan, session)
+
+    def replace_for_conversation(
+        self, conversation: Conversation, plans: Optional[list[dict[str, Any]]]
+    ) -> list[Plan]:
+        """
+        Replace a conversation's plan rows with the given plan dicts.
+
+        Args:
+            conversation: Conversation the plans belong to
+            plans: Plan dicts in ``PlanInfo.to_dict()`` form (None or empty
+                removes all plans)
+
+        Returns:
+            The new Plan rows, in plan_index order
+        """
+        conversation.plans.clear()
+        # Deletes must reach the database before re-using plan_index values
+        self.session.flush()
+
+        for index, data in enumerate(plans or []):
+            if not isinstance(data, dict):
+                continue
+            plan = Plan(
+                workspace_id=conversation.workspace_id,
+                plan_index=index,
+                plan_file_path=data.get("plan_file_path") or "",
+                status=data.get("status") or "active",
+                iteration_count=data.get("iteration_count") or 1,
+                initial_content=data.get("initial_content"),
+                final_content=data.get("final_content"),
+                entry_message_index=data.get("entry_message_index"),
+                exit_message_index=data.get("exit_message_index"),
+                related_agent_session_ids=list(
+                    data.get("related_agent_session_ids") or []
+                ),
+            )
+            plan.iterations = [
+                PlanIteration(
+                    sequence=sequence,
+                    operation_type=op.get("operation_type") or "",
+                    file_path=op.get("file_path") or "",
+                    content=op.get("content"),
+                    old_content=op.get("old_content"),
+                    new_content=op.get("new_content"),
+                    timestamp=_parse_timestamp(op.get("timestamp")),
+                    message_index=op.get("message_index") or 0,
+                )
+                for sequence, op in enumerate(data.get("operations") or [])
+                if isinstance(op, dict)
+            ]
+            conversation.plans.append(plan)
+
+        self.session.flush()
+        return list(conversation.plans)
+
+    def get_for_conversation(self, conversation_id: UUID) -> list[Plan]:
+        """Get a conversation's plans with their iterations, in order."""
+        stmt = (
+            select(Plan)
+            .where(Plan.conversation_id == conversation_id)
+            .options(selectinload(Plan.iterations))
+            .order_by(Plan.plan_index)
+        )
+        return list(self.session.execute(stmt).scalars().all())
+
+    def list_page(
+        self,
+        workspace_id: UUID,
+        status: Optional[str] = None,
+        project_id: Optional[UUID] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        offset: int = 0,
+        limit: int = 50,
+    ) -> tuple[list[Any], int]:
+        """
+        List plans in a workspace, newest conversation first.
+
+        Filters apply to the plan status and the parent conversation's
+        project and start time.
+
+        Returns:
+            Tuple of (rows, total) where each row has plan_file_path, status,
+            iteration_count, conversation_id, conversation_start_time,
+            project_id and project_name
+        """
+        query = (
+            self.session.query(Plan)
+            .join(Conversation, Plan.conversation_id == Conversation.id)
+            .filter(Plan.workspace_id == workspace_id)
+        )
+        if status:
+            query = query.filter(Plan.status == status)
+        if project_id:
+            query = query.filter(Conversation.project_id == project_id)
+        if start_date:
+            query = query.filter(Conversation.start_time >= start_date)
+        if end_date:
+            query = query.filter(Conversation.start_time <= end_date)
+
+        total = query.order_by(None).count()
+        rows = (
+            query.outerjoin(Project, Conversation.project_id == Project.id)
+            .with_entities(
+                Plan.plan_file_path,
+                Plan.status,
+                Plan.iteration_count,
+                Plan.conversation_id,
+                Conversation.start_time.label("conversation_start_time"),
+                Conversation.project_id,
+                Project.name.label("project_name"),
+            )
+            .order_by(
+                Conversation.start_time.desc(),
+                Plan.conversation_id,
+                Plan.plan_index,
+            )
+            .offset(offset)
+            .limit(limit)
+            .all()
+        )
+        return rows, total
+
+    def stats(self, workspace_id: UUID) -> tuple[int, dict[str, int], int]:
+        """
+        Count plans in a workspace.
+
+        Returns:
+            Tuple of (total plans, plans by status, conversations with plans)
+        """
+        by_status = dict(
+            self.session.query(Plan.status, func.count(Plan.id))
+            .filter(Plan.workspace_id == workspace_id)
+            .group_by(Plan.status)
+            .all()
+        )
+        conversations = (
+            self.session.query(func.count(func.distinct(Plan.conversation_id)))
+            .filter(Plan.workspace_id == workspace_id)
+            .scalar()
+            or 0
+        )
+        return sum(by_status.values()), by_status, conversations
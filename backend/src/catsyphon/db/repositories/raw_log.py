@@ -2,17 +2,31 @@
 RawLog repository.
 """
 
+import os
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Iterator, List, Mapping, Optional
 
+from sqlalchemy import Row, select, tuple_, update
 from sqlalchemy.orm import Session, load_only
 
 from catsyphon.db.repositories.base import BaseRepository
 from catsyphon.models.db import RawLog
-from catsyphon.parsers.incremental import calculate_partial_hash
-from catsyphon.utils.hashing import calculate_content_hash, calculate_file_hash
+from catsyphon.utils.hashing import (
+    PartialHashState,
+    advance_partial_hash,
+    calculate_content_hash,
+    calculate_file_hash,
+)
+
+
+def _file_mtime(file_path: str) -> Optional[float]:
+    """Current mtime of a log file, or None if it cannot be read."""
+    try:
+        return os.stat(file_path).st_mtime
+    except OSError:
+        return None
 
 
 class RawLogRepository(BaseRepository[RawLog]):
@@ -130,6 +144,7 @@ class RawLogRepository(BaseRepository[RawLog]):
                     RawLog.last_processed_offset,
                     RawLog.file_size_bytes,
                     RawLog.partial_hash,
+                    RawLog.partial_hash_state,
                     RawLog.imported_at,
                 )
             )
@@ -141,6 +156,76 @@ class RawLogRepository(BaseRepository[RawLog]):
             query = query.limit(limit)
         return query.all()
 
+    def iter_directory_state(
+        self, directory: str, batch_size: int = 1000
+    ) -> Iterator[Row[Any]]:
+        """
+        Stream change-detection state for raw logs under a directory.
+
+        Rows are ordered by file_path in byte order and fetched in keyset
+        pages of ``batch_size``, so the watch daemon's startup scan can
+        merge-join them against a sorted directory walk without loading every
+        tracked file at once. Each page is read in full before it is
+        yielded, so no cursor stays open while the caller works on it.
+
+        Args:
+            directory: Directory path (matches any file_path under it)
+            batch_size: Rows fetched per page
+
+        Yields:
+            Rows with id, file_path, last_processed_offset, file_size_bytes,
+            partial_hash, partial_hash_state and file_mtime
+        """
+        search_pattern = directory.rstrip("/") + "/%"
+        # Match Python string ordering regardless of database collation
+        file_path = (
+            RawLog.file_path.collate("C")
+            if self.session.get_bind().dialect.name == "postgresql"
+            else RawLog.file_path
+        )
+
+        stmt = (
+            select(
+                RawLog.id,
+                RawLog.file_path,
+                RawLog.last_processed_offset,
+                RawLog.file_size_bytes,
+                RawLog.partial_hash,
+                RawLog.partial_hash_state,
+                RawLog.file_mtime,
+            )
+            .where(RawLog.file_path.like(search_pattern))
+            .order_by(file_path, RawLog.id)
+            .limit(batch_size)
+        )
+        page = stmt
+        while True:
+            rows = self.session.execute(page).all()
+            yield from rows
+            if len(rows) < batch_size:
+                return
+            last = rows[-1]
+            page = stmt.where(
+                tuple_(file_path, RawLog.id) > tuple_(last.file_path, last.id)
+            )
+
+    def set_file_mtimes(self, mtimes: Mapping[uuid.UUID, float]) -> None:
+        """
+        Record file mtimes for raw logs whose state was verified unchanged.
+
+        Args:
+            mtimes: File mtime keyed by raw log id
+        """
+        if not mtimes:
+            return
+        self.session.execute(
+            update(RawLog),
+            [
+                {"id": raw_log_id, "file_mtime": mtime}
+                for raw_log_id, mtime in mtimes.items()
+            ],
+        )
+
     def exists_by_file_hash(self, file_hash: str) -> bool:
         """
         Check if a raw log with the given file hash exists.
@@ -175,7 +260,7 @@ class RawLogRepository(BaseRepository[RawLog]):
             file_path: Path to original log file
             store_raw_content: Persist full raw file content when True. Set to
                 False for large watch files to avoid high memory usage.
-            **kwargs: Additional fields (e.g., extra_data)
+            **kwargs: Additional fields (e.g., extra_data, parser_name)
 
         Returns:
             Created raw log instance
@@ -190,10 +275,12 @@ class RawLogRepository(BaseRepository[RawLog]):
             raw_content = file_path.read_text(encoding="utf-8")
 
         # Get file size
-        file_size = file_path.stat().st_size
+        stat = file_path.stat()
+        file_size = stat.st_size
 
-        # Calculate partial hash for the entire file (since we processed all of it)
-        partial_hash = calculate_partial_hash(file_path, file_size)
+        # Calculate partial hash for the entire file (since we processed all of it),
+        # keeping the chained state so later appends only hash new bytes
+        partial_hash, hash_state = advance_partial_hash(file_path, file_size)
 
         return self.create(
             conversation_id=conversation_id,
@@ -205,6 +292,8 @@ class RawLogRepository(BaseRepository[RawLog]):
             file_size_bytes=file_size,
             last_processed_offset=file_size,
             partial_hash=partial_hash,
+            partial_hash_state=hash_state.to_dict(),
+            file_mtime=stat.st_mtime,
             **kwargs,
         )
 
@@ -212,6 +301,7 @@ class RawLogRepository(BaseRepository[RawLog]):
         self,
         raw_log: RawLog,
         file_path: Path,
+        parser_name: Optional[str] = None,
     ) -> RawLog:
         """
         Update existing raw log from file (for full reparse scenarios).
@@ -223,6 +313,7 @@ class RawLogRepository(BaseRepository[RawLog]):
         Args:
             raw_log: Existing raw log instance to update
             file_path: Path to original log file
+            parser_name: Parser that handled the file, if known
 
         Returns:
             Updated raw log instance
@@ -234,10 +325,12 @@ class RawLogRepository(BaseRepository[RawLog]):
         raw_content = file_path.read_text(encoding="utf-8")
 
         # Get file size
-        file_size = file_path.stat().st_size
+        stat = file_path.stat()
+        file_size = stat.st_size
 
-        # Calculate partial hash for the entire file (since we processed all of it)
-        partial_hash = calculate_partial_hash(file_path, file_size)
+        # Calculate partial hash for the entire file (since we processed all of it),
+        # keeping the chained state so later appends only hash new bytes
+        partial_hash, hash_state = advance_partial_hash(file_path, file_size)
 
         # Update raw log fields
         raw_log.raw_content = raw_content
@@ -246,6 +339,10 @@ class RawLogRepository(BaseRepository[RawLog]):
         raw_log.file_size_bytes = file_size
         raw_log.last_processed_offset = file_size  # Processed entire file
         raw_log.partial_hash = partial_hash
+        raw_log.partial_hash_state = hash_state.to_dict()
+        raw_log.file_mtime = stat.st_mtime
+        if parser_name:
+            raw_log.parser_name = parser_name
         raw_log.imported_at = datetime.now(timezone.utc)
 
         # Note: Caller is responsible for flushing to ensure proper
@@ -301,6 +398,8 @@ class RawLogRepository(BaseRepository[RawLog]):
         file_size_bytes: int,
         partial_hash: str,
         last_message_timestamp: Optional[object] = None,
+        partial_hash_state: Optional[PartialHashState] = None,
+        parser_name: Optional[str] = None,
     ) -> RawLog:
         """
         Update incremental parsing state for a raw log.
@@ -312,6 +411,9 @@ class RawLogRepository(BaseRepository[RawLog]):
             file_size_bytes: Current file size in bytes
             partial_hash: SHA-256 hash of content up to last_processed_offset
             last_message_timestamp: Timestamp of last processed message
+            partial_hash_state: Chained-hash state when ``partial_hash`` came
+                from ``advance_partial_hash``; None for a plain SHA-256
+            parser_name: Parser that handled the file; left unchanged if None
 
         Returns:
             Updated raw log instance
@@ -320,7 +422,17 @@ class RawLogRepository(BaseRepository[RawLog]):
         raw_log.last_processed_line = last_processed_line
         raw_log.file_size_bytes = file_size_bytes
         raw_log.partial_hash = partial_hash
+        raw_log.partial_hash_state = (
+            partial_hash_state.to_dict() if partial_hash_state else None
+        )
         raw_log.last_message_timestamp = last_message_timestamp
+        # Stat after the caller measured file_size_bytes: a write in between
+        # leaves the recorded size stale, so the next startup scan re-checks
+        raw_log.file_mtime = (
+            _file_mtime(raw_log.file_path) if raw_log.file_path else None
+        )
+        if parser_name:
+            raw_log.parser_name = parser_name
         # Note: Caller is responsible for flushing to ensure proper
         # transaction ordering (messages must be persisted before RawLog state)
         return raw_log
@@ -0,0 +1,340 @@
+"""
+Rollup repository.
+
+Maintains the conversation_rollups and project_daily_rollups tables at
+ingest time so analytics endpoints read pre-aggregated rows instead of
+grouping messages and files_touched on every request.
+
+Appends (collector batches, incremental log parsing) add only the rows
+written in that batch to the existing rollup, so a long-running session is
+never re-aggregated per batch. Full ingests and reparses recompute the
+conversation's rollup from its own rows (an indexed, single-conversation
+aggregate). Either way the project-day bucket is adjusted by the difference
+between the old and new rollup, so moving a conversation to another project
+never rescans the rest of the project.
+"""
+
+import logging
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Optional, Sequence, Union
+
+from sqlalchemy import case, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from catsyphon.models.db import (
+    Conversation,
+    ConversationRollup,
+    FileTouched,
+    Message,
+    ProjectDailyRollup,
+)
+
+logger = logging.getLogger(__name__)
+
+# ProjectDailyRollup counters that are adjusted incrementally
+_DAILY_COUNTERS = (
+    "session_count",
+    "message_count",
+    "user_message_count",
+    "assistant_message_count",
+    "tool_call_count",
+    "lines_added",
+    "lines_deleted",
+    "first_change_latency_seconds",
+    "first_change_sessions",
+)
+
+BucketKey = tuple[uuid.UUID, date]
+
+# Ids per IN clause when aggregating a batch (SQLite bind parameter limit)
+_ID_CHUNK_SIZE = 500
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Normalize a datetime to aware UTC (SQLite returns naive values)."""
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+def rollup_day(start_time: datetime) -> date:
+    """Return the project-day bucket for a conversation start time."""
+    return _as_utc(start_time).date()
+
+
+def _contribution(rollup: ConversationRollup) -> dict[str, float]:
+    """What a conversation rollup adds to its project-day bucket."""
+    latency = rollup.first_change_latency_seconds
+    return {
+        "session_count": 1,
+        "message_count": rollup.message_count,
+        "user_message_count": rollup.user_message_count,
+        "assistant_message_count": rollup.assistant_message_count,
+        "tool_call_count": rollup.user_tool_call_count
+        + rollup.assistant_tool_call_count,
+        "lines_added": rollup.lines_added,
+        "lines_deleted": rollup.lines_deleted,
+        "first_change_latency_seconds": latency or 0.0,
+        "first_change_sessions": 1 if latency is not None else 0,
+    }
+
+
+def _chunks(ids: Sequence[uuid.UUID]) -> Iterable[Sequence[uuid.UUID]]:
+    for start in range(0, len(ids), _ID_CHUNK_SIZE):
+        yield ids[start : start + _ID_CHUNK_SIZE]
+
+
+class RollupRepository:
+    """Repository maintaining conversation and project-day rollups."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def refresh(self, conversation: Conversation) -> ConversationRollup:
+        """
+        Recompute a conversation's rollup and adjust its project-day bucket.
+
+        Call after the conversation's messages and files_touched have been
+        written (the queries autoflush pending rows).
+
+        Args:
+            conversation: Conversation whose rows changed
+
+        Returns:
+            The up-to-date ConversationRollup
+        """
+        rollup = self.session.get(ConversationRollup, conversation.id)
+        deltas: dict[BucketKey, dict[str, float]] = {}
+        if rollup is None:
+            rollup = ConversationRollup(conversation_id=conversation.id)
+        else:
+            self._accumulate(deltas, rollup, sign=-1)
+
+        self._compute(conversation, rollup)
+        self.session.add(rollup)
+        self._accumulate(deltas, rollup, sign=1)
+        self._apply(deltas)
+        self.session.flush()
+        return rollup
+
+    def add(
+        self,
+        conversation: Conversation,
+        message_ids: Sequence[uuid.UUID] = (),
+        file_touched_ids: Sequence[uuid.UUID] = (),
+    ) -> ConversationRollup:
+        """
+        Add a batch of newly written rows to a conversation's rollup.
+
+        Aggregates only the given messages and files_touched and adds them to
+        the stored rollup, so the cost is proportional to the batch rather
+        than the conversation. Falls back to refresh() when the conversation
+        has no rollup yet. Use refresh() after replacing or reparsing rows.
+
+        Args:
+            conversation: Conversation the rows were appended to
+            message_ids: IDs of messages inserted in this batch
+            file_touched_ids: IDs of files_touched inserted in this batch
+
+        Returns:
+            The up-to-date ConversationRollup
+        """
+        rollup = self.session.get(ConversationRollup, conversation.id)
+        if rollup is None:
+            return self.refresh(conversation)
+
+        deltas: dict[BucketKey, dict[str, float]] = {}
+        self._accumulate(deltas, rollup, sign=-1)
+
+        for chunk in _chunks(message_ids):
+            msg = self._message_totals(Message.id.in_(chunk))
+            rollup.message_count += msg.total or 0
+            rollup.user_message_count += msg.user or 0
+            rollup.assistant_message_count += msg.assistant or 0
+            rollup.user_tool_call_count += msg.user_tool or 0
+            rollup.assistant_tool_call_count += msg.assistant_tool or 0
+        for chunk in _chunks(file_touched_ids):
+            files = self._file_totals(FileTouched.id.in_(chunk))
+            rollup.lines_added += int(files.added or 0)
+            rollup.lines_deleted += int(files.deleted or 0)
+            if files.first_change and (
+                rollup.first_change_at is None
+                or _as_utc(files.first_change) < _as_utc(rollup.first_change_at)
+            ):
+                rollup.first_change_at = files.first_change
+        self._place(conversation, rollup)
+
+        self._accumulate(deltas, rollup, sign=1)
+        self._apply(deltas)
+        self.session.flush()
+        return rollup
+
+    def refresh_many(self, conversations: Iterable[Conversation]) -> int:
+        """Refresh rollups for several conversations; returns the count."""
+        count = 0
+        for conversation in conversations:
+            self.refresh(conversation)
+            count += 1
+        return count
+
+    def remove(self, conversation_id: uuid.UUID) -> None:
+        """
+        Drop a conversation's rollup and subtract it from its bucket.
+
+        Call before deleting a conversation; the database cascade would
+        remove the rollup row but leave the project-day bucket inflated.
+        """
+        rollup = self.session.get(ConversationRollup, conversation_id)
+        if rollup is None:
+            return
+        deltas: dict[BucketKey, dict[str, float]] = {}
+        self._accumulate(deltas, rollup, sign=-1)
+        self._apply(deltas)
+        self.session.delete(rollup)
+        self.session.flush()
+
+    def get_by_conversation_ids(
+        self, conversation_ids: list[uuid.UUID]
+    ) -> dict[uuid.UUID, ConversationRollup]:
+        """Get rollups keyed by conversation ID."""
+        if not conversation_ids:
+            return {}
+        rows = (
+            self.session.query(ConversationRollup)
+            .filter(ConversationRollup.conversation_id.in_(conversation_ids))
+            .all()
+        )
+        return {row.conversation_id: row for row in rows}
+
+    def get_daily(
+        self,
+        project_ids: list[uuid.UUID],
+        start_day: Optional[date] = None,
+        end_day: Optional[date] = None,
+    ) -> list[ProjectDailyRollup]:
+        """Get project-day buckets for projects, optionally within a day range."""
+        if not project_ids:
+            return []
+        query = self.session.query(ProjectDailyRollup).filter(
+            ProjectDailyRollup.project_id.in_(project_ids)
+        )
+        if start_day:
+            query = query.filter(ProjectDailyRollup.day >= start_day)
+        if end_day:
+            query = query.filter(ProjectDailyRollup.day <= end_day)
+        return query.order_by(ProjectDailyRollup.day).all()
+
+    def _compute(self, conversation: Conversation, rollup: ConversationRollup) -> None:
+        """Fill ``rollup`` from the conversation's messages and files_touched."""
+        msg = self._message_totals(Message.conversation_id == conversation.id)
+        files = self._file_totals(FileTouched.conversation_id == conversation.id)
+
+        rollup.message_count = msg.total or 0
+        rollup.user_message_count = msg.user or 0
+        rollup.assistant_message_count = msg.assistant or 0
+        rollup.user_tool_call_count = msg.user_tool or 0
+        rollup.assistant_tool_call_count = msg.assistant_tool or 0
+        rollup.lines_added = int(files.added or 0)
+        rollup.lines_deleted = int(files.deleted or 0)
+        rollup.first_change_at = files.first_change
+        self._place(conversation, rollup)
+
+    def _message_totals(self, criterion: Any) -> Any:
+        """Aggregate message counts for the messages matching ``criterion``."""
+        # Tool counts mirror the analytics definition: messages of the role
+        # whose tool_calls column is set
+        return (
+            self.session.query(
+                func.count(Message.id).label("total"),
+                func.count(case((Message.role == "user", 1))).label("user"),
+                func.count(case((Message.role == "assistant", 1))).label("assistant"),
+                func.count(case((Message.role == "user", Message.tool_calls))).label(
+                    "user_tool"
+                ),
+                func.count(
+                    case((Message.role == "assistant", Message.tool_calls))
+                ).label("assistant_tool"),
+            )
+            .filter(criterion)
+            .one()
+        )
+
+    def _file_totals(self, criterion: Any) -> Any:
+        """Aggregate line counts for the files_touched matching ``criterion``."""
+        return (
+            self.session.query(
+                func.coalesce(func.sum(FileTouched.lines_added), 0).label("added"),
+                func.coalesce(func.sum(FileTouched.lines_deleted), 0).label("deleted"),
+                func.min(FileTouched.timestamp).label("first_change"),
+            )
+            .filter(criterion)
+            .one()
+        )
+
+    @staticmethod
+    def _place(conversation: Conversation, rollup: ConversationRollup) -> None:
+        """Set the rollup's bucket and first-change latency from the conversation."""
+        rollup.project_id = conversation.project_id
+        rollup.day = rollup_day(conversation.start_time)
+        rollup.first_change_latency_seconds = (
+            max(
+                (
+                    _as_utc(rollup.first_change_at) - _as_utc(conversation.start_time)
+                ).total_seconds(),
+                0.0,
+            )
+            if rollup.first_change_at
+            else None
+        )
+
+    @staticmethod
+    def _accumulate(
+        deltas: dict[BucketKey, dict[str, float]],
+        rollup: ConversationRollup,
+        sign: int,
+    ) -> None:
+        if rollup.project_id is None:
+            return
+        bucket = deltas.setdefault(
+            (rollup.project_id, rollup.day), dict.fromkeys(_DAILY_COUNTERS, 0)
+        )
+        for name, value in _contribution(rollup).items():
+            bucket[name] += sign * value
+
+    def _apply(self, deltas: dict[BucketKey, dict[str, float]]) -> None:
+        """Add per-bucket deltas to project_daily_rollups via upsert."""
+        for (project_id, day), delta in deltas.items():
+            if not any(delta.values()):
+                continue
+            stmt = self._insert(ProjectDailyRollup).values(
+                project_id=project_id, day=day, **delta
+            )
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[ProjectDailyRollup.project_id, ProjectDailyRollup.day],
+                set_={
+                    name: getattr(ProjectDailyRollup, name)
+                    + getattr(stmt.excluded, name)
+                    for name in _DAILY_COUNTERS
+                },
+            )
+            self.session.execute(stmt)
+
+            if delta["session_count"] < 0:
+                self.session.execute(
+                    delete(ProjectDailyRollup).where(
+                        ProjectDailyRollup.project_id == project_id,
+                        ProjectDailyRollup.day == day,
+                        ProjectDailyRollup.session_count <= 0,
+                    )
+                )
+
+    def _insert(
+        self, model: type[ProjectDailyRollup]
+    ) -> Union[postgresql.Insert, sqlite.Insert]:
+        if self.session.get_bind().dialect.name == "postgresql":
+            return pg_insert(model)
+        return sqlite_insert(model)
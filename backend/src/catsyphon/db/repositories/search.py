@@ -0,0 +1,217 @@
+"""
+Message search repository.
+
+Full-text search over message content, tool-call parameters and thinking
+content. PostgreSQL queries the GIN-indexed ``messages.search_vector``
+column; SQLite falls back to the ``messages_fts`` FTS5 table. Both are kept
+current by the database (see ``MESSAGE_SEARCH_PG_DDL`` in models/db.py), so
+nothing here needs calling at ingest.
+
+Results are paged with a keyset on (sort key, message id) rather than an
+offset, so deep pages cost the same as the first one.
+"""
+
+import logging
+from datetime import datetime
+from typing import Any, Literal, Optional, Union
+from uuid import UUID
+
+from sqlalchemy import (
+    ColumnClause,
+    Float,
+    Select,
+    Subquery,
+    Text,
+    column,
+    func,
+    literal_column,
+    select,
+    table,
+    tuple_,
+)
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories.base import BaseRepository
+from catsyphon.models.db import Conversation, Message
+
+logger = logging.getLogger(__name__)
+
+SearchSort = Literal["relevance", "recent"]
+# (rank or timestamp, message_id) of the last hit on a page
+SearchCursor = tuple[Union[float, datetime], UUID]
+
+# Markers wrapped around matched terms in snippets
+HIGHLIGHT_START = "<mark>"
+HIGHLIGHT_STOP = "</mark>"
+
+# Upper bound on text fed to ts_headline per hit; it re-parses the document
+_HEADLINE_CHARS = 20000
+_PG_CONFIG: ColumnClause[Any] = literal_column("'english'::regconfig")
+_PG_TOOL_PARAMETERS: ColumnClause[Any] = literal_column("'$[*].parameters'::jsonpath")
+
+# FTS5 table created by MESSAGE_SEARCH_SQLITE_DDL
+_messages_fts = table("messages_fts", column("message_id"))
+
+
+def _fts5_query(query: str) -> str:
+    """Quote each term so user input can't be read as FTS5 syntax."""
+    return " ".join('"' + term.replace('"', '""') + '"' for term in query.split())
+
+
+class MessageSearchRepository(BaseRepository[Message]):
+    """Repository for full-text search over messages."""
+
+    def __init__(self, session: Session):
+        super().__init__(Message, session)
+
+    def search(
+        self,
+        workspace_id: UUID,
+        query: str,
+        project_id: Optional[UUID] = None,
+        sort: SearchSort = "relevance",
+        after: Optional[SearchCursor] = None,
+        limit: int = 20,
+    ) -> list[Any]:
+        """
+        Search messages in a workspace.
+
+        Args:
+            workspace_id: Workspace to search
+            query: Search terms (web-search syntax on PostgreSQL: quoted
+                phrases, ``or`` and ``-term``; all terms must match on SQLite)
+            project_id: Only search conversations in this project
+            sort: ``relevance`` (best match first) or ``recent`` (newest first)
+            after: (rank or timestamp, message_id) of the last hit on the
+                previous page
+            limit: Maximum hits to return
+
+        Returns:
+            Rows with message_id, conversation_id, project_id, role,
+            timestamp, rank and snippet, in sort order. The snippet is the
+            raw message text with matches wrapped in ``<mark>`` tags.
+        """
+        if not query.strip():
+            return []
+        if self.session.get_bind().dialect.name == "postgresql":
+            return self._search_postgresql(
+                workspace_id, query, project_id, sort, after, limit
+            )
+        return self._search_sqlite(workspace_id, query, project_id, sort, after, limit)
+
+    def _page(
+        self,
+        matches: Subquery,
+        sort: SearchSort,
+        after: Optional[SearchCursor],
+        limit: int,
+    ) -> Select[Any]:
+        """Apply keyset ordering and the cursor to a subquery of matches."""
+        if sort == "recent":
+            key = (matches.c.timestamp, matches.c.message_id)
+        else:
+            key = (matches.c.rank, matches.c.message_id)
+        stmt = select(matches)
+        if after is not None:
+            stmt = stmt.where(tuple_(*key) < tuple_(*after))
+        return stmt.order_by(*(part.desc() for part in key)).limit(limit)
+
+    def _search_postgresql(
+        self,
+        workspace_id: UUID,
+        query: str,
+        project_id: Optional[UUID],
+        sort: SearchSort,
+        after: Optional[SearchCursor],
+        limit: int,
+    ) -> list[Any]:
+        search_vector: ColumnClause[Any] = literal_column("messages.search_vector")
+        tsquery = func.websearch_to_tsquery(_PG_CONFIG, query)
+
+        matches = (
+            select(
+                Message.id.label("message_id"),
+                Message.conversation_id,
+                Conversation.project_id,
+                Message.role,
+                Message.timestamp,
+                func.ts_rank(search_vector, tsquery).cast(Float).label("rank"),
+            )
+            .join(Conversation, Message.conversation_id == Conversation.id)
+            .where(
+                search_vector.op("@@")(tsquery),
+                Conversation.workspace_id == workspace_id,
+            )
+        )
+        if project_id:
+            matches = matches.where(Conversation.project_id == project_id)
+        page = self._page(matches.subquery(), sort, after, limit).subquery()
+
+        # Headlines are computed for the page only, not for every match
+        document = func.concat_ws(
+            " … ",
+            func.left(Message.content, _HEADLINE_CHARS),
+            func.left(
+                func.jsonb_path_query_array(
+                    Message.tool_calls, _PG_TOOL_PARAMETERS
+                ).cast(Text),
+                _HEADLINE_CHARS,
+            ),
+            func.left(Message.thinking_content, _HEADLINE_CHARS),
+        )
+        headline = func.ts_headline(
+            _PG_CONFIG,
+            document,
+            tsquery,
+            f"StartSel={HIGHLIGHT_START}, StopSel={HIGHLIGHT_STOP}, "
+            "MaxFragments=2, MinWords=5, MaxWords=20",
+        )
+        order_key = page.c.timestamp if sort == "recent" else page.c.rank
+        stmt = (
+            select(page, headline.label("snippet"))
+            .join(Message, Message.id == page.c.message_id)
+            .order_by(order_key.desc(), page.c.message_id.desc())
+        )
+        return list(self.session.execute(stmt).all())
+
+    def _search_sqlite(
+        self,
+        workspace_id: UUID,
+        query: str,
+        project_id: Optional[UUID],
+        sort: SearchSort,
+        after: Optional[SearchCursor],
+        limit: int,
+    ) -> list[Any]:
+        fts_query = _fts5_query(query)
+        fts: ColumnClause[Any] = literal_column("messages_fts")
+
+        matches = (
+            select(
+                Message.id.label("message_id"),
+                Message.conversation_id,
+                Conversation.project_id,
+                Message.role,
+                Message.timestamp,
+                # bm25() is lower-is-better; weights follow the PG setweight
+                # order (content, tool input, thinking)
+                (-func.bm25(fts, 0.0, 1.0, 0.4, 0.2, type_=Float)).label("rank"),
+                func.snippet(fts, -1, HIGHLIGHT_START, HIGHLIGHT_STOP, "…", 16).label(
+                    "snippet"
+                ),
+            )
+            .select_from(_messages_fts)
+            .join(Message, Message.id == _messages_fts.c.message_id)
+            .join(Conversation, Message.conversation_id == Conversation.id)
+            .where(
+                fts.op("MATCH")(fts_query),
+                Conversation.workspace_id == workspace_id,
+            )
+        )
+        if project_id:
+            matches = matches.where(Conversation.project_id == project_id)
+        return list(
+            self.session.execute(
+                self._page(matches.subquery(), sort, after, limit)
+            ).all()
+        )
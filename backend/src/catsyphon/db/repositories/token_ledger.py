@@ -0,0 +1,198 @@
+"""
+Token ledger repository.
+
+Maintains the token_ledger table: per-(conversation, model, day) token
+totals, incremented from each inserted message's ``extra_data["token_usage"]``
+by the code paths that insert messages. Cost endpoints read these rows and
+price them with ``llm/pricing.py`` at query time, so they never scan message
+JSON and a pricing change needs no reprocessing.
+"""
+
+import logging
+import uuid
+from datetime import date, datetime, timezone
+from typing import Any, Iterable, Optional, Union
+
+from sqlalchemy import BigInteger, cast, delete, func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from catsyphon.models.db import Conversation, TokenLedger
+
+logger = logging.getLogger(__name__)
+
+# TokenLedger counters, in insert order
+_COUNTERS = (
+    "message_count",
+    "input_tokens",
+    "output_tokens",
+    "cache_read_tokens",
+    "cache_creation_tokens",
+)
+
+# token_usage key spellings per counter: parser output first, then the raw
+# provider names some collectors forward unchanged
+_USAGE_KEYS = {
+    "input_tokens": ("input_tokens",),
+    "output_tokens": ("output_tokens",),
+    "cache_read_tokens": (
+        "cache_read_tokens",
+        "cache_read_input_tokens",
+        "cached_input_tokens",
+    ),
+    "cache_creation_tokens": ("cache_creation_tokens", "cache_creation_input_tokens"),
+}
+
+_MODEL_LENGTH = 100
+
+LedgerKey = tuple[str, date]
+
+
+def _utc_day(value: datetime) -> date:
+    """UTC date of a timestamp (SQLite returns naive UTC values)."""
+    if value.tzinfo is None:
+        return value.date()
+    return value.astimezone(timezone.utc).date()
+
+
+def usage_counts(token_usage: dict[str, Any]) -> dict[str, int]:
+    """Normalize a message's token_usage dict to ledger counters."""
+    counts = {}
+    for counter, keys in _USAGE_KEYS.items():
+        value = next((token_usage[k] for k in keys if token_usage.get(k)), 0)
+        try:
+            counts[counter] = int(value)
+        except (TypeError, ValueError):
+            counts[counter] = 0
+    return counts
+
+
+class TokenLedgerRepository:
+    """Repository maintaining per-conversation, per-model daily token totals."""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    def record(
+        self,
+        conversation: Conversation,
+        messages: Iterable[tuple[Optional[dict[str, Any]], Optional[datetime]]],
+    ) -> int:
+        """
+        Add newly inserted messages' token usage to the ledger.
+
+        Call once per insert with exactly the messages that were written, so
+        re-sent or deduplicated messages are not counted twice.
+
+        Args:
+            conversation: Conversation the messages belong to
+            messages: (extra_data, timestamp) of each inserted message;
+                messages without a model or token_usage are skipped
+
+        Returns:
+            Number of messages added to the ledger
+        """
+        deltas: dict[LedgerKey, dict[str, int]] = {}
+        recorded = 0
+        for extra_data, timestamp in messages:
+            if not extra_data or timestamp is None:
+                continue
+            model = extra_data.get("model")
+            token_usage = extra_data.get("token_usage")
+            if not model or not isinstance(token_usage, dict):
+                continue
+            key = (str(model)[:_MODEL_LENGTH], _utc_day(timestamp))
+            bucket = deltas.setdefault(key, dict.fromkeys(_COUNTERS, 0))
+            bucket["message_count"] += 1
+            for counter, value in usage_counts(token_usage).items():
+                bucket[counter] += value
+            recorded += 1
+
+        if deltas:
+            self._apply(conversation, deltas)
+        return recorded
+
+    def clear(self, conversation_id: uuid.UUID) -> None:
+        """Drop a conversation's ledger rows (before its messages are replaced)."""
+        self.session.execute(
+            delete(TokenLedger).where(TokenLedger.conversation_id == conversation_id)
+        )
+
+    def totals(
+        self,
+        workspace_id: uuid.UUID,
+        project_id: Optional[uuid.UUID] = None,
+        since: Optional[date] = None,
+    ) -> list[Any]:
+        """
+        Sum ledger rows per (model, day) for a workspace or one project.
+
+        Args:
+            workspace_id: Workspace UUID
+            project_id: Only conversations in this project
+            since: Only days on or after this date
+
+        Returns:
+            Rows with model, day, message_count, input_tokens, output_tokens,
+            cache_read_tokens and cache_creation_tokens (ints), ordered by day
+        """
+        # PostgreSQL sums bigint columns as numeric (Decimal in Python), which
+        # the float pricing math cannot multiply
+        query = self.session.query(
+            TokenLedger.model,
+            TokenLedger.day,
+            *(
+                cast(func.sum(getattr(TokenLedger, counter)), BigInteger).label(counter)
+                for counter in _COUNTERS
+            ),
+        ).filter(TokenLedger.workspace_id == workspace_id)
+        if project_id:
+            query = query.join(
+                Conversation, TokenLedger.conversation_id == Conversation.id
+            ).filter(Conversation.project_id == project_id)
+        if since:
+            query = query.filter(TokenLedger.day >= since)
+        rows: list[Any] = (
+            query.group_by(TokenLedger.model, TokenLedger.day)
+            .order_by(TokenLedger.day, TokenLedger.model)
+            .all()
+        )
+        return rows
+
+    def _apply(
+        self, conversation: Conversation, deltas: dict[LedgerKey, dict[str, int]]
+    ) -> None:
+        """Upsert ledger rows, adding deltas to existing counters."""
+        rows = [
+            {
+                "conversation_id": conversation.id,
+                "workspace_id": conversation.workspace_id,
+                "model": model,
+                "day": day,
+                **counters,
+            }
+            for (model, day), counters in deltas.items()
+        ]
+        stmt: Union[postgresql.Insert, sqlite.Insert]
+        if self.session.get_bind().dialect.name == "postgresql":
+            stmt = pg_insert(TokenLedger)
+        else:
+            stmt = sqlite_insert(TokenLedger)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                TokenLedger.conversation_id,
+                TokenLedger.model,
+                TokenLedger.day,
+            ],
+            set_={
+                **{
+                    counter: getattr(TokenLedger, counter)
+                    + getattr(stmt.excluded, counter)
+                    for counter in _COUNTERS
+                },
+                "updated_at": func.now(),
+            },
+        )
+        self.session.execute(stmt, rows)
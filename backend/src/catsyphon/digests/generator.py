@@ -6,7 +6,11 @@ from collections import Counter
 from datetime import datetime
 from typing import Any
 
+from sqlalchemy import func
+
 from catsyphon.db.repositories.conversation import ConversationRepository
+from catsyphon.db.repositories.rollup import rollup_day
+from catsyphon.models.db import Project, ProjectDailyRollup
 
 
 class WeeklyDigestGenerator:
@@ -37,10 +41,32 @@ class WeeklyDigestGenerator:
             round(success_sessions / total_sessions, 2) if total_sessions else None
         )
 
+        # Project activity comes from the project-day rollups (day granularity)
+        # instead of loading each conversation's project
+        project_activity = (
+            self.session.query(
+                Project.name,
+                func.sum(ProjectDailyRollup.session_count).label("sessions"),
+                func.sum(ProjectDailyRollup.message_count).label("messages"),
+                func.sum(
+                    ProjectDailyRollup.lines_added + ProjectDailyRollup.lines_deleted
+                ).label("lines"),
+            )
+            .join(Project, Project.id == ProjectDailyRollup.project_id)
+            .filter(
+                Project.workspace_id == workspace_id,
+                ProjectDailyRollup.day >= rollup_day(period_start),
+                ProjectDailyRollup.day <= rollup_day(period_end),
+            )
+            .group_by(Project.name)
+            .all()
+        )
         project_counts = Counter(
-            conv.project.name for conv in conversations if conv.project
+            {row.name: int(row.sessions or 0) for row in project_activity}
         )
         top_projects = [name for name, _ in project_counts.most_common(3)]
+        total_messages = sum(int(row.messages or 0) for row in project_activity)
+        lines_changed = sum(int(row.lines or 0) for row in project_activity)
 
         feature_counts: Counter[str] = Counter()
         problem_counts: Counter[str] = Counter()
@@ -77,6 +103,8 @@ class WeeklyDigestGenerator:
             "failed_sessions": failed_sessions,
             "success_rate": success_rate,
             "top_projects": top_projects,
+            "total_messages": total_messages,
+            "lines_changed": lines_changed,
         }
 
         return {
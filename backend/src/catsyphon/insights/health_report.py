@@ -18,9 +18,9 @@ from uuid import UUID
 
 from sqlalchemy.orm import Session
 
-from catsyphon.db.repositories import ConversationRepository
+from catsyphon.db.repositories import ConversationRepository, RollupRepository
 from catsyphon.llm import create_llm_client_for
-from catsyphon.models.db import Conversation
+from catsyphon.models.db import Conversation, ConversationRollup
 
 logger = logging.getLogger(__name__)
 
@@ -198,7 +198,10 @@ class HealthReportGenerator:
             return self._empty_response()
 
         # Compute metrics
-        metrics = self._compute_metrics(conversations)
+        rollups = RollupRepository(session).get_by_conversation_ids(
+            [c.id for c in conversations]
+        )
+        metrics = self._compute_metrics(conversations, rollups)
 
         # Get score and label
         score = metrics["overall_score"]
@@ -250,8 +253,12 @@ class HealthReportGenerator:
         days = {"7d": 7, "30d": 30, "90d": 90}.get(date_range, 30)
         return datetime.now().astimezone() - timedelta(days=days)
 
-    def _compute_metrics(self, conversations: list[Conversation]) -> dict[str, Any]:
-        """Compute aggregate metrics from conversations."""
+    def _compute_metrics(
+        self,
+        conversations: list[Conversation],
+        rollups: dict[UUID, ConversationRollup],
+    ) -> dict[str, Any]:
+        """Compute aggregate metrics from conversations and their rollups."""
         total = len(conversations)
         success_count = 0
         failed_count = 0
@@ -275,39 +282,23 @@ class HealthReportGenerator:
             if conv.start_time and conv.end_time:
                 duration_seconds = (conv.end_time - conv.start_time).total_seconds()
 
-            # LOC/hour - get lines from files_touched if loaded
+            # LOC/hour and first change latency from the ingest-time rollup
             if duration_seconds and duration_seconds > 0:
                 hours = duration_seconds / 3600
 
-                # Try to get lines from files_touched relationship
-                total_lines = 0
-                first_file_change_at = None
-                try:
-                    if conv.files_touched:
-                        for ft in conv.files_touched:
-                            total_lines += (ft.lines_added or 0) + (
-                                ft.lines_deleted or 0
-                            )
-                            if ft.timestamp and (
-                                first_file_change_at is None
-                                or ft.timestamp < first_file_change_at
-                            ):
-                                first_file_change_at = ft.timestamp
-
-                        if total_lines > 0:
-                            loc_hour = total_lines / hours if hours > 0 else 0
-                            loc_hours.append(loc_hour)
-
-                        # First change latency
-                        if first_file_change_at and conv.start_time:
-                            delta = (
-                                first_file_change_at - conv.start_time
-                            ).total_seconds() / 60
-                            if delta >= 0:
-                                first_changes.append(delta)
-                except Exception:
-                    # files_touched might not be loaded - skip
-                    pass
+                rollup = rollups.get(conv.id)
+                if rollup is not None:
+                    total_lines = rollup.lines_added + rollup.lines_deleted
+                    if total_lines > 0:
+                        loc_hours.append(total_lines / hours)
+
+                    # First change latency
+                    if rollup.first_change_at and conv.start_time:
+                        delta = (
+                            rollup.first_change_at - conv.start_time
+                        ).total_seconds() / 60
+                        if delta >= 0:
+                            first_changes.append(delta)
 
                 # Duration bucket
                 minutes = duration_seconds / 60
@@ -3,14 +3,17 @@
 from catsyphon.llm.factory import create_llm_client, create_llm_client_for
 from catsyphon.llm.protocol import LLMClient
 from catsyphon.llm.provenance import run_to_provenance_dict, stable_sha256
+from catsyphon.llm.rate_limit import TokenBucket, get_rate_limiter
 from catsyphon.llm.types import LLMResponse, LLMUsage
 
 __all__ = [
     "LLMClient",
     "LLMResponse",
     "LLMUsage",
+    "TokenBucket",
     "create_llm_client",
     "create_llm_client_for",
+    "get_rate_limiter",
     "run_to_provenance_dict",
     "stable_sha256",
 ]
@@ -0,0 +1,99 @@
+"""Token-bucket request rate limiting for LLM provider calls."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Callable, Final, Optional
+
+from catsyphon.config import settings
+
+# Requests per minute per provider when CATSYPHON_LLM_REQUESTS_PER_MINUTE is
+# unset. Conservative lower-tier limits; raise them via the setting.
+_DEFAULT_REQUESTS_PER_MINUTE: Final[dict[str, int]] = {
+    "openai": 500,
+    "anthropic": 50,
+    "google": 60,
+}
+_FALLBACK_REQUESTS_PER_MINUTE: Final[int] = 60
+
+
+class TokenBucket:
+    """Thread-safe token bucket: ``rate_per_minute`` refill, ``burst`` capacity."""
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        burst: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = float(
+            burst if burst is not None else max(1, rate_per_minute // 10)
+        )
+        self._tokens = self.capacity
+        self._clock = clock
+        self._sleep = sleep
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate_per_second
+        )
+        self._updated = now
+
+    def try_acquire(self) -> float:
+        """Take a token if one is available.
+
+        Returns:
+            0.0 if a token was taken, else seconds until one will be
+        """
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1.0:
+                self._tokens -= 1.0
+                return 0.0
+            return (1.0 - self._tokens) / self.rate_per_second
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """Block until a token is taken.
+
+        Args:
+            timeout: Give up after this many seconds (None waits indefinitely)
+
+        Returns:
+            True if a token was taken, False on timeout
+        """
+        deadline = None if timeout is None else self._clock() + timeout
+        while True:
+            wait = self.try_acquire()
+            if wait == 0.0:
+                return True
+            if deadline is not None:
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    return False
+                wait = min(wait, remaining)
+            self._sleep(wait)
+
+
+_limiters: dict[tuple[str, str], TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(provider: str, model: str) -> TokenBucket:
+    """Shared token bucket for a provider/model pair (one per process)."""
+    key = (provider, model)
+    with _limiters_lock:
+        limiter = _limiters.get(key)
+        if limiter is None:
+            rate = settings.llm_requests_per_minute or _DEFAULT_REQUESTS_PER_MINUTE.get(
+                provider, _FALLBACK_REQUESTS_PER_MINUTE
+            )
+            limiter = _limiters[key] = TokenBucket(rate_per_minute=rate)
+        return limiter
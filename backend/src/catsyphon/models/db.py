@@ -7,11 +7,14 @@ conversation data.
 
 import enum
 import uuid
-from datetime import datetime
-from typing import Optional
+from datetime import date, datetime
+from typing import Any, Optional
 
 from sqlalchemy import (
+    DDL,
+    BigInteger,
     Boolean,
+    Date,
     DateTime,
     Enum,
     Float,
@@ -21,6 +24,7 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
 )
 from sqlalchemy.dialects.postgresql import JSONB, UUID
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
@@ -167,9 +171,7 @@ class Workspace(Base):
     watch_configurations: Mapped[list["WatchConfiguration"]] = relationship(
         back_populates="workspace"
     )
-    otel_events: Mapped[list["OtelEvent"]] = relationship(
-        back_populates="workspace"
-    )
+    otel_events: Mapped[list["OtelEvent"]] = relationship(back_populates="workspace")
 
     def __repr__(self) -> str:
         return f"<Workspace(id={self.id}, name={self.name!r}, slug={self.slug!r})>"
@@ -433,6 +435,12 @@ class Conversation(Base):
     permanently_orphaned: Mapped[bool] = mapped_column(
         Boolean, nullable=False, default=False, server_default="false"
     )
+    # Collector session_id of a parent that had not arrived when this
+    # conversation was created. Cleared once linked or marked permanent, so the
+    # partial index only ever holds conversations still waiting on a parent.
+    pending_parent_session_id: Mapped[Optional[str]] = mapped_column(
+        String(255), nullable=True
+    )
     iteration_count: Mapped[int] = mapped_column(
         Integer, nullable=False, server_default="1"
     )
@@ -472,6 +480,22 @@ class Conversation(Base):
             extra_data["session_id"].as_string(),
             unique=True,
         ),
+        Index(
+            "ix_conversations_pending_parent",
+            "workspace_id",
+            "pending_parent_session_id",
+            postgresql_where=pending_parent_session_id.isnot(None),
+            sqlite_where=pending_parent_session_id.isnot(None),
+        ),
+        # Keyset pagination of top-level conversations by last activity
+        Index(
+            "ix_conversations_workspace_last_activity",
+            "workspace_id",
+            func.coalesce(end_time, start_time),
+            "id",
+            postgresql_where=parent_conversation_id.is_(None),
+            sqlite_where=parent_conversation_id.is_(None),
+        ),
     )
 
     created_at: Mapped[datetime] = mapped_column(
@@ -528,6 +552,11 @@ class Conversation(Base):
     recommendations: Mapped[list["AutomationRecommendation"]] = relationship(
         back_populates="conversation", cascade="all, delete-orphan"
     )
+    plans: Mapped[list["Plan"]] = relationship(
+        back_populates="conversation",
+        cascade="all, delete-orphan",
+        order_by="Plan.plan_index",
+    )
 
     def __repr__(self) -> str:
         return (
@@ -661,6 +690,12 @@ class Message(Base):
     thinking_content: Mapped[Optional[str]] = mapped_column(
         Text, nullable=True
     )  # Claude's extended thinking (internal reasoning)
+    content_tokens: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )  # Token count of content, computed at ingest (NULL = not yet counted)
+    thinking_tokens: Mapped[Optional[int]] = mapped_column(
+        Integer, nullable=True
+    )  # Token count of thinking_content, computed at ingest
     timestamp: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), nullable=False, index=True
     )
@@ -685,6 +720,9 @@ class Message(Base):
     tool_results: Mapped[list] = mapped_column(
         JSONB, nullable=False, server_default="[]"
     )
+    spawns_agent: Mapped[bool] = mapped_column(
+        Boolean, nullable=False, default=False, server_default="false"
+    )  # Has a sub-agent spawning tool call (e.g. Task), set at ingest
 
     # Code changes
     code_changes: Mapped[list] = mapped_column(
@@ -705,6 +743,34 @@ class Message(Base):
         DateTime(timezone=True), server_default=func.now(), nullable=False
     )
 
+    # Conflict target for collector bulk inserts (ON CONFLICT DO NOTHING)
+    __table_args__ = (
+        Index(
+            "uq_messages_conversation_event_hash",
+            "conversation_id",
+            "event_hash",
+            unique=True,
+            postgresql_where=event_hash.isnot(None),
+            sqlite_where=event_hash.isnot(None),
+        ),
+        # Keyset pagination of a conversation's messages
+        Index(
+            "ix_messages_conversation_sequence",
+            "conversation_id",
+            "sequence",
+            "timestamp",
+            "id",
+        ),
+        # Latest agent-spawning call before a time, when linking agents
+        Index(
+            "ix_messages_agent_spawns",
+            "conversation_id",
+            "timestamp",
+            postgresql_where=spawns_agent.is_(True),
+            sqlite_where=spawns_agent.is_(True),
+        ),
+    )
+
     # Relationships
     epoch: Mapped["Epoch"] = relationship(back_populates="messages")
     conversation: Mapped["Conversation"] = relationship(back_populates="messages")
@@ -720,6 +786,124 @@ class Message(Base):
         )
 
 
+# Full-text search over message content, tool-call parameters and thinking.
+# Both variants are maintained by the database on every insert/update, so
+# add_message(), add_messages_bulk() and the pipeline's bulk inserts keep the
+# index current without extra round trips. Queried by MessageSearchRepository.
+#
+# PostgreSQL: a tsvector column set by a BEFORE INSERT/UPDATE trigger, with a
+# GIN index (also created by the e6a4c8d2f9b1 migration for existing
+# databases). Every input, tool call parameters included, is truncated so a
+# huge tool output or Write/Edit payload can't exceed the 1MB tsvector limit
+# and fail the insert.
+MESSAGE_SEARCH_PG_DDL = [
+    "ALTER TABLE messages ADD COLUMN IF NOT EXISTS search_vector tsvector",
+    """
+    CREATE OR REPLACE FUNCTION messages_search_vector_update()
+    RETURNS trigger AS $$
+    BEGIN
+        NEW.search_vector :=
+            setweight(to_tsvector('english'::regconfig,
+                left(coalesce(NEW.content, ''), 100000)), 'A')
+            || setweight(to_tsvector('english'::regconfig,
+                left(jsonb_path_query_array(coalesce(NEW.tool_calls, '[]'::jsonb),
+                    '$[*].parameters')::text, 100000)), 'B')
+            || setweight(to_tsvector('english'::regconfig,
+                left(coalesce(NEW.thinking_content, ''), 100000)), 'C');
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER messages_search_vector_trigger
+    BEFORE INSERT OR UPDATE OF content, tool_calls, thinking_content ON messages
+    FOR EACH ROW EXECUTE FUNCTION messages_search_vector_update()
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_messages_search_vector "
+    "ON messages USING gin (search_vector)",
+]
+
+# SQLite (tests and local dev): an FTS5 table kept in step by triggers. FTS
+# rows share the message's rowid so updates and deletes are rowid lookups
+# (message_id is UNINDEXED, so matching on it alone would scan the table).
+# VACUUM may renumber messages, so deletes also check message_id and inserts
+# replace whatever row held the rowid.
+MESSAGE_SEARCH_SQLITE_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS messages_fts USING fts5(
+        message_id UNINDEXED, content, tool_input, thinking_content,
+        tokenize = 'porter unicode61'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages
+    BEGIN
+        INSERT OR REPLACE INTO messages_fts (
+            rowid, message_id, content, tool_input, thinking_content
+        )
+        VALUES (
+            new.rowid,
+            new.id,
+            new.content,
+            (SELECT group_concat(json_extract(value, '$.parameters'), ' ')
+             FROM json_each(new.tool_calls)),
+            new.thinking_content
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_update
+    AFTER UPDATE OF content, tool_calls, thinking_content ON messages
+    BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = old.rowid AND message_id = old.id;
+        INSERT OR REPLACE INTO messages_fts (
+            rowid, message_id, content, tool_input, thinking_content
+        )
+        VALUES (
+            new.rowid,
+            new.id,
+            new.content,
+            (SELECT group_concat(json_extract(value, '$.parameters'), ' ')
+             FROM json_each(new.tool_calls)),
+            new.thinking_content
+        );
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages
+    BEGIN
+        DELETE FROM messages_fts
+        WHERE rowid = old.rowid AND message_id = old.id;
+    END
+    """,
+]
+
+
+def _dialect_ddl(statement: str, dialect: str) -> DDL:
+    """DDL run from a table event only on the given dialect."""
+    return DDL(statement).execute_if(dialect=dialect)  # type: ignore[no-untyped-call]
+
+
+for _statement in MESSAGE_SEARCH_PG_DDL:
+    event.listen(
+        Message.__table__,
+        "after_create",
+        _dialect_ddl(_statement, "postgresql"),
+    )
+for _statement in MESSAGE_SEARCH_SQLITE_DDL:
+    event.listen(
+        Message.__table__,
+        "after_create",
+        _dialect_ddl(_statement, "sqlite"),
+    )
+event.listen(
+    Message.__table__,
+    "after_drop",
+    _dialect_ddl("DROP TABLE IF EXISTS messages_fts", "sqlite"),
+)
+
+
 class FileTouched(Base):
     """Files touched during conversations."""
 
@@ -782,6 +966,115 @@ class FileTouched(Base):
         )
 
 
+class Plan(Base):
+    """Plans extracted from conversations (plan mode).
+
+    Indexed copy of ``Conversation.extra_data["plans"]``, written whenever a
+    conversation's plans are set at ingest, so plan listing, status filters
+    and counts are indexed queries instead of JSONB scans. ``plan_index`` is
+    the plan's position in the conversation's plan list.
+    """
+
+    __tablename__ = "plans"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    plan_index: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    plan_file_path: Mapped[str] = mapped_column(Text, nullable=False)
+    status: Mapped[str] = mapped_column(
+        String(20), nullable=False, server_default="active"
+    )  # 'active', 'approved', 'abandoned'
+    iteration_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="1"
+    )
+    initial_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    final_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    entry_message_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    exit_message_index: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    related_agent_session_ids: Mapped[list[str]] = mapped_column(
+        JSONB, nullable=False, server_default="[]"
+    )
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    __table_args__ = (
+        UniqueConstraint(
+            "conversation_id", "plan_index", name="uq_plans_conversation_index"
+        ),
+        Index("ix_plans_workspace_status", "workspace_id", "status"),
+    )
+
+    # Relationships
+    conversation: Mapped["Conversation"] = relationship(back_populates="plans")
+    iterations: Mapped[list["PlanIteration"]] = relationship(
+        back_populates="plan",
+        cascade="all, delete-orphan",
+        order_by="PlanIteration.sequence",
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<Plan(id={self.id}, "
+            f"plan_file_path={self.plan_file_path!r}, "
+            f"status={self.status!r})>"
+        )
+
+
+class PlanIteration(Base):
+    """A create/edit/read operation on a plan file, in conversation order."""
+
+    __tablename__ = "plan_iterations"
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True), primary_key=True, default=uuid.uuid4
+    )
+    plan_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("plans.id", ondelete="CASCADE"),
+        nullable=False,
+        index=True,
+    )
+    sequence: Mapped[int] = mapped_column(Integer, nullable=False)
+
+    operation_type: Mapped[str] = mapped_column(
+        String(20), nullable=False
+    )  # 'create', 'edit', 'read'
+    file_path: Mapped[str] = mapped_column(Text, nullable=False)
+    content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    old_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    new_content: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    timestamp: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    message_index: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+
+    # Relationships
+    plan: Mapped["Plan"] = relationship(back_populates="iterations")
+
+    def __repr__(self) -> str:
+        return (
+            f"<PlanIteration(plan_id={self.plan_id}, "
+            f"sequence={self.sequence}, "
+            f"operation_type={self.operation_type!r})>"
+        )
+
+
 class Thread(Base):
     """Thread within a conversation for tracking conversation flow hierarchy.
 
@@ -998,6 +1291,9 @@ class RawLog(Base):
     log_format: Mapped[str] = mapped_column(
         String(50), nullable=False
     )  # 'json', 'markdown', 'xml', etc.
+    parser_name: Mapped[Optional[str]] = mapped_column(
+        String(50), nullable=True
+    )  # Parser that handled the file (skips format probing on appends)
     raw_content: Mapped[str] = mapped_column(Text, nullable=False)
     file_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True, index=True)
     file_hash: Mapped[str] = mapped_column(
@@ -1017,9 +1313,16 @@ class RawLog(Base):
     partial_hash: Mapped[Optional[str]] = mapped_column(
         String(64), nullable=True
     )  # Hash of content up to last_processed_offset (detect mid-file changes)
+    partial_hash_state: Mapped[Optional[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=True
+    )  # Chained-hash state for partial_hash (None = plain SHA-256 of the prefix)
     last_message_timestamp: Mapped[Optional[datetime]] = mapped_column(
         DateTime(timezone=True), nullable=True
     )  # Timestamp of last processed message (validation)
+    file_mtime: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # File mtime when state was recorded (startup scan skips files whose
+    # size and mtime both match)
 
     imported_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now(), nullable=False
@@ -1300,6 +1603,9 @@ class ConversationCanonical(Base):
     source_token_estimate: Mapped[int] = mapped_column(
         Integer, nullable=False
     )  # Estimated tokens in source conversation
+    sampler_state: Mapped[Optional[dict[str, Any]]] = mapped_column(
+        JSONB, nullable=True
+    )  # Streamed sampler state + watermark, for incremental regeneration
 
     # Timestamps
     generated_at: Mapped[datetime] = mapped_column(
@@ -1739,7 +2045,9 @@ class ArtifactSnapshot(Base):
 
     __table_args__ = (
         UniqueConstraint(
-            "workspace_id", "source_type", "source_path",
+            "workspace_id",
+            "source_type",
+            "source_path",
             name="uq_artifact_snapshot_ws_type_path",
         ),
     )
@@ -1778,7 +2086,9 @@ class ArtifactHistory(Base):
     )
     source_type: Mapped[str] = mapped_column(String(30), nullable=False, index=True)
     change_type: Mapped[str] = mapped_column(String(20), nullable=False)
-    diff_summary: Mapped[dict] = mapped_column(JSONB, nullable=False, server_default="{}")
+    diff_summary: Mapped[dict[str, Any]] = mapped_column(
+        JSONB, nullable=False, server_default="{}"
+    )
     prev_content_hash: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     new_content_hash: Mapped[str] = mapped_column(String(64), nullable=False)
     detected_at: Mapped[datetime] = mapped_column(
@@ -1788,7 +2098,9 @@ class ArtifactHistory(Base):
     __table_args__ = (
         Index(
             "ix_artifact_history_ws_type_detected",
-            "workspace_id", "source_type", "detected_at",
+            "workspace_id",
+            "source_type",
+            "detected_at",
         ),
     )
 
@@ -1800,3 +2112,235 @@ class ArtifactHistory(Base):
             f"source_type={self.source_type!r}, "
             f"change_type={self.change_type!r})>"
         )
+
+
+class AnalyticsCacheVersion(Base):
+    """Monotonic version counter per analytics cache scope.
+
+    Scopes are strings such as ``project:<uuid>`` or ``workspace:<uuid>``.
+    Ingestion bumps the counter, which changes every cache key built for the
+    scope so all API workers stop serving the old results at once.
+    """
+
+    __tablename__ = "analytics_cache_versions"
+
+    scope: Mapped[str] = mapped_column(String(100), primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, nullable=False, server_default="0")
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsCacheVersion(scope={self.scope!r}, version={self.version})>"
+
+
+class AnalyticsCacheEntry(Base):
+    """Serialized analytics response shared across API worker processes."""
+
+    __tablename__ = "analytics_cache_entries"
+
+    cache_key: Mapped[str] = mapped_column(String(512), primary_key=True)
+    scope: Mapped[str] = mapped_column(String(100), nullable=False, index=True)
+    value: Mapped[dict[str, Any]] = mapped_column(JSONB, nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), nullable=False, index=True
+    )
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<AnalyticsCacheEntry(cache_key={self.cache_key!r}, "
+            f"expires_at={self.expires_at})>"
+        )
+
+
+class ConversationRollup(Base):
+    """Per-conversation activity totals maintained at ingest time.
+
+    Recomputed from the conversation's own messages and files_touched whenever
+    it is ingested, so dashboards read one row per conversation instead of
+    aggregating messages. ``project_id`` and ``day`` record the
+    project_daily_rollups bucket the totals are currently counted in.
+    """
+
+    __tablename__ = "conversation_rollups"
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    project_id: Mapped[Optional[uuid.UUID]] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
+    day: Mapped[date] = mapped_column(
+        Date, nullable=False
+    )  # UTC date of conversation start_time
+
+    # Role counts (tool counts: messages of that role carrying tool_calls)
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    user_message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    assistant_message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    user_tool_call_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    assistant_tool_call_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+
+    # Code change totals from files_touched
+    lines_added: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    lines_deleted: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    first_change_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )  # Earliest files_touched timestamp
+    first_change_latency_seconds: Mapped[Optional[float]] = mapped_column(
+        Float, nullable=True
+    )  # first_change_at - start_time clamped at 0, as counted in the day bucket
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ConversationRollup(conversation_id={self.conversation_id}, "
+            f"messages={self.message_count})>"
+        )
+
+
+class ProjectDailyRollup(Base):
+    """Per-project, per-day activity buckets.
+
+    Conversations are bucketed by the UTC date of their start_time and the
+    bucket is adjusted by the difference between a conversation's old and new
+    rollup, so maintaining it never rescans the project.
+    """
+
+    __tablename__ = "project_daily_rollups"
+
+    project_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("projects.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    session_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    user_message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    assistant_message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    tool_call_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    lines_added: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    lines_deleted: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    # Sum and count of first-change latencies, for averaging across days
+    first_change_latency_seconds: Mapped[float] = mapped_column(
+        Float, nullable=False, server_default="0"
+    )
+    first_change_sessions: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    def __repr__(self) -> str:
+        return (
+            f"<ProjectDailyRollup(project_id={self.project_id}, "
+            f"day={self.day}, sessions={self.session_count})>"
+        )
+
+
+class TokenLedger(Base):
+    """Per-(conversation, model, day) token totals.
+
+    Incremented as messages are inserted, from each message's
+    ``extra_data["token_usage"]``. Costs are priced from these rows at query
+    time, so a pricing change needs no reprocessing. Days are UTC dates of
+    the message timestamps.
+    """
+
+    __tablename__ = "token_ledger"
+
+    conversation_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("conversations.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    model: Mapped[str] = mapped_column(String(100), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    workspace_id: Mapped[uuid.UUID] = mapped_column(
+        UUID(as_uuid=True),
+        ForeignKey("workspaces.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+
+    message_count: Mapped[int] = mapped_column(
+        Integer, nullable=False, server_default="0"
+    )
+    input_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default="0"
+    )
+    output_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default="0"
+    )
+    cache_read_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default="0"
+    )
+    cache_creation_tokens: Mapped[int] = mapped_column(
+        BigInteger, nullable=False, server_default="0"
+    )
+
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
+        nullable=False,
+    )
+
+    __table_args__ = (Index("ix_token_ledger_workspace_day", "workspace_id", "day"),)
+
+    def __repr__(self) -> str:
+        return (
+            f"<TokenLedger(conversation_id={self.conversation_id}, "
+            f"model={self.model!r}, day={self.day})>"
+        )
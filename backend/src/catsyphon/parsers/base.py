@@ -82,6 +82,9 @@ class ConversationParser(Protocol):
 
     # Optional: parsers may expose a richer probe signature:
     # def probe(self, file_path: Path) -> "ProbeResult": ...
+    # and, to share the registry's single bounded read of the file head
+    # (see catsyphon.parsers.sniff) instead of opening the file themselves:
+    # def probe_sample(self, sample: "FileSample") -> "ProbeResult": ...
 
     def parse(self, file_path: Path) -> ParsedConversation:
         """
@@ -6,11 +6,11 @@ Each log file contains a series of JSON objects, one per line, representing
 the conversation timeline.
 """
 
-import difflib
 import json
 import logging
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
@@ -33,13 +33,17 @@ from catsyphon.parsers.plan_extraction import (
     extract_plan_operations,
     is_plan_file_path,
 )
+from catsyphon.parsers.sniff import FileSample
 from catsyphon.parsers.types import ParseIssue, ParseIssueSeverity, ProbeResult
 from catsyphon.parsers.utils import (
+    JsonlReader,
     extract_text_content,
     extract_thinking_content,
     match_tool_calls_with_results,
     parse_iso_timestamp,
 )
+from catsyphon.utils.hashing import PartialHashState, advance_partial_hash
+from catsyphon.utils.line_diff import diff_line_counts
 
 logger = logging.getLogger(__name__)
 
@@ -104,6 +108,7 @@ class ClaudeCodeParser:
                 ParserCapability.INCREMENTAL,
                 ParserCapability.BATCH,
                 ParserCapability.STREAMING,
+                ParserCapability.RESUMABLE_HASH,
             },
             priority=50,
             description="Parser for Claude Code conversation logs (JSONL format)",
@@ -171,15 +176,20 @@ class ClaudeCodeParser:
         """
         Fast probe to determine whether this parser can handle the file.
         """
-        reasons: list[str] = []
-
-        if file_path.suffix.lower() != ".jsonl":
-            return ProbeResult(can_parse=False, confidence=0.0, reasons=["not .jsonl"])
-
-        if not file_path.exists() or not file_path.is_file():
+        if file_path.suffix.lower() == ".jsonl" and not file_path.is_file():
             return ProbeResult(
                 can_parse=False, confidence=0.0, reasons=["file missing or unreadable"]
             )
+        return self.probe_sample(FileSample(file_path))
+
+    def probe_sample(self, sample: FileSample) -> ProbeResult:
+        """
+        Probe a sample of the file's head shared with other parsers.
+        """
+        reasons: list[str] = []
+
+        if sample.path.suffix.lower() != ".jsonl":
+            return ProbeResult(can_parse=False, confidence=0.0, reasons=["not .jsonl"])
 
         confidence = 0.3
         saw_json = False
@@ -187,42 +197,33 @@ class ClaudeCodeParser:
         # Scan content to detect format
         # Each JSONL message is independent - sessionId could appear anywhere
         try:
-            with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-                for idx, line in enumerate(f):
-                    if idx > 1000:  # still capped to keep probe reasonably light
-                        break
-                    if not line.strip():
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        saw_json = True
-                        if "sessionId" in data and "version" in data:
-                            reasons.append("sessionId+version found")
-                            return ProbeResult(
-                                can_parse=True, confidence=0.9, reasons=reasons
-                            )
-                        if "sessionId" in data:
-                            reasons.append("sessionId found")
-                            confidence = max(confidence, 0.7)
-                        if data.get("version"):
-                            reasons.append("version found")
-                            confidence = max(confidence, 0.6)
-                        if data.get("type") in ("summary", "file-history-snapshot"):
-                            reasons.append("metadata entry found")
-                            confidence = max(confidence, 0.6)
-                        # Conversational records typically have message.role/content
-                        message = data.get("message") or {}
-                        if message.get("role") in {"user", "assistant"}:
-                            reasons.append("message role found")
-                            confidence = max(confidence, 0.5)
-                        if "type" in data and data.get("type") in {"user", "assistant"}:
-                            reasons.append("conversation type entry")
-                            confidence = max(confidence, 0.5)
-                    except json.JSONDecodeError:
-                        continue
-        except (OSError, UnicodeDecodeError) as e:
-            logger.debug(f"Cannot read file {file_path}: {e}")
+            for data in islice(sample.records(), 1000):
+                saw_json = True
+                if "sessionId" in data and "version" in data:
+                    reasons.append("sessionId+version found")
+                    return ProbeResult(can_parse=True, confidence=0.9, reasons=reasons)
+                if "sessionId" in data:
+                    reasons.append("sessionId found")
+                    confidence = max(confidence, 0.7)
+                if data.get("version"):
+                    reasons.append("version found")
+                    confidence = max(confidence, 0.6)
+                if data.get("type") in ("summary", "file-history-snapshot"):
+                    reasons.append("metadata entry found")
+                    confidence = max(confidence, 0.6)
+                # Conversational records typically have message.role/content
+                message = data.get("message") or {}
+                if isinstance(message, dict) and message.get("role") in {
+                    "user",
+                    "assistant",
+                }:
+                    reasons.append("message role found")
+                    confidence = max(confidence, 0.5)
+                if "type" in data and data.get("type") in {"user", "assistant"}:
+                    reasons.append("conversation type entry")
+                    confidence = max(confidence, 0.5)
+        except OSError as e:
+            logger.debug(f"Cannot read file {sample.path}: {e}")
             return ProbeResult(can_parse=False, confidence=0.0, reasons=[str(e)])
 
         # Fallback: if we saw JSONL content but no markers, still attempt parse with low confidence.
@@ -247,58 +248,53 @@ class ClaudeCodeParser:
     ) -> tuple[list[dict[str, Any]], int, int, bool]:
         """Read up to *limit* valid JSONL lines from *start_offset*.
 
-        Uses ``readline()`` in a loop so partial trailing lines at EOF
-        are naturally deferred to the next call.
+        An undecodable line at the end of the file may still be mid-write,
+        so it is deferred to the next call rather than skipped. Bytes that
+        are not UTF-8 anywhere else raise ParseFormatError.
 
         Returns:
             ``(parsed_dicts, new_offset, new_line, is_eof)``
         """
         parsed: list[dict[str, Any]] = []
+        offset = start_offset
         line_num = start_line
-        file_size = file_path.stat().st_size
 
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                f.seek(start_offset)
-                while len(parsed) < limit:
-                    line = f.readline()
-                    if not line:
-                        # True EOF
-                        return parsed, f.tell(), line_num, True
-
-                    line_num += 1
-                    stripped = line.strip()
-                    if not stripped:
-                        continue
-
-                    try:
-                        data = json.loads(stripped)
-                        parsed.append(data)
-                    except json.JSONDecodeError as e:
-                        # At EOF a partial write may produce invalid JSON —
-                        # defer to next pass rather than skip permanently.
-                        if f.tell() >= file_size:
-                            logger.debug(
-                                "Deferring partial trailing line at %s:%s",
-                                file_path,
-                                line_num,
+            with JsonlReader(file_path, start_offset, start_line) as reader:
+                for line in reader:
+                    line_num = line.line_number
+                    if line.text:
+                        try:
+                            parsed.append(line.loads())
+                        except ValueError as e:
+                            # At EOF a partial write may produce invalid JSON —
+                            # defer to next pass rather than skip permanently.
+                            if line.end >= reader.size:
+                                logger.debug(
+                                    "Deferring partial trailing line at %s:%s",
+                                    file_path,
+                                    line_num,
+                                )
+                                return parsed, line.offset, line_num - 1, False
+                            if isinstance(e, UnicodeDecodeError):
+                                raise
+                            self._add_warning(
+                                f"Skipping invalid JSON: {e}",
+                                line_number=line_num,
+                                context=line.context,
                             )
-                            # Rewind before this partial line
-                            rewind_offset = f.tell() - len(line.encode("utf-8"))
-                            return parsed, rewind_offset, line_num - 1, False
-                        self._add_warning(
-                            f"Skipping invalid JSON: {e}",
-                            line_number=line_num,
-                            context=stripped[:100] if stripped else None,
-                        )
-                        continue
+                    offset = line.end
 
-                # Reached the limit — not EOF
-                return parsed, f.tell(), line_num, False
+                    if len(parsed) >= limit:
+                        # Reached the limit — not EOF
+                        return parsed, offset, line_num, False
 
         except (OSError, UnicodeDecodeError) as e:
             raise ParseFormatError(f"Cannot read file {file_path}: {e}") from e
 
+        # True EOF
+        return parsed, offset, line_num, True
+
     def parse_metadata(self, file_path: Path) -> ConversationMetadata:
         """Extract session-level metadata from the first few lines.
 
@@ -383,12 +379,14 @@ class ClaudeCodeParser:
         file_path: Path,
         offset: int = 0,
         limit: int = 500,
+        hash_state: Optional[PartialHashState] = None,
     ) -> MessageChunk:
         """Parse up to *limit* messages starting from byte *offset*.
 
         Separates conversational from non-conversational records, matches
         tool calls with results, and extracts summaries and compaction
-        events encountered in this chunk.
+        events encountered in this chunk. Pass the previous chunk's
+        ``hash_state`` so the partial hash only reads the new bytes.
         """
         raw_lines, new_offset, new_line, is_eof = self._parse_lines_limited(
             file_path, offset, 0, limit
@@ -397,7 +395,9 @@ class ClaudeCodeParser:
         file_size = file_path.stat().st_size
 
         if not raw_lines:
-            partial_hash = calculate_partial_hash(file_path, new_offset)
+            partial_hash, next_hash_state = advance_partial_hash(
+                file_path, new_offset, hash_state
+            )
             return MessageChunk(
                 messages=[],
                 next_offset=new_offset,
@@ -405,6 +405,7 @@ class ClaudeCodeParser:
                 is_last=is_eof,
                 partial_hash=partial_hash,
                 file_size=file_size,
+                hash_state=next_hash_state,
             )
 
         # Separate conversational from non-conversational
@@ -458,7 +459,9 @@ class ClaudeCodeParser:
         # Extract summaries and compaction events from this chunk
         summaries, compaction_events = self._extract_metadata_records(raw_lines)
 
-        partial_hash = calculate_partial_hash(file_path, new_offset)
+        partial_hash, next_hash_state = advance_partial_hash(
+            file_path, new_offset, hash_state
+        )
         return MessageChunk(
             messages=parsed_messages,
             next_offset=new_offset,
@@ -468,6 +471,7 @@ class ClaudeCodeParser:
             file_size=file_size,
             summaries=summaries,
             compaction_events=compaction_events,
+            hash_state=next_hash_state,
         )
 
     # ------------------------------------------------------------------
@@ -493,13 +497,15 @@ class ClaudeCodeParser:
         all_summaries: list[dict] = []
         all_compaction: list[dict] = []
         offset = 0
+        hash_state: Optional[PartialHashState] = None
 
         while True:
-            chunk = self.parse_messages(file_path, offset)
+            chunk = self.parse_messages(file_path, offset, hash_state=hash_state)
             all_messages.extend(chunk.messages)
             all_summaries.extend(chunk.summaries)
             all_compaction.extend(chunk.compaction_events)
             offset = chunk.next_offset
+            hash_state = chunk.hash_state
             if chunk.is_last:
                 break
 
@@ -748,29 +754,22 @@ class ClaudeCodeParser:
             Skips invalid lines and logs warnings rather than failing.
         """
         messages = []
-        line_num = start_line
 
         try:
-            with file_path.open("r", encoding="utf-8") as f:
-                # Seek to the last processed offset
-                f.seek(start_offset)
-
-                # Read only new lines from this point
-                for line in f:
-                    line_num += 1
-                    line = line.strip()
-
-                    if not line:
+            with JsonlReader(file_path, start_offset, start_line) as reader:
+                for line in reader:
+                    if not line.text:
                         continue
 
                     try:
-                        data = json.loads(line)
-                        messages.append(data)
-                    except json.JSONDecodeError as e:
+                        messages.append(line.loads())
+                    except UnicodeDecodeError:
+                        raise
+                    except ValueError as e:
                         self._add_warning(
                             f"Skipping invalid JSON: {e}",
-                            line_number=line_num,
-                            context=line[:100] if line else None,
+                            line_number=line.line_number,
+                            context=line.context,
                         )
                         continue
 
@@ -792,33 +791,7 @@ class ClaudeCodeParser:
         Note:
             Skips invalid lines and logs warnings rather than failing.
         """
-        messages = []
-        line_num = 0
-
-        try:
-            with file_path.open("r", encoding="utf-8") as f:
-                for line in f:
-                    line_num += 1
-                    line = line.strip()
-
-                    if not line:
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        messages.append(data)
-                    except json.JSONDecodeError as e:
-                        self._add_warning(
-                            f"Skipping invalid JSON: {e}",
-                            line_number=line_num,
-                            context=line[:100] if line else None,
-                        )
-                        continue
-
-        except (OSError, UnicodeDecodeError) as e:
-            raise ParseFormatError(f"Cannot read file {file_path}: {e}") from e
-
-        return messages
+        return self._parse_lines_from_offset(file_path, 0, 0)
 
     def _build_message_thread(
         self, raw_messages: list[dict[str, Any]]
@@ -1233,16 +1206,6 @@ class ClaudeCodeParser:
         """
         code_changes = []
 
-        def _diff_counts(old_text: str, new_text: str) -> tuple[int, int]:
-            """Return (added, deleted) line counts using ndiff."""
-            added = deleted = 0
-            for line in difflib.ndiff(old_text.splitlines(), new_text.splitlines()):
-                if line.startswith("+ "):
-                    added += 1
-                elif line.startswith("- "):
-                    deleted += 1
-            return added, deleted
-
         for tool_call in tool_calls:
             tool_name = tool_call.tool_name
 
@@ -1253,7 +1216,9 @@ class ClaudeCodeParser:
                 new_string = tool_call.parameters.get("new_string", "")
 
                 if file_path:
-                    added, deleted = _diff_counts(old_string or "", new_string or "")
+                    added, deleted = diff_line_counts(
+                        old_string or "", new_string or ""
+                    )
                     code_changes.append(
                         CodeChange(
                             file_path=file_path,
@@ -9,10 +9,10 @@ Key record types:
 - event_msg: agent_reasoning / agent_message events
 """
 
-import json
 import logging
 from dataclasses import dataclass
 from datetime import UTC, datetime
+from itertools import islice
 from pathlib import Path
 from typing import Any, Optional
 
@@ -28,8 +28,10 @@ from catsyphon.parsers.incremental import (
     calculate_partial_hash,
 )
 from catsyphon.parsers.metadata import ParserCapability, ParserMetadata
+from catsyphon.parsers.sniff import FileSample
 from catsyphon.parsers.types import ProbeResult
-from catsyphon.parsers.utils import parse_iso_timestamp
+from catsyphon.parsers.utils import JsonlReader, loads_json, parse_iso_timestamp
+from catsyphon.utils.hashing import PartialHashState, advance_partial_hash
 
 logger = logging.getLogger(__name__)
 
@@ -53,6 +55,7 @@ class CodexParser:
                 ParserCapability.BATCH,
                 ParserCapability.INCREMENTAL,
                 ParserCapability.STREAMING,
+                ParserCapability.RESUMABLE_HASH,
             },
             priority=60,  # Slightly above Claude to favor explicit Codex logs
             description="Parser for OpenAI Codex session logs",
@@ -62,39 +65,30 @@ class CodexParser:
     def metadata(self) -> ParserMetadata:
         return self._metadata
 
-    def _iter_sample_lines(self, file_path: Path, max_lines: int = 80) -> list[str]:
-        """Read up to N lines to keep can_parse lightweight."""
-        lines: list[str] = []
-        with file_path.open("r", encoding="utf-8", errors="ignore") as f:
-            for idx, line in enumerate(f):
-                if idx >= max_lines:
-                    break
-                if line.strip():
-                    lines.append(line)
-        return lines
-
     def can_parse(self, file_path: Path) -> bool:
         return self.probe(file_path).can_parse
 
     def probe(self, file_path: Path) -> ProbeResult:
-        if file_path.suffix.lower() != ".jsonl":
-            return ProbeResult(can_parse=False, confidence=0.0, reasons=["not .jsonl"])
-        if not file_path.is_file():
+        if file_path.suffix.lower() == ".jsonl" and not file_path.is_file():
             return ProbeResult(
                 can_parse=False, confidence=0.0, reasons=["file missing or unreadable"]
             )
+        return self.probe_sample(FileSample(file_path))
+
+    def probe_sample(self, sample: FileSample) -> ProbeResult:
+        """Probe a sample of the file's head shared with other parsers."""
+        if sample.path.suffix.lower() != ".jsonl":
+            return ProbeResult(can_parse=False, confidence=0.0, reasons=["not .jsonl"])
 
         reasons: list[str] = []
         confidence = 0.25
 
-        for line in self._iter_sample_lines(file_path):
-            try:
-                data = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-
+        # The first records are enough to recognise Codex scaffolding
+        for data in islice(sample.records(), 80):
             rec_type = data.get("type")
             payload = data.get("payload") or {}
+            if not isinstance(payload, dict):
+                continue
             if rec_type == "session_meta":
                 origin = payload.get("originator", "") or payload.get("source", "")
                 if "codex" in origin:
@@ -129,12 +123,16 @@ class CodexParser:
     # ------------------------------------------------------------------
 
     def _record_from_line(
-        self, line: str, file_path: Optional[Path] = None
+        self, line: bytes | str, file_path: Optional[Path] = None
     ) -> Optional[_CodexRecord]:
-        """Parse a single JSONL line into a _CodexRecord."""
+        """Parse a single JSONL line into a _CodexRecord.
+
+        Lines that are not valid JSON, including bytes that are not UTF-8,
+        are skipped like any other malformed line.
+        """
         try:
-            data = json.loads(line)
-        except json.JSONDecodeError:
+            data = loads_json(line)
+        except ValueError:
             if file_path:
                 logger.debug("Skipping invalid JSON line in %s", file_path)
             return None
@@ -153,11 +151,11 @@ class CodexParser:
 
     def _load_records(self, file_path: Path) -> list[_CodexRecord]:
         records: list[_CodexRecord] = []
-        with file_path.open("r", encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
+        with JsonlReader(file_path) as reader:
+            for line in reader:
+                if not line.text:
                     continue
-                rec = self._record_from_line(line, file_path=file_path)
+                rec = self._record_from_line(line.text, file_path=file_path)
                 if rec:
                     records.append(rec)
         return records
@@ -258,45 +256,32 @@ class CodexParser:
             ``(records, new_offset, new_line, is_eof)``
         """
         records: list[_CodexRecord] = []
-        line_num = start_line
-        file_size = file_path.stat().st_size
         last_good_offset = start_offset
         last_good_line = start_line
 
-        with file_path.open("r", encoding="utf-8") as f:
-            f.seek(start_offset)
-            while len(records) < limit:
-                line = f.readline()
-                if not line:
-                    return records, last_good_offset, last_good_line, True
-
-                line_num += 1
-                if not line.strip():
-                    last_good_offset = f.tell()
-                    last_good_line = line_num
-                    continue
-
-                rec = self._record_from_line(line)
-                if rec is None:
-                    # At EOF, partial line — defer to next pass
-                    if f.tell() >= file_size:
+        with JsonlReader(file_path, start_offset, start_line) as reader:
+            for line in reader:
+                if line.text:
+                    rec = self._record_from_line(line.text)
+                    if rec is None and line.end >= reader.size:
+                        # At EOF, partial line — defer to next pass
                         logger.debug(
                             "Deferring partial trailing line at %s:%s",
                             file_path,
-                            line_num,
+                            line.line_number,
                         )
                         return records, last_good_offset, last_good_line, False
-                    # Otherwise skip malformed line but advance offset
-                    last_good_offset = f.tell()
-                    last_good_line = line_num
-                    continue
+                    # A malformed line mid-file is skipped but still advances
+                    if rec is not None:
+                        records.append(rec)
+                last_good_offset = line.end
+                last_good_line = line.line_number
 
-                records.append(rec)
-                last_good_offset = f.tell()
-                last_good_line = line_num
+                if len(records) >= limit:
+                    # Reached limit — not EOF
+                    return records, last_good_offset, last_good_line, False
 
-        # Reached limit — not EOF
-        return records, last_good_offset, last_good_line, False
+        return records, last_good_offset, last_good_line, True
 
     def parse_metadata(self, file_path: Path) -> ConversationMetadata:
         """Extract session-level metadata from the first few Codex log lines.
@@ -336,8 +321,13 @@ class CodexParser:
         file_path: Path,
         offset: int = 0,
         limit: int = 500,
+        hash_state: Optional[PartialHashState] = None,
     ) -> MessageChunk:
-        """Parse up to *limit* Codex messages starting from byte *offset*."""
+        """Parse up to *limit* Codex messages starting from byte *offset*.
+
+        Pass the previous chunk's ``hash_state`` so the partial hash only
+        reads the new bytes.
+        """
         records, new_offset, new_line, is_eof = self._parse_lines_limited(
             file_path, offset, 0, limit
         )
@@ -345,7 +335,9 @@ class CodexParser:
         file_size = file_path.stat().st_size
 
         if not records:
-            partial_hash = calculate_partial_hash(file_path, new_offset)
+            partial_hash, next_hash_state = advance_partial_hash(
+                file_path, new_offset, hash_state
+            )
             return MessageChunk(
                 messages=[],
                 next_offset=new_offset,
@@ -353,12 +345,15 @@ class CodexParser:
                 is_last=is_eof,
                 partial_hash=partial_hash,
                 file_size=file_size,
+                hash_state=next_hash_state,
             )
 
         messages = self._build_messages(records)
         messages.sort(key=lambda m: m.timestamp)
 
-        partial_hash = calculate_partial_hash(file_path, new_offset)
+        partial_hash, next_hash_state = advance_partial_hash(
+            file_path, new_offset, hash_state
+        )
         return MessageChunk(
             messages=messages,
             next_offset=new_offset,
@@ -366,6 +361,7 @@ class CodexParser:
             is_last=is_eof,
             partial_hash=partial_hash,
             file_size=file_size,
+            hash_state=next_hash_state,
         )
 
     # ------------------------------------------------------------------
@@ -380,11 +376,13 @@ class CodexParser:
         meta = self.parse_metadata(file_path)
         all_messages: list[ParsedMessage] = []
         offset = 0
+        hash_state: Optional[PartialHashState] = None
 
         while True:
-            chunk = self.parse_messages(file_path, offset)
+            chunk = self.parse_messages(file_path, offset, hash_state=hash_state)
             all_messages.extend(chunk.messages)
             offset = chunk.next_offset
+            hash_state = chunk.hash_state
             if chunk.is_last:
                 break
 
@@ -444,41 +442,27 @@ class CodexParser:
         )
 
         new_records: list[_CodexRecord] = []
-        line_num = last_line
         last_good_offset = last_offset
         last_good_line = last_line
 
-        with file_path.open("r", encoding="utf-8") as f:
-            f.seek(last_offset)
-            while True:
-                line = f.readline()
-                if not line:
-                    break
-
-                line_num += 1
-                if not line.strip():
-                    last_good_offset = f.tell()
-                    last_good_line = line_num
-                    continue
-
-                rec = self._record_from_line(line)
-                if rec is None:
-                    # If we're at EOF, treat this as a partial line and retry next pass.
-                    if f.tell() >= file_size:
+        with JsonlReader(file_path, last_offset, last_line) as reader:
+            for line in reader:
+                if line.text:
+                    rec = self._record_from_line(line.text)
+                    if rec is None and line.end >= reader.size:
+                        # If we're at EOF, treat this as a partial line and retry next pass.
                         logger.debug(
                             "Deferring partial/invalid trailing line at %s:%s",
                             file_path,
-                            line_num,
+                            line.line_number,
                         )
                         break
-                    # Otherwise skip malformed line but advance offset so we don't loop.
-                    last_good_offset = f.tell()
-                    last_good_line = line_num
-                    continue
-
-                new_records.append(rec)
-                last_good_offset = f.tell()
-                last_good_line = line_num
+                    # A malformed line mid-file is skipped but still advances
+                    # the offset so we don't loop.
+                    if rec is not None:
+                        new_records.append(rec)
+                last_good_offset = line.end
+                last_good_line = line.line_number
 
         parsed_messages = self._build_messages(new_records)
         parsed_messages.sort(key=lambda m: m.timestamp)
@@ -14,7 +14,9 @@ Provides two protocol layers:
    all callers migrate. Will be removed after Step 6 of the ADR-009 plan.
 
 Utility helpers (``detect_file_change_type``, ``calculate_partial_hash``)
-are shared by both layers.
+are shared by both layers. Parsers declaring ``ParserCapability.RESUMABLE_HASH``
+also accept a ``PartialHashState`` so chunk loops hash only new bytes
+(see ``parse_messages_resumable``).
 """
 
 import hashlib
@@ -25,6 +27,8 @@ from pathlib import Path
 from typing import List, Optional, Protocol, runtime_checkable
 
 from catsyphon.models.parsed import ConversationMetadata, ParsedMessage
+from catsyphon.parsers.metadata import ParserCapability
+from catsyphon.utils.hashing import PartialHashState, verify_partial_hash
 
 
 class ChangeType(str, Enum):
@@ -138,6 +142,11 @@ class MessageChunk:
     ``summaries`` and ``compaction_events`` live here because they appear
     inline in the JSONL stream and are encountered during chunk parsing.
     The ingestion loop accumulates them across chunks.
+
+    ``hash_state`` is set by parsers with ``ParserCapability.RESUMABLE_HASH``;
+    when present, ``partial_hash`` is the chained hash it resumes (see
+    ``catsyphon.utils.hashing.advance_partial_hash``) and both must be
+    stored together.
     """
 
     messages: list[ParsedMessage]
@@ -148,6 +157,7 @@ class MessageChunk:
     file_size: int
     summaries: list[dict] = field(default_factory=list)
     compaction_events: list[dict] = field(default_factory=list)
+    hash_state: Optional[PartialHashState] = None
 
 
 @runtime_checkable
@@ -185,11 +195,35 @@ class ChunkedParser(Protocol):
         ...
 
 
+def parse_messages_resumable(
+    parser: ChunkedParser,
+    file_path: Path,
+    offset: int,
+    hash_state: Optional[PartialHashState] = None,
+) -> MessageChunk:
+    """Call ``parser.parse_messages``, resuming the partial hash when supported.
+
+    Chunk loops should feed each chunk's ``hash_state`` back in. Parsers
+    without ``ParserCapability.RESUMABLE_HASH`` (e.g., plugins written
+    against the base protocol) are called without it.
+    """
+    metadata = getattr(parser, "metadata", None)
+    if hash_state is not None and (
+        metadata is not None
+        and ParserCapability.RESUMABLE_HASH in metadata.capabilities
+    ):
+        return parser.parse_messages(  # type: ignore[call-arg]
+            file_path, offset, hash_state=hash_state
+        )
+    return parser.parse_messages(file_path, offset)
+
+
 def detect_file_change_type(
     file_path: Path,
     last_offset: int,
     last_file_size: int,
     last_partial_hash: Optional[str],
+    last_hash_state: Optional[PartialHashState] = None,
 ) -> ChangeType:
     """
     Detect what type of change occurred to a file.
@@ -202,6 +236,9 @@ def detect_file_change_type(
         last_offset: Byte offset where parsing last stopped
         last_file_size: File size at last parse
         last_partial_hash: SHA-256 hash of content up to last_offset
+        last_hash_state: Chained-hash state stored with ``last_partial_hash``.
+            When given, the hash is a chained partial hash (see
+            ``verify_partial_hash``); the whole prefix is still re-hashed.
 
     Returns:
         ChangeType indicating the type of change detected
@@ -228,12 +265,13 @@ def detect_file_change_type(
     # Quick check: file size unchanged
     if current_size == last_file_size:
         # If we have a partial hash, verify content hasn't changed
-        if last_partial_hash:
-            current_partial_hash = calculate_partial_hash(
-                file_path, min(last_offset, current_size)
-            )
-            if current_partial_hash != last_partial_hash:
-                return ChangeType.REWRITE
+        if last_partial_hash and not _prefix_matches(
+            file_path,
+            min(last_offset, current_size),
+            last_partial_hash,
+            last_hash_state,
+        ):
+            return ChangeType.REWRITE
         return ChangeType.UNCHANGED
 
     # File shrunk - truncation detected
@@ -243,11 +281,11 @@ def detect_file_change_type(
     # File grew - check if it's a clean append or mid-file rewrite
     if current_size > last_file_size:
         # Verify content up to last_offset hasn't changed
-        if last_partial_hash:
-            current_partial_hash = calculate_partial_hash(file_path, last_offset)
-            if current_partial_hash != last_partial_hash:
-                # Mid-file content changed - full reparse required
-                return ChangeType.REWRITE
+        if last_partial_hash and not _prefix_matches(
+            file_path, last_offset, last_partial_hash, last_hash_state
+        ):
+            # Mid-file content changed - full reparse required
+            return ChangeType.REWRITE
 
         # File grew and old content intact - clean append
         return ChangeType.APPEND
@@ -256,6 +294,18 @@ def detect_file_change_type(
     return ChangeType.UNCHANGED
 
 
+def _prefix_matches(
+    file_path: Path,
+    offset: int,
+    expected_hash: str,
+    hash_state: Optional[PartialHashState],
+) -> bool:
+    """Check the stored partial hash; a stored state marks it as chained."""
+    if hash_state is not None:
+        return verify_partial_hash(file_path, offset, expected_hash)
+    return calculate_partial_hash(file_path, offset) == expected_hash
+
+
 def calculate_partial_hash(file_path: Path, offset: int) -> str:
     """
     Calculate SHA-256 hash of file content up to specified offset.
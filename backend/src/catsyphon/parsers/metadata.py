@@ -26,6 +26,9 @@ class ParserCapability(str, Enum):
     STREAMING = "streaming"
     """Parser can process large files in streaming mode (low memory)."""
 
+    RESUMABLE_HASH = "resumable_hash"
+    """Parser's ``parse_messages`` accepts a ``hash_state`` to resume hashing."""
+
 
 @dataclass
 class ParserMetadata:
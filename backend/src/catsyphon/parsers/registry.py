@@ -6,26 +6,41 @@ automatic format detection to route log files to the appropriate parser.
 """
 
 import logging
+import os
 import time
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 from catsyphon.models.parsed import ParsedConversation
 from catsyphon.parsers.base import ConversationParser, EmptyFileError, ParseFormatError
 from catsyphon.parsers.incremental import ChunkedParser, IncrementalParser
 from catsyphon.parsers.metadata import ParserMetadata
+from catsyphon.parsers.sniff import FileSample, ProbeCache
 from catsyphon.parsers.types import ParseResult, ProbeResult
 
 logger = logging.getLogger(__name__)
 
 
+def get_parser_name(parser: Union[ConversationParser, ChunkedParser]) -> str:
+    """Identifier of a parser: its metadata name, else the lowercased class name."""
+    metadata: Optional[ParserMetadata] = getattr(parser, "metadata", None)
+    return metadata.name if metadata else type(parser).__name__.lower()
+
+
 class ParserRegistry:
     """
     Registry for conversation log parsers with auto-detection.
 
     The registry maintains a list of parser implementations and provides
-    automatic format detection. When parsing a file, it tries each parser's
-    can_parse() method and uses the first match.
+    automatic format detection. When parsing a file, it probes each parser
+    and uses the first match.
+
+    Probing reads one bounded sample of the file head that is shared by all
+    parsers (see ``catsyphon.parsers.sniff``); parsers implementing
+    ``probe_sample()`` inspect that sample, others fall back to
+    ``probe()``/``can_parse()``. The chosen parser is cached per file, and
+    callers that already know a file's parser (e.g. from ``RawLog``) can pass
+    it as ``parser_hint`` to skip probing altogether.
 
     Example:
         >>> from catsyphon.parsers.claude_code import ClaudeCodeParser
@@ -34,9 +49,10 @@ class ParserRegistry:
         >>> conversation = registry.parse(Path("conversation.jsonl"))
     """
 
-    def __init__(self) -> None:
+    def __init__(self, probe_cache_size: int = 4096) -> None:
         """Initialize an empty parser registry."""
         self._parsers: list[ConversationParser] = []
+        self._probe_cache = ProbeCache(max_entries=probe_cache_size)
 
     def register(self, parser: ConversationParser) -> None:
         """
@@ -50,6 +66,8 @@ class ParserRegistry:
             parsers before generic ones to ensure correct detection.
         """
         self._parsers.append(parser)
+        # A new parser may outrank cached choices
+        self._probe_cache.clear()
         logger.debug(f"Registered parser: {type(parser).__name__}")
 
     def _sorted_parsers(self, file_path: Path) -> list[ConversationParser]:
@@ -76,12 +94,115 @@ class ParserRegistry:
 
         return sorted(self._parsers, key=lambda p: score(p), reverse=True)
 
-    def parse_with_metadata(self, file_path: Path) -> ParseResult:
+    def _get_by_name(self, name: str) -> Optional[ConversationParser]:
+        for parser in self._parsers:
+            if get_parser_name(parser) == name:
+                return parser
+        return None
+
+    @staticmethod
+    def _probe(
+        parser: ConversationParser, file_path: Path, sample: FileSample
+    ) -> ProbeResult:
+        """Probe one parser, preferring the shared sample over its own read."""
+        probe_sample = getattr(parser, "probe_sample", None)
+        if callable(probe_sample):
+            result: ProbeResult = probe_sample(sample)
+            return result
+        probe_fn = getattr(parser, "probe", None)
+        if callable(probe_fn):
+            result = probe_fn(file_path)
+            return result
+        can_parse = parser.can_parse(file_path)
+        return ProbeResult(
+            can_parse=can_parse,
+            confidence=0.5,
+            reasons=["can_parse returned True"] if can_parse else [],
+        )
+
+    def _candidates(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        parser_hint: Optional[str] = None,
+        attempts: Optional[list[str]] = None,
+    ) -> Iterator[tuple[ConversationParser, ProbeResult]]:
+        """
+        Yield parsers whose probe accepts the file, in selection order.
+
+        A parser named by ``parser_hint`` or remembered in the probe cache is
+        yielded first without probing. The remaining parsers are probed
+        lazily against one shared sample, so a consumer that stops at the
+        first acceptable parser never probes the rest.
+        """
+        known: Optional[ConversationParser] = None
+        if parser_hint:
+            known = self._get_by_name(parser_hint)
+            if known is not None:
+                yield known, ProbeResult(
+                    can_parse=True,
+                    confidence=1.0,
+                    reasons=["parser recorded for this file"],
+                )
+        else:
+            cached = self._probe_cache.get(file_path, stat)
+            if cached is not None:
+                known = self._get_by_name(cached.parser_name)
+                if known is not None:
+                    yield known, ProbeResult(
+                        can_parse=True,
+                        confidence=cached.confidence,
+                        reasons=list(cached.reasons),
+                    )
+
+        sample = FileSample(file_path)
+        for parser in self._sorted_parsers(file_path):
+            if parser is known:
+                continue
+            parser_name = type(parser).__name__
+            logger.debug(f"Trying parser: {parser_name}")
+            try:
+                probe = self._probe(parser, file_path, sample)
+            except Exception as probe_error:
+                probe_msg = f"{parser_name} probe failed: {probe_error}"
+                if attempts is not None:
+                    attempts.append(probe_msg)
+                logger.debug(probe_msg)
+                continue
+
+            if not probe.can_parse:
+                if attempts is not None:
+                    attempts.append(f"{parser_name} skipped (probe negative)")
+                continue
+
+            yield parser, probe
+
+    def _remember(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        parser: ConversationParser,
+        probe: ProbeResult,
+    ) -> None:
+        """Cache the parser chosen for a file."""
+        self._probe_cache.put(
+            file_path,
+            stat,
+            get_parser_name(parser),
+            probe.confidence,
+            probe.reasons,
+        )
+
+    def parse_with_metadata(
+        self, file_path: Path, parser_hint: Optional[str] = None
+    ) -> ParseResult:
         """
         Parse a conversation log file with automatic format detection and metadata.
 
         Args:
             file_path: Path to the log file to parse
+            parser_hint: Name of the parser known to handle this file; it is
+                tried first without probing
 
         Returns:
             ParseResult containing ParsedConversation and parser metadata
@@ -96,43 +217,20 @@ class ParserRegistry:
             >>> registry.register(ClaudeCodeParser())
             >>> result = registry.parse_with_metadata(Path("log.jsonl"))
         """
-        if not file_path.exists():
-            raise FileNotFoundError(f"Log file not found: {file_path}")
+        try:
+            stat = file_path.stat()
+        except FileNotFoundError:
+            raise FileNotFoundError(f"Log file not found: {file_path}") from None
 
         # Check for empty files early - these are often abandoned sessions
-        file_size = file_path.stat().st_size
-        if file_size == 0:
+        if stat.st_size == 0:
             raise EmptyFileError(f"Log file is empty (0 bytes): {file_path}")
 
         attempts: list[str] = []
         parse_errors: list[str] = []
 
-        # Try each registered parser
-        for parser in self._sorted_parsers(file_path):
+        for parser, probe in self._candidates(file_path, stat, parser_hint, attempts):
             parser_name = type(parser).__name__
-            logger.debug(f"Trying parser: {parser_name}")
-
-            # Probe
-            try:
-                probe_fn = getattr(parser, "probe", None)
-                if callable(probe_fn):
-                    probe: ProbeResult = probe_fn(file_path)
-                    can_parse = probe.can_parse
-                    reasons = probe.reasons
-                    confidence = probe.confidence
-                else:
-                    can_parse = parser.can_parse(file_path)
-                    reasons = ["can_parse returned True"] if can_parse else []
-                    confidence = 0.5
-            except Exception as probe_error:
-                probe_msg = f"{parser_name} probe failed: {probe_error}"
-                attempts.append(probe_msg)
-                logger.debug(probe_msg)
-                continue
-
-            if not can_parse:
-                attempts.append(f"{parser_name} skipped (probe negative)")
-                continue
 
             # Parse
             try:
@@ -145,8 +243,9 @@ class ParserRegistry:
                 logger.debug(error_msg, exc_info=True)
                 continue
 
+            self._remember(file_path, stat, parser, probe)
+
             parser_meta: Optional[ParserMetadata] = getattr(parser, "metadata", None)
-            parser_meta_name = parser_meta.name if parser_meta else parser_name.lower()
             parser_meta_version = parser_meta.version if parser_meta else None
 
             # Attach parser metadata to parsed output for downstream observability
@@ -155,8 +254,8 @@ class ParserRegistry:
                 existing_meta["parser"] = {
                     "name": parser_meta.name,
                     "version": parser_meta.version,
-                    "confidence": confidence,
-                    "reasons": reasons,
+                    "confidence": probe.confidence,
+                    "reasons": probe.reasons,
                 }
                 parsed.metadata = existing_meta
 
@@ -169,7 +268,7 @@ class ParserRegistry:
 
             result = ParseResult(
                 conversation=parsed,
-                parser_name=parser_meta_name,
+                parser_name=get_parser_name(parser),
                 parser_version=parser_meta_version,
                 parse_method="full",
                 change_type=None,
@@ -198,12 +297,15 @@ class ParserRegistry:
         """
         return self.parse_with_metadata(file_path).conversation
 
-    def find_parser(self, file_path: Path) -> Optional[ConversationParser]:
+    def find_parser(
+        self, file_path: Path, parser_hint: Optional[str] = None
+    ) -> Optional[ConversationParser]:
         """
         Find a parser that can handle the given file.
 
         Args:
             file_path: Path to the log file
+            parser_hint: Name of the parser known to handle this file
 
         Returns:
             The first parser that can handle the file, or None if no match
@@ -212,32 +314,26 @@ class ParserRegistry:
             This method doesn't actually parse the file, just finds a compatible
             parser. Useful for validation or testing.
         """
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
-        for parser in self._sorted_parsers(file_path):
-            try:
-                probe_fn = getattr(parser, "probe", None)
-                if callable(probe_fn):
-                    probe: ProbeResult = probe_fn(file_path)
-                    if probe.can_parse:
-                        return parser
-                    continue
-
-                if parser.can_parse(file_path):
-                    return parser
-            except Exception as e:
-                logger.debug(f"Parser {type(parser).__name__} check failed: {e}")
-                continue
+        for parser, probe in self._candidates(file_path, stat, parser_hint):
+            self._remember(file_path, stat, parser, probe)
+            return parser
 
         return None
 
-    def find_incremental_parser(self, file_path: Path) -> Optional[IncrementalParser]:
+    def find_incremental_parser(
+        self, file_path: Path, parser_hint: Optional[str] = None
+    ) -> Optional[IncrementalParser]:
         """
         Find a parser that supports incremental parsing for the given file.
 
         Args:
             file_path: Path to the log file
+            parser_hint: Name of the parser known to handle this file
 
         Returns:
             The first parser that supports incremental parsing for this file,
@@ -255,21 +351,13 @@ class ParserRegistry:
             >>> if parser:
             ...     result = parser.parse_incremental(path, offset, line)
         """
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
-        for parser in self._sorted_parsers(file_path):
+        for parser, probe in self._candidates(file_path, stat, parser_hint):
             try:
-                # Check if parser can handle this file format
-                probe_fn = getattr(parser, "probe", None)
-                if callable(probe_fn):
-                    probe: ProbeResult = probe_fn(file_path)
-                    if not probe.can_parse:
-                        continue
-                else:
-                    if not parser.can_parse(file_path):
-                        continue
-
                 # Check if parser implements IncrementalParser protocol
                 if not isinstance(parser, IncrementalParser):
                     continue
@@ -280,6 +368,7 @@ class ParserRegistry:
                         continue
 
                 # Found a matching incremental parser
+                self._remember(file_path, stat, parser, probe)
                 return parser
 
             except Exception as e:
@@ -290,34 +379,24 @@ class ParserRegistry:
 
         return None
 
-    def find_chunked_parser(self, file_path: Path) -> Optional[ChunkedParser]:
+    def find_chunked_parser(
+        self, file_path: Path, parser_hint: Optional[str] = None
+    ) -> Optional[ChunkedParser]:
         """Find a parser that implements ChunkedParser for the given file.
 
         Returns the first matching parser, or None if no parser supports
-        chunked parsing for this file.
+        chunked parsing for this file. Pass ``parser_hint`` (e.g. the parser
+        recorded on the file's ``RawLog``) to skip probing a known file.
         """
-        if not file_path.exists():
+        try:
+            stat = file_path.stat()
+        except OSError:
             return None
 
-        for parser in self._sorted_parsers(file_path):
-            try:
-                probe_fn = getattr(parser, "probe", None)
-                if callable(probe_fn):
-                    probe: ProbeResult = probe_fn(file_path)
-                    if not probe.can_parse:
-                        continue
-                else:
-                    if not parser.can_parse(file_path):
-                        continue
-
-                if isinstance(parser, ChunkedParser):
-                    return parser
-
-            except Exception as e:
-                logger.debug(
-                    f"Parser {type(parser).__name__} chunked check failed: {e}"
-                )
-                continue
+        for parser, probe in self._candidates(file_path, stat, parser_hint):
+            if isinstance(parser, ChunkedParser):
+                self._remember(file_path, stat, parser, probe)
+                return parser
 
         return None
 
@@ -0,0 +1,230 @@
+"""
+Format sniffing for parser auto-detection.
+
+Instead of every parser opening and scanning a file on its own, the registry
+reads one bounded sample from the head of the file and hands the same
+``FileSample`` to each parser's ``probe_sample()``. JSONL lines in the sample
+are decoded at most once, on demand, however many parsers look at them.
+
+Detection results are kept in a ``ProbeCache`` keyed by file identity
+(device, inode) and validated against size and mtime, so re-detecting a file
+that has only been appended to (the common case for the watcher) costs a
+``stat()`` and a small head read instead of a full probe.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterator, Optional
+
+# Bytes read from the head of a file for probing. If no complete line fits,
+# the read is extended up to MAX_SNIFF_BYTES (very large first records).
+SNIFF_BYTES = 256 * 1024
+MAX_SNIFF_BYTES = 4 * 1024 * 1024
+
+# Head bytes fingerprinted to confirm that a grown file was appended to
+# rather than rewritten in place
+HEAD_FINGERPRINT_BYTES = 4096
+
+
+class FileSample:
+    """
+    Bounded sample of a log file's head, shared by all parser probes.
+
+    Nothing is read until a probe first looks at the data, so parsers that
+    reject a file by name alone never cause I/O.
+
+    Attributes:
+        path: File the sample is read from
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        size: int = SNIFF_BYTES,
+        max_size: int = MAX_SNIFF_BYTES,
+    ) -> None:
+        self.path = path
+        self._size = size
+        self._max_size = max_size
+        self._data: Optional[bytes] = None
+        self._complete = False
+        self._line_iter: Optional[Iterator[bytes]] = None
+        self._records: list[dict[str, Any]] = []
+
+    def _read(self) -> bytes:
+        if self._data is None:
+            with self.path.open("rb") as f:
+                data = f.read(self._size)
+                while b"\n" not in data and len(data) < self._max_size:
+                    more = f.read(min(self._size, self._max_size - len(data)))
+                    if not more:
+                        break
+                    data += more
+                self._complete = len(data) >= os.fstat(f.fileno()).st_size
+            self._data = data
+        return self._data
+
+    @property
+    def data(self) -> bytes:
+        """Raw bytes from the start of the file."""
+        return self._read()
+
+    @property
+    def complete(self) -> bool:
+        """Whether the sample holds the whole file."""
+        self._read()
+        return self._complete
+
+    def _lines(self) -> Iterator[bytes]:
+        """Non-blank complete lines (a cut-off last line is dropped)."""
+        data = self.data
+        end = len(data) if self.complete else data.rfind(b"\n") + 1
+        pos = 0
+        while pos < end:
+            newline = data.find(b"\n", pos, end)
+            if newline < 0:
+                newline = end
+            line = data[pos:newline]
+            pos = newline + 1
+            if line.strip():
+                yield line
+
+    def records(self) -> Iterator[dict[str, Any]]:
+        """
+        Yield the JSON objects in the sample, in file order.
+
+        Lines are split and decoded lazily and memoized, so a parser that
+        stops at the first record costs one ``json.loads`` and a later parser
+        re-uses it. Lines that are not JSON objects are skipped.
+        """
+        index = 0
+        while True:
+            if index < len(self._records):
+                yield self._records[index]
+                index += 1
+                continue
+            if self._line_iter is None:
+                self._line_iter = self._lines()
+            line = next(self._line_iter, None)
+            if line is None:
+                return
+            try:
+                data = json.loads(line.decode("utf-8", errors="ignore"))
+            except json.JSONDecodeError:
+                continue
+            if isinstance(data, dict):
+                self._records.append(data)
+
+
+def head_fingerprint(file_path: Path, length: int) -> str:
+    """Hash of the first ``length`` bytes of a file."""
+    with file_path.open("rb") as f:
+        return hashlib.sha256(f.read(length)).hexdigest()
+
+
+@dataclass(frozen=True)
+class ProbeCacheEntry:
+    """Detection result remembered for one file."""
+
+    size: int
+    mtime_ns: int
+    parser_name: str
+    confidence: float
+    reasons: tuple[str, ...]
+    head_length: int
+    head_hash: str
+
+
+class ProbeCache:
+    """
+    Bounded LRU of detection results keyed by (device, inode).
+
+    A lookup hits when the file is unchanged (same size and mtime) or has
+    grown and its head still matches the fingerprint taken at probe time,
+    i.e. it was appended to. Shrunk or rewritten files miss and are
+    re-probed. Safe to share between threads.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._entries: OrderedDict[tuple[int, int], ProbeCacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, file_path: Path, stat: os.stat_result) -> Optional[ProbeCacheEntry]:
+        """Return the cached result for ``file_path`` if it is still valid."""
+        key = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+
+        if entry.size == stat.st_size and entry.mtime_ns == stat.st_mtime_ns:
+            return entry
+        if stat.st_size > entry.size:
+            try:
+                if head_fingerprint(file_path, entry.head_length) == entry.head_hash:
+                    return entry
+            except OSError:
+                pass
+
+        self.discard(stat)
+        return None
+
+    def put(
+        self,
+        file_path: Path,
+        stat: os.stat_result,
+        parser_name: str,
+        confidence: float,
+        reasons: list[str],
+    ) -> None:
+        """Remember which parser handles ``file_path`` at its current state."""
+        key = (stat.st_dev, stat.st_ino)
+        with self._lock:
+            current = self._entries.get(key)
+        if (
+            current is not None
+            and current.parser_name == parser_name
+            and current.size == stat.st_size
+            and current.mtime_ns == stat.st_mtime_ns
+        ):
+            return
+
+        head_length = min(stat.st_size, HEAD_FINGERPRINT_BYTES)
+        try:
+            head_hash = head_fingerprint(file_path, head_length)
+        except OSError:
+            return
+
+        entry = ProbeCacheEntry(
+            size=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            parser_name=parser_name,
+            confidence=confidence,
+            reasons=tuple(reasons),
+            head_length=head_length,
+            head_hash=head_hash,
+        )
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, stat: os.stat_result) -> None:
+        """Forget the entry for a file."""
+        with self._lock:
+            self._entries.pop((stat.st_dev, stat.st_ino), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
@@ -2,16 +2,28 @@
 Utility functions for parsing conversation logs.
 
 This module provides common utilities used by various parsers, including
-timestamp parsing, thread reconstruction, and tool call matching.
+timestamp parsing, thread reconstruction, tool call matching, and the
+byte-level JSONL reader shared by the JSONL parsers.
 """
 
 import json
+import os
+from dataclasses import dataclass
 from datetime import datetime
+from io import FileIO
 from pathlib import Path
-from typing import Any, Optional
+from types import TracebackType
+from typing import Any, Iterator, Optional
 
 from dateutil import parser as date_parser
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 
 def parse_iso_timestamp(timestamp_str: str) -> datetime:
     """
@@ -264,3 +276,148 @@ def is_conversational_log(file_path: Path, max_lines: int = 5) -> bool:
 
     # No markers found in first N lines = likely metadata-only file
     return False
+
+
+def loads_json(data: bytes | str) -> Any:
+    """
+    Decode one JSON document, using orjson when it is installed.
+
+    Inputs orjson rejects but the standard library accepts (e.g. ``NaN``)
+    fall back to ``json.loads``. Integers wider than 64 bits, which agent
+    logs do not use, may decode as floats under orjson.
+
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON
+        UnicodeDecodeError: If bytes are not valid UTF-8 (stdlib decoder)
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+@dataclass(slots=True)
+class JsonlLine:
+    """
+    One line of a JSONL file, located by byte offsets.
+
+    Attributes:
+        line_number: 1-based line number (counted from the reader's start line)
+        offset: Byte offset of the first byte of the line
+        end: Byte offset just past the line's newline (the next line's offset)
+        text: Line content with surrounding whitespace stripped
+        complete: False for a last line with no newline yet (maybe mid-write)
+    """
+
+    line_number: int
+    offset: int
+    end: int
+    text: bytes
+    complete: bool
+
+    def loads(self) -> Any:
+        """Decode the line as JSON (see ``loads_json``)."""
+        return loads_json(self.text)
+
+    @property
+    def context(self) -> Optional[str]:
+        """Start of the line as text, for parse warnings."""
+        if not self.text:
+            return None
+        return self.text[:100].decode("utf-8", errors="replace")
+
+
+# Bytes read from the file per refill of JsonlReader's window
+JSONL_READ_SIZE = 1 << 20
+
+
+class JsonlReader:
+    """
+    Buffered, byte-level reader for JSONL logs.
+
+    The file is read in bounded ``JSONL_READ_SIZE`` windows and lines are
+    split on ``\\n`` directly in the bytes, so offsets are exact byte
+    positions with no text decoding or ``tell()`` bookkeeping. Reading stops
+    at the file size seen when the reader was opened; bytes appended later
+    are left for the next read. If the file is truncated meanwhile (a log
+    being rotated or rewritten), ``size`` shrinks to what could actually be
+    read, so callers comparing ``line.end`` to ``size`` still see EOF.
+
+    Example:
+        >>> with JsonlReader(path, start_offset=offset) as reader:
+        ...     for line in reader:
+        ...         if line.text:
+        ...             record = line.loads()
+    """
+
+    def __init__(
+        self, file_path: Path, start_offset: int = 0, start_line: int = 0
+    ) -> None:
+        self.file_path = file_path
+        self.start_offset = start_offset
+        self.start_line = start_line
+        self.size = 0
+        self._file: Optional[FileIO] = None
+
+    def __enter__(self) -> "JsonlReader":
+        # Unbuffered: the window below is the only buffer, and reads past a
+        # truncation return nothing instead of stale buffered bytes
+        self._file = self.file_path.open("rb", buffering=0)
+        try:
+            self.size = os.fstat(self._file.fileno()).st_size
+        except Exception:
+            self._file.close()
+            raise
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[type[BaseException]],
+        exc: Optional[BaseException],
+        tb: Optional[TracebackType],
+    ) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __iter__(self) -> Iterator[JsonlLine]:
+        file = self._file
+        if file is None or self.start_offset >= self.size:
+            return
+        pos = self.start_offset
+        line_number = self.start_line
+        file.seek(pos)
+        # buffer holds the file's bytes from buffer_start onward; bytes
+        # before scanned (relative to the buffer) hold no newline
+        buffer = bytearray()
+        buffer_start = pos
+        scanned = 0
+        while pos < self.size:
+            newline = buffer.find(b"\n", scanned)
+            if newline < 0 and buffer_start + len(buffer) < self.size:
+                chunk = file.read(
+                    min(JSONL_READ_SIZE, self.size - buffer_start - len(buffer))
+                )
+                if not chunk:
+                    # Truncated since the reader was opened
+                    self.size = buffer_start + len(buffer)
+                    continue
+                del buffer[: pos - buffer_start]
+                buffer_start = pos
+                scanned = len(buffer)
+                buffer += chunk
+                continue
+            complete = newline >= 0
+            end = buffer_start + newline + 1 if complete else self.size
+            line_number += 1
+            yield JsonlLine(
+                line_number=line_number,
+                offset=pos,
+                end=end,
+                text=bytes(buffer[pos - buffer_start : end - buffer_start]).strip(),
+                complete=complete,
+            )
+            pos = end
+            scanned = end - buffer_start
@@ -22,8 +22,11 @@ from catsyphon.db.repositories import (
     EpochRepository,
     IngestionJobRepository,
     MessageRepository,
+    PlanRepository,
     ProjectRepository,
     RawLogRepository,
+    RollupRepository,
+    TokenLedgerRepository,
     WorkspaceRepository,
 )
 from catsyphon.exceptions import DuplicateFileError
@@ -38,46 +41,6 @@ from catsyphon.utils.hashing import calculate_file_hash
 logger = logging.getLogger(__name__)
 
 
-def _find_parent_task_message(
-    session: Session,
-    parent_conversation_id: UUID,
-    agent_start_time: datetime,
-) -> Optional[UUID]:
-    """Find the parent message that spawned an agent conversation.
-
-    Looks for Task tool calls in the parent conversation that occurred
-    before the agent started, returning the closest preceding one.
-
-    Args:
-        session: Database session
-        parent_conversation_id: Parent conversation UUID
-        agent_start_time: When the agent conversation started
-
-    Returns:
-        Message ID of the spawning Task call, or None if not found
-    """
-    # Query parent conversation's messages before agent start
-    # ordered by timestamp descending (newest first)
-    messages = (
-        session.query(Message)
-        .filter(
-            Message.conversation_id == parent_conversation_id,
-            Message.timestamp <= agent_start_time,
-        )
-        .order_by(Message.timestamp.desc())
-        .all()
-    )
-
-    # Find the most recent message with a Task tool call
-    for msg in messages:
-        if msg.tool_calls:
-            for tool_call in msg.tool_calls:
-                if tool_call.get("tool_name") == "Task":
-                    return msg.id
-
-    return None
-
-
 def _build_extra_data(parsed: ParsedConversation) -> dict[str, Any]:
     """Build extra_data dictionary for a conversation.
 
@@ -728,6 +691,7 @@ def ingest_conversation(
                     # Delete children explicitly to ensure CASCADE works
                     # NOTE: We do NOT delete RawLog - it will be updated in place
                     # to avoid FK constraint violations
+                    TokenLedgerRepository(session).clear(existing_conversation.id)
                     session.query(Message).filter(
                         Message.conversation_id == existing_conversation.id
                     ).delete()
@@ -755,7 +719,11 @@ def ingest_conversation(
                                 f"Deleting {len(child_conversations)} child conversations for re-ingest"
                             )
                             # Delete child's related data first (Messages, Epochs, FilesTouched)
+                            rollup_repo = RollupRepository(session)
+                            ledger_repo = TokenLedgerRepository(session)
                             for child in child_conversations:
+                                rollup_repo.remove(child.id)
+                                ledger_repo.clear(child.id)
                                 session.query(Message).filter(
                                     Message.conversation_id == child.id
                                 ).delete()
@@ -904,10 +872,8 @@ def ingest_conversation(
 
                 # Find the exact parent message that spawned this agent
                 # by looking for Task tool calls that occurred before agent start
-                parent_message_id = _find_parent_task_message(
-                    session=session,
-                    parent_conversation_id=parent_conversation_id,
-                    agent_start_time=parsed.start_time,
+                parent_message_id = MessageRepository(session).find_spawning_message(
+                    parent_conversation_id, parsed.start_time
                 )
 
                 if parent_message_id:
@@ -985,7 +951,7 @@ def ingest_conversation(
         logger.debug(f"Created epoch: {epoch.id}")
 
         # Step 5: Create Messages (bulk insert for efficiency)
-        message_data = []
+        message_data: list[dict[str, Any]] = []
         for idx, msg in enumerate(parsed.messages):
             # Serialize tool calls and code changes to JSON
             tool_calls_json = [
@@ -1043,6 +1009,9 @@ def ingest_conversation(
         # Bulk create messages
         messages = message_repo.bulk_create(message_data)
         logger.info(f"Created {len(messages)} messages")
+        TokenLedgerRepository(session).record(
+            conversation, [(d["extra_data"], d["timestamp"]) for d in message_data]
+        )
 
         # Step 6: Create FileTouched records
         if parsed.files_touched:
@@ -1085,6 +1054,7 @@ def ingest_conversation(
                 raw_log = raw_log_repo.update_from_file(
                     raw_log=existing_raw_logs[0],
                     file_path=file_path,
+                    parser_name=parse_result.parser_name if parse_result else None,
                 )
                 logger.debug(
                     f"Updated existing raw log: {raw_log.id} (file_path updated to {file_path.name})"
@@ -1096,6 +1066,7 @@ def ingest_conversation(
                     agent_type=parsed.agent_type,
                     log_format="jsonl",  # Assume JSONL for now
                     file_path=file_path,
+                    parser_name=parse_result.parser_name if parse_result else None,
                 )
                 logger.debug(f"Stored raw log: {raw_log.id}")
 
@@ -1112,6 +1083,12 @@ def ingest_conversation(
         # Flush to ensure all IDs are generated and counts are saved
         session.flush()
 
+        # Maintain analytics rollups and plan rows for the (re)ingested conversation
+        RollupRepository(session).refresh(conversation)
+        PlanRepository(session).replace_for_conversation(
+            conversation, conversation.extra_data.get("plans")
+        )
+
         # Refresh conversation to load relationships
         session.refresh(conversation)
 
@@ -1287,7 +1264,7 @@ def _append_messages_incremental(
         )
 
     # Create Message records for NEW messages only
-    message_data = []
+    message_data: list[dict[str, Any]] = []
     for idx, msg in enumerate(new_messages):
         # Calculate global sequence (existing + new index)
         sequence = existing_message_count + idx
@@ -1348,12 +1325,17 @@ def _append_messages_incremental(
     # Bulk create new messages
     new_message_records = message_repo.bulk_create(message_data)
     logger.info(f"Created {len(new_message_records)} new message records")
+    TokenLedgerRepository(session).record(
+        existing_conversation,
+        [(d["extra_data"], d["timestamp"]) for d in message_data],
+    )
 
     # Create FileTouched records from new code changes
     new_code_changes = []
     for msg in new_messages:
         new_code_changes.extend(msg.code_changes)
 
+    new_file_touches = []
     for code_change in new_code_changes:
         file_touched = FileTouched(
             conversation_id=existing_conversation.id,
@@ -1365,6 +1347,7 @@ def _append_messages_incremental(
             timestamp=parsed.end_time or parsed.start_time,
         )
         session.add(file_touched)
+        new_file_touches.append(file_touched)
 
     if new_code_changes:
         logger.debug(f"Created {len(new_code_changes)} new file touched records")
@@ -1421,6 +1404,11 @@ def _append_messages_incremental(
 
     # Flush and refresh
     session.flush()
+    RollupRepository(session).add(
+        existing_conversation,
+        [m.id for m in new_message_records],
+        [f.id for f in new_file_touches],
+    )
     session.refresh(existing_conversation)
 
     logger.info(
@@ -1547,7 +1535,7 @@ def ingest_messages_incremental(
         existing_message_count = conversation.message_count
 
         # Create Message records for NEW messages only
-        message_data = []
+        message_data: list[dict[str, Any]] = []
         for idx, msg in enumerate(incremental_result.new_messages):
             sequence = existing_message_count + idx
 
@@ -1605,12 +1593,16 @@ def ingest_messages_incremental(
         # Bulk create messages
         new_messages = message_repo.bulk_create(message_data)
         logger.info(f"Created {len(new_messages)} new message records")
+        TokenLedgerRepository(session).record(
+            conversation, [(d["extra_data"], d["timestamp"]) for d in message_data]
+        )
 
         # Create FileTouched records
         new_code_changes = []
         for msg in incremental_result.new_messages:
             new_code_changes.extend(msg.code_changes)
 
+        new_file_touches = []
         for code_change in new_code_changes:
             file_touched = FileTouched(
                 conversation_id=conversation.id,
@@ -1623,6 +1615,7 @@ def ingest_messages_incremental(
                 or conversation.end_time,
             )
             session.add(file_touched)
+            new_file_touches.append(file_touched)
 
         # Update conversation counts
         conversation.message_count += len(incremental_result.new_messages)
@@ -1656,6 +1649,11 @@ def ingest_messages_incremental(
 
         # Flush and refresh
         session.flush()
+        RollupRepository(session).add(
+            conversation,
+            [m.id for m in new_messages],
+            [f.id for f in new_file_touches],
+        )
         session.refresh(conversation)
 
         tracker.mark_success(
@@ -1758,6 +1756,7 @@ def link_orphaned_agents(
     logger.info(f"Starting post-ingestion agent linking for workspace {workspace_id}")
 
     conversation_repo = ConversationRepository(session)
+    message_repo = MessageRepository(session)
 
     # Find linkable orphaned agent conversations (excludes permanently orphaned)
     orphaned_agents = (
@@ -1812,6 +1811,7 @@ def link_orphaned_agents(
                 max_age_hours=max_orphan_age_hours,
             ):
                 agent.permanently_orphaned = True
+                agent.pending_parent_session_id = None
                 marked_permanent_count += 1
                 logger.warning(
                     "Marked agent %s as permanently orphaned "
@@ -1832,8 +1832,20 @@ def link_orphaned_agents(
 
         # Link agent to parent
         agent.parent_conversation_id = parent_conversation.id
+        agent.pending_parent_session_id = None
         linked_count += 1
 
+        # Record the spawning Task message, as direct ingestion does
+        if "parent_message_id" not in agent.agent_metadata:
+            parent_message_id = message_repo.find_spawning_message(
+                parent_conversation.id, agent.start_time
+            )
+            if parent_message_id:
+                agent.agent_metadata = {
+                    **agent.agent_metadata,
+                    "parent_message_id": str(parent_message_id),
+                }
+
         logger.info(
             f"Linked agent conversation {agent.id} (session_id={agent.extra_data.get('session_id')}) "
             f"to parent {parent_conversation.id} (session_id={parent_session_id})"
@@ -0,0 +1,233 @@
+"""
+Parallel multi-file ingestion for ``catsyphon ingest --workers N``.
+
+Parsing is CPU-bound and needs no database, so files are turned into events
+by ``prepare_file()`` in a process pool. Prepared files are handed to a small
+number of writer threads, each storing one file per database session through
+``IngestionService.ingest_prepared()``.
+
+Agent logs are stored after their parent: a prepared file whose parent
+session is neither in the database nor stored yet by this batch is held
+back until the parent has been stored (files are also queued with
+``agent-*`` logs last, so this is rarely needed). Agents whose parent is not
+part of the batch, and held agents beyond ``_MAX_HELD_FILES``, are stored as
+orphans and linked once their parent arrives.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+from collections import deque
+from concurrent.futures import (
+    FIRST_COMPLETED,
+    Future,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    wait,
+)
+from contextlib import AbstractContextManager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories.collector_session import CollectorSessionRepository
+from catsyphon.services.ingestion_service import (
+    IngestionOutcome,
+    IngestionService,
+    PreparedFile,
+    prepare_file,
+)
+
+logger = logging.getLogger(__name__)
+
+# Parsed files waiting for a writer, per worker process. Bounds memory when
+# the database is slower than the parsers.
+_QUEUED_PER_WORKER = 2
+
+# Agent files held back waiting for their parent. Beyond this they are
+# stored as orphans instead, bounding the parsed events kept in memory.
+_MAX_HELD_FILES = 200
+
+
+@dataclass
+class FileResult:
+    """Outcome of ingesting one file in a batch."""
+
+    file_path: Path
+    outcome: IngestionOutcome
+    events: int = 0
+
+
+def _prepare_in_worker(file_path: Path) -> PreparedFile:
+    from catsyphon.parsers import get_default_registry
+
+    return prepare_file(file_path, get_default_registry())
+
+
+def _ingest_order(file_path: Path) -> tuple[bool, str]:
+    """Sort key queueing main conversation logs before agent logs."""
+    return file_path.name.startswith("agent-"), str(file_path)
+
+
+def _parent_in_database(
+    session_factory: Callable[[], AbstractContextManager[Session]],
+    parent_session_id: str,
+) -> bool:
+    """Whether a parent session was already stored (e.g. by an earlier run)."""
+    try:
+        with session_factory() as session:
+            parent = CollectorSessionRepository(session).get_by_collector_session_id(
+                parent_session_id
+            )
+    except Exception as e:
+        logger.warning(f"Parent lookup failed for {parent_session_id}: {e}")
+        return False
+    return parent is not None
+
+
+def ingest_files_parallel(
+    files: Iterable[Path],
+    workspace_id: UUID,
+    session_factory: Callable[[], AbstractContextManager[Session]],
+    workers: int,
+    writers: int = 2,
+    project_name: Optional[str] = None,
+    developer_username: Optional[str] = None,
+    enable_tagging: bool = False,
+    on_result: Optional[Callable[[FileResult], None]] = None,
+) -> list[FileResult]:
+    """
+    Parse files in a process pool and store them with a few DB writers.
+
+    Args:
+        files: Log files to ingest
+        workspace_id: Workspace to ingest into
+        session_factory: Context manager yielding a session that commits on
+            exit (e.g. ``db_session``); one is opened per stored file
+        workers: Number of parser processes
+        writers: Number of concurrent database writers
+        project_name: Optional project name
+        developer_username: Optional developer username
+        enable_tagging: Whether to queue stored conversations for tagging
+        on_result: Called in the calling thread as each file finishes
+
+    Returns:
+        One FileResult per file, in completion order
+    """
+    pending = deque(sorted(files, key=_ingest_order))
+    results: list[FileResult] = []
+    parsing: dict[Future[PreparedFile], Path] = {}
+    writing: dict[Future[IngestionOutcome], PreparedFile] = {}
+    # Agent files waiting for their parent session, keyed by parent
+    held: dict[str, list[PreparedFile]] = {}
+    held_count = 0
+    stored_sessions: set[str] = set()
+
+    def _parent_stored(parent_session_id: str) -> bool:
+        if parent_session_id in stored_sessions:
+            return True
+        if _parent_in_database(session_factory, parent_session_id):
+            stored_sessions.add(parent_session_id)
+            return True
+        return False
+
+    def _store(prepared: PreparedFile) -> IngestionOutcome:
+        try:
+            with session_factory() as session:
+                return IngestionService(session).ingest_prepared(
+                    prepared,
+                    workspace_id=workspace_id,
+                    project_name=project_name,
+                    developer_username=developer_username,
+                    source_type="cli",
+                    enable_tagging=enable_tagging,
+                )
+        except Exception as e:
+            logger.error(f"Ingestion failed for {prepared.file_path}: {e}")
+            return IngestionOutcome(status="error", error_message=str(e))
+
+    def _finish(result: FileResult) -> None:
+        results.append(result)
+        if on_result:
+            on_result(result)
+
+    def _submit_write(prepared: PreparedFile) -> None:
+        writing[write_pool.submit(_store, prepared)] = prepared
+
+    def _release_held() -> None:
+        nonlocal held_count
+        for children in held.values():
+            for child in children:
+                _submit_write(child)
+        held.clear()
+        held_count = 0
+
+    with (
+        ProcessPoolExecutor(
+            max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+        ) as parse_pool,
+        ThreadPoolExecutor(
+            max_workers=writers, thread_name_prefix="ingest-writer"
+        ) as write_pool,
+    ):
+        while pending or parsing or writing:
+            while pending and len(parsing) + len(writing) < (
+                workers * _QUEUED_PER_WORKER + writers
+            ):
+                path = pending.popleft()
+                parsing[parse_pool.submit(_prepare_in_worker, path)] = path
+
+            running: list[Future[Any]] = [*parsing, *writing]
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future in parsing:
+                    path = parsing.pop(future)
+                    try:
+                        prepared = future.result()
+                    except Exception as e:
+                        logger.error(f"Parsing failed for {path}: {e}")
+                        _finish(
+                            FileResult(
+                                path,
+                                IngestionOutcome(status="error", error_message=str(e)),
+                            )
+                        )
+                        continue
+                    parent = prepared.parent_session_id
+                    if (
+                        parent
+                        and (pending or parsing or writing)
+                        and not _parent_stored(parent)
+                    ):
+                        # The parent may be among the files not yet stored
+                        held.setdefault(parent, []).append(prepared)
+                        held_count += 1
+                        if held_count > _MAX_HELD_FILES:
+                            logger.info(
+                                f"Storing {held_count} agent logs before their "
+                                "parents; they are linked when the parents arrive"
+                            )
+                            _release_held()
+                    else:
+                        _submit_write(prepared)
+                else:
+                    prepared = writing.pop(future)
+                    _finish(
+                        FileResult(
+                            prepared.file_path, future.result(), len(prepared.events)
+                        )
+                    )
+                    stored_sessions.add(prepared.session_id)
+                    for child in held.pop(prepared.session_id, []):
+                        held_count -= 1
+                        _submit_write(child)
+
+            if held and not (pending or parsing or writing):
+                # Remaining agents have no parent in this batch
+                _release_held()
+
+    return results
@@ -19,23 +19,38 @@ import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from uuid import UUID
 
 from sqlalchemy.exc import DBAPIError
 from sqlalchemy.orm import Session
 
+from catsyphon.analytics.cache import ANALYTICS_CACHE
 from catsyphon.config import settings
-from catsyphon.db.repositories.collector_session import CollectorSessionRepository
+from catsyphon.db.repositories.collector_session import (
+    CollectorSessionRepository,
+    tool_call_line_counts,
+)
 from catsyphon.db.repositories.raw_log import RawLogRepository
-from catsyphon.models.db import IngestionJob
-from catsyphon.parsers.registry import ParserRegistry
+from catsyphon.db.repositories.rollup import RollupRepository
+from catsyphon.models.db import Conversation, IngestionJob
+from catsyphon.parsers.incremental import parse_messages_resumable
+from catsyphon.parsers.registry import ParserRegistry, get_parser_name
+from catsyphon.utils.hashing import PartialHashState
 
 if TYPE_CHECKING:
-    from catsyphon.models.parsed import ParsedConversation, ParsedMessage
+    from catsyphon.models.parsed import (
+        ConversationMetadata,
+        ParsedConversation,
+        ParsedMessage,
+    )
+    from catsyphon.services.streaming_upload import UploadSpool
 
 logger = logging.getLogger(__name__)
 
+# Spool bytes to wait for before sniffing the format of a streaming upload
+_STREAM_SNIFF_BYTES = 64 * 1024
+
 
 def _utc_now() -> datetime:
     """Get current UTC time."""
@@ -123,6 +138,14 @@ class IngestionOutcome:
         return self.status in ("success", "duplicate")
 
 
+def _interrupted_upload_outcome() -> IngestionOutcome:
+    """Outcome for a streaming upload whose body never finished arriving."""
+    return IngestionOutcome(
+        status="error",
+        error_message="Upload interrupted before the file was fully received",
+    )
+
+
 @dataclass
 class CollectorEvent:
     """Internal event representation for processing."""
@@ -134,12 +157,310 @@ class CollectorEvent:
     data: dict[str, Any]
 
 
+def _create_event(
+    event_type: str,
+    emitted_at: datetime,
+    data: dict[str, Any],
+) -> CollectorEvent:
+    """Create an event with computed hash."""
+    observed_at = _utc_now()
+    return CollectorEvent(
+        type=event_type,
+        emitted_at=emitted_at,
+        observed_at=observed_at,
+        event_hash=_compute_event_hash(event_type, emitted_at, data),
+        data=data,
+    )
+
+
+def _session_start_event(meta: "ConversationMetadata") -> CollectorEvent:
+    """Build the session_start event from chunked-parser metadata."""
+    session_start_data: dict[str, Any] = {
+        "agent_type": meta.agent_type or "unknown",
+        "agent_version": meta.agent_version or "unknown",
+        "working_directory": meta.working_directory,
+        "git_branch": meta.git_branch,
+    }
+    if meta.parent_session_id:
+        session_start_data["parent_session_id"] = meta.parent_session_id
+    if meta.slug:
+        session_start_data["slug"] = meta.slug
+    if meta.metadata:
+        for key, value in meta.metadata.items():
+            if key not in session_start_data:
+                session_start_data[key] = _serialize_for_json(value)
+
+    return _create_event(
+        event_type="session_start",
+        emitted_at=meta.start_time or _utc_now(),
+        data=session_start_data,
+    )
+
+
+def _parsed_to_events(parsed: "ParsedConversation") -> list[CollectorEvent]:
+    """
+    Convert a ParsedConversation to a list of events.
+
+    Same logic as CollectorClient._message_to_events() but returns internal
+    CollectorEvent objects instead of dicts for HTTP transport.
+    """
+    events: list[CollectorEvent] = []
+
+    # Session start event
+    session_start_data: dict[str, Any] = {
+        "agent_type": parsed.agent_type or "unknown",
+        "agent_version": parsed.agent_version or "unknown",
+        "working_directory": parsed.working_directory,
+        "git_branch": parsed.git_branch,
+    }
+    if parsed.parent_session_id:
+        session_start_data["parent_session_id"] = parsed.parent_session_id
+    if parsed.slug:
+        session_start_data["slug"] = parsed.slug
+    if parsed.summaries:
+        session_start_data["summaries"] = _serialize_for_json(parsed.summaries)
+    if parsed.compaction_events:
+        session_start_data["compaction_events"] = _serialize_for_json(
+            parsed.compaction_events
+        )
+    if parsed.metadata:
+        for key, value in parsed.metadata.items():
+            if key not in session_start_data:
+                session_start_data[key] = _serialize_for_json(value)
+
+    start_time = parsed.start_time or _utc_now()
+    events.append(
+        _create_event(
+            event_type="session_start",
+            emitted_at=start_time,
+            data=session_start_data,
+        )
+    )
+
+    # Message events
+    for msg in parsed.messages:
+        events.extend(_message_to_events(msg))
+
+    # Session end event
+    if parsed.end_time:
+        session_end_data: dict[str, Any] = {
+            "outcome": "unknown",
+            "total_messages": len(parsed.messages),
+        }
+        if parsed.plans:
+            session_end_data["plans"] = [
+                plan.to_dict() if hasattr(plan, "to_dict") else plan
+                for plan in parsed.plans
+            ]
+        if parsed.files_touched:
+            session_end_data["files_touched"] = parsed.files_touched
+
+        events.append(
+            _create_event(
+                event_type="session_end",
+                emitted_at=parsed.end_time,
+                data=session_end_data,
+            )
+        )
+
+    return events
+
+
+def _message_to_events(msg: "ParsedMessage") -> list[CollectorEvent]:
+    """Convert a ParsedMessage to events."""
+    events: list[CollectorEvent] = []
+
+    # Map role to author_role
+    role_mapping = {
+        "user": "human",
+        "human": "human",
+        "assistant": "assistant",
+        "system": "system",
+        "tool": "tool",
+    }
+    author_role = msg.author_role or role_mapping.get(msg.role or "", "assistant")
+    event_time = msg.emitted_at or msg.timestamp or _utc_now()
+
+    # Determine message_type
+    message_type = msg.message_type
+    if not message_type:
+        if msg.role in ("user", "human"):
+            message_type = "prompt"
+        elif msg.role == "tool":
+            message_type = "tool_result"
+        else:
+            message_type = "response"
+
+    # Tool call events
+    if msg.tool_calls:
+        for idx, tool_call in enumerate(msg.tool_calls):
+            tool_event_time = tool_call.timestamp or event_time
+            tool_use_id = f"tool_{tool_event_time.isoformat()}_{idx}"
+
+            events.append(
+                _create_event(
+                    event_type="tool_call",
+                    emitted_at=tool_event_time,
+                    data={
+                        "tool_name": tool_call.tool_name,
+                        "tool_use_id": tool_use_id,
+                        "parameters": tool_call.parameters or {},
+                    },
+                )
+            )
+
+            if tool_call.result is not None:
+                result_value = tool_call.result
+                if not isinstance(result_value, str):
+                    result_value = json.dumps(result_value)
+                events.append(
+                    _create_event(
+                        event_type="tool_result",
+                        emitted_at=tool_event_time,
+                        data={
+                            "tool_use_id": tool_use_id,
+                            "success": tool_call.success,
+                            "result": result_value,
+                        },
+                    )
+                )
+
+    # Main message event
+    data: dict[str, Any] = {
+        "author_role": author_role,
+        "message_type": message_type,
+        "content": msg.content or "",
+    }
+    if msg.model:
+        data["model"] = msg.model
+    if msg.token_usage:
+        data["token_usage"] = msg.token_usage
+    if msg.thinking_content:
+        data["thinking_content"] = msg.thinking_content
+    if msg.stop_reason:
+        data["stop_reason"] = msg.stop_reason
+    if msg.thinking_metadata:
+        data["thinking_metadata"] = msg.thinking_metadata
+
+    events.append(
+        _create_event(
+            event_type="message",
+            emitted_at=event_time,
+            data=data,
+        )
+    )
+
+    return events
+
+
+@dataclass
+class PreparedFile:
+    """A log file parsed into events, ready to be stored."""
+
+    file_path: Path
+    session_id: str
+    events: list[CollectorEvent]
+    agent_type: str = "unknown"
+    parser_name: Optional[str] = None
+    parent_session_id: Optional[str] = None
+
+
+def prepare_file(file_path: Path, registry: ParserRegistry) -> PreparedFile:
+    """
+    Parse a log file into events without touching the database.
+
+    Chunked parsers are preferred to keep parser memory bounded (ADR-009);
+    other formats are parsed in full.
+
+    Raises:
+        ValueError: If no parser could read the file
+    """
+    chunked_parser = registry.find_chunked_parser(file_path)
+    if chunked_parser:
+        return _prepare_chunked(file_path, chunked_parser)
+
+    # Fallback: full parse for non-chunked parsers
+    parse_result = registry.parse_with_metadata(file_path)
+    parsed = parse_result.conversation
+    if not parsed:
+        raise ValueError(f"Failed to parse file: {file_path}")
+
+    return PreparedFile(
+        file_path=file_path,
+        session_id=parsed.session_id or file_path.stem,
+        events=_parsed_to_events(parsed),
+        agent_type=parsed.agent_type or "unknown",
+        parser_name=parse_result.parser_name,
+        parent_session_id=parsed.parent_session_id,
+    )
+
+
+def _prepare_chunked(file_path: Path, chunked_parser: Any) -> PreparedFile:
+    """Build the events for a file using chunked parsing (ADR-009).
+
+    Extracts metadata, then iterates parse_messages() in a loop,
+    converting each chunk to events. Peak parser memory is ~3 MB per
+    chunk regardless of file size.
+    """
+    meta = chunked_parser.parse_metadata(file_path)
+
+    # Accumulate events across chunks (we still process in one batch
+    # per the events API contract, but memory is bounded by chunk size
+    # since messages are converted to lightweight event dicts)
+    all_events: list[CollectorEvent] = []
+
+    # Session start event
+    all_events.append(_session_start_event(meta))
+
+    # Parse messages in chunks
+    offset = 0
+    last_message_time = meta.start_time
+    hash_state: Optional[PartialHashState] = None
+
+    while True:
+        chunk = parse_messages_resumable(chunked_parser, file_path, offset, hash_state)
+
+        for msg in chunk.messages:
+            all_events.extend(_message_to_events(msg))
+            if msg.timestamp:
+                last_message_time = msg.timestamp
+
+        offset = chunk.next_offset
+        hash_state = chunk.hash_state
+        if chunk.is_last:
+            break
+
+    # Session end event
+    if last_message_time:
+        session_end_data: dict[str, Any] = {
+            "outcome": "unknown",
+            "total_messages": sum(1 for e in all_events if e.type == "message"),
+        }
+        all_events.append(
+            _create_event(
+                event_type="session_end",
+                emitted_at=last_message_time,
+                data=session_end_data,
+            )
+        )
+
+    return PreparedFile(
+        file_path=file_path,
+        session_id=meta.session_id or file_path.stem,
+        events=all_events,
+        agent_type=meta.agent_type or "unknown",
+        parser_name=get_parser_name(chunked_parser),
+        parent_session_id=meta.parent_session_id,
+    )
+
+
 class IngestionService:
     """
     Unified ingestion service for all ingestion paths.
 
     This service provides:
     - `ingest_from_file()`: Parse a file and ingest via event pipeline
+    - `ingest_prepared()`: Ingest a file already parsed by `prepare_file()`
     - `process_events()`: Process events directly (used by HTTP endpoint)
 
     All methods use the same underlying event processing logic for consistency.
@@ -190,54 +511,16 @@ class IngestionService:
         start_time = time.time()
 
         try:
-            # ADR-009: Prefer chunked parsing to keep memory bounded
-            chunked_parser = self.parser_registry.find_chunked_parser(file_path)
-            if chunked_parser:
-                return self._ingest_chunked(
-                    file_path=file_path,
-                    chunked_parser=chunked_parser,
-                    workspace_id=workspace_id,
-                    collector_id=collector_id,
-                    source_type=source_type,
-                    enable_tagging=enable_tagging,
-                    start_time=start_time,
-                )
-
-            # Fallback: full parse for non-chunked parsers
-            parsed = self.parser_registry.parse(file_path)
-            if not parsed:
-                return IngestionOutcome(
-                    status="error",
-                    error_message=f"Failed to parse file: {file_path}",
-                )
-
-            session_id = parsed.session_id or file_path.stem
-            events = self._parsed_to_events(parsed)
-
-            if not events:
-                return IngestionOutcome(
-                    status="skipped",
-                    error_message="No events generated from file",
-                )
-
-            outcome = self.process_events(
-                events=events,
-                session_id=session_id,
+            prepared = prepare_file(file_path, self.parser_registry)
+            return self.ingest_prepared(
+                prepared,
                 workspace_id=workspace_id,
-                collector_id=collector_id,
+                project_name=project_name,
+                developer_username=developer_username,
                 source_type=source_type,
                 enable_tagging=enable_tagging,
+                collector_id=collector_id,
             )
-
-            if outcome.success and outcome.conversation_id:
-                self._ensure_raw_log(
-                    conversation_id=outcome.conversation_id,
-                    file_path=file_path,
-                    agent_type=parsed.agent_type or "unknown",
-                )
-
-            return outcome
-
         except Exception as e:
             processing_time_ms = int((time.time() - start_time) * 1000)
             logger.error(f"Ingestion failed for {file_path}: {e}", exc_info=True)
@@ -247,97 +530,31 @@ class IngestionService:
                 processing_time_ms=processing_time_ms,
             )
 
-    def _ingest_chunked(
+    def ingest_prepared(
         self,
-        file_path: Path,
-        chunked_parser: Any,
+        prepared: PreparedFile,
         workspace_id: UUID,
-        collector_id: Optional[UUID],
-        source_type: str,
-        enable_tagging: bool,
-        start_time: float,
+        project_name: Optional[str] = None,
+        developer_username: Optional[str] = None,
+        source_type: str = "cli",
+        enable_tagging: bool = False,
+        collector_id: Optional[UUID] = None,
     ) -> IngestionOutcome:
-        """Ingest a file using chunked parsing (ADR-009).
-
-        Extracts metadata, then iterates parse_messages() in a loop,
-        converting each chunk to events and processing them. Peak memory
-        is ~3 MB per chunk regardless of file size.
         """
-        meta = chunked_parser.parse_metadata(file_path)
-        session_id = meta.session_id or file_path.stem
-
-        # Accumulate events across chunks (we still process in one batch
-        # per the events API contract, but memory is bounded by chunk size
-        # since messages are converted to lightweight event dicts)
-        all_events: list[CollectorEvent] = []
-
-        # Session start event
-        session_start_data: dict[str, Any] = {
-            "agent_type": meta.agent_type or "unknown",
-            "agent_version": meta.agent_version or "unknown",
-            "working_directory": meta.working_directory,
-            "git_branch": meta.git_branch,
-        }
-        if meta.parent_session_id:
-            session_start_data["parent_session_id"] = meta.parent_session_id
-        if meta.slug:
-            session_start_data["slug"] = meta.slug
-        if meta.metadata:
-            for key, value in meta.metadata.items():
-                if key not in session_start_data:
-                    session_start_data[key] = _serialize_for_json(value)
+        Store a file that was already parsed by ``prepare_file()``.
 
-        all_events.append(
-            self._create_event(
-                event_type="session_start",
-                emitted_at=meta.start_time or _utc_now(),
-                data=session_start_data,
-            )
-        )
-
-        # Parse messages in chunks
-        offset = 0
-        all_summaries: list[dict] = []
-        all_compaction: list[dict] = []
-        last_message_time = meta.start_time
-
-        while True:
-            chunk = chunked_parser.parse_messages(file_path, offset)
-
-            for msg in chunk.messages:
-                all_events.extend(self._message_to_events(msg))
-                if msg.timestamp:
-                    last_message_time = msg.timestamp
-
-            all_summaries.extend(chunk.summaries)
-            all_compaction.extend(chunk.compaction_events)
-            offset = chunk.next_offset
-            if chunk.is_last:
-                break
-
-        # Session end event
-        if last_message_time:
-            session_end_data: dict[str, Any] = {
-                "outcome": "unknown",
-                "total_messages": sum(1 for e in all_events if e.type == "message"),
-            }
-            all_events.append(
-                self._create_event(
-                    event_type="session_end",
-                    emitted_at=last_message_time,
-                    data=session_end_data,
-                )
-            )
-
-        if not all_events:
+        Lets callers parse elsewhere (e.g. in worker processes) and only do
+        the database work here. Arguments are as for ``ingest_from_file()``.
+        """
+        if not prepared.events:
             return IngestionOutcome(
                 status="skipped",
                 error_message="No events generated from file",
             )
 
         outcome = self.process_events(
-            events=all_events,
-            session_id=session_id,
+            events=prepared.events,
+            session_id=prepared.session_id,
             workspace_id=workspace_id,
             collector_id=collector_id,
             source_type=source_type,
@@ -347,10 +564,192 @@ class IngestionService:
         if outcome.success and outcome.conversation_id:
             self._ensure_raw_log(
                 conversation_id=outcome.conversation_id,
-                file_path=file_path,
-                agent_type=meta.agent_type or "unknown",
+                file_path=prepared.file_path,
+                agent_type=prepared.agent_type,
+                parser_name=prepared.parser_name,
+            )
+
+        return outcome
+
+    def ingest_stream(
+        self,
+        spool: "UploadSpool",
+        workspace_id: UUID,
+        tracking_job: IngestionJob,
+        source_type: str = "upload",
+        enable_tagging: bool = False,
+        on_chunk: Optional[Callable[[IngestionOutcome], None]] = None,
+    ) -> IngestionOutcome:
+        """
+        Ingest a JSONL upload while its body is still being received.
+
+        Waits for enough of the spool to detect the format, then runs the
+        ADR-009 chunk loop against the growing file: each parsed chunk is
+        processed as soon as it is complete, and the loop blocks for more
+        data until the spool is closed. Every chunk is recorded under
+        ``tracking_job``, which is finalized here.
+
+        Args:
+            spool: Spool file being written by the upload request
+            workspace_id: Workspace to ingest into
+            tracking_job: Persisted job that tracks the whole upload
+            source_type: Source identifier for ingestion job
+            enable_tagging: Whether to queue for LLM tagging at session end
+            on_chunk: Called after each processed chunk (e.g. to commit
+                progress so pollers see it)
+
+        Returns:
+            IngestionOutcome summarizing the whole upload
+        """
+        start_time = time.time()
+        spool.wait_for(_STREAM_SNIFF_BYTES)
+
+        with spool.reading():
+            chunked_parser = self.parser_registry.find_chunked_parser(spool.path)
+
+        chunks = 0
+        events_accepted = 0
+        conversation_id: Optional[UUID] = None
+        session_id = spool.path.stem
+
+        def _process(events: list[CollectorEvent], tagging: bool) -> IngestionOutcome:
+            nonlocal chunks, events_accepted, conversation_id
+            outcome = self.process_events(
+                events=events,
+                session_id=session_id,
+                workspace_id=workspace_id,
+                source_type=source_type,
+                enable_tagging=tagging,
+                tracking_job=tracking_job,
+            )
+            if outcome.success:
+                chunks += 1
+                events_accepted += outcome.events_accepted
+                conversation_id = outcome.conversation_id or conversation_id
+                if on_chunk:
+                    on_chunk(outcome)
+            return outcome
+
+        if chunked_parser is None:
+            # Non-chunked formats need the whole file before parsing
+            spool.wait_closed()
+            if spool.aborted:
+                return self._finish_stream(
+                    tracking_job, _interrupted_upload_outcome(), start_time
+                )
+            parse_result = self.parser_registry.parse_with_metadata(spool.path)
+            parsed = parse_result.conversation
+            parser_name = parse_result.parser_name
+            session_id = parsed.session_id or session_id
+            agent_type = parsed.agent_type or "unknown"
+            outcome = _process(_parsed_to_events(parsed), enable_tagging)
+            if not outcome.success:
+                return self._finish_stream(tracking_job, outcome, start_time)
+        else:
+            parser_name = get_parser_name(chunked_parser)
+            with spool.reading():
+                meta = chunked_parser.parse_metadata(spool.path)
+            session_id = meta.session_id or session_id
+            agent_type = meta.agent_type or "unknown"
+            pending = [_session_start_event(meta)]
+            last_message_time = meta.start_time
+            message_events = 0
+            offset = 0
+            hash_state: Optional[PartialHashState] = None
+
+            while True:
+                spool.wait_for(offset + 1)
+                with spool.reading():
+                    chunk = parse_messages_resumable(
+                        chunked_parser, spool.path, offset, hash_state
+                    )
+
+                for msg in chunk.messages:
+                    pending.extend(_message_to_events(msg))
+                    if msg.timestamp:
+                        last_message_time = msg.timestamp
+
+                if pending:
+                    message_events += sum(1 for e in pending if e.type == "message")
+                    outcome = _process(pending, tagging=False)
+                    if not outcome.success:
+                        return self._finish_stream(tracking_job, outcome, start_time)
+                    pending = []
+
+                if not chunk.is_last and chunk.next_offset <= offset:
+                    logger.warning(
+                        "Chunk parser made no forward progress for upload "
+                        "(offset=%s); stopping parse loop",
+                        offset,
+                    )
+                    break
+
+                offset = chunk.next_offset
+                hash_state = chunk.hash_state
+                # is_last only means the parser caught up with the spool;
+                # the upload is complete once the spool is closed and drained
+                if chunk.is_last and spool.closed and offset >= spool.size:
+                    break
+
+            if spool.aborted:
+                outcome = _interrupted_upload_outcome()
+                outcome.conversation_id = conversation_id
+                return self._finish_stream(tracking_job, outcome, start_time)
+
+            if last_message_time:
+                end_event = _create_event(
+                    event_type="session_end",
+                    emitted_at=last_message_time,
+                    data={"outcome": "unknown", "total_messages": message_events},
+                )
+                outcome = _process([end_event], enable_tagging)
+                if not outcome.success:
+                    return self._finish_stream(tracking_job, outcome, start_time)
+
+        if conversation_id:
+            self._ensure_raw_log(
+                conversation_id=conversation_id,
+                file_path=spool.path,
+                agent_type=agent_type,
+                parser_name=parser_name,
             )
 
+        return self._finish_stream(
+            tracking_job,
+            IngestionOutcome(
+                status="success",
+                conversation_id=conversation_id,
+                messages_added=tracking_job.messages_added,
+                events_accepted=events_accepted,
+            ),
+            start_time,
+            metrics={
+                "chunks": chunks,
+                "bytes": spool.size,
+                "events_accepted": events_accepted,
+            },
+        )
+
+    def _finish_stream(
+        self,
+        tracking_job: IngestionJob,
+        outcome: IngestionOutcome,
+        start_time: float,
+        metrics: Optional[dict[str, Any]] = None,
+    ) -> IngestionOutcome:
+        """Record the final state of a streaming upload on its job."""
+        outcome.processing_time_ms = int((time.time() - start_time) * 1000)
+        tracking_job.status = "success" if outcome.success else "failed"
+        tracking_job.error_message = outcome.error_message
+        tracking_job.conversation_id = (
+            outcome.conversation_id or tracking_job.conversation_id
+        )
+        tracking_job.processing_time_ms = outcome.processing_time_ms
+        tracking_job.completed_at = _utc_now()
+        tracking_job.metrics = {
+            **(metrics or {}),
+            "total_ms": outcome.processing_time_ms,
+        }
         return outcome
 
     def process_events(
@@ -361,6 +760,7 @@ class IngestionService:
         collector_id: Optional[UUID] = None,
         source_type: str = "service",
         enable_tagging: bool = False,
+        tracking_job: Optional[IngestionJob] = None,
     ) -> IngestionOutcome:
         """
         Process a list of events.
@@ -376,6 +776,9 @@ class IngestionService:
             collector_id: Optional collector ID for tracking
             source_type: Source identifier for ingestion job
             enable_tagging: Whether to queue for LLM tagging
+            tracking_job: Existing job to record into instead of creating one
+                per call. Streaming uploads record every chunk under the
+                upload's job; the caller owns its final status.
 
         Returns:
             IngestionOutcome with processing results
@@ -385,25 +788,29 @@ class IngestionService:
         max_attempts = 3
 
         for attempt in range(max_attempts):
-            # Create ingestion job for tracking
-            ingestion_job = IngestionJob(
-                source_type=source_type,
-                collector_id=collector_id,
-                status="processing",
-                started_at=start_datetime,
-                messages_added=0,
-                metrics={},
-            )
-            self.session.add(ingestion_job)
-            self.session.flush()
+            if tracking_job is not None:
+                ingestion_job = tracking_job
+            else:
+                # Create ingestion job for tracking
+                ingestion_job = IngestionJob(
+                    source_type=source_type,
+                    collector_id=collector_id,
+                    status="processing",
+                    started_at=start_datetime,
+                    messages_added=0,
+                    metrics={},
+                )
+                self.session.add(ingestion_job)
+                self.session.flush()
 
             try:
                 # Sort events by timestamp
                 sorted_events = sorted(events, key=lambda e: e.emitted_at)
 
                 if not sorted_events:
-                    ingestion_job.status = "skipped"
-                    ingestion_job.completed_at = _utc_now()
+                    if tracking_job is None:
+                        ingestion_job.status = "skipped"
+                        ingestion_job.completed_at = _utc_now()
                     return IngestionOutcome(status="skipped")
 
                 session_start_event = next(
@@ -445,10 +852,15 @@ class IngestionService:
                 # Process events
                 messages_added = 0
                 files_touched_count = 0
+                message_ids: list[UUID] = []
+                file_touched_ids: list[UUID] = []
                 session_completed = False
 
-                # Accumulate file touches for batch insert
-                pending_file_touches: list[tuple[str, str, datetime]] = []
+                # Accumulate messages and file touches for batch insert
+                pending_messages: list[
+                    tuple[str, datetime, datetime, dict[str, Any], Optional[str]]
+                ] = []
+                pending_file_touches: list[tuple[str, str, datetime, int, int]] = []
 
                 # Tools for file tracking
                 file_modifying_tools = {
@@ -478,15 +890,15 @@ class IngestionService:
                         "thinking",
                         "error",
                     ):
-                        self.session_repo.add_message(
-                            conversation=conversation,
-                            event_type=event.type,
-                            emitted_at=event.emitted_at,
-                            observed_at=event.observed_at,
-                            data=event.data,
-                            event_hash=event.event_hash,
+                        pending_messages.append(
+                            (
+                                event.type,
+                                event.emitted_at,
+                                event.observed_at,
+                                event.data,
+                                event.event_hash,
+                            )
                         )
-                        messages_added += 1
 
                         # Accumulate file touches from tool_call events
                         if event.type == "tool_call":
@@ -501,11 +913,12 @@ class IngestionService:
                                             file_path,
                                             file_modifying_tools[tool_name],
                                             event.emitted_at,
+                                            *tool_call_line_counts(tool_name, params),
                                         )
                                     )
                                 elif tool_name in file_reading_tools:
                                     pending_file_touches.append(
-                                        (file_path, "read", event.emitted_at)
+                                        (file_path, "read", event.emitted_at, 0, 0)
                                     )
 
                     # Handle session_end
@@ -521,12 +934,24 @@ class IngestionService:
                         )
                         session_completed = True
 
-                # Batch-insert accumulated file touches
-                if pending_file_touches:
-                    files_touched_count = self.session_repo.add_file_touches_batch(
+                # Bulk-insert accumulated messages
+                if pending_messages:
+                    message_ids = self.session_repo.insert_messages_bulk(
                         conversation=conversation,
-                        touches=pending_file_touches,
+                        events=pending_messages,
                     )
+                    messages_added = len(message_ids)
+
+                # Batch-insert accumulated file touches
+                if pending_file_touches:
+                    file_touched_ids = [
+                        record.id
+                        for record in self.session_repo.insert_file_touches_batch(
+                            conversation=conversation,
+                            touches=pending_file_touches,
+                        )
+                    ]
+                    files_touched_count = len(file_touched_ids)
 
                 # Update counts
                 if new_events:
@@ -544,34 +969,73 @@ class IngestionService:
                         event_timestamp=last_event.emitted_at,
                     )
 
-                # Link orphaned sessions only when needed:
+                # Link orphaned sessions only when needed, touching only the
+                # orphans keyed on the relevant parent:
                 # - A new conversation was created (potential parent for existing orphans)
                 # - Batch contains a session_start with parent_session_id (potential orphan)
                 has_parent_ref = any(
                     e.type == "session_start" and e.data.get("parent_session_id")
                     for e in new_events
                 )
-                if created or has_parent_ref:
-                    linked = self.session_repo.link_orphaned_collectors(workspace_id)
-                    if linked > 0:
-                        logger.info(f"Linked {linked} orphaned collector sessions")
+                linked = 0
+                if created and conversation.collector_session_id:
+                    linked += self.session_repo.link_orphaned_collectors(
+                        workspace_id,
+                        parent_session_id=conversation.collector_session_id,
+                    )
+                if has_parent_ref and conversation.pending_parent_session_id:
+                    linked += self.session_repo.link_orphaned_collectors(
+                        workspace_id,
+                        parent_session_id=conversation.pending_parent_session_id,
+                    )
+                if linked > 0:
+                    logger.info(f"Linked {linked} orphaned collector sessions")
+
+                # Maintain analytics rollups by adding just this batch's rows
+                # (session_end also writes its own files_touched, so recompute
+                # once then); linked children may have inherited this
+                # conversation's project
+                if new_events:
+                    rollup_repo = RollupRepository(self.session)
+                    if session_completed:
+                        rollup_repo.refresh(conversation)
+                    else:
+                        rollup_repo.add(conversation, message_ids, file_touched_ids)
+                    if created and linked > 0:
+                        rollup_repo.refresh_many(
+                            self.session.query(Conversation)
+                            .filter(
+                                Conversation.parent_conversation_id == conversation.id
+                            )
+                            .all()
+                        )
+
+                # Invalidate cached analytics for the affected project and
+                # workspace once the ingested data commits
+                if new_events:
+                    ANALYTICS_CACHE.invalidate_after_commit(
+                        self.session, workspace_id, conversation.project_id
+                    )
 
                 # Calculate processing time
                 processing_time_ms = int((time.time() - start_time) * 1000)
 
                 # Update ingestion job
-                ingestion_job.status = "success"
-                ingestion_job.messages_added = messages_added
-                ingestion_job.processing_time_ms = processing_time_ms
-                ingestion_job.completed_at = _utc_now()
-                ingestion_job.metrics = {
-                    "events_received": len(sorted_events),
-                    "events_accepted": len(new_events),
-                    "events_deduplicated": len(sorted_events) - len(new_events),
-                    "files_touched": files_touched_count,
-                    "session_created": created,
-                    "total_ms": processing_time_ms,
-                }
+                if tracking_job is not None:
+                    ingestion_job.messages_added += messages_added
+                else:
+                    ingestion_job.status = "success"
+                    ingestion_job.messages_added = messages_added
+                    ingestion_job.processing_time_ms = processing_time_ms
+                    ingestion_job.completed_at = _utc_now()
+                    ingestion_job.metrics = {
+                        "events_received": len(sorted_events),
+                        "events_accepted": len(new_events),
+                        "events_deduplicated": len(sorted_events) - len(new_events),
+                        "files_touched": files_touched_count,
+                        "session_created": created,
+                        "total_ms": processing_time_ms,
+                    }
 
                 # Queue tagging if enabled
                 if enable_tagging and session_completed and settings.llm_configured:
@@ -630,181 +1094,12 @@ class IngestionService:
             processing_time_ms=processing_time_ms,
         )
 
-    def _parsed_to_events(self, parsed: "ParsedConversation") -> list[CollectorEvent]:
-        """
-        Convert a ParsedConversation to a list of events.
-
-        Same logic as CollectorClient._message_to_events() but returns internal
-        CollectorEvent objects instead of dicts for HTTP transport.
-        """
-        events: list[CollectorEvent] = []
-
-        # Session start event
-        session_start_data: dict[str, Any] = {
-            "agent_type": parsed.agent_type or "unknown",
-            "agent_version": parsed.agent_version or "unknown",
-            "working_directory": parsed.working_directory,
-            "git_branch": parsed.git_branch,
-        }
-        if parsed.parent_session_id:
-            session_start_data["parent_session_id"] = parsed.parent_session_id
-        if parsed.slug:
-            session_start_data["slug"] = parsed.slug
-        if parsed.summaries:
-            session_start_data["summaries"] = _serialize_for_json(parsed.summaries)
-        if parsed.compaction_events:
-            session_start_data["compaction_events"] = _serialize_for_json(
-                parsed.compaction_events
-            )
-        if parsed.metadata:
-            for key, value in parsed.metadata.items():
-                if key not in session_start_data:
-                    session_start_data[key] = _serialize_for_json(value)
-
-        start_time = parsed.start_time or _utc_now()
-        events.append(
-            self._create_event(
-                event_type="session_start",
-                emitted_at=start_time,
-                data=session_start_data,
-            )
-        )
-
-        # Message events
-        for msg in parsed.messages:
-            events.extend(self._message_to_events(msg))
-
-        # Session end event
-        if parsed.end_time:
-            session_end_data: dict[str, Any] = {
-                "outcome": "unknown",
-                "total_messages": len(parsed.messages),
-            }
-            if parsed.plans:
-                session_end_data["plans"] = [
-                    plan.to_dict() if hasattr(plan, "to_dict") else plan
-                    for plan in parsed.plans
-                ]
-            if parsed.files_touched:
-                session_end_data["files_touched"] = parsed.files_touched
-
-            events.append(
-                self._create_event(
-                    event_type="session_end",
-                    emitted_at=parsed.end_time,
-                    data=session_end_data,
-                )
-            )
-
-        return events
-
-    def _message_to_events(self, msg: "ParsedMessage") -> list[CollectorEvent]:
-        """Convert a ParsedMessage to events."""
-        events: list[CollectorEvent] = []
-
-        # Map role to author_role
-        role_mapping = {
-            "user": "human",
-            "human": "human",
-            "assistant": "assistant",
-            "system": "system",
-            "tool": "tool",
-        }
-        author_role = msg.author_role or role_mapping.get(msg.role or "", "assistant")
-        event_time = msg.emitted_at or msg.timestamp or _utc_now()
-
-        # Determine message_type
-        message_type = msg.message_type
-        if not message_type:
-            if msg.role in ("user", "human"):
-                message_type = "prompt"
-            elif msg.role == "tool":
-                message_type = "tool_result"
-            else:
-                message_type = "response"
-
-        # Tool call events
-        if msg.tool_calls:
-            for idx, tool_call in enumerate(msg.tool_calls):
-                tool_event_time = tool_call.timestamp or event_time
-                tool_use_id = f"tool_{tool_event_time.isoformat()}_{idx}"
-
-                events.append(
-                    self._create_event(
-                        event_type="tool_call",
-                        emitted_at=tool_event_time,
-                        data={
-                            "tool_name": tool_call.tool_name,
-                            "tool_use_id": tool_use_id,
-                            "parameters": tool_call.parameters or {},
-                        },
-                    )
-                )
-
-                if tool_call.result is not None:
-                    result_value = tool_call.result
-                    if not isinstance(result_value, str):
-                        result_value = json.dumps(result_value)
-                    events.append(
-                        self._create_event(
-                            event_type="tool_result",
-                            emitted_at=tool_event_time,
-                            data={
-                                "tool_use_id": tool_use_id,
-                                "success": tool_call.success,
-                                "result": result_value,
-                            },
-                        )
-                    )
-
-        # Main message event
-        data: dict[str, Any] = {
-            "author_role": author_role,
-            "message_type": message_type,
-            "content": msg.content or "",
-        }
-        if msg.model:
-            data["model"] = msg.model
-        if msg.token_usage:
-            data["token_usage"] = msg.token_usage
-        if msg.thinking_content:
-            data["thinking_content"] = msg.thinking_content
-        if msg.stop_reason:
-            data["stop_reason"] = msg.stop_reason
-        if msg.thinking_metadata:
-            data["thinking_metadata"] = msg.thinking_metadata
-
-        events.append(
-            self._create_event(
-                event_type="message",
-                emitted_at=event_time,
-                data=data,
-            )
-        )
-
-        return events
-
-    def _create_event(
-        self,
-        event_type: str,
-        emitted_at: datetime,
-        data: dict[str, Any],
-    ) -> CollectorEvent:
-        """Create an event with computed hash."""
-        observed_at = _utc_now()
-        return CollectorEvent(
-            type=event_type,
-            emitted_at=emitted_at,
-            observed_at=observed_at,
-            event_hash=_compute_event_hash(event_type, emitted_at, data),
-            data=data,
-        )
-
     def _ensure_raw_log(
         self,
         conversation_id: UUID,
         file_path: Path,
         agent_type: str,
+        parser_name: Optional[str] = None,
     ) -> None:
         """
         Create or update RawLog entry for incremental parsing state.
@@ -813,11 +1108,11 @@ class IngestionService:
         Uses a savepoint to isolate failures (e.g., duplicate file_hash) from
         the main transaction.
         """
-        from catsyphon.utils.hashing import calculate_partial_hash
+        from catsyphon.utils.hashing import advance_partial_hash
 
         try:
             file_size = file_path.stat().st_size
-            partial_hash = calculate_partial_hash(file_path, file_size)
+            partial_hash, hash_state = advance_partial_hash(file_path, file_size)
 
             # Use savepoint to isolate RawLog operations from main transaction
             # This prevents IntegrityError from corrupting the session state
@@ -831,6 +1126,8 @@ class IngestionService:
                         last_processed_line=0,  # Not tracked in this mode
                         file_size_bytes=file_size,
                         partial_hash=partial_hash,
+                        partial_hash_state=hash_state,
+                        parser_name=parser_name,
                     )
                 else:
                     self.raw_log_repo.create_from_file(
@@ -848,6 +1145,8 @@ class IngestionService:
                             last_processed_line=0,
                             file_size_bytes=file_size,
                             partial_hash=partial_hash,
+                            partial_hash_state=hash_state,
+                            parser_name=parser_name,
                         )
                 savepoint.commit()
             except Exception:
@@ -0,0 +1,264 @@
+"""
+Streaming upload ingestion.
+
+The streaming upload endpoint writes the request body into an ``UploadSpool``
+as it arrives, while a background worker runs
+``IngestionService.ingest_stream`` against the same spool. Parsed chunks are
+ingested and committed as soon as they are complete, so neither the request
+body nor the full set of parsed events is ever held in memory.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import tempfile
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator, Optional
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from catsyphon.config import settings
+from catsyphon.models.db import IngestionJob
+from catsyphon.services.ingestion_service import IngestionOutcome, IngestionService
+
+logger = logging.getLogger(__name__)
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+class UploadSpool:
+    """
+    Append-only spool file shared by an upload request and its ingest worker.
+
+    Only complete JSONL lines are written to disk; a trailing partial line is
+    buffered until its newline (or ``close()``) arrives. Readers hold
+    ``reading()`` while parsing so they never observe a write in progress,
+    and block in ``wait_for()`` until more data lands or the upload ends.
+    """
+
+    def __init__(self, filename: str):
+        self._dir = Path(tempfile.mkdtemp(prefix="catsyphon-upload-"))
+        # Keep the client's filename so parsers can fall back to it for the
+        # session ID, as they do for files ingested from disk
+        self.path = self._dir / (Path(filename).name or "upload.jsonl")
+        self._file = self.path.open("wb")
+        self._cond = threading.Condition()
+        self._tail = bytearray()
+        self._size = 0
+        self._closed = False
+        self._aborted = False
+
+    @property
+    def size(self) -> int:
+        """Bytes of complete lines visible to readers."""
+        return self._size
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    @property
+    def aborted(self) -> bool:
+        return self._aborted
+
+    def write(self, data: bytes) -> bool:
+        """Append request body bytes. Returns False once the spool is closed."""
+        with self._cond:
+            if self._closed:
+                return False
+            self._tail += data
+            cut = self._tail.rfind(b"\n") + 1
+            if cut:
+                self._file.write(self._tail[:cut])
+                self._file.flush()
+                del self._tail[:cut]
+                self._size += cut
+                self._cond.notify_all()
+            return True
+
+    def close(self) -> None:
+        """Mark the upload complete, flushing any unterminated last line."""
+        with self._cond:
+            if self._closed:
+                return
+            if self._tail:
+                self._file.write(self._tail)
+                self._size += len(self._tail)
+                self._tail.clear()
+            self._file.close()
+            self._closed = True
+            self._cond.notify_all()
+
+    def abort(self) -> None:
+        """Stop the upload early (client disconnect or failed ingestion)."""
+        with self._cond:
+            if not self._closed:
+                self._file.close()
+                self._closed = True
+            self._aborted = True
+            self._cond.notify_all()
+
+    def wait_for(self, size: int) -> None:
+        """Block until at least ``size`` bytes are visible or the spool closes."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._size >= size or self._closed)
+
+    def wait_closed(self) -> None:
+        """Block until the whole upload has been received."""
+        with self._cond:
+            self._cond.wait_for(lambda: self._closed)
+
+    @contextmanager
+    def reading(self) -> Iterator[None]:
+        """Hold off writers while a parser reads the spool file."""
+        with self._cond:
+            yield
+
+    def discard(self) -> None:
+        """Delete the spool file."""
+        self.abort()
+        shutil.rmtree(self._dir, ignore_errors=True)
+
+
+@dataclass
+class StreamingUpload:
+    """Handle for a streaming upload in progress."""
+
+    job_id: UUID
+    spool: UploadSpool
+    future: Optional[Future[IngestionOutcome]] = None
+    # Set once the first chunk is committed (or ingestion has ended), i.e.
+    # once the job is attached to a conversation and visible to pollers
+    started: threading.Event = field(default_factory=threading.Event)
+    conversation_id: Optional[UUID] = None
+    messages_added: int = 0
+
+    @property
+    def done(self) -> bool:
+        return self.future is not None and self.future.done()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, settings.upload_stream_workers),
+                thread_name_prefix="catsyphon-upload",
+            )
+        return _executor
+
+
+def shutdown_streaming_uploads() -> None:
+    """Stop accepting streaming ingests (called on application shutdown)."""
+    global _executor
+    with _executor_lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
+
+
+def start_streaming_upload(
+    session: Session,
+    workspace_id: UUID,
+    filename: str,
+    enable_tagging: bool = True,
+    session_factory: Optional[Callable[[], Session]] = None,
+) -> StreamingUpload:
+    """
+    Create the tracking job and spool for an upload and start ingesting it.
+
+    The job is committed on ``session`` so its ID can be handed to the client
+    immediately. Ingestion runs on the streaming-upload worker pool with its
+    own session from ``session_factory`` (default: bound like ``session``).
+
+    Args:
+        session: Request database session
+        workspace_id: Workspace to ingest into
+        filename: Client filename of the upload
+        enable_tagging: Whether to queue for LLM tagging at session end
+        session_factory: Creates the worker's session
+
+    Returns:
+        StreamingUpload whose spool the caller must write to and close
+    """
+    job = IngestionJob(
+        source_type="upload",
+        file_path=filename,
+        status="processing",
+        started_at=datetime.now(timezone.utc),
+        messages_added=0,
+        metrics={},
+    )
+    session.add(job)
+    session.commit()
+
+    if session_factory is None:
+        bind = session.get_bind()
+        session_factory = lambda: Session(bind=bind)  # noqa: E731
+
+    upload = StreamingUpload(job_id=job.id, spool=UploadSpool(filename))
+    upload.future = _get_executor().submit(
+        _run_streaming_upload, upload, workspace_id, session_factory, enable_tagging
+    )
+    upload.future.add_done_callback(lambda _: _release(upload))
+    return upload
+
+
+def _release(upload: StreamingUpload) -> None:
+    """Wake the request and drop the spool once ingestion has ended."""
+    upload.started.set()
+    upload.spool.discard()
+
+
+def _run_streaming_upload(
+    upload: StreamingUpload,
+    workspace_id: UUID,
+    session_factory: Callable[[], Session],
+    enable_tagging: bool,
+) -> IngestionOutcome:
+    """Worker body: ingest the spool chunk by chunk, committing as it goes."""
+    session = session_factory()
+    try:
+        job = session.get(IngestionJob, upload.job_id)
+        if job is None:
+            raise ValueError(f"Ingestion job {upload.job_id} not found")
+
+        def on_chunk(outcome: IngestionOutcome) -> None:
+            session.commit()
+            upload.conversation_id = outcome.conversation_id or upload.conversation_id
+            upload.messages_added += outcome.messages_added
+            upload.started.set()
+
+        try:
+            outcome = IngestionService(session).ingest_stream(
+                spool=upload.spool,
+                workspace_id=workspace_id,
+                tracking_job=job,
+                source_type="upload",
+                enable_tagging=enable_tagging,
+                on_chunk=on_chunk,
+            )
+        except Exception as e:
+            logger.error(f"Streaming upload {upload.job_id} failed: {e}", exc_info=True)
+            session.rollback()
+            job.status = "failed"
+            job.error_message = str(e)
+            job.completed_at = datetime.now(timezone.utc)
+            outcome = IngestionOutcome(status="error", error_message=str(e))
+
+        session.commit()
+        if not outcome.success:
+            # Tell the request to stop reading a body nobody will ingest
+            upload.spool.abort()
+        return outcome
+    finally:
+        session.close()
@@ -1,34 +1,98 @@
-"""File-based cache for conversation tags."""
+"""SQLite-backed cache for conversation tags."""
 
 import hashlib
 import json
 import logging
-from datetime import datetime, timedelta, timezone
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Any, Iterable, Iterator, Optional, Sequence
 
 from catsyphon.models.parsed import ConversationTags, ParsedConversation
 
 logger = logging.getLogger(__name__)
 
+_DB_FILENAME = "tags.sqlite3"
+
+# Evict least recently used entries after this many writes, so the size bound
+# is enforced without a COUNT(*) on every set()
+_EVICT_EVERY = 256
+
+# SQLite's default limit on bound parameters is 999
+_LOOKUP_CHUNK = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS tag_cache (
+    key TEXT PRIMARY KEY,
+    cached_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    tags TEXT NOT NULL,
+    agent_type TEXT,
+    message_count INTEGER
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_tag_cache_cached_at ON tag_cache (cached_at);
+CREATE INDEX IF NOT EXISTS ix_tag_cache_accessed_at ON tag_cache (accessed_at);
+"""
+
 
 class TagCache:
-    """File-based cache for conversation tags.
+    """SQLite-backed cache for conversation tags.
+
+    Caches tags using SHA-256 hash of conversation content as key, in a
+    single database file under ``cache_dir``. Entries older than the TTL are
+    expired via an index on their write time, and the cache is bounded to
+    ``max_entries`` by evicting the least recently read entries.
 
-    Caches tags using SHA-256 hash of conversation content as key.
-    Automatically expires entries older than TTL.
+    Legacy one-file-per-entry JSON caches found in ``cache_dir`` are
+    imported once and removed.
     """
 
-    def __init__(self, cache_dir: Path, ttl_days: int = 30):
+    def __init__(self, cache_dir: Path, ttl_days: int = 30, max_entries: int = 100_000):
         """Initialize the tag cache.
 
         Args:
-            cache_dir: Directory to store cache files
+            cache_dir: Directory holding the cache database
             ttl_days: Time-to-live in days (default: 30)
+            max_entries: Maximum entries kept (default: 100,000)
         """
         self.cache_dir = cache_dir
         self.ttl_days = ttl_days
+        self.max_entries = max_entries
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.cache_dir / _DB_FILENAME
+
+        # One connection shared by worker threads, serialized by a lock
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._writes_since_evict = 0
+
+        self._migrate_json_files()
+        self._evict()
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Hold the lock and run statements in one transaction."""
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                yield self._conn
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def close(self) -> None:
+        """Close the cache database."""
+        with self._lock:
+            self._conn.close()
 
     def get(self, parsed: ParsedConversation) -> Optional[ConversationTags]:
         """Get cached tags for a conversation.
@@ -39,47 +103,59 @@ class TagCache:
         Returns:
             Cached ConversationTags if found and not expired, None otherwise
         """
-        cache_key = self._compute_cache_key(parsed)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        return self.get_many([parsed])[0]
 
-        if not cache_file.exists():
-            logger.debug(f"Cache miss: {cache_key}")
-            return None
+    def get_many(
+        self, conversations: Sequence[ParsedConversation]
+    ) -> list[Optional[ConversationTags]]:
+        """Get cached tags for several conversations with batched lookups.
 
-        try:
-            with open(cache_file, "r", encoding="utf-8") as f:
-                data = json.load(f)
-
-            # Check expiration
-            cached_at = datetime.fromisoformat(data["cached_at"])
-            age = datetime.now(timezone.utc) - cached_at
-            if age > timedelta(days=self.ttl_days):
-                logger.debug(f"Cache expired: {cache_key} (age: {age.days} days)")
-                cache_file.unlink()  # Delete expired entry
-                return None
-
-            # Reconstruct ConversationTags from cached data
-            tags_dict = data["tags"]
-            tags = ConversationTags(
-                sentiment=tags_dict.get("sentiment"),
-                sentiment_score=tags_dict.get("sentiment_score"),
-                intent=tags_dict.get("intent"),
-                outcome=tags_dict.get("outcome"),
-                iterations=tags_dict.get("iterations", 1),
-                entities=tags_dict.get("entities", {}),
-                features=tags_dict.get("features", []),
-                problems=tags_dict.get("problems", []),
-                patterns=tags_dict.get("patterns", []),
-                tools_used=tags_dict.get("tools_used", []),
-                has_errors=tags_dict.get("has_errors", False),
-            )
+        Args:
+            conversations: Parsed conversations
 
-            logger.debug(f"Cache hit: {cache_key}")
-            return tags
+        Returns:
+            Cached tags (or None) for each conversation, in order
+        """
+        keys = [self._compute_cache_key(parsed) for parsed in conversations]
+        now = time.time()
+        cutoff = self._expiry_cutoff(now)
+        found: dict[str, Optional[ConversationTags]] = {}
 
+        try:
+            with self._transaction() as conn:
+                for chunk in _chunks(list(dict.fromkeys(keys)), _LOOKUP_CHUNK):
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = conn.execute(
+                        f"SELECT key, cached_at, tags FROM tag_cache "
+                        f"WHERE key IN ({placeholders})",
+                        chunk,
+                    ).fetchall()
+
+                    hits, expired = [], []
+                    for key, cached_at, tags_json in rows:
+                        if cached_at < cutoff:
+                            expired.append(key)
+                            continue
+                        found[key] = _tags_from_dict(json.loads(tags_json))
+                        hits.append(key)
+
+                    # Delete expired entries, refresh recency of hits
+                    if expired:
+                        conn.executemany(
+                            "DELETE FROM tag_cache WHERE key = ?",
+                            [(key,) for key in expired],
+                        )
+                    if hits:
+                        conn.executemany(
+                            "UPDATE tag_cache SET accessed_at = ? WHERE key = ?",
+                            [(now, key) for key in hits],
+                        )
         except Exception as e:
-            logger.warning(f"Failed to read cache for {cache_key}: {e}")
-            return None
+            logger.warning(f"Failed to read tag cache: {e}")
+            return [None] * len(keys)
+
+        logger.debug(f"Tag cache lookup: {len(found)}/{len(keys)} hits")
+        return [found.get(key) for key in keys]
 
     def set(self, parsed: ParsedConversation, tags: ConversationTags) -> None:
         """Store tags in cache.
@@ -89,20 +165,28 @@ class TagCache:
             tags: The tags to cache
         """
         cache_key = self._compute_cache_key(parsed)
-        cache_file = self.cache_dir / f"{cache_key}.json"
+        now = time.time()
 
         try:
-            data = {
-                "cached_at": datetime.now(timezone.utc).isoformat(),
-                "tags": tags.to_dict(),
-                "metadata": {
-                    "agent_type": parsed.agent_type,
-                    "message_count": len(parsed.messages),
-                },
-            }
-
-            with open(cache_file, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO tag_cache "
+                    "(key, cached_at, accessed_at, tags, agent_type, message_count) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (
+                        cache_key,
+                        now,
+                        now,
+                        json.dumps(tags.to_dict()),
+                        parsed.agent_type,
+                        len(parsed.messages),
+                    ),
+                )
+                self._writes_since_evict += 1
+                evict = self._writes_since_evict >= _EVICT_EVERY
+
+            if evict:
+                self._evict()
 
             logger.debug(f"Cached tags: {cache_key}")
 
@@ -136,36 +220,44 @@ class TagCache:
         hash_obj = hashlib.sha256(content_string.encode("utf-8"))
         return hash_obj.hexdigest()
 
-    def clear_expired(self) -> int:
-        """Remove all expired cache entries.
+    def _expiry_cutoff(self, now: float) -> float:
+        return now - self.ttl_days * 86400
+
+    def clear(self) -> int:
+        """Remove all cache entries.
 
         Returns:
             Number of entries removed
         """
-        removed = 0
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                try:
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-
-                    cached_at = datetime.fromisoformat(data["cached_at"])
-                    age = datetime.now(timezone.utc) - cached_at
-
-                    if age > timedelta(days=self.ttl_days):
-                        cache_file.unlink()
-                        removed += 1
-                        logger.debug(f"Removed expired cache: {cache_file.name}")
+            with self._lock:
+                removed = self._conn.execute("DELETE FROM tag_cache").rowcount
+                self._writes_since_evict = 0
+        except Exception as e:
+            logger.error(f"Failed to clear tag cache: {e}")
+            return 0
 
-                except Exception as e:
-                    logger.warning(f"Failed to check cache file {cache_file}: {e}")
+        logger.info(f"Cleared {removed} cache entries")
+        return removed
 
-            if removed > 0:
-                logger.info(f"Cleared {removed} expired cache entries")
+    def clear_expired(self) -> int:
+        """Remove all expired cache entries.
 
+        Returns:
+            Number of entries removed
+        """
+        try:
+            with self._lock:
+                removed = self._conn.execute(
+                    "DELETE FROM tag_cache WHERE cached_at < ?",
+                    (self._expiry_cutoff(time.time()),),
+                ).rowcount
         except Exception as e:
             logger.error(f"Failed to clear expired cache: {e}")
+            return 0
 
+        if removed > 0:
+            logger.info(f"Cleared {removed} expired cache entries")
         return removed
 
     def stats(self) -> dict[str, int]:
@@ -174,29 +266,99 @@ class TagCache:
         Returns:
             Dictionary with cache stats (total, expired, valid)
         """
-        total = 0
-        expired = 0
-        valid = 0
-
         try:
-            for cache_file in self.cache_dir.glob("*.json"):
-                total += 1
-                try:
-                    with open(cache_file, "r", encoding="utf-8") as f:
-                        data = json.load(f)
+            with self._lock:
+                total, expired = self._conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(cached_at < ?), 0) FROM tag_cache",
+                    (self._expiry_cutoff(time.time()),),
+                ).fetchone()
+        except Exception as e:
+            logger.error(f"Failed to compute cache stats: {e}")
+            return {"total": 0, "valid": 0, "expired": 0}
 
-                    cached_at = datetime.fromisoformat(data["cached_at"])
-                    age = datetime.now(timezone.utc) - cached_at
+        return {"total": total, "valid": total - expired, "expired": expired}
 
-                    if age > timedelta(days=self.ttl_days):
-                        expired += 1
-                    else:
-                        valid += 1
+    def _evict(self) -> None:
+        """Drop least recently read entries beyond max_entries."""
+        try:
+            with self._lock:
+                self._writes_since_evict = 0
+                removed = self._conn.execute(
+                    "DELETE FROM tag_cache WHERE key IN ("
+                    "SELECT key FROM tag_cache ORDER BY accessed_at DESC "
+                    "LIMIT -1 OFFSET ?)",
+                    (self.max_entries,),
+                ).rowcount
+        except Exception as e:
+            logger.warning(f"Failed to evict tag cache entries: {e}")
+            return
 
-                except Exception:
-                    expired += 1  # Treat corrupted files as expired
+        if removed > 0:
+            logger.info(f"Evicted {removed} least recently used cache entries")
 
-        except Exception as e:
-            logger.error(f"Failed to compute cache stats: {e}")
+    def _migrate_json_files(self) -> None:
+        """Import a legacy one-file-per-entry cache, then delete its files.
+
+        Entries keep their original write time, so expired ones stay expired;
+        unreadable files are dropped.
+        """
+        files = list(self.cache_dir.glob("*.json"))
+        if not files:
+            return
+
+        rows = []
+        for cache_file in files:
+            try:
+                with open(cache_file, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                cached_at = datetime.fromisoformat(data["cached_at"]).timestamp()
+                metadata = data.get("metadata") or {}
+                rows.append(
+                    (
+                        cache_file.stem,
+                        cached_at,
+                        cached_at,
+                        json.dumps(data["tags"]),
+                        metadata.get("agent_type"),
+                        metadata.get("message_count"),
+                    )
+                )
+            except Exception as e:
+                logger.warning(f"Skipping unreadable cache file {cache_file}: {e}")
+
+        with self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO tag_cache "
+                "(key, cached_at, accessed_at, tags, agent_type, message_count) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                rows,
+            )
 
-        return {"total": total, "valid": valid, "expired": expired}
+        for cache_file in files:
+            cache_file.unlink(missing_ok=True)
+
+        logger.info(
+            f"Migrated {len(rows)} of {len(files)} tag cache files into {self.db_path}"
+        )
+
+
+def _chunks(items: list[str], size: int) -> Iterable[list[str]]:
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _tags_from_dict(tags_dict: dict[str, Any]) -> ConversationTags:
+    """Reconstruct ConversationTags from cached data."""
+    return ConversationTags(
+        sentiment=tags_dict.get("sentiment"),
+        sentiment_score=tags_dict.get("sentiment_score"),
+        intent=tags_dict.get("intent"),
+        outcome=tags_dict.get("outcome"),
+        iterations=tags_dict.get("iterations", 1),
+        entities=tags_dict.get("entities", {}),
+        features=tags_dict.get("features", []),
+        problems=tags_dict.get("problems", []),
+        patterns=tags_dict.get("patterns", []),
+        tools_used=tags_dict.get("tools_used", []),
+        has_errors=tags_dict.get("has_errors", False),
+    )
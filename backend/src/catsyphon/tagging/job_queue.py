@@ -103,28 +103,46 @@ class TaggingJobQueue:
         Returns:
             TaggingJob if one is available, None otherwise
         """
-        # Find and lock the next pending job
-        job = (
+        jobs = self.claim_batch(1)
+        return jobs[0] if jobs else None
+
+    def claim_batch(self, limit: int) -> list[TaggingJob]:
+        """
+        Atomically claim up to ``limit`` pending jobs in one query.
+
+        Rows locked by other workers are skipped, so concurrent workers
+        claim disjoint batches.
+
+        Args:
+            limit: Maximum number of jobs to claim
+
+        Returns:
+            Claimed jobs in priority order (empty if the queue is empty)
+        """
+        # Find and lock the next pending jobs
+        jobs = (
             self.session.query(TaggingJob)
             .filter(TaggingJob.status == TaggingJobStatus.PENDING.value)
             .order_by(TaggingJob.priority, TaggingJob.created_at)
             .with_for_update(skip_locked=True)
-            .first()
+            .limit(limit)
+            .all()
         )
 
-        if not job:
-            return None
-
         # Mark as processing
-        job.status = TaggingJobStatus.PROCESSING.value
-        job.started_at = datetime.now(timezone.utc)
-        job.attempts += 1
-        self.session.flush()
+        now = datetime.now(timezone.utc)
+        for job in jobs:
+            job.status = TaggingJobStatus.PROCESSING.value
+            job.started_at = now
+            job.attempts += 1
+            logger.debug(
+                f"Claimed tagging job {job.id} "
+                f"(attempt {job.attempts}/{job.max_attempts})"
+            )
+        if jobs:
+            self.session.flush()
 
-        logger.debug(
-            f"Claimed tagging job {job.id} (attempt {job.attempts}/{job.max_attempts})"
-        )
-        return job
+        return jobs
 
     def complete(
         self,
@@ -5,7 +5,7 @@ import logging
 import time
 from typing import Any, Optional
 
-from catsyphon.llm import create_llm_client_for
+from catsyphon.llm import create_llm_client_for, get_rate_limiter
 from catsyphon.models.parsed import ConversationTags, ParsedConversation
 from catsyphon.tagging.llm_logger import llm_logger
 
@@ -121,6 +121,9 @@ class LLMTagger:
             temperature: Temperature for generation
         """
         self.client = create_llm_client_for(provider=provider, api_key=api_key)
+        # Shared across taggers and threads so concurrent workers stay
+        # within the provider's request rate
+        self.rate_limiter = get_rate_limiter(provider, model)
         self.provider = provider
         self.model = model
         self.max_tokens = max_tokens
@@ -154,6 +157,7 @@ class LLMTagger:
             )
 
             # Call provider API with timing
+            self.rate_limiter.acquire()
             start_time = time.time()
             response = self.client.generate_json(
                 model=self.model,
@@ -248,6 +252,7 @@ class LLMTagger:
             prompt = self._build_canonical_prompt(narrative, metadata)
 
             # Call provider API with timing
+            self.rate_limiter.acquire()
             start_time = time.time()
             response = self.client.generate_json(
                 model=self.model,
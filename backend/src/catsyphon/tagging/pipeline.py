@@ -1,6 +1,7 @@
 """Tagging pipeline that combines rule-based and LLM taggers with caching."""
 
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
@@ -17,6 +18,19 @@ from .rule_tagger import RuleTagger
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class PreparedTagging:
+    """Database-derived inputs for the LLM step of canonical tagging.
+
+    Built while a session is open; holds no ORM objects, so the LLM call can
+    run after the session is released.
+    """
+
+    narrative: str
+    metadata: dict[str, Any]
+    rule_tags: ConversationTags
+
+
 class TaggingPipeline:
     """Pipeline that orchestrates tagging with caching and multiple taggers.
 
@@ -141,15 +155,25 @@ class TaggingPipeline:
             - tags_dict: Dictionary of tags suitable for database storage
             - llm_metrics_dict: LLM metrics (tokens, cost, duration, model)
         """
-        # Check cache first (using conversation ID as key)
-        # Note: We could enhance cache to use canonical hash, but for now
-        # we rely on the canonical repository's caching
-        if self.enable_cache and hasattr(conversation, "id"):
-            # Try to get from tag cache using conversation ID
-            # This requires adapting the cache to support ID-based lookup
-            # For now, we'll skip tag cache and rely on canonical cache
-            pass
+        prepared = self.prepare_canonical(conversation, session, children=children)
+        return self.tag_prepared(prepared)
+
+    def prepare_canonical(
+        self,
+        conversation: Any,
+        session: Session,
+        children: Optional[list[Any]] = None,
+    ) -> PreparedTagging:
+        """Load the canonical form and run the rule tagger (database step).
+
+        Args:
+            conversation: Database Conversation object (must have .id attribute)
+            session: SQLAlchemy session for canonical caching
+            children: Optional list of child conversations to include
 
+        Returns:
+            PreparedTagging to pass to tag_prepared()
+        """
         # Get or generate canonical representation
         canonical_repo = CanonicalRepository(session)
         canonicalizer = Canonicalizer(canonical_type=CanonicalType.TAGGING)
@@ -174,18 +198,27 @@ class TaggingPipeline:
             "has_errors": canonical.has_errors,
         }
 
-        # Run taggers with canonical data
-        rule_tags = self.rule_tagger.tag_from_canonical(canonical)
-        llm_tags, llm_metrics = self.llm_tagger.tag_from_canonical(
+        return PreparedTagging(
             narrative=canonical.narrative,
             metadata=metadata,
+            rule_tags=self.rule_tagger.tag_from_canonical(canonical),
         )
 
-        # Merge tags (rule-based takes precedence for deterministic fields)
-        merged_tags = self._merge_tags(rule_tags, llm_tags)
+    def tag_prepared(
+        self, prepared: PreparedTagging
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Run the LLM tagger on prepared inputs and merge (no database access).
 
-        # Note: Tag cache could be updated here if needed
-        # For now, canonical caching provides the primary benefit
+        Returns:
+            Tuple of (tags_dict, llm_metrics_dict), as tag_from_canonical()
+        """
+        llm_tags, llm_metrics = self.llm_tagger.tag_from_canonical(
+            narrative=prepared.narrative,
+            metadata=prepared.metadata,
+        )
+
+        # Merge tags (rule-based takes precedence for deterministic fields)
+        merged_tags = self._merge_tags(prepared.rule_tags, llm_tags)
 
         return merged_tags.to_dict(), llm_metrics
 
@@ -1,19 +1,26 @@
 """
 Background worker for processing tagging jobs.
 
-This worker polls the tagging job queue and processes conversations
-sequentially, preventing connection pool exhaustion during high-throughput
-ingestion.
+This worker polls the tagging job queue and processes conversations,
+one at a time by default or with several LLM calls in flight. Database work
+happens in short sessions before and after each LLM call, and the number of
+sessions open at once is capped, preventing connection pool exhaustion during
+high-throughput ingestion.
 """
 
 import logging
 import threading
 import time
+import uuid
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Iterator, Optional
 
 from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
 
+from catsyphon.analytics.cache import ANALYTICS_CACHE
 from catsyphon.config import settings
 from catsyphon.db.connection import db_session
 from catsyphon.db.repositories.analysis_run import AnalysisRunRepository
@@ -30,7 +37,10 @@ class TaggingWorker:
     Background worker that processes tagging jobs from the queue.
 
     Features:
-    - Single-threaded to prevent connection contention
+    - Optional concurrency: up to ``concurrency`` jobs with an LLM call in
+      flight, claimed in batches, rate limited per provider/model
+    - Bounded DB footprint: no session is held during LLM calls and at most
+      ``max_db_sessions`` are open at once
     - Graceful shutdown support
     - Automatic retry on transient failures
     - Stale job cleanup
@@ -41,6 +51,8 @@ class TaggingWorker:
         poll_interval: float = 2.0,
         stale_job_timeout_minutes: int = 30,
         purge_completed_days: int = 7,
+        concurrency: int = 1,
+        max_db_sessions: int = 2,
     ):
         """
         Initialize the tagging worker.
@@ -49,13 +61,21 @@ class TaggingWorker:
             poll_interval: Seconds between queue polls when idle
             stale_job_timeout_minutes: Reset jobs processing longer than this
             purge_completed_days: Delete completed jobs older than this
+            concurrency: Jobs processed at once (1 = sequential)
+            max_db_sessions: Max DB sessions open at once across all jobs
         """
         self.poll_interval = poll_interval
         self.stale_job_timeout_minutes = stale_job_timeout_minutes
         self.purge_completed_days = purge_completed_days
+        self.concurrency = max(1, concurrency)
+        self._db_slots = threading.BoundedSemaphore(
+            max(1, min(max_db_sessions, self.concurrency))
+        )
         self._running = False
         self._stop_event = threading.Event()
         self._pipeline: Optional[TaggingPipeline] = None
+        self._stats_lock = threading.Lock()
+        self._in_flight = 0
         self._jobs_processed = 0
         self._jobs_succeeded = 0
         self._jobs_failed = 0
@@ -80,18 +100,39 @@ class TaggingWorker:
 
         return self._pipeline
 
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Open a DB session, waiting for a free slot under max_db_sessions."""
+        with self._db_slots, db_session() as session:
+            yield session
+
     def run(self) -> None:
         """
         Main worker loop.
 
         Polls the job queue and processes jobs until stopped.
         """
-        logger.info("Tagging worker starting")
+        logger.info(f"Tagging worker starting (concurrency={self.concurrency})")
         self._running = True
 
         # Initial cleanup
         self._cleanup()
 
+        if self.concurrency > 1:
+            self._run_concurrent()
+        else:
+            self._run_sequential()
+
+        logger.info(
+            f"Tagging worker stopped. "
+            f"Processed: {self._jobs_processed}, "
+            f"Succeeded: {self._jobs_succeeded}, "
+            f"Failed: {self._jobs_failed}"
+        )
+        self._running = False
+
+    def _run_sequential(self) -> None:
+        """Process one job at a time until stopped."""
         while not self._stop_event.is_set():
             try:
                 job_processed = self._process_next_job()
@@ -108,13 +149,49 @@ class TaggingWorker:
                 # Brief pause before retrying
                 self._stop_event.wait(1.0)
 
-        logger.info(
-            f"Tagging worker stopped. "
-            f"Processed: {self._jobs_processed}, "
-            f"Succeeded: {self._jobs_succeeded}, "
-            f"Failed: {self._jobs_failed}"
-        )
-        self._running = False
+    def _run_concurrent(self) -> None:
+        """Keep up to ``concurrency`` jobs in flight until stopped.
+
+        Free slots are filled with one batch claim; the loop then waits for
+        any job to finish (or poll_interval) before claiming again. On stop,
+        jobs already claimed are finished before returning.
+        """
+        in_flight: set[Future[None]] = set()
+        with ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="tagging-job"
+        ) as pool:
+            while not self._stop_event.is_set():
+                try:
+                    free = self.concurrency - len(in_flight)
+                    if free > 0 and self._get_pipeline():
+                        for job_id, conversation_id in self._claim_jobs(free):
+                            in_flight.add(
+                                pool.submit(
+                                    self._process_job, job_id, conversation_id
+                                )
+                            )
+                except OperationalError as e:
+                    logger.warning(f"Tagging worker DB unavailable: {e}")
+                    self._stop_event.wait(5.0)
+                    continue
+                except Exception as e:
+                    logger.error(f"Error in tagging worker loop: {e}", exc_info=True)
+                    self._stop_event.wait(1.0)
+                    continue
+
+                if not in_flight:
+                    # No jobs available - wait before polling again
+                    self._stop_event.wait(self.poll_interval)
+                    continue
+
+                done, in_flight = wait(
+                    in_flight, timeout=self.poll_interval, return_when=FIRST_COMPLETED
+                )
+                for future in done:
+                    if future.exception():
+                        logger.error(
+                            f"Unhandled error in tagging job: {future.exception()}"
+                        )
 
     def stop(self) -> None:
         """Signal the worker to stop gracefully."""
@@ -133,112 +210,164 @@ class TaggingWorker:
         Returns:
             True if a job was processed, False if queue is empty
         """
-        pipeline = self._get_pipeline()
-        if not pipeline:
+        if not self._get_pipeline():
             return False
 
-        with db_session() as session:
-            queue = TaggingJobQueue(session)
-            job = queue.claim_next()
+        jobs = self._claim_jobs(1)
+        if not jobs:
+            return False
 
-            if not job:
-                return False
+        self._process_job(*jobs[0])
+        return True
 
-            job_id = job.id
-            conversation_id = job.conversation_id
-            self._jobs_processed += 1
-            logger.info(
-                f"Processing tagging job {job_id} for conversation {conversation_id}"
-            )
+    def _claim_jobs(self, limit: int) -> list[tuple[uuid.UUID, uuid.UUID]]:
+        """Claim up to ``limit`` jobs; returns (job_id, conversation_id) pairs."""
+        with self._session() as session:
+            jobs = TaggingJobQueue(session).claim_batch(limit)
+            claimed = [(job.id, job.conversation_id) for job in jobs]
 
             # Persist claim state before processing so failed attempts are counted.
             # Without this commit, a rollback in the exception path resets attempts
             # and can cause infinite retry loops.
             session.commit()
 
-            try:
-                # Load conversation
-                conv_repo = ConversationRepository(session)
-                # Use workspace_id from conversation's workspace
+        return claimed
+
+    def _process_job(self, job_id: uuid.UUID, conversation_id: uuid.UUID) -> None:
+        """
+        Tag one claimed conversation and complete its job.
+
+        Runs in three steps so no DB connection is held during the LLM call:
+        load the canonical form and rule tags, call the LLM, then store tags
+        and the analysis run.
+        """
+        pipeline = self._get_pipeline()
+        assert pipeline is not None
+        with self._stats_lock:
+            self._jobs_processed += 1
+            self._in_flight += 1
+        logger.info(
+            f"Processing tagging job {job_id} for conversation {conversation_id}"
+        )
+
+        try:
+            # Step 1: canonical form + rule tags
+            with self._session() as session:
                 conversation = (
-                    session.query(conv_repo.model)
+                    session.query(ConversationRepository(session).model)
                     .filter_by(id=conversation_id)
                     .first()
                 )
-
                 if not conversation:
                     raise ValueError(f"Conversation {conversation_id} not found")
 
-                # Run tagging pipeline
-                tag_started_at = time.time()
-                tags, metrics = pipeline.tag_from_canonical(
-                    conversation=conversation,
-                    session=session,
-                    children=[],
-                )
-                tag_completed_at = time.time()
-
-                run_repo = AnalysisRunRepository(session)
-                run = run_repo.create_run(
-                    capability="tagging",
-                    artifact_type="conversation_tagging",
-                    artifact_id=conversation.id,
-                    conversation_id=conversation.id,
-                    provider=str(metrics.get("llm_provider", settings.active_llm_provider)),
-                    model_id=str(metrics.get("llm_model", settings.active_llm_model)),
-                    prompt_version="tagging-v1",
-                    temperature=settings.llm_temperature,
-                    max_tokens=settings.active_llm_max_tokens,
-                    prompt_tokens=int(metrics.get("llm_prompt_tokens", 0)),
-                    completion_tokens=int(metrics.get("llm_completion_tokens", 0)),
-                    total_tokens=int(metrics.get("llm_total_tokens", 0)),
-                    cost_usd=float(metrics.get("llm_cost_usd", 0.0) or 0.0),
-                    latency_ms=float(metrics.get("llm_tagging_ms", 0.0) or 0.0),
-                    finish_reason=str(metrics.get("llm_finish_reason", "unknown")),
-                    status=(
-                        "failed" if metrics.get("llm_error") else "succeeded"
-                    ),
-                    error_message=(
-                        str(metrics.get("llm_error")) if metrics.get("llm_error") else None
-                    ),
-                    started_at=datetime.fromtimestamp(tag_started_at, tz=timezone.utc),
-                    completed_at=datetime.fromtimestamp(
-                        tag_completed_at, tz=timezone.utc
-                    ),
+                prepared = pipeline.prepare_canonical(
+                    conversation=conversation, session=session, children=[]
                 )
-
-                # Update conversation with tags
-                conversation.tags = tags
-                conversation.last_tagging_run_id = run.id
-                session.flush()
-
-                # Mark job complete
-                queue.complete(job_id, success=True)
+                # Keep a freshly generated canonical form even if tagging fails
                 session.commit()
 
+            # Step 2: LLM call (rate limited inside the tagger)
+            tag_started_at = time.time()
+            tags, metrics = pipeline.tag_prepared(prepared)
+            tag_completed_at = time.time()
+
+            # Step 3: store tags and analysis run
+            with self._session() as session:
+                self._store_tags(
+                    session,
+                    job_id,
+                    conversation_id,
+                    tags,
+                    metrics,
+                    tag_started_at,
+                    tag_completed_at,
+                )
+
+            with self._stats_lock:
                 self._jobs_succeeded += 1
                 self._last_job_time = time.time()
 
-                logger.info(
-                    f"Completed tagging job {job_id}: "
-                    f"intent={tags.get('intent')}, outcome={tags.get('outcome')}, "
-                    f"tokens={metrics.get('llm_total_tokens', 0)}"
-                )
+            logger.info(
+                f"Completed tagging job {job_id}: "
+                f"intent={tags.get('intent')}, outcome={tags.get('outcome')}, "
+                f"tokens={metrics.get('llm_total_tokens', 0)}"
+            )
 
-            except Exception as e:
-                session.rollback()
-                # Mark job failed (will be retried or marked permanently failed)
-                queue.complete(job_id, success=False, error=str(e))
+        except Exception as e:
+            # Mark job failed (will be retried or marked permanently failed)
+            with self._session() as session:
+                TaggingJobQueue(session).complete(job_id, success=False, error=str(e))
                 session.commit()
 
+            with self._stats_lock:
                 self._jobs_failed += 1
 
-                logger.warning(
-                    f"Failed tagging job {job_id} for conversation "
-                    f"{conversation_id}: {e}"
-                )
+            logger.warning(
+                f"Failed tagging job {job_id} for conversation "
+                f"{conversation_id}: {e}"
+            )
+        finally:
+            with self._stats_lock:
+                self._in_flight -= 1
 
-        return True
+    def _store_tags(
+        self,
+        session: Session,
+        job_id: uuid.UUID,
+        conversation_id: uuid.UUID,
+        tags: dict[str, Any],
+        metrics: dict[str, Any],
+        tag_started_at: float,
+        tag_completed_at: float,
+    ) -> None:
+        """Record the analysis run, update conversation tags, complete the job."""
+        conversation = (
+            session.query(ConversationRepository(session).model)
+            .filter_by(id=conversation_id)
+            .first()
+        )
+        if not conversation:
+            raise ValueError(f"Conversation {conversation_id} not found")
+
+        run_repo = AnalysisRunRepository(session)
+        run = run_repo.create_run(
+            capability="tagging",
+            artifact_type="conversation_tagging",
+            artifact_id=conversation.id,
+            conversation_id=conversation.id,
+            provider=str(metrics.get("llm_provider", settings.active_llm_provider)),
+            model_id=str(metrics.get("llm_model", settings.active_llm_model)),
+            prompt_version="tagging-v1",
+            temperature=settings.llm_temperature,
+            max_tokens=settings.active_llm_max_tokens,
+            prompt_tokens=int(metrics.get("llm_prompt_tokens", 0)),
+            completion_tokens=int(metrics.get("llm_completion_tokens", 0)),
+            total_tokens=int(metrics.get("llm_total_tokens", 0)),
+            cost_usd=float(metrics.get("llm_cost_usd", 0.0) or 0.0),
+            latency_ms=float(metrics.get("llm_tagging_ms", 0.0) or 0.0),
+            finish_reason=str(metrics.get("llm_finish_reason", "unknown")),
+            status=("failed" if metrics.get("llm_error") else "succeeded"),
+            error_message=(
+                str(metrics.get("llm_error")) if metrics.get("llm_error") else None
+            ),
+            started_at=datetime.fromtimestamp(tag_started_at, tz=timezone.utc),
+            completed_at=datetime.fromtimestamp(tag_completed_at, tz=timezone.utc),
+        )
+
+        # Update conversation with tags
+        conversation.tags = tags
+        conversation.last_tagging_run_id = run.id
+        session.flush()
+
+        # Tags feed sentiment/outcome analytics
+        ANALYTICS_CACHE.invalidate_after_commit(
+            session, conversation.workspace_id, conversation.project_id
+        )
+
+        # Mark job complete
+        TaggingJobQueue(session).complete(job_id, success=True)
+        session.commit()
 
     def _cleanup(self) -> None:
         """Perform periodic cleanup tasks."""
@@ -276,7 +405,10 @@ def start_worker() -> None:
         logger.warning("Tagging worker is already running")
         return
 
-    _worker = TaggingWorker()
+    _worker = TaggingWorker(
+        concurrency=settings.tagging_worker_concurrency,
+        max_db_sessions=settings.tagging_worker_db_sessions,
+    )
     _worker_thread = threading.Thread(
         target=_worker.run,
         daemon=True,
@@ -314,6 +446,8 @@ def get_worker_stats() -> dict[str, object]:
 
     return {
         "running": _worker.is_running,
+        "concurrency": _worker.concurrency,
+        "in_flight": _worker._in_flight,
         "jobs_processed": _worker._jobs_processed,
         "jobs_succeeded": _worker._jobs_succeeded,
         "jobs_failed": _worker._jobs_failed,
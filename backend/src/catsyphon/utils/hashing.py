@@ -1,7 +1,9 @@
 """File hashing utilities for deduplication."""
 
 import hashlib
+from dataclasses import asdict, dataclass
 from pathlib import Path
+from typing import Any, Optional
 
 
 def calculate_file_hash(file_path: Path | str, chunk_size: int = 8192) -> str:
@@ -97,3 +99,157 @@ def calculate_partial_hash(
             bytes_read += len(chunk)
 
     return sha256_hash.hexdigest()
+
+
+# Block size for chained partial hashing. Large enough that the per-block
+# digest overhead is negligible, small enough that re-reading the tail
+# block on resume is cheap.
+PARTIAL_HASH_BLOCK_SIZE = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class PartialHashState:
+    """
+    Resumable state for chained partial hashing.
+
+    The prefix ``[0, offset)`` is split into fixed-size blocks. Each complete
+    block is folded into a chain digest (``chain_i = sha256(chain_{i-1} +
+    block_i)``) and the partial hash is ``sha256(chain_k + tail)`` where
+    ``tail`` is the incomplete final block. Persisting the chain lets the
+    next computation start at the last block boundary instead of byte 0.
+
+    For prefixes shorter than one block the chain is empty, so the result is
+    identical to ``calculate_partial_hash``.
+
+    Attributes:
+        block_size: Block size the chain was built with
+        blocks: Number of complete blocks folded into ``chain``
+        chain: Hex digest of the chain after ``blocks`` blocks ("" if none)
+    """
+
+    block_size: int = PARTIAL_HASH_BLOCK_SIZE
+    blocks: int = 0
+    chain: str = ""
+
+    @property
+    def resume_offset(self) -> int:
+        """Byte offset where hashing resumes from this state."""
+        return self.blocks * self.block_size
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for storage (e.g., ``RawLog.partial_hash_state``)."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Optional[dict[str, Any]]) -> Optional["PartialHashState"]:
+        """Deserialize stored state, returning None when missing or malformed."""
+        if not data:
+            return None
+        try:
+            return cls(
+                block_size=int(data["block_size"]),
+                blocks=int(data["blocks"]),
+                chain=str(data["chain"]),
+            )
+        except (KeyError, TypeError, ValueError):
+            return None
+
+
+def advance_partial_hash(
+    file_path: Path | str,
+    up_to_offset: int,
+    state: Optional[PartialHashState] = None,
+    chunk_size: int = 65536,
+) -> tuple[str, PartialHashState]:
+    """
+    Calculate the chained partial hash up to ``up_to_offset``, resuming from state.
+
+    Only bytes from ``state.resume_offset`` to ``up_to_offset`` are read, so
+    hashing successive chunks of a growing file is linear in total I/O
+    rather than quadratic.
+
+    Args:
+        file_path: Path to the file to hash
+        up_to_offset: Read and hash only up to this byte offset
+        state: State from a previous call on the same file, or None to start
+            from byte 0. Ignored if it lies beyond ``up_to_offset`` or was
+            built with a different block size.
+        chunk_size: Size of reads (default: 64KB)
+
+    Returns:
+        Tuple of (hex partial hash, state to resume from next time)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the path is not a file or the offset is negative
+    """
+    file_path = Path(file_path)
+
+    if not file_path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if not file_path.is_file():
+        raise ValueError(f"Not a file: {file_path}")
+
+    if up_to_offset < 0:
+        raise ValueError(f"Offset must be non-negative, got {up_to_offset}")
+
+    if (
+        state is None
+        or state.block_size != PARTIAL_HASH_BLOCK_SIZE
+        or state.resume_offset > up_to_offset
+    ):
+        state = PartialHashState()
+
+    block_size = state.block_size
+    blocks = state.blocks
+    chain = bytes.fromhex(state.chain)
+
+    block_hash = hashlib.sha256(chain)
+    block_filled = 0
+    position = state.resume_offset
+
+    with open(file_path, "rb") as f:
+        f.seek(position)
+        while position < up_to_offset:
+            to_read = min(
+                chunk_size, up_to_offset - position, block_size - block_filled
+            )
+            chunk = f.read(to_read)
+            if not chunk:
+                break
+            block_hash.update(chunk)
+            block_filled += len(chunk)
+            position += len(chunk)
+
+            if block_filled == block_size:
+                chain = block_hash.digest()
+                blocks += 1
+                block_hash = hashlib.sha256(chain)
+                block_filled = 0
+
+    return block_hash.hexdigest(), PartialHashState(
+        block_size=block_size,
+        blocks=blocks,
+        chain=chain.hex(),
+    )
+
+
+def verify_partial_hash(file_path: Path | str, offset: int, expected_hash: str) -> bool:
+    """
+    Check a chained partial hash by re-hashing the whole prefix.
+
+    Change detection must notice edits anywhere in ``[0, offset)``, so the
+    stored state is not used to skip blocks here; it only resumes hashing of
+    new chunks once the prefix is known to be intact.
+
+    Args:
+        file_path: Path to the file to check
+        offset: Byte offset the expected hash was computed up to
+        expected_hash: Stored chained partial hash
+
+    Returns:
+        True if the prefix is unchanged
+    """
+    current_hash, _ = advance_partial_hash(file_path, offset)
+    return current_hash == expected_hash
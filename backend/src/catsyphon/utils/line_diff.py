@@ -0,0 +1,121 @@
+"""
+Line diff counting for code changes.
+
+Computes how many lines an edit added and deleted, i.e. the ``+``/``-``
+lines of a minimal line diff between the old and new text. Used for Edit
+tool calls when parsing logs and for collector file-touch accounting.
+
+Only the size of the shortest edit script is needed (never the script
+itself), so the core is Myers' O((N+M)·D) distance algorithm over lines
+mapped to integer IDs. Cheap exact reductions run first:
+
+- common leading and trailing lines are stripped (Edit blocks usually keep
+  context lines around the change);
+- lines that occur on only one side can never be matched, so they are
+  counted directly and dropped before diffing.
+
+For very dissimilar large inputs, where D itself approaches N+M, the Myers
+search is capped and the counts fall back to a multiset comparison of lines,
+which is exact unless unchanged lines were also reordered.
+"""
+
+from collections import Counter
+from typing import Optional
+
+# Edit-distance budget for the Myers search before falling back to the
+# multiset count. Work is bounded by roughly (N+M) * this many steps.
+MAX_EDIT_COST = 2_000
+
+
+def diff_line_counts(old_text: str, new_text: str) -> tuple[int, int]:
+    """
+    Count added and deleted lines between two texts.
+
+    Lines are split with ``str.splitlines()``.
+
+    Args:
+        old_text: Text before the change
+        new_text: Text after the change
+
+    Returns:
+        Tuple of (lines_added, lines_deleted)
+    """
+    if old_text == new_text:
+        return 0, 0
+    return diff_counts(old_text.splitlines(), new_text.splitlines())
+
+
+def diff_counts(old: list[str], new: list[str]) -> tuple[int, int]:
+    """Count (added, deleted) entries between two lists of lines."""
+    # Strip the common prefix and suffix
+    start = 0
+    end_old, end_new = len(old), len(new)
+    while start < end_old and start < end_new and old[start] == new[start]:
+        start += 1
+    while end_old > start and end_new > start and old[end_old - 1] == new[end_new - 1]:
+        end_old -= 1
+        end_new -= 1
+
+    if start == end_old or start == end_new:
+        return end_new - start, end_old - start
+
+    # Map lines to integer IDs, keeping only lines present on both sides
+    ids: dict[str, int] = {}
+    for line in old[start:end_old]:
+        ids.setdefault(line, len(ids))
+    shared: set[int] = set()
+    b: list[int] = []
+    for line in new[start:end_new]:
+        line_id = ids.get(line)
+        if line_id is not None:
+            shared.add(line_id)
+            b.append(line_id)
+    a = [
+        line_id
+        for line_id in map(ids.__getitem__, old[start:end_old])
+        if line_id in shared
+    ]
+
+    only_old = (end_old - start) - len(a)
+    only_new = (end_new - start) - len(b)
+    if not a:
+        return only_new, only_old
+
+    distance = _myers_distance(a, b, MAX_EDIT_COST)
+    if distance is None:
+        # Too dissimilar to search exhaustively: lines common to both sides
+        # (by multiplicity) are assumed to be kept
+        common = sum((Counter(a) & Counter(b)).values())
+        return only_new + len(b) - common, only_old + len(a) - common
+
+    # distance = deleted + added, and both sides lose the same LCS length
+    deleted = (distance + len(a) - len(b)) // 2
+    added = distance - deleted
+    return only_new + added, only_old + deleted
+
+
+def _myers_distance(a: list[int], b: list[int], max_cost: int) -> Optional[int]:
+    """
+    Length of the shortest insert/delete script turning ``a`` into ``b``.
+
+    Returns None if it exceeds ``max_cost``.
+    """
+    n, m = len(a), len(b)
+    limit = min(n + m, max_cost)
+    offset = limit + 1
+    # v[offset + k]: furthest x reached on diagonal k (y = x - k)
+    v = [0] * (2 * limit + 3)
+    for d in range(limit + 1):
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[offset + k - 1] < v[offset + k + 1]):
+                x = v[offset + k + 1]
+            else:
+                x = v[offset + k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[offset + k] = x
+            if x >= n and y >= m:
+                return d
+    return None
@@ -0,0 +1,222 @@
+"""
+Wire formats for the Collector Events API.
+
+Event batches may be sent as JSON or msgpack (``Content-Type``) and
+compressed with gzip or zstd (``Content-Encoding``). The server advertises
+what it accepts with ``Accept-Post`` (media types) and ``Accept-Encoding``
+(content codings, RFC 7694) response headers; clients start with plain JSON
+and upgrade once they have seen those headers.
+
+msgpack and zstd are used only when their packages are importable.
+"""
+
+import gzip
+import io
+import json
+import logging
+import zlib
+from dataclasses import dataclass
+from typing import Any, Iterable
+
+logger = logging.getLogger(__name__)
+
+try:
+    import msgpack  # type: ignore[import-untyped]
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Batches smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+
+
+class UnsupportedWireFormatError(ValueError):
+    """Request body uses a media type or content coding we cannot decode."""
+
+
+class PayloadTooLargeError(ValueError):
+    """Decompressed request body exceeds the configured limit."""
+
+
+def supported_content_types() -> list[str]:
+    """Media types accepted for event batches, most compact first."""
+    if MSGPACK_AVAILABLE:
+        return [MSGPACK_CONTENT_TYPE, JSON_CONTENT_TYPE]
+    return [JSON_CONTENT_TYPE]
+
+
+def supported_encodings() -> list[str]:
+    """Content codings accepted for event batches, preferred first."""
+    if ZSTD_AVAILABLE:
+        return ["zstd", "gzip"]
+    return ["gzip"]
+
+
+def _parse_header_list(value: str | None) -> list[str]:
+    if not value:
+        return []
+    return [item.split(";", 1)[0].strip().lower() for item in value.split(",") if item]
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """A (media type, content coding) pair used to send event batches."""
+
+    content_type: str = JSON_CONTENT_TYPE
+    content_encoding: str = "identity"
+
+    @classmethod
+    def negotiate(
+        cls, accept_post: str | None, accept_encoding: str | None
+    ) -> "WireFormat":
+        """Pick the best format both this process and the server support."""
+        server_types = _parse_header_list(accept_post)
+        server_encodings = _parse_header_list(accept_encoding)
+        content_type = next(
+            (t for t in supported_content_types() if t in server_types),
+            JSON_CONTENT_TYPE,
+        )
+        content_encoding = next(
+            (e for e in supported_encodings() if e in server_encodings),
+            "identity",
+        )
+        return cls(content_type=content_type, content_encoding=content_encoding)
+
+    @property
+    def headers(self) -> dict[str, str]:
+        headers = {"Content-Type": self.content_type}
+        if self.content_encoding != "identity":
+            headers["Content-Encoding"] = self.content_encoding
+        return headers
+
+    def encode_item(self, item: Any) -> bytes:
+        """Encode one event for inclusion in a batch body."""
+        if self.content_type == MSGPACK_CONTENT_TYPE:
+            packed: bytes = msgpack.packb(item, datetime=False)
+            return packed
+        return json.dumps(item, separators=(",", ":")).encode()
+
+    def frame(self, session_id: str, items: Iterable[bytes]) -> bytes:
+        """Assemble pre-encoded events into a ``{session_id, events}`` body."""
+        items = list(items)
+        if self.content_type == MSGPACK_CONTENT_TYPE:
+            packer = msgpack.Packer()
+            head = (
+                packer.pack_map_header(2)
+                + packer.pack("session_id")
+                + packer.pack(session_id)
+                + packer.pack("events")
+                + packer.pack_array_header(len(items))
+            )
+            return bytes(head) + b"".join(items)
+        return (
+            b'{"session_id":'
+            + json.dumps(session_id).encode()
+            + b',"events":['
+            + b",".join(items)
+            + b"]}"
+        )
+
+    def frame_overhead(self, session_id: str) -> int:
+        """Bytes a body adds beyond its encoded events (upper bound)."""
+        return len(session_id) + 40
+
+    def compress(self, body: bytes) -> tuple[bytes, dict[str, str]]:
+        """Compress a framed body; returns the bytes and request headers."""
+        if self.content_encoding == "identity" or len(body) < MIN_COMPRESS_BYTES:
+            return body, {"Content-Type": self.content_type}
+        if self.content_encoding == "zstd":
+            compressed = zstandard.ZstdCompressor(level=3).compress(body)
+        else:
+            compressed = gzip.compress(body, compresslevel=6)
+        return compressed, self.headers
+
+
+def decode_body(
+    body: bytes,
+    content_type: str | None,
+    content_encoding: str | None,
+    max_bytes: int,
+) -> Any:
+    """
+    Decompress and decode a request body.
+
+    Raises:
+        UnsupportedWireFormatError: Unknown media type or content coding
+        PayloadTooLargeError: Decompressed body exceeds ``max_bytes``
+        ValueError: Body is corrupt or not valid for its media type
+    """
+    for coding in reversed(_parse_header_list(content_encoding)):
+        body = _decompress(body, coding, max_bytes)
+    if len(body) > max_bytes:
+        raise PayloadTooLargeError(f"Request body exceeds {max_bytes} bytes")
+
+    media_type = _parse_header_list(content_type)[:1] or [JSON_CONTENT_TYPE]
+    if media_type[0] == JSON_CONTENT_TYPE or media_type[0].endswith("+json"):
+        return json.loads(body)
+    if media_type[0] in (MSGPACK_CONTENT_TYPE, "application/x-msgpack"):
+        if not MSGPACK_AVAILABLE:
+            raise UnsupportedWireFormatError("msgpack is not available on this server")
+        try:
+            return msgpack.unpackb(body, raw=False)
+        except (msgpack.ExtraData, msgpack.FormatError, msgpack.StackError) as e:
+            raise ValueError(f"Invalid msgpack body: {e}") from e
+    raise UnsupportedWireFormatError(f"Unsupported Content-Type: {media_type[0]}")
+
+
+def _decompress(body: bytes, coding: str, max_bytes: int) -> bytes:
+    """Decompress one content coding, refusing output beyond ``max_bytes``."""
+    if coding == "identity":
+        return body
+    if coding in ("gzip", "x-gzip"):
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        try:
+            data = decompressor.decompress(body, max_bytes + 1)
+        except zlib.error as e:
+            raise ValueError(f"Invalid gzip body: {e}") from e
+    elif coding == "zstd":
+        if not ZSTD_AVAILABLE:
+            raise UnsupportedWireFormatError("zstd is not available on this server")
+        reader = zstandard.ZstdDecompressor().stream_reader(io.BytesIO(body))
+        # read() may return fewer bytes than asked before the end of the
+        # stream, so keep reading until EOF or just past the limit
+        chunks: list[bytes] = []
+        size = 0
+        try:
+            while size <= max_bytes:
+                chunk = reader.read(max_bytes + 1 - size)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+                size += len(chunk)
+        except zstandard.ZstdError as e:
+            raise ValueError(f"Invalid zstd body: {e}") from e
+        data = b"".join(chunks)
+    else:
+        raise UnsupportedWireFormatError(f"Unsupported Content-Encoding: {coding}")
+
+    if len(data) > max_bytes:
+        raise PayloadTooLargeError(f"Decompressed body exceeds {max_bytes} bytes")
+    return data
+
+
+def reencode_as_json(body: bytes, headers: dict[str, str]) -> bytes:
+    """Turn an encoded batch back into plain JSON (fallback after a 415)."""
+    payload = decode_body(
+        body,
+        headers.get("Content-Type"),
+        headers.get("Content-Encoding"),
+        max_bytes=len(body) * 1024 + (1 << 20),
+    )
+    return json.dumps(payload, separators=(",", ":")).encode()
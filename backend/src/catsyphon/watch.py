@@ -13,12 +13,13 @@ import signal
 import sys
 import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
 from datetime import UTC, datetime, timedelta
 from multiprocessing import Queue
 from pathlib import Path
 from threading import Event, Thread
-from typing import TYPE_CHECKING, Any, Optional, Set
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Set
 from uuid import UUID
 
 if TYPE_CHECKING:
@@ -46,13 +47,19 @@ else:
 from catsyphon.config import settings
 from catsyphon.db.connection import db_session
 from catsyphon.db.connection import engine as db_engine
+from catsyphon.db.repositories.collector_session import CollectorSessionRepository
 from catsyphon.db.repositories.raw_log import RawLogRepository
 from catsyphon.exceptions import DuplicateFileError
 from catsyphon.models.db import Conversation
 from catsyphon.parsers.base import EmptyFileError
-from catsyphon.parsers.incremental import ChangeType, detect_file_change_type
-from catsyphon.parsers.registry import get_default_registry
+from catsyphon.parsers.incremental import (
+    ChangeType,
+    detect_file_change_type,
+    parse_messages_resumable,
+)
+from catsyphon.parsers.registry import get_default_registry, get_parser_name
 from catsyphon.pipeline.ingestion import link_orphaned_agents
+from catsyphon.utils.hashing import PartialHashState
 
 logger = logging.getLogger(__name__)
 
@@ -98,13 +105,43 @@ def _first_message_time(messages: list["ParsedMessage"]) -> datetime:
     return earliest
 
 
+def _iter_jsonl_sorted(directory: Path) -> Iterable[os.DirEntry[str]]:
+    """
+    Walk a directory tree for .jsonl files, yielding them in path order.
+
+    Siblings are visited in order of their name, with "/" appended for
+    directories, so full paths come out in plain string order (the byte
+    order tracked paths are streamed from the database in). Symlinked
+    directories are not descended into, matching ``Path.rglob``.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = []
+            for entry in it:
+                try:
+                    is_dir = entry.is_dir(follow_symlinks=False)
+                except OSError:
+                    continue
+                entries.append((entry.name + "/" if is_dir else entry.name, entry))
+    except OSError as e:
+        logger.debug(f"Cannot scan {directory}: {e}")
+        return
+
+    entries.sort(key=lambda item: item[0])
+    for key, entry in entries:
+        if key.endswith("/"):
+            yield from _iter_jsonl_sorted(Path(entry.path))
+        elif entry.name.endswith(".jsonl") and entry.is_file():
+            yield entry
+
+
 @dataclass
 class ApiIngestionConfig:
     """
     Configuration for API-based ingestion.
 
     All watch daemons now use API mode for ingestion.
-    batch_size defaults to CATSYPHON_COLLECTOR_BATCH_SIZE (default: 20).
+    batch_size defaults to CATSYPHON_COLLECTOR_BATCH_SIZE (default: 50).
     """
 
     server_url: str = "http://localhost:8000"
@@ -189,6 +226,23 @@ class WatcherStats:
     files_retried: int = 0
     last_activity: Optional[datetime] = None
 
+    # Startup scan progress
+    scan_files_queued: int = 0
+    scan_files_completed: int = 0
+    scan_started_at: Optional[datetime] = None
+    scan_completed_at: Optional[datetime] = None
+
+    @property
+    def scan_files_per_second(self) -> float:
+        """Startup scan throughput (completed files per second of scan time)."""
+        if not self.scan_started_at:
+            return 0.0
+        end = self.scan_completed_at or datetime.now()
+        elapsed = (end - self.scan_started_at).total_seconds()
+        if elapsed <= 0:
+            return 0.0
+        return round(self.scan_files_completed / elapsed, 2)
+
     def to_dict(self) -> dict[str, Any]:
         """Convert stats to dictionary for serialization."""
         return {
@@ -200,6 +254,15 @@ class WatcherStats:
             "last_activity": (
                 self.last_activity.isoformat() if self.last_activity else None
             ),
+            "scan_files_queued": self.scan_files_queued,
+            "scan_files_completed": self.scan_files_completed,
+            "scan_files_per_second": self.scan_files_per_second,
+            "scan_started_at": (
+                self.scan_started_at.isoformat() if self.scan_started_at else None
+            ),
+            "scan_completed_at": (
+                self.scan_completed_at.isoformat() if self.scan_completed_at else None
+            ),
         }
 
 
@@ -417,8 +480,14 @@ class FileWatcher(FileSystemEventHandler):
         thread = Thread(target=self._process_file, args=(file_path,), daemon=True)
         thread.start()
 
-    def _process_file(self, file_path: Path) -> None:
-        """Process a single file (called in background thread)."""
+    def _process_file(self, file_path: Path, skip_debounce: bool = False) -> None:
+        """Process a single file (called in background thread).
+
+        Args:
+            file_path: File to ingest
+            skip_debounce: Skip the wait-for-writes sleep. The startup scan
+                sets this for files that have not been modified recently.
+        """
         path_str = str(file_path)
 
         # Atomically check if already processing this file and mark as processing
@@ -461,7 +530,8 @@ class FileWatcher(FileSystemEventHandler):
                     )
 
             # Wait for file to finish writing (debounce at file level)
-            time.sleep(self.debounce_seconds)
+            if not skip_debounce:
+                time.sleep(self.debounce_seconds)
 
             # Check if file exists and is readable
             if not file_path.exists():
@@ -484,6 +554,9 @@ class FileWatcher(FileSystemEventHandler):
                                     existing_raw_log.last_processed_offset or 0,
                                     existing_raw_log.file_size_bytes or 0,
                                     existing_raw_log.partial_hash,
+                                    PartialHashState.from_dict(
+                                        existing_raw_log.partial_hash_state
+                                    ),
                                 )
                             except Exception as e:
                                 logger.warning(
@@ -622,7 +695,11 @@ class FileWatcher(FileSystemEventHandler):
                         or 0,
                         "file_size_bytes": existing_raw_log.file_size_bytes or 0,
                         "partial_hash": existing_raw_log.partial_hash,
+                        "partial_hash_state": PartialHashState.from_dict(
+                            existing_raw_log.partial_hash_state
+                        ),
                         "agent_type": existing_raw_log.agent_type,
+                        "parser_name": existing_raw_log.parser_name,
                         "session_id": conv_metadata.get("session_id"),
                         "working_directory": conv_metadata.get("working_directory"),
                         "git_branch": conv_metadata.get("git_branch"),
@@ -635,6 +712,7 @@ class FileWatcher(FileSystemEventHandler):
                         existing_raw_log_state["last_processed_offset"],
                         existing_raw_log_state["file_size_bytes"],
                         existing_raw_log_state["partial_hash"],
+                        existing_raw_log_state["partial_hash_state"],
                     )
 
                     if change_type == ChangeType.UNCHANGED:
@@ -657,13 +735,27 @@ class FileWatcher(FileSystemEventHandler):
         parsed = None
         chunked_result: Optional[dict] = None  # type: ignore[assignment]
 
-        chunked_parser = self.parser_registry.find_chunked_parser(file_path)
+        # An append to a file we have already ingested keeps its format, so
+        # reuse the recorded parser instead of probing the file again
+        parser_hint = None
+        if existing_raw_log_state and change_type == ChangeType.APPEND:
+            parser_hint = existing_raw_log_state.get("parser_name")
+
+        chunked_parser = self.parser_registry.find_chunked_parser(
+            file_path, parser_hint=parser_hint
+        )
+        parser_name = None
         if chunked_parser:
             start_offset = 0
+            start_hash_state = None
             if existing_raw_log_state and change_type == ChangeType.APPEND:
                 start_offset = existing_raw_log_state["last_processed_offset"]
+                start_hash_state = existing_raw_log_state["partial_hash_state"]
             chunked_result = self._parse_chunked(
-                file_path, chunked_parser, start_offset=start_offset
+                file_path,
+                chunked_parser,
+                start_offset=start_offset,
+                start_hash_state=start_hash_state,
             )
             if not chunked_result.get("accepted") and not chunked_result.get(
                 "messages"
@@ -677,7 +769,11 @@ class FileWatcher(FileSystemEventHandler):
                 return
         else:
             # Fallback for parsers that don't implement ChunkedParser
-            parsed = self.parser_registry.parse(file_path)
+            parse_result = self.parser_registry.parse_with_metadata(
+                file_path, parser_hint=parser_hint
+            )
+            parsed = parse_result.conversation
+            parser_name = parse_result.parser_name
 
         # Resolve session_id: prefer parser-extracted, then existing conversation,
         # then file stem.  Using the original parser-extracted session_id on
@@ -763,6 +859,7 @@ class FileWatcher(FileSystemEventHandler):
                 parsed=parsed,
                 incremental_result=None,
                 has_existing_raw_log=existing_raw_log_state is not None,
+                parser_name=parser_name,
             )
 
         # Compute fingerprint for reconciliation
@@ -793,6 +890,7 @@ class FileWatcher(FileSystemEventHandler):
         file_path: Path,
         chunked_parser: "ChunkedParser",
         start_offset: int = 0,
+        start_hash_state: Optional[PartialHashState] = None,
     ) -> dict:
         """Parse a file in bounded chunks to avoid OOM (ADR-009).
 
@@ -801,7 +899,9 @@ class FileWatcher(FileSystemEventHandler):
         Peak memory is ~3 MB per chunk regardless of file size.
 
         For new files, ``start_offset=0``. For appends, it's the stored
-        ``last_processed_offset`` from the raw_log table.
+        ``last_processed_offset`` from the raw_log table, and
+        ``start_hash_state`` lets the partial hash resume without re-reading
+        the already-processed prefix.
 
         Returns a dict with keys:
             session_id, agent_type, agent_version, working_directory,
@@ -840,10 +940,14 @@ class FileWatcher(FileSystemEventHandler):
         last_messages: list = []
         offset = start_offset
         last_chunk: Optional[MessageChunk] = None
+        hash_state = start_hash_state
 
         while True:
-            chunk = chunked_parser.parse_messages(file_path, offset)
+            chunk = parse_messages_resumable(
+                chunked_parser, file_path, offset, hash_state
+            )
             last_chunk = chunk
+            hash_state = chunk.hash_state
 
             if chunk.messages:
                 result = self._collector_client.ingest_incremental_messages(
@@ -879,6 +983,7 @@ class FileWatcher(FileSystemEventHandler):
                 conversation_id=conversation_id,
                 agent_type=meta.agent_type,
                 last_chunk=last_chunk,
+                parser_name=get_parser_name(chunked_parser),
             )
 
         return {
@@ -899,6 +1004,7 @@ class FileWatcher(FileSystemEventHandler):
         conversation_id: str,
         agent_type: str,
         last_chunk: "MessageChunk",
+        parser_name: Optional[str] = None,
     ) -> None:
         """Update raw_log entry after chunked parsing completes."""
         from sqlalchemy.exc import IntegrityError
@@ -915,6 +1021,8 @@ class FileWatcher(FileSystemEventHandler):
                         last_processed_line=last_chunk.next_line,
                         file_size_bytes=last_chunk.file_size,
                         partial_hash=last_chunk.partial_hash,
+                        partial_hash_state=last_chunk.hash_state,
+                        parser_name=parser_name,
                     )
                 else:
                     raw_log_repo.create_from_file(
@@ -932,6 +1040,8 @@ class FileWatcher(FileSystemEventHandler):
                             last_processed_line=last_chunk.next_line,
                             file_size_bytes=last_chunk.file_size,
                             partial_hash=last_chunk.partial_hash,
+                            partial_hash_state=last_chunk.hash_state,
+                            parser_name=parser_name,
                         )
                 session.commit()
         except IntegrityError:
@@ -946,6 +1056,7 @@ class FileWatcher(FileSystemEventHandler):
         parsed: Optional["ParsedConversation"],
         incremental_result: Optional["IncrementalParseResult"],
         has_existing_raw_log: bool,
+        parser_name: Optional[str] = None,
     ) -> None:
         """
         Update or create raw_log entry to track file state for incremental parsing.
@@ -989,6 +1100,7 @@ class FileWatcher(FileSystemEventHandler):
                             last_processed_line=new_line,
                             file_size_bytes=file_size,
                             partial_hash=partial_hash,
+                            parser_name=parser_name,
                         )
                         logger.debug(
                             f"Updated raw_log state: offset={new_offset}, size={file_size}"
@@ -1023,6 +1135,7 @@ class FileWatcher(FileSystemEventHandler):
                                 last_processed_line=new_line,
                                 file_size_bytes=file_size,
                                 partial_hash=partial_hash,
+                                parser_name=parser_name,
                             )
                         logger.debug(
                             f"Created raw_log for {file_path.name}: offset={new_offset}, size={file_size}"
@@ -1039,6 +1152,7 @@ class FileWatcher(FileSystemEventHandler):
                                 last_processed_line=new_line,
                                 file_size_bytes=file_size,
                                 partial_hash=partial_hash,
+                                parser_name=parser_name,
                             )
                             session.commit()
                             logger.debug(
@@ -1073,6 +1187,8 @@ class WatcherDaemon:
         stats_queue: Optional["Queue[dict[str, Any]]"] = None,
         api_config: Optional[ApiIngestionConfig] = None,
         workspace_id: Optional[UUID] = None,
+        scan_workers: Optional[int] = None,
+        scan_memory_budget_mb: Optional[int] = None,
     ):
         self.directory = directory
         self.project_name = project_name
@@ -1086,12 +1202,15 @@ class WatcherDaemon:
         self.stats_queue = stats_queue
         self.api_config = api_config or ApiIngestionConfig()
         self.workspace_id = workspace_id  # For multi-tenancy orphan linking
-        # Sequential scanning: chunked parsing bounds per-chunk memory, but the
-        # collector client buffers all events for a chunk before batching.
-        # With N workers on N large files, peak memory = N × chunk_events
-        # which can exceed the container limit.  One-at-a-time is safe and
-        # fast enough for startup scans.
-        self._scan_workers = 1
+        # Startup scan concurrency: chunked parsing bounds per-chunk memory,
+        # but the collector client buffers all events for a chunk before
+        # batching, so peak memory grows with the number of in-flight files.
+        # The worker count bounds it and the RSS budget throttles admission
+        # back towards one-at-a-time when the container limit gets close.
+        self._scan_workers = scan_workers or settings.watch_scan_workers
+        self._scan_memory_budget_bytes = (
+            scan_memory_budget_mb or settings.watch_scan_memory_budget_mb
+        ) * (1024 * 1024)
         self._stats_lock = threading.Lock()  # Protects stats from concurrent updates
 
         # API mode is always used
@@ -1227,6 +1346,14 @@ class WatcherDaemon:
             self.linking_thread.join(timeout=2)
             logger.info("✓ Linking thread stopped")
 
+        # Close the collector client (stops its pipelined send loop)
+        collector_client = getattr(self.event_handler, "_collector_client", None)
+        if collector_client is not None:
+            try:
+                collector_client.close()
+            except Exception as e:
+                logger.error(f"Error closing collector client: {e}", exc_info=True)
+
         logger.info("✓ Watch daemon stopped")
 
     def is_running(self) -> bool:
@@ -1258,6 +1385,9 @@ class WatcherDaemon:
                     else None
                 ),
                 "retry_queue_size": len(self.retry_queue),
+                "scan_files_queued": self.stats.scan_files_queued,
+                "scan_files_completed": self.stats.scan_files_completed,
+                "scan_files_per_second": self.stats.scan_files_per_second,
             }
 
     def _signal_handler(self, signum: int, frame: Any) -> None:
@@ -1347,7 +1477,15 @@ class WatcherDaemon:
             logger.info("Scan lock released")
 
     def _do_scan(self) -> None:
-        """Execute the actual directory scan (called under lock)."""
+        """Execute the actual directory scan (called under lock).
+
+        Tracked raw log state is read from the database in keyset pages in
+        file path order and merge-joined against a walk of the directory in
+        the same order, so neither side is materialized and no cursor stays
+        open while candidates are ingested. Untracked files are ingested;
+        tracked files are only checked with ``detect_file_change_type`` when
+        their size or mtime differs from the recorded state.
+        """
         try:
             from catsyphon.db.repositories.raw_log import RawLogRepository as RawLogRepo
 
@@ -1357,85 +1495,182 @@ class WatcherDaemon:
                 # Resolve symlinks to match how files are stored in database
                 resolved_dir = self.directory.resolve()
 
-                # PHASE 1: Get all tracked files from database
-                tracked_files = raw_log_repo.get_files_in_directory(str(resolved_dir))
-                tracked_paths = {Path(raw_log.file_path) for raw_log in tracked_files}
+                counts = {"disk": 0, "new": 0, "tracked": 0, "checked": 0, "changed": 0}
+                # Unchanged files recorded before mtimes were tracked (or
+                # touched without a content change) get their mtime filled in
+                verified_mtimes: dict[UUID, float] = {}
+
+                def candidate_files() -> Iterable[Path]:
+                    tracked = iter(raw_log_repo.iter_directory_state(str(resolved_dir)))
+                    raw_log = next(tracked, None)
+
+                    for entry in _iter_jsonl_sorted(resolved_dir):
+                        counts["disk"] += 1
+                        # Skip tracked files that are no longer on disk
+                        while raw_log is not None and raw_log.file_path < entry.path:
+                            raw_log = next(tracked, None)
+
+                        if raw_log is None or raw_log.file_path != entry.path:
+                            counts["new"] += 1
+                            yield Path(entry.path)
+                            continue
+
+                        state = raw_log
+                        while raw_log is not None and raw_log.file_path == entry.path:
+                            raw_log = next(tracked, None)
+                        counts["tracked"] += 1
+
+                        change = self._check_tracked_file(entry, state)
+                        if change is None:
+                            continue
+                        counts["checked"] += 1
+                        if change == ChangeType.UNCHANGED:
+                            logger.debug(f"No changes: {entry.name}")
+                            verified_mtimes[state.id] = entry.stat().st_mtime
+                            continue
+
+                        logger.info(
+                            f"Startup scan detected {change.value}: {entry.name}"
+                        )
+                        counts["changed"] += 1
+                        # Existing handler does incremental or full reparse
+                        yield Path(entry.path)
 
-                logger.info(f"Found {len(tracked_files)} tracked files in database")
+                with self._stats_lock:
+                    self.stats.scan_started_at = datetime.now()
+                    self.stats.scan_completed_at = None
+                    self.stats.scan_files_queued = 0
+                    self.stats.scan_files_completed = 0
 
-                # PHASE 2: Stream filesystem scan to avoid materializing the
-                # full file list in memory on large log directories.
-                disk_file_count = 0
-                new_file_count = 0
-                import gc
+                self._process_scan_files(candidate_files())
 
-                for fp in resolved_dir.rglob("*.jsonl"):
-                    disk_file_count += 1
-                    if fp in tracked_paths:
-                        continue
+                raw_log_repo.set_file_mtimes(verified_mtimes)
 
-                    new_file_count += 1
-                    if self.shutdown_event.is_set():
-                        logger.info("Shutdown requested, aborting startup scan")
-                        break
-                    try:
-                        self.event_handler._process_file(fp)
-                    except Exception as e:
-                        logger.error(
-                            f"Startup scan failed for {fp.name}: {e}"
-                        )
-                    gc.collect()
+                with self._stats_lock:
+                    self.stats.scan_completed_at = datetime.now()
+                    files_per_second = self.stats.scan_files_per_second
 
                 logger.info(
-                    "Found %d .jsonl files on disk (%d new files)",
-                    disk_file_count,
-                    new_file_count,
+                    f"Startup scan complete: {counts['disk']} .jsonl files on disk, "
+                    f"{counts['new']} new files ingested, "
+                    f"{counts['changed']}/{counts['tracked']} tracked files changed "
+                    f"({counts['checked']} checked, {files_per_second} files/s)"
                 )
 
-                # PHASE 4: Check tracked files for changes
-                changed_count = 0
-                for raw_log in tracked_files:
-                    file_path = Path(raw_log.file_path)
+        except Exception as e:
+            logger.error(f"Startup scan failed: {e}", exc_info=True)
+            # Don't fail daemon startup on scan error
+
+    def _check_tracked_file(
+        self, entry: os.DirEntry[str], raw_log: Any
+    ) -> Optional[ChangeType]:
+        """
+        Detect how a tracked file changed since its state was recorded.
 
-                    if not file_path.exists():
-                        logger.debug(f"Tracked file no longer exists: {file_path.name}")
-                        continue
+        Returns:
+            None when size and mtime match the recorded state (nothing to
+            check), otherwise the result of ``detect_file_change_type``
+        """
+        try:
+            stat = entry.stat()
+        except OSError:
+            logger.debug(f"Tracked file no longer exists: {entry.name}")
+            return None
+
+        if (
+            raw_log.file_mtime is not None
+            and stat.st_mtime == raw_log.file_mtime
+            and stat.st_size == (raw_log.file_size_bytes or 0)
+        ):
+            return None
+
+        # Import here so test patches on catsyphon.parsers.incremental work
+        from catsyphon.parsers.incremental import (
+            detect_file_change_type as detect_change,
+        )
 
-                    # Detect change type
-                    # Import inside loop so test patches on catsyphon.parsers.incremental work
-                    from catsyphon.parsers.incremental import (
-                        detect_file_change_type as detect_change,
-                    )
+        return detect_change(
+            Path(entry.path),
+            raw_log.last_processed_offset or 0,
+            raw_log.file_size_bytes or 0,
+            raw_log.partial_hash,
+            PartialHashState.from_dict(raw_log.partial_hash_state),
+        )
 
-                    change_type = detect_change(
-                        file_path,
-                        raw_log.last_processed_offset or 0,
-                        raw_log.file_size_bytes or 0,
-                        raw_log.partial_hash,
-                    )
+    def _process_scan_files(self, file_paths: Iterable[Path]) -> None:
+        """
+        Process startup-scan candidates on a bounded worker pool.
 
-                    if change_type == ChangeType.UNCHANGED:
-                        logger.debug(f"No changes: {file_path.name}")
-                        continue
+        At most ``_scan_workers`` files are in flight, and no new file is
+        admitted while process RSS exceeds the scan memory budget until an
+        in-flight file completes. Files not modified within
+        ``watch_scan_quiet_seconds`` skip the debounce sleep since nothing
+        is still writing to them.
+        """
+        import gc
+
+        workers = max(1, self._scan_workers)
+        quiet_cutoff = time.time() - settings.watch_scan_quiet_seconds
+        pending: set[Future[None]] = set()
+        paths: dict[Future[None], Path] = {}
 
+        def drain(futures: set[Future[None]]) -> None:
+            for future in futures:
+                fp = paths.pop(future)
+                try:
+                    future.result()
+                except Exception as e:
+                    logger.error(f"Startup scan failed for {fp.name}: {e}")
+                with self._stats_lock:
+                    self.stats.scan_files_completed += 1
+                    completed = self.stats.scan_files_completed
+                    queued = self.stats.scan_files_queued
+                if completed % 100 == 0:
                     logger.info(
-                        f"Startup scan detected {change_type.value}: {file_path.name}"
+                        "Startup scan progress: %d/%d files (%.2f files/s)",
+                        completed,
+                        queued,
+                        self.stats.scan_files_per_second,
                     )
-                    changed_count += 1
 
-                    # Process file using existing handler
-                    # This will handle both incremental and full reparse
-                    self.event_handler._process_file(file_path)
+        with ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="startup-scan"
+        ) as pool:
+            for fp in file_paths:
+                if self.shutdown_event.is_set():
+                    logger.info("Shutdown requested, aborting startup scan")
+                    break
 
-                logger.info(
-                    f"Startup scan complete: "
-                    f"{new_file_count} new files ingested, "
-                    f"{changed_count}/{len(tracked_files)} tracked files changed"
+                while pending and (len(pending) >= workers or self._scan_over_budget()):
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    drain(done)
+                    gc.collect()
+
+                try:
+                    skip_debounce = fp.stat().st_mtime < quiet_cutoff
+                except OSError:
+                    skip_debounce = False
+
+                future = pool.submit(
+                    self.event_handler._process_file, fp, skip_debounce=skip_debounce
                 )
+                pending.add(future)
+                paths[future] = fp
+                with self._stats_lock:
+                    self.stats.scan_files_queued += 1
 
-        except Exception as e:
-            logger.error(f"Startup scan failed: {e}", exc_info=True)
-            # Don't fail daemon startup on scan error
+            done, _ = wait(pending)
+            drain(done)
+
+    def _scan_over_budget(self) -> bool:
+        """Check whether daemon RSS exceeds the startup scan memory budget."""
+        try:
+            import psutil  # type: ignore[import-untyped]
+
+            rss = psutil.Process(os.getpid()).memory_info().rss
+        except Exception:
+            return False
+        return bool(rss > self._scan_memory_budget_bytes)
 
     def _retry_loop(self) -> None:
         """Background thread that retries failed files."""
@@ -1482,6 +1717,12 @@ class WatcherDaemon:
                 else:
                     with db_session() as session:
                         linked_count = link_orphaned_agents(session, self.workspace_id)
+                        # Collector orphans are only retried when their parent
+                        # is ingested; sweep them here so orphans whose parent
+                        # never arrives reach the permanent-orphan policy
+                        linked_count += CollectorSessionRepository(
+                            session
+                        ).link_orphaned_collectors(self.workspace_id)
                         if linked_count > 0:
                             logger.info(f"Linked {linked_count} orphaned agent(s)")
                         session.commit()
@@ -1510,7 +1751,7 @@ def run_daemon_process(
     api_url: str = "http://localhost:8000",
     api_key: str = "",
     collector_id: str = "",
-    api_batch_size: int = 20,
+    api_batch_size: Optional[int] = None,
     workspace_id: Optional[UUID] = None,
 ) -> None:
     """
@@ -1534,7 +1775,7 @@ def run_daemon_process(
         api_url: CatSyphon server URL for API ingestion
         api_key: Collector API key for authentication (required)
         collector_id: Registered collector ID (required)
-        api_batch_size: Number of events per batch
+        api_batch_size: Max events per batch (None uses the settings default)
         workspace_id: Workspace ID for orphan linking (required for multi-tenancy)
     """
     # Setup logging for child process with context-specific log file
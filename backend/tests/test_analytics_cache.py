@@ -0,0 +1,224 @@
+"""Tests for the shared, versioned analytics cache."""
+
+import uuid
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.orm import Session
+
+from catsyphon.analytics.cache import (
+    ANALYTICS_CACHE,
+    AnalyticsCache,
+    DatabaseCacheBackend,
+    MemoryCacheBackend,
+    create_backend,
+    project_scope,
+    workspace_scope,
+)
+from catsyphon.api.routes import stats as stats_routes
+from catsyphon.models.db import AnalyticsCacheEntry, Conversation, Workspace
+from catsyphon.services.ingestion_service import CollectorEvent, IngestionService
+
+
+@pytest.fixture(params=["memory", "database"])
+def cache(request) -> AnalyticsCache:
+    backend = MemoryCacheBackend() if request.param == "memory" else None
+    return AnalyticsCache(backend=backend or DatabaseCacheBackend(), ttl_seconds=60.0)
+
+
+class TestAnalyticsCache:
+    """Test cache behaviour shared by all backends."""
+
+    def test_set_then_get(self, cache: AnalyticsCache, db_session: Session):
+        scope = project_scope(uuid.uuid4())
+        key = cache.key(db_session, "project_analytics", scope, "30d")
+
+        assert cache.get(db_session, key) is None
+        cache.set(db_session, key, {"total": 3})
+
+        assert cache.get(db_session, key) == {"total": 3}
+
+    def test_params_are_part_of_key(self, cache: AnalyticsCache, db_session: Session):
+        scope = project_scope(uuid.uuid4())
+        cache.set(db_session, cache.key(db_session, "a", scope, "7d"), {"v": 7})
+
+        assert cache.get(db_session, cache.key(db_session, "a", scope, "30d")) is None
+
+    def test_invalidate_changes_key_and_drops_entries(
+        self, cache: AnalyticsCache, db_session: Session
+    ):
+        scope = project_scope(uuid.uuid4())
+        old_key = cache.key(db_session, "project_analytics", scope, None)
+        cache.set(db_session, old_key, {"total": 1})
+
+        cache.invalidate(db_session, scope)
+        new_key = cache.key(db_session, "project_analytics", scope, None)
+
+        assert new_key != old_key
+        assert cache.get(db_session, new_key) is None
+        assert cache.get(db_session, old_key) is None
+
+    def test_result_computed_before_bump_is_never_served(
+        self, cache: AnalyticsCache, db_session: Session
+    ):
+        """A slow computation that straddles ingestion stores under the old key."""
+        scope = project_scope(uuid.uuid4())
+        key = cache.key(db_session, "project_analytics", scope, None)
+
+        cache.invalidate(db_session, scope)
+        cache.set(db_session, key, {"stale": True})
+
+        fresh_key = cache.key(db_session, "project_analytics", scope, None)
+        assert cache.get(db_session, fresh_key) is None
+
+    def test_invalidate_other_scope_keeps_entry(
+        self, cache: AnalyticsCache, db_session: Session
+    ):
+        scope = project_scope(uuid.uuid4())
+        key = cache.key(db_session, "project_analytics", scope, None)
+        cache.set(db_session, key, {"total": 1})
+
+        cache.invalidate(db_session, project_scope(uuid.uuid4()))
+
+        assert cache.get(db_session, key) == {"total": 1}
+
+    def test_expired_entries_miss(self, cache: AnalyticsCache, db_session: Session):
+        expired = AnalyticsCache(backend=cache.backend, ttl_seconds=-1.0)
+        key = expired.key(db_session, "overview_stats", workspace_scope(uuid.uuid4()))
+        expired.set(db_session, key, {"total": 1})
+
+        assert expired.get(db_session, key) is None
+
+
+def test_invalidate_after_commit_discards_scopes_on_rollback(
+    cache: AnalyticsCache, db_session: Session
+):
+    workspace_id = uuid.uuid4()
+    scope = workspace_scope(workspace_id)
+
+    with db_session.begin_nested():
+        cache.invalidate_after_commit(db_session, workspace_id, None)
+        # Releasing a savepoint is not the commit the bump waits for
+    assert cache.backend.get_version(db_session, scope) == 0
+
+    db_session.rollback()
+    db_session.commit()
+    assert cache.backend.get_version(db_session, scope) == 0
+
+    cache.invalidate_after_commit(db_session, workspace_id, None)
+    cache.invalidate_after_commit(db_session, workspace_id, None)
+    db_session.commit()
+    assert cache.backend.get_version(db_session, scope) == 1
+
+
+def test_database_writes_sweep_expired_entries(db_session: Session):
+    backend = DatabaseCacheBackend()
+    expired = AnalyticsCache(backend=backend, ttl_seconds=-1.0)
+    fresh = AnalyticsCache(backend=backend, ttl_seconds=60.0)
+
+    # Within the sweep interval writes leave expired entries alone
+    backend._next_sweep = float("inf")
+    for name in ("a", "b"):
+        expired.set(db_session, expired.key(db_session, name, "scope"), 1)
+    assert db_session.query(AnalyticsCacheEntry).count() == 2
+
+    backend._next_sweep = 0.0
+    fresh.set(db_session, fresh.key(db_session, "c", "scope"), 3)
+
+    assert db_session.query(AnalyticsCacheEntry).count() == 1
+    assert backend._next_sweep > 0.0
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        create_backend("redis")
+
+
+class TestIngestionInvalidation:
+    """Test that ingestion bumps the versions used by API cache keys."""
+
+    def test_process_events_bumps_workspace_and_project(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        service = IngestionService(db_session)
+        now = datetime.now(timezone.utc)
+        workspace_key = ANALYTICS_CACHE.key(
+            db_session, "overview_stats", workspace_scope(sample_workspace.id)
+        )
+
+        outcome = service.process_events(
+            session_id="cache-session",
+            workspace_id=sample_workspace.id,
+            events=[
+                CollectorEvent(
+                    type="session_start",
+                    emitted_at=now,
+                    observed_at=now,
+                    event_hash="a" * 32,
+                    data={"agent_type": "claude-code", "working_directory": "/p"},
+                ),
+                CollectorEvent(
+                    type="message",
+                    emitted_at=now,
+                    observed_at=now,
+                    event_hash="b" * 32,
+                    data={"author_role": "human", "content": "hello"},
+                ),
+            ],
+        )
+        conversation = db_session.get(Conversation, outcome.conversation_id)
+
+        # Versions only move once the ingested data is committed
+        assert (
+            ANALYTICS_CACHE.key(
+                db_session, "overview_stats", workspace_scope(sample_workspace.id)
+            )
+            == workspace_key
+        )
+        db_session.commit()
+
+        assert (
+            ANALYTICS_CACHE.key(
+                db_session, "overview_stats", workspace_scope(sample_workspace.id)
+            )
+            != workspace_key
+        )
+        assert conversation.project_id is not None
+        assert (
+            ANALYTICS_CACHE.backend.get_version(
+                db_session, project_scope(conversation.project_id)
+            )
+            == 1
+        )
+
+    def test_overview_served_from_cache_until_invalidated(
+        self, api_client, db_session: Session, sample_workspace: Workspace, monkeypatch
+    ):
+        frozen_now = datetime.now(timezone.utc)
+
+        class _FrozenDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return frozen_now
+
+        # Keep the per-minute key component stable for the whole test
+        monkeypatch.setattr(stats_routes, "datetime", _FrozenDatetime)
+        first = api_client.get("/stats/overview").json()
+
+        db_session.add(
+            Conversation(
+                workspace_id=sample_workspace.id,
+                agent_type="claude-code",
+                start_time=datetime.now(timezone.utc),
+                status="completed",
+            )
+        )
+        db_session.flush()
+
+        assert api_client.get("/stats/overview").json() == first
+
+        ANALYTICS_CACHE.invalidate_after_commit(db_session, sample_workspace.id, None)
+        db_session.commit()
+        refreshed = api_client.get("/stats/overview").json()
+
+        assert refreshed["total_conversations"] == first["total_conversations"] + 1
@@ -8,14 +8,19 @@ Tests the collector events protocol:
 - POST /collectors/sessions/{session_id}/complete - Complete session
 """
 
+import gzip
+import json
 import uuid
 from datetime import datetime, timedelta, timezone
 
+import msgpack
 import pytest
+import zstandard
 from fastapi.testclient import TestClient
 
 from catsyphon.api.app import app
 from catsyphon.api.routes.collectors import generate_api_key, verify_api_key
+from catsyphon.config import settings
 from catsyphon.db.repositories import CollectorRepository
 from catsyphon.models.db import Conversation
 
@@ -397,6 +402,63 @@ class TestEventSubmission:
         assert response2.status_code == 202
         assert response2.json()["accepted"] == 0  # Duplicate detected by content hash
 
+    def test_edit_tool_call_records_line_counts(
+        self, client, db_session, workspace_with_collector
+    ):
+        """File touches from Edit/Write tool calls carry diff line counts."""
+        collector = workspace_with_collector["collector"]
+        api_key = workspace_with_collector["api_key"]
+        session_id = f"test-session-{uuid.uuid4()}"
+        now = datetime.now(timezone.utc).isoformat()
+
+        events = [
+            {
+                "type": "tool_call",
+                "emitted_at": now,
+                "observed_at": now,
+                "data": {
+                    "tool_name": "Edit",
+                    "tool_use_id": "toolu_1",
+                    "parameters": {
+                        "file_path": "/repo/app.py",
+                        "old_string": "a = 1\nb = 2\nc = 3",
+                        "new_string": "a = 1\nb = 20\nb2 = 21\nc = 3",
+                    },
+                },
+            },
+            {
+                "type": "tool_call",
+                "emitted_at": now,
+                "observed_at": now,
+                "data": {
+                    "tool_name": "Write",
+                    "tool_use_id": "toolu_2",
+                    "parameters": {"file_path": "/repo/new.py", "content": "x\ny\n"},
+                },
+            },
+        ]
+
+        response = client.post(
+            "/collectors/events",
+            json={"session_id": session_id, "events": events},
+            headers={
+                "Authorization": f"Bearer {api_key}",
+                "X-Collector-ID": str(collector.id),
+            },
+        )
+
+        assert response.status_code == 202
+        conversation = (
+            db_session.query(Conversation)
+            .filter(Conversation.collector_session_id == session_id)
+            .one()
+        )
+        counts = {
+            ft.file_path: (ft.lines_added, ft.lines_deleted)
+            for ft in conversation.files_touched
+        }
+        assert counts == {"/repo/app.py": (2, 1), "/repo/new.py": (2, 0)}
+
 
 class TestSessionStatus:
     """Tests for GET /collectors/sessions/{session_id} endpoint."""
@@ -645,6 +707,152 @@ class TestEventValidation:
         assert response.status_code == 422  # Validation error
 
 
+class TestWireFormats:
+    """Tests for compressed and msgpack event batches."""
+
+    @staticmethod
+    def _payload(count: int = 3) -> dict:
+        now = datetime.now(timezone.utc).isoformat()
+        return {
+            "session_id": f"test-session-{uuid.uuid4()}",
+            "events": [
+                {
+                    "type": "message",
+                    "emitted_at": now,
+                    "observed_at": now,
+                    "data": {
+                        "author_role": "human",
+                        "message_type": "prompt",
+                        "content": f"Message {i} " + "x" * 2000,
+                    },
+                }
+                for i in range(count)
+            ],
+        }
+
+    @staticmethod
+    def _headers(workspace_with_collector, **extra) -> dict:
+        return {
+            "Authorization": f"Bearer {workspace_with_collector['api_key']}",
+            "X-Collector-ID": str(workspace_with_collector["collector"].id),
+            **extra,
+        }
+
+    def test_formats_advertised(self, client, workspace_with_collector):
+        response = client.post(
+            "/collectors/events",
+            json=self._payload(),
+            headers=self._headers(workspace_with_collector),
+        )
+
+        assert response.status_code == 202
+        assert "application/msgpack" in response.headers["Accept-Post"]
+        assert "gzip" in response.headers["Accept-Encoding"]
+
+    def test_request_body_documented(self, client):
+        operation = client.get("/openapi.json").json()["paths"]["/collectors/events"][
+            "post"
+        ]
+
+        content = operation["requestBody"]["content"]
+        assert set(content) == {"application/json", "application/msgpack"}
+        schema = content["application/json"]["schema"]
+        assert schema["required"] == ["session_id", "events"]
+        event = schema["properties"]["events"]["items"]
+        assert "type" in event["properties"]
+        assert "$ref" not in json.dumps(operation["requestBody"])
+
+    def test_gzip_json(self, client, workspace_with_collector):
+        body = gzip.compress(json.dumps(self._payload()).encode())
+
+        response = client.post(
+            "/collectors/events",
+            content=body,
+            headers=self._headers(
+                workspace_with_collector,
+                **{"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            ),
+        )
+
+        assert response.status_code == 202
+        assert response.json()["accepted"] == 3
+
+    def test_zstd_msgpack(self, client, workspace_with_collector):
+        body = zstandard.ZstdCompressor().compress(msgpack.packb(self._payload()))
+
+        response = client.post(
+            "/collectors/events",
+            content=body,
+            headers=self._headers(
+                workspace_with_collector,
+                **{
+                    "Content-Type": "application/msgpack",
+                    "Content-Encoding": "zstd",
+                },
+            ),
+        )
+
+        assert response.status_code == 202
+        assert response.json()["accepted"] == 3
+
+    def test_msgpack_validation_error(self, client, workspace_with_collector):
+        payload = self._payload(51)
+
+        response = client.post(
+            "/collectors/events",
+            content=msgpack.packb(payload),
+            headers=self._headers(
+                workspace_with_collector, **{"Content-Type": "application/msgpack"}
+            ),
+        )
+
+        assert response.status_code == 422
+        assert response.json()["detail"][0]["loc"][:2] == ["body", "events"]
+
+    def test_unsupported_encoding(self, client, workspace_with_collector):
+        response = client.post(
+            "/collectors/events",
+            content=json.dumps(self._payload()).encode(),
+            headers=self._headers(
+                workspace_with_collector,
+                **{"Content-Type": "application/json", "Content-Encoding": "br"},
+            ),
+        )
+
+        assert response.status_code == 415
+        assert "gzip" in response.headers["Accept-Encoding"]
+
+    def test_corrupt_body(self, client, workspace_with_collector):
+        response = client.post(
+            "/collectors/events",
+            content=b"not gzip at all",
+            headers=self._headers(
+                workspace_with_collector,
+                **{"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            ),
+        )
+
+        assert response.status_code == 400
+
+    def test_decompressed_size_limited(
+        self, client, workspace_with_collector, monkeypatch
+    ):
+        monkeypatch.setattr(settings, "collector_max_payload_bytes", 4096)
+        body = gzip.compress(json.dumps(self._payload()).encode())
+
+        response = client.post(
+            "/collectors/events",
+            content=body,
+            headers=self._headers(
+                workspace_with_collector,
+                **{"Content-Type": "application/json", "Content-Encoding": "gzip"},
+            ),
+        )
+
+        assert len(body) < 4096
+        assert response.status_code == 413
+
+
 class TestBuiltinCredentials:
     """Tests for GET /collectors/builtin/credentials endpoint."""
 
@@ -385,6 +385,65 @@ class TestListConversations:
         ids2 = {c["id"] for c in data2["items"]}
         assert len(ids1 & ids2) == 0
 
+    def test_cursor_pagination(
+        self,
+        api_client: TestClient,
+        db_session: Session,
+        sample_workspace,
+    ):
+        """Cursor pages cover every parent once, with children kept inline."""
+        repo = ConversationRepository(db_session)
+        now = datetime.now(UTC)
+        # Two parents share a timestamp so the id tie-break is exercised
+        times = [now, now, now - timedelta(minutes=1), now - timedelta(minutes=2)]
+        parents = [
+            repo.create(
+                id=uuid.uuid4(),
+                workspace_id=sample_workspace.id,
+                agent_type="claude-code",
+                start_time=start,
+            )
+            for start in times
+        ]
+        child = repo.create(
+            id=uuid.uuid4(),
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            conversation_type="agent",
+            parent_conversation_id=parents[3].id,
+            start_time=now,
+        )
+        db_session.commit()
+
+        seen = []
+        cursor = ""
+        while cursor is not None:
+            response = api_client.get(
+                "/conversations",
+                params={"page_size": 2, "cursor": cursor, "count": "none"},
+            )
+            assert response.status_code == 200
+            data = response.json()
+            assert data["total"] is None
+            seen.extend(data["items"])
+            cursor = data["next_cursor"]
+
+        top_level = [c["id"] for c in seen if c["depth_level"] == 0]
+        assert sorted(top_level) == sorted(str(p.id) for p in parents)
+        assert len(set(top_level)) == len(top_level)
+        ids = [c["id"] for c in seen]
+        assert ids.index(str(child.id)) == ids.index(str(parents[3].id)) + 1
+
+        response = api_client.get(
+            "/conversations", params={"cursor": "", "count": "approximate"}
+        )
+        assert response.json()["total"] == 4
+
+    def test_invalid_cursor_returns_400(self, api_client: TestClient):
+        response = api_client.get("/conversations", params={"cursor": "bogus"})
+
+        assert response.status_code == 400
+
     def test_invalid_date_format_returns_400(
         self, api_client: TestClient, db_session: Session
     ):
@@ -523,6 +582,42 @@ class TestGetConversationMessages:
 
         assert len(data) == 5
 
+    def test_get_messages_after_cursor(
+        self,
+        api_client: TestClient,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_epoch: Epoch,
+    ):
+        """Messages sharing a sequence are paged by timestamp and id."""
+        repo = MessageRepository(db_session)
+        base = datetime.now(UTC)
+        for i in range(5):
+            repo.create_message(
+                epoch_id=sample_epoch.id,
+                conversation_id=sample_conversation.id,
+                role="user",
+                content=f"Message {i}",
+                timestamp=base + timedelta(seconds=i),
+                sequence=i // 2,
+            )
+
+        url = f"/conversations/{sample_conversation.id}/messages"
+        pages = []
+        params = {"limit": 2}
+        while True:
+            data = api_client.get(url, params=params).json()
+            if not data:
+                break
+            pages.append([m["content"] for m in data])
+            params = {"limit": 2, "after": data[-1]["id"]}
+
+        contents = [c for page in pages for c in page]
+        assert contents == [f"Message {i}" for i in range(5)]
+
+        response = api_client.get(url, params={"after": str(uuid.uuid4())})
+        assert response.status_code == 400
+
     def test_get_messages_for_nonexistent_conversation_returns_404(
         self, api_client: TestClient, db_session: Session
     ):
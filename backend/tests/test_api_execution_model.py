@@ -0,0 +1,31 @@
+"""Tests that database-backed routes do not run on the event loop."""
+
+import inspect
+
+from fastapi.dependencies.models import Dependant
+from fastapi.routing import APIRoute
+
+from catsyphon.api.app import app
+from catsyphon.db.connection import get_db
+
+# Async handlers that must await the request body before handing the
+# synchronous database work to a worker thread themselves.
+ASYNC_OFFLOADING_ROUTES = {"ingest_otel_logs", "stream_conversation_log"}
+
+
+def _uses_db(dependant: Dependant) -> bool:
+    return any(dep.call is get_db or _uses_db(dep) for dep in dependant.dependencies)
+
+
+def test_db_routes_are_sync_handlers():
+    """Handlers that take a DB session run in the threadpool, not on the loop."""
+    offenders = [
+        route.endpoint.__name__
+        for route in app.routes
+        if isinstance(route, APIRoute)
+        and _uses_db(route.dependant)
+        and inspect.iscoroutinefunction(route.endpoint)
+        and route.endpoint.__name__ not in ASYNC_OFFLOADING_ROUTES
+    ]
+
+    assert offenders == []
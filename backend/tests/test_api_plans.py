@@ -6,6 +6,7 @@ from datetime import UTC, datetime
 import pytest
 from sqlalchemy.orm import Session
 
+from catsyphon.db.repositories import PlanRepository
 from catsyphon.models.db import (
     Conversation,
     Epoch,
@@ -97,6 +98,11 @@ def conversation_with_plans(
     )
     db_session.add(message)
 
+    # Ingest keeps the plans table in step with extra_data["plans"]
+    PlanRepository(db_session).replace_for_conversation(
+        conversation, conversation.extra_data["plans"]
+    )
+
     db_session.commit()
     db_session.refresh(conversation)
     return conversation
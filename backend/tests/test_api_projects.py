@@ -11,7 +11,11 @@ import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
 
-from catsyphon.db.repositories import ConversationRepository, MessageRepository
+from catsyphon.db.repositories import (
+    ConversationRepository,
+    MessageRepository,
+    TokenLedgerRepository,
+)
 from catsyphon.models.db import (
     Conversation,
     Developer,
@@ -1382,3 +1386,51 @@ class TestGetProjectFiles:
         file_paths = [f["file_path"] for f in data]
         assert "/path/to/project1_file.py" in file_paths
         assert "/path/to/project2_file.py" not in file_paths
+
+
+class TestProjectCosts:
+    """Tests for GET /projects/{id}/costs."""
+
+    def test_get_project_costs_from_token_ledger(
+        self,
+        api_client: TestClient,
+        db_session: Session,
+        sample_workspace,
+        sample_project: Project,
+    ):
+        """Costs are priced from ledger rows written at message insert."""
+        now = datetime.now(UTC)
+        conversation = ConversationRepository(db_session).create(
+            id=uuid.uuid4(),
+            workspace_id=sample_workspace.id,
+            project_id=sample_project.id,
+            agent_type="claude-code",
+            start_time=now,
+        )
+        TokenLedgerRepository(db_session).record(
+            conversation,
+            [
+                (
+                    {
+                        "model": "claude-sonnet-4-6",
+                        "token_usage": {
+                            "input_tokens": 1_000_000,
+                            "output_tokens": 0,
+                            "cache_read_tokens": 500_000,
+                        },
+                    },
+                    now,
+                )
+            ],
+        )
+        db_session.commit()
+
+        response = api_client.get(f"/projects/{sample_project.id}/costs")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total_cost_usd"] == 3.0
+        assert list(data["cost_by_model"]) == ["claude-sonnet-4-6"]
+        assert data["daily_costs"][0]["date"] == now.date().isoformat()
+        assert data["conversation_count"] == 1
+        assert data["cache_ratio"] == 0.5
@@ -0,0 +1,67 @@
+"""Tests for the message search API."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from catsyphon.models.db import Conversation, Epoch, Message, Workspace
+
+
+def _seed(db_session: Session, workspace: Workspace, contents: list[str]) -> None:
+    conversation = Conversation(
+        id=uuid.uuid4(),
+        workspace_id=workspace.id,
+        agent_type="claude-code",
+        start_time=datetime.now(UTC),
+    )
+    epoch = Epoch(conversation=conversation, sequence=0, start_time=datetime.now(UTC))
+    db_session.add_all([conversation, epoch])
+    db_session.flush()
+    for i, content in enumerate(contents):
+        db_session.add(
+            Message(
+                epoch_id=epoch.id,
+                conversation_id=conversation.id,
+                role="user",
+                content=content,
+                timestamp=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=i),
+                sequence=i,
+            )
+        )
+    db_session.commit()
+
+
+def test_search_pages_with_cursor(api_client, db_session, sample_workspace):
+    _seed(db_session, sample_workspace, [f"flaky migration {i}" for i in range(3)])
+
+    response = api_client.get("/search", params={"q": "migration", "limit": 2})
+    assert response.status_code == 200
+    first = response.json()
+    assert len(first["items"]) == 2
+    assert "<mark>migration</mark>" in first["items"][0]["snippet"]
+    assert first["next_cursor"]
+
+    response = api_client.get(
+        "/search",
+        params={"q": "migration", "limit": 2, "cursor": first["next_cursor"]},
+    )
+    second = response.json()
+    assert len(second["items"]) == 1
+    assert second["next_cursor"] is None
+    ids = {hit["message_id"] for hit in first["items"] + second["items"]}
+    assert len(ids) == 3
+
+
+def test_search_recent_sort(api_client, db_session, sample_workspace):
+    _seed(db_session, sample_workspace, ["deploy one", "deploy two"])
+
+    response = api_client.get("/search", params={"q": "deploy", "sort": "recent"})
+
+    snippets = [hit["snippet"] for hit in response.json()["items"]]
+    assert snippets == ["<mark>deploy</mark> two", "<mark>deploy</mark> one"]
+
+
+def test_search_rejects_bad_cursor(api_client):
+    response = api_client.get("/search", params={"q": "x", "cursor": "not-a-cursor"})
+    assert response.status_code == 400
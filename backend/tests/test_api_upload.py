@@ -404,3 +404,100 @@ class TestFileUpload:
 
         # Should fail validation (422 Unprocessable Entity)
         assert response.status_code == 422
+
+
+class TestStreamingUpload:
+    """Tests for the streaming upload endpoint."""
+
+    def test_stream_upload_ingests_in_chunks(
+        self, api_client, sample_jsonl_content: str
+    ):
+        """Body sent in pieces is ingested and tracked under one job."""
+        body = sample_jsonl_content.encode()
+
+        def body_chunks():
+            # Split mid-line so the spool has to hold back a partial line
+            for i in range(0, len(body), 97):
+                yield body[i : i + 97]
+
+        response = api_client.post(
+            "/upload/stream?filename=conversation.jsonl&wait=true",
+            content=body_chunks(),
+        )
+
+        assert response.status_code == 202
+        result = response.json()
+        assert result["status"] == "success"
+        assert result["filename"] == "conversation.jsonl"
+        assert result["conversation_id"] is not None
+        assert result["messages_added"] == 2
+
+        job = api_client.get(f"/ingestion/jobs/{result['job_id']}")
+        assert job.status_code == 200
+        assert job.json()["status"] == "success"
+        assert job.json()["source_type"] == "upload"
+        assert job.json()["conversation_id"] == result["conversation_id"]
+        assert job.json()["messages_added"] == 2
+
+    def test_stream_upload_rejects_non_jsonl(self, api_client):
+        """Only .jsonl filenames are accepted."""
+        response = api_client.post(
+            "/upload/stream?filename=conversation.txt", content=b"{}\n"
+        )
+
+        assert response.status_code == 400
+
+    def test_stream_upload_requires_filename(self, api_client):
+        """The filename query parameter is required."""
+        response = api_client.post("/upload/stream", content=b"{}\n")
+
+        assert response.status_code == 422
+
+    def test_stream_upload_malformed_fails_job(self, api_client):
+        """Unparseable uploads mark the job as failed."""
+        response = api_client.post(
+            "/upload/stream?filename=conversation.jsonl&wait=true",
+            content=b"not json at all\n",
+        )
+
+        assert response.status_code == 202
+        assert response.json()["status"] == "failed"
+        assert response.json()["error"]
+
+
+class TestUploadSpool:
+    """Tests for the spool shared by streaming uploads and their worker."""
+
+    def test_only_complete_lines_are_visible(self):
+        from catsyphon.services.streaming_upload import UploadSpool
+
+        spool = UploadSpool("session.jsonl")
+        try:
+            assert spool.path.name == "session.jsonl"
+            spool.write(b'{"a": 1}\n{"b"')
+            assert spool.size == len(b'{"a": 1}\n')
+            assert spool.path.read_bytes() == b'{"a": 1}\n'
+
+            spool.write(b": 2}")
+            spool.close()
+            assert spool.closed
+            assert spool.path.read_bytes() == b'{"a": 1}\n{"b": 2}'
+            assert spool.write(b"more\n") is False
+        finally:
+            spool.discard()
+        assert not spool.path.exists()
+
+    def test_abort_wakes_waiting_reader(self):
+        import threading
+
+        from catsyphon.services.streaming_upload import UploadSpool
+
+        spool = UploadSpool("session.jsonl")
+        waiter = threading.Thread(target=spool.wait_for, args=(1024,))
+        waiter.start()
+        spool.abort()
+        waiter.join(timeout=5)
+
+        assert not waiter.is_alive()
+        assert spool.aborted
+        spool.discard()
@@ -0,0 +1,132 @@
+"""Tests for parallel multi-file ingestion."""
+
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pytest
+
+from catsyphon.db.repositories import ConversationRepository
+from catsyphon.services import batch_ingest
+from catsyphon.services.batch_ingest import (
+    _ingest_order,
+    _parent_in_database,
+    ingest_files_parallel,
+)
+
+
+def _line(session_id: str, uuid: str, ts: str, agent_id: str | None = None) -> str:
+    agent = f'"agentId":"{agent_id}","isSidechain":true,' if agent_id else ""
+    return (
+        f'{{"sessionId":"{session_id}",{agent}"version":"2.0.17","type":"user",'
+        f'"message":{{"role":"user","content":"Hi"}},"uuid":"{uuid}",'
+        f'"timestamp":"{ts}"}}\n'
+    )
+
+
+@pytest.fixture
+def session_factory(db_session):
+    # Writer threads and parent lookups share the test session
+    lock = threading.Lock()
+
+    @contextmanager
+    def factory():
+        with lock:
+            yield db_session
+
+    return factory
+
+
+def test_agent_logs_queued_after_main_logs():
+    files = [Path("b/agent-1.jsonl"), Path("b/main.jsonl"), Path("a/agent-2.jsonl")]
+
+    assert sorted(files, key=_ingest_order) == [
+        Path("b/main.jsonl"),
+        Path("a/agent-2.jsonl"),
+        Path("b/agent-1.jsonl"),
+    ]
+
+
+def test_parallel_ingest_stores_files_and_links_agents(
+    db_session, sample_workspace, session_factory, tmp_path
+):
+    (tmp_path / "parent-1.jsonl").write_text(
+        _line("parent-1", "m1", "2025-01-01T00:00:00Z")
+    )
+    (tmp_path / "agent-a1.jsonl").write_text(
+        _line("parent-1", "a1", "2025-01-01T00:00:05Z", agent_id="a1")
+    )
+    (tmp_path / "other.jsonl").write_text(
+        _line("other-1", "o1", "2025-01-01T00:01:00Z")
+    )
+    (tmp_path / "broken.jsonl").write_text("not json\n")
+
+    seen = []
+    results = ingest_files_parallel(
+        sorted(tmp_path.glob("*.jsonl")),
+        workspace_id=sample_workspace.id,
+        session_factory=session_factory,
+        workers=2,
+        writers=1,
+        on_result=seen.append,
+    )
+
+    assert seen == results
+    statuses = {r.file_path.name: r.outcome.status for r in results}
+    assert statuses["parent-1.jsonl"] == "success"
+    assert statuses["agent-a1.jsonl"] == "success"
+    assert statuses["other.jsonl"] == "success"
+    assert statuses["broken.jsonl"] == "error"
+
+    names = [r.file_path.name for r in results]
+    assert names.index("parent-1.jsonl") < names.index("agent-a1.jsonl")
+
+    by_name = {r.file_path.name: r.outcome.conversation_id for r in results}
+    repo = ConversationRepository(db_session)
+    agent = repo.get(by_name["agent-a1.jsonl"])
+    assert agent.conversation_type == "agent"
+    assert agent.parent_conversation_id == by_name["parent-1.jsonl"]
+
+
+def test_parent_in_database(sample_workspace, session_factory, tmp_path):
+    parent_log = tmp_path / "parent-1.jsonl"
+    parent_log.write_text(_line("parent-1", "m1", "2025-01-01T00:00:00Z"))
+
+    assert _parent_in_database(session_factory, "parent-1") is False
+    ingest_files_parallel(
+        [parent_log],
+        workspace_id=sample_workspace.id,
+        session_factory=session_factory,
+        workers=1,
+        writers=1,
+    )
+    assert _parent_in_database(session_factory, "parent-1") is True
+
+
+def test_agents_beyond_hold_cap_are_stored_as_orphans_and_linked(
+    db_session, sample_workspace, session_factory, tmp_path, monkeypatch
+):
+    monkeypatch.setattr(batch_ingest, "_MAX_HELD_FILES", 0)
+    (tmp_path / "parent-1.jsonl").write_text(
+        _line("parent-1", "m1", "2025-01-01T00:00:00Z")
+    )
+    for agent_id in ("a1", "a2"):
+        (tmp_path / f"agent-{agent_id}.jsonl").write_text(
+            _line("parent-1", agent_id, "2025-01-01T00:00:05Z", agent_id=agent_id)
+        )
+
+    results = ingest_files_parallel(
+        sorted(tmp_path.glob("*.jsonl")),
+        workspace_id=sample_workspace.id,
+        session_factory=session_factory,
+        workers=2,
+        writers=1,
+    )
+
+    assert {r.outcome.status for r in results} == {"success"}
+    by_name = {r.file_path.name: r.outcome.conversation_id for r in results}
+    repo = ConversationRepository(db_session)
+    for name in ("agent-a1.jsonl", "agent-a2.jsonl"):
+        assert (
+            repo.get(by_name[name]).parent_conversation_id == by_name["parent-1.jsonl"]
+        )
@@ -1,15 +1,19 @@
 """Integration tests for CanonicalRepository."""
 
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import uuid4
 
+import pytest
 from sqlalchemy.dialects import postgresql
 
+from catsyphon.canonicalization import Canonicalizer, CanonicalType
 from catsyphon.canonicalization.version import CANONICAL_VERSION
 from catsyphon.db.repositories.canonical import (
     CanonicalRepository,
     _build_postgres_upsert_stmt,
 )
+from catsyphon.db.repositories.message import MessageRepository
+from catsyphon.models.db import Message
 
 
 def test_get_cached_returns_none_when_no_cache(test_session):
@@ -287,3 +291,110 @@ def test_postgres_upsert_uses_metadata_column_for_jsonb() -> None:
     assert "canonical_metadata" not in sql
     assert "metadata" in sql
     assert "metadata = %(param_" in sql
+
+
+def _append_messages(session, conversation, epoch, start: int, count: int) -> None:
+    base = datetime(2025, 1, 1)
+    for i in range(start, start + count):
+        session.add(
+            Message(
+                conversation_id=conversation.id,
+                epoch_id=epoch.id,
+                role="assistant" if i % 2 else "user",
+                content=f"message {i}" + (" failed" if i % 9 == 0 else ""),
+                tool_calls=[{"tool_name": "Read"}] if i % 4 == 0 else [],
+                timestamp=base + timedelta(seconds=i),
+                sequence=i,
+            )
+        )
+    conversation.message_count = start + count
+    session.flush()
+
+
+def _generate(repo, conversation):
+    return repo.get_or_generate(
+        conversation=conversation,
+        canonical_type=CanonicalType.TAGGING,
+        regeneration_threshold_tokens=0,
+    )
+
+
+def test_get_or_generate_extends_canonical_of_grown_conversation(
+    test_session, sample_conversation, sample_epoch, monkeypatch
+):
+    """Only messages appended after the watermark are sampled on regeneration."""
+    repo = CanonicalRepository(test_session)
+    _append_messages(test_session, sample_conversation, sample_epoch, 0, 40)
+    first = _generate(repo, sample_conversation)
+    assert first.sampler_state["message_count"] == 40
+
+    _append_messages(test_session, sample_conversation, sample_epoch, 40, 25)
+
+    def full_scan(*args, **kwargs):
+        raise AssertionError("conversation was re-sampled from scratch")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(MessageRepository, "epoch_message_bounds", full_scan)
+        extended = _generate(repo, sample_conversation)
+
+    rebuilt = Canonicalizer(canonical_type=CanonicalType.TAGGING).canonicalize(
+        sample_conversation
+    )
+    assert extended.sampler_state["message_count"] == 65
+    assert extended.sampler_state["watermark"][0] == 64
+    assert extended.narrative == rebuilt.narrative
+    assert repo.get_cached(sample_conversation.id, "tagging").sampler_state == (
+        extended.sampler_state
+    )
+
+
+def test_get_or_generate_rebuilds_rewritten_conversation(
+    test_session, sample_conversation, sample_epoch
+):
+    """A conversation whose sampled history changed is re-sampled in full."""
+    repo = CanonicalRepository(test_session)
+    _append_messages(test_session, sample_conversation, sample_epoch, 0, 20)
+    _generate(repo, sample_conversation)
+
+    first = test_session.query(Message).filter_by(sequence=0).one()
+    test_session.delete(first)
+    _append_messages(test_session, sample_conversation, sample_epoch, 20, 5)
+
+    canonical = _generate(repo, sample_conversation)
+
+    assert canonical.sampler_state["message_count"] == 24
+    assert "message 0 failed" not in canonical.narrative
+    assert "message 24" in canonical.narrative
+
+
+@pytest.mark.parametrize("budget_change", [True, False])
+def test_get_or_generate_ignores_state_from_other_config(
+    test_session, sample_conversation, sample_epoch, budget_change, monkeypatch
+):
+    """Stored sampler state is only reused with the config that produced it."""
+    repo = CanonicalRepository(test_session)
+    _append_messages(test_session, sample_conversation, sample_epoch, 0, 10)
+    _generate(repo, sample_conversation)
+    _append_messages(test_session, sample_conversation, sample_epoch, 10, 5)
+
+    canonicalizer = Canonicalizer(canonical_type=CanonicalType.TAGGING)
+    if budget_change:
+        canonicalizer.config.token_budget = 4000
+    else:
+        canonicalizer.config.include_thinking = False
+    calls = []
+    original = MessageRepository.epoch_message_bounds
+
+    def spy(self, conversation_id):
+        calls.append(conversation_id)
+        return original(self, conversation_id)
+
+    monkeypatch.setattr(MessageRepository, "epoch_message_bounds", spy)
+    repo.get_or_generate(
+        conversation=sample_conversation,
+        canonical_type=CanonicalType.TAGGING,
+        canonicalizer=canonicalizer,
+        regeneration_threshold_tokens=0,
+    )
+
+    assert calls == [sample_conversation.id]
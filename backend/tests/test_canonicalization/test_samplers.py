@@ -2,14 +2,19 @@
 
 from datetime import datetime
 
+from sqlalchemy import inspect
+
+from catsyphon.canonicalization import Canonicalizer, CanonicalType
 from catsyphon.canonicalization.models import CanonicalConfig
 from catsyphon.canonicalization.samplers import (
     ChronologicalSampler,
+    MessageSummary,
     SampledMessage,
     SemanticSampler,
 )
-from catsyphon.canonicalization.tokens import TokenCounter
-from catsyphon.models.db import Message
+from catsyphon.canonicalization.tokens import TokenCounter, message_token_counts
+from catsyphon.db.repositories.message import MessageRepository
+from catsyphon.models.db import Epoch, FileTouched, Message
 
 # ===== ChronologicalSampler Tests =====
 
@@ -138,7 +143,9 @@ def test_chronological_sampler_ignores_budget(
 
     # Use small budget
     result = sampler.sample(
-        messages=messages, epochs=[sample_epoch], token_budget=100  # Very small budget
+        messages=messages,
+        epochs=[sample_epoch],
+        token_budget=100,  # Very small budget
     )
 
     # Should still include all messages despite small budget
@@ -496,3 +503,197 @@ def test_chronological_sampler_returns_sampled_message_objects(sample_message):
     assert hasattr(result[0], "priority")
     assert hasattr(result[0], "reason")
     assert hasattr(result[0], "estimated_tokens")
+
+
+# ===== Stored token counts =====
+
+
+def test_sampler_uses_token_counts_stored_at_ingest():
+    """Messages with ingest-time counts are not re-encoded."""
+    config = CanonicalConfig(max_message_chars=1000, max_thinking_chars=1000)
+    sampler = SemanticSampler(config, TokenCounter(model="gpt-4o-mini"))
+    message = Message(
+        role="assistant",
+        content="short reply",
+        content_tokens=7,
+        thinking_content="some reasoning",
+        thinking_tokens=5,
+        sequence=0,
+    )
+
+    # 10 for role/timestamp structure + stored counts
+    assert sampler._estimate_message_tokens(message) == 10 + 7 + 5
+
+
+def test_sampler_scales_stored_counts_for_truncated_text():
+    """Truncated text uses the kept fraction of the stored count."""
+    config = CanonicalConfig(max_message_chars=100)
+    sampler = SemanticSampler(config, TokenCounter(model="gpt-4o-mini"))
+    message = Message(
+        role="assistant", content="x" * 400, content_tokens=200, sequence=0
+    )
+
+    assert sampler._estimate_message_tokens(message) == 10 + 50 + 1
+
+
+# ===== Streamed sampling =====
+
+
+def _long_session(test_session, conversation, first_epoch) -> list[Message]:
+    """60 messages over two epochs, mixing errors, tools, thinking and code."""
+    second_epoch = Epoch(
+        conversation_id=conversation.id, sequence=1, start_time=datetime.now()
+    )
+    test_session.add(second_epoch)
+    test_session.flush()
+
+    messages = []
+    for i in range(60):
+        content = f"Step {i}: " + ("Traceback: boom" if i % 11 == 0 else "ok " * i)
+        thinking = "weighing options " * 3 if i % 7 == 0 else None
+        message = Message(
+            conversation_id=conversation.id,
+            epoch_id=(first_epoch if i < 30 else second_epoch).id,
+            role="assistant" if i % 2 else "user",
+            content=content,
+            thinking_content=thinking,
+            tool_calls=[{"tool_name": "Bash"}] * (i % 5 == 0),
+            code_changes=[{"lines_added": 1}] if i % 13 == 0 else [],
+            timestamp=datetime.now(),
+            sequence=i,
+        )
+        # Every third message predates stored counts
+        if i % 3:
+            for key, value in message_token_counts(content, thinking).items():
+                setattr(message, key, value)
+        test_session.add(message)
+        messages.append(message)
+    test_session.flush()
+    return messages
+
+
+def test_streamed_sampling_matches_in_memory_sampling(
+    test_session, sample_conversation, sample_epoch
+):
+    """Streaming summaries selects the same messages as sampling loaded ones."""
+    messages = _long_session(test_session, sample_conversation, sample_epoch)
+    epochs = test_session.query(Epoch).all()
+    sampler = SemanticSampler(CanonicalConfig(), TokenCounter(model="gpt-4o-mini"))
+    repo = MessageRepository(test_session)
+    bounds = repo.epoch_message_bounds(sample_conversation.id)
+
+    in_memory = sampler.sample(messages=messages, epochs=epochs, token_budget=400)
+    streamed, _ = sampler.sample_stream(
+        summaries=(
+            MessageSummary(**row._mapping)
+            for row in repo.iter_sampling_summaries(
+                sample_conversation.id, SemanticSampler.ERROR_PATTERNS, batch_size=7
+            )
+        ),
+        epoch_bounds={epoch_id: (lo, hi) for epoch_id, (lo, hi, _) in bounds.items()},
+        message_count=60,
+        token_budget=400,
+        load_messages=repo.get_for_rendering,
+    )
+
+    assert 2 < len(streamed) < 60
+    assert [(sm.message.id, sm.reason, sm.estimated_tokens) for sm in streamed] == [
+        (sm.message.id, sm.reason, sm.estimated_tokens) for sm in in_memory
+    ]
+
+
+def test_streamed_epoch_boundaries_with_shared_sequences(
+    test_session, sample_conversation, sample_epoch
+):
+    """Only each epoch's first and last message are boundaries when
+    collector batches give messages the same sequence."""
+    second_epoch = Epoch(
+        conversation_id=sample_conversation.id, sequence=1, start_time=datetime.now()
+    )
+    test_session.add(second_epoch)
+    test_session.flush()
+    messages = [
+        Message(
+            conversation_id=sample_conversation.id,
+            epoch_id=(sample_epoch if i < 4 else second_epoch).id,
+            role="assistant",
+            content=f"message {i}",
+            timestamp=datetime(2026, 1, 1, 12, i),
+            sequence=i // 4,
+        )
+        for i in range(8)
+    ]
+    test_session.add_all(messages)
+    test_session.flush()
+    sampler = SemanticSampler(CanonicalConfig(), TokenCounter(model="gpt-4o-mini"))
+    repo = MessageRepository(test_session)
+    bounds = repo.epoch_message_bounds(sample_conversation.id)
+
+    assert bounds == {
+        sample_epoch.id: (messages[0].id, messages[3].id, 4),
+        second_epoch.id: (messages[4].id, messages[7].id, 4),
+    }
+
+    streamed, _ = sampler.sample_stream(
+        summaries=(
+            MessageSummary(**row._mapping)
+            for row in repo.iter_sampling_summaries(
+                sample_conversation.id, SemanticSampler.ERROR_PATTERNS
+            )
+        ),
+        epoch_bounds={
+            epoch_id: (first, last) for epoch_id, (first, last, _) in bounds.items()
+        },
+        message_count=8,
+        token_budget=4000,
+        load_messages=repo.get_for_rendering,
+    )
+
+    assert len(streamed) == 8
+    assert {sm.message.id for sm in streamed if "epoch-boundary" in sm.reason} == {
+        messages[i].id for i in (0, 3, 4, 7)
+    }
+
+
+def test_canonicalizer_streams_unloaded_messages(
+    test_session, sample_conversation, sample_epoch
+):
+    """Canonicalizing never loads the conversation's full message list."""
+    messages = _long_session(test_session, sample_conversation, sample_epoch)
+    test_session.expire(sample_conversation, ["messages"])
+
+    canonical = Canonicalizer(canonical_type=CanonicalType.TAGGING).canonicalize(
+        sample_conversation
+    )
+
+    assert "messages" in inspect(sample_conversation).unloaded
+    assert messages[0].content in canonical.narrative
+    assert messages[-1].content in canonical.narrative
+    assert canonical.has_errors
+    assert canonical.tools_used == ["Bash"]
+
+
+def test_canonicalizer_queries_unloaded_files_touched(
+    test_session, sample_conversation, sample_epoch
+):
+    """Files touched are read as columns, not loaded as FileTouched objects."""
+    for path, change_type in [("src/app.py", "edit"), ("README.md", "create")]:
+        test_session.add(
+            FileTouched(
+                conversation_id=sample_conversation.id,
+                epoch_id=sample_epoch.id,
+                file_path=path,
+                change_type=change_type,
+                timestamp=datetime(2025, 1, 1, 10, 0, 0),
+            )
+        )
+    test_session.flush()
+    test_session.expire(sample_conversation, ["files_touched"])
+
+    canonicalizer = Canonicalizer(canonical_type=CanonicalType.TAGGING)
+    canonical = canonicalizer.canonicalize(sample_conversation)
+
+    assert "files_touched" in inspect(sample_conversation).unloaded
+    assert sorted(canonical.files_touched) == ["README.md", "src/app.py"]
+    assert canonical.files_count == 2
+    assert "Files: 2" in canonical.narrative
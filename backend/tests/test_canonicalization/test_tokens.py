@@ -2,7 +2,13 @@
 
 import pytest
 
-from catsyphon.canonicalization.tokens import BudgetAllocator, TokenCounter
+from catsyphon.canonicalization.tokens import (
+    ESTIMATE_PREFIX_CHARS,
+    BudgetAllocator,
+    TokenCounter,
+    get_token_counter,
+    message_token_counts,
+)
 
 
 class TestTokenCounter:
@@ -105,3 +111,33 @@ class TestBudgetAllocator:
         assert summary["component_a"]["allocated"] == 500
         assert summary["component_a"]["spent"] == 200
         assert summary["component_a"]["remaining"] == 300
+
+
+class TestSharedCounting:
+    """Test process-wide counters and ingest-time message counts."""
+
+    def test_get_token_counter_is_shared(self):
+        """Test that counters (and their encodings) are created once."""
+        assert get_token_counter("gpt-4o-mini") is get_token_counter("gpt-4o-mini")
+        assert TokenCounter().encoding is TokenCounter().encoding
+
+    def test_message_token_counts(self):
+        """Test counts stored on messages at ingest."""
+        counts = message_token_counts("Hello, world!", None)
+
+        assert counts["content_tokens"] == TokenCounter().count("Hello, world!")
+        assert counts["thinking_tokens"] is None
+        assert message_token_counts(None, "hmm")["content_tokens"] == 0
+
+    def test_long_message_counts_are_estimated_from_prefix(self):
+        """Test that ingest counts long text from a bounded prefix."""
+        counter = TokenCounter()
+        text = "def handler(event):\n    return event['id']\n" * 2000
+        assert len(text) > ESTIMATE_PREFIX_CHARS
+
+        estimated = message_token_counts(text, None)["content_tokens"]
+        exact = message_token_counts(text, None, exact=True)["content_tokens"]
+
+        assert exact == counter.count(text)
+        assert estimated == counter.estimate(text)
+        assert abs(estimated - exact) <= exact * 0.05
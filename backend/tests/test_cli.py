@@ -351,6 +351,31 @@ class TestIngestCommand:
         finally:
             Path(temp_path).unlink(missing_ok=True)
 
+    def test_ingest_directory_with_workers(self, db_session, sample_workspace):
+        """Test that --workers ingests a directory through the parallel path."""
+
+        @contextmanager
+        def mock_db_session():
+            yield db_session
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            for i in range(3):
+                (Path(temp_dir) / f"session-{i}.jsonl").write_text(
+                    f'{{"sessionId":"workers-{i}","version":"2.0.17","type":"user",'
+                    '"message":{"role":"user","content":"Test"},"uuid":"msg-1",'
+                    '"timestamp":"2025-01-01T00:00:00Z"}\n'
+                )
+
+            with patch("catsyphon.db.connection.db_session", mock_db_session):
+                result = runner.invoke(
+                    app, ["ingest", temp_dir, "--workers", "2", "--writers", "1"]
+                )
+
+        assert result.exit_code == 0
+        assert "Workers: 2" in result.stdout
+        assert "Successful: 3" in result.stdout
+        assert "Failed: 0" in result.stdout
+
 
 class TestServeCommand:
     """Tests for serve command."""
@@ -0,0 +1,262 @@
+"""Tests for the collector client's batching and pipelined send mode."""
+
+import asyncio
+import json
+import threading
+
+import httpx
+import pytest
+import zstandard
+
+from catsyphon.collector_client import (
+    MAX_BATCH_EVENTS,
+    CollectorClient,
+    CollectorConfig,
+)
+from catsyphon.utils.wire_format import PayloadTooLargeError, decode_body
+
+
+def _events(count: int, padding: int = 0) -> list[dict]:
+    return [
+        {
+            "type": "message",
+            "emitted_at": f"2026-01-01T00:00:{i % 60:02d}+00:00",
+            "observed_at": "2026-01-01T00:00:00+00:00",
+            "event_hash": f"{i:032x}",
+            "data": {"index": i, "content": "x" * padding},
+        }
+        for i in range(count)
+    ]
+
+
+def _config(**overrides) -> CollectorConfig:
+    values = {
+        "server_url": "http://catsyphon.test",
+        "api_key": "cs_test",
+        "collector_id": "collector-1",
+        "max_retries": 1,
+    }
+    values.update(overrides)
+    return CollectorConfig(**values)
+
+
+def _accepted(request: httpx.Request) -> httpx.Response:
+    payload = json.loads(request.content)
+    return httpx.Response(
+        202,
+        json={
+            "accepted": len(payload["events"]),
+            "conversation_id": "00000000-0000-0000-0000-000000000001",
+        },
+    )
+
+
+class TestBatching:
+    def test_batch_size_capped_at_api_limit(self):
+        config = _config(batch_size=500)
+
+        assert config.batch_size == MAX_BATCH_EVENTS
+
+    def test_batches_bounded_by_bytes(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return _accepted(request)
+
+        config = _config(pipelined=False, batch_size=50, max_batch_bytes=4096)
+        with CollectorClient(config, transport=httpx.MockTransport(handler)) as client:
+            result = client._send_events("session-1", _events(40, padding=500))
+
+        assert result["accepted"] == 40
+        assert result["total_events"] == 40
+        assert len(requests) > 1
+        assert all(len(r.content) <= 4096 for r in requests)
+        sent = [
+            e["data"]["index"]
+            for r in requests
+            for e in json.loads(r.content)["events"]
+        ]
+        assert sent == list(range(40))
+
+    def test_oversized_event_sent_alone(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return _accepted(request)
+
+        config = _config(pipelined=False, max_batch_bytes=1024)
+        with CollectorClient(config, transport=httpx.MockTransport(handler)) as client:
+            result = client._send_events("session-1", _events(3, padding=2048))
+
+        assert result["accepted"] == 3
+        assert [len(json.loads(r.content)["events"]) for r in requests] == [1, 1, 1]
+
+
+class TestPipelinedSends:
+    def test_session_batches_arrive_in_order(self):
+        arrivals: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            events = json.loads(request.content)["events"]
+            # Later batches answer faster; ordering must still hold
+            await asyncio.sleep(0.01 if events[0]["data"]["index"] == 0 else 0)
+            arrivals.extend(e["data"]["index"] for e in events)
+            return _accepted(request)
+
+        config = _config(batch_size=5, max_in_flight=3)
+        with CollectorClient(
+            config, async_transport=httpx.MockTransport(handler)
+        ) as client:
+            result = client._send_events("session-1", iter(_events(42)))
+
+        assert arrivals == list(range(42))
+        assert result["accepted"] == 42
+        assert result["total_events"] == 42
+        assert result["conversation_id"] is not None
+
+    def test_failed_batch_stops_later_batches(self):
+        posted: list[int] = []
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            first = json.loads(request.content)["events"][0]["data"]["index"]
+            posted.append(first)
+            if first == 5:
+                return httpx.Response(400, json={"detail": "bad batch"})
+            return _accepted(request)
+
+        config = _config(batch_size=5, max_in_flight=4)
+        with CollectorClient(
+            config, async_transport=httpx.MockTransport(handler)
+        ) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                client._send_events("session-1", _events(30))
+
+        assert posted == [0, 5]
+
+    def test_sessions_are_sent_concurrently(self):
+        active = 0
+        peak = 0
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.02)
+            active -= 1
+            return _accepted(request)
+
+        config = _config(batch_size=5)
+        with CollectorClient(
+            config, async_transport=httpx.MockTransport(handler)
+        ) as client:
+            threads = [
+                threading.Thread(
+                    target=client._send_events, args=(f"session-{i}", _events(10))
+                )
+                for i in range(3)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+
+        assert peak > 1
+
+
+class TestWireFormatNegotiation:
+    ADVERTISED = {
+        "Accept-Post": "application/msgpack, application/json",
+        "Accept-Encoding": "zstd, gzip",
+    }
+
+    @staticmethod
+    def _decode(request: httpx.Request) -> dict:
+        return decode_body(
+            request.content,
+            request.headers.get("content-type"),
+            request.headers.get("content-encoding"),
+            max_bytes=1 << 24,
+        )
+
+    def test_upgrades_after_advertisement(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            count = len(self._decode(request)["events"])
+            return httpx.Response(
+                202, json={"accepted": count}, headers=self.ADVERTISED
+            )
+
+        config = _config(pipelined=False, batch_size=5)
+        with CollectorClient(config, transport=httpx.MockTransport(handler)) as client:
+            result = client._send_events("session-1", _events(10, padding=500))
+
+        assert result["accepted"] == 10
+        assert requests[0].headers["content-type"] == "application/json"
+        assert "content-encoding" not in requests[0].headers
+        assert requests[1].headers["content-type"] == "application/msgpack"
+        assert requests[1].headers["content-encoding"] == "zstd"
+        sent = [e["data"]["index"] for r in requests for e in self._decode(r)["events"]]
+        assert sent == list(range(10))
+
+    def test_falls_back_to_json_on_415(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers["content-type"] != "application/json":
+                return httpx.Response(415, json={"detail": "unsupported"})
+            count = len(json.loads(request.content)["events"])
+            return httpx.Response(202, json={"accepted": count})
+
+        config = _config(pipelined=False, batch_size=5)
+        with CollectorClient(config, transport=httpx.MockTransport(handler)) as client:
+            client._wire_format = client._wire_format.negotiate(
+                self.ADVERTISED["Accept-Post"], self.ADVERTISED["Accept-Encoding"]
+            )
+            result = client._send_events("session-1", _events(10, padding=500))
+
+        assert result["accepted"] == 10
+        assert [r.headers["content-type"] for r in requests] == [
+            "application/msgpack",
+            "application/json",
+            "application/json",
+        ]
+
+
+_ZstdDecompressor = zstandard.ZstdDecompressor
+
+
+class _ShortReadDecompressor:
+    """ZstdDecompressor whose stream reader returns a few bytes per read."""
+
+    def stream_reader(self, source):
+        reader = _ZstdDecompressor().stream_reader(source)
+
+        class ShortReader:
+            def read(self, size: int) -> bytes:
+                return reader.read(min(size, 7))
+
+        return ShortReader()
+
+
+class TestDecodeBody:
+    def test_zstd_short_reads_are_completed(self, monkeypatch):
+        body = json.dumps({"session_id": "s", "events": _events(3)}).encode()
+        compressed = zstandard.ZstdCompressor().compress(body)
+        monkeypatch.setattr(zstandard, "ZstdDecompressor", _ShortReadDecompressor)
+
+        payload = decode_body(compressed, "application/json", "zstd", len(body))
+
+        assert len(payload["events"]) == 3
+
+    def test_zstd_limit_enforced_across_reads(self, monkeypatch):
+        body = json.dumps({"session_id": "s", "events": _events(3)}).encode()
+        compressed = zstandard.ZstdCompressor().compress(body)
+        monkeypatch.setattr(zstandard, "ZstdDecompressor", _ShortReadDecompressor)
+
+        with pytest.raises(PayloadTooLargeError):
+            decode_body(compressed, "application/json", "zstd", len(body) - 1)
@@ -206,6 +206,45 @@ class TestFileHashTracking:
         # raw_content should remain deferred until explicitly accessed.
         assert "raw_content" not in rows[0].__dict__
 
+    def test_iter_directory_state_streams_in_path_order(
+        self,
+        db_session: Session,
+        sample_parsed_conversation: ParsedConversation,
+        tmp_path: Path,
+    ):
+        """Test startup-scan state streams every tracked file, sorted by path."""
+        conv = ingest_conversation(
+            session=db_session,
+            parsed=sample_parsed_conversation,
+            project_name="test-project",
+        )
+        raw_log_repo = RawLogRepository(db_session)
+        names = ["b.jsonl", "a/z.jsonl", "a-c.jsonl", "a.jsonl", "c.jsonl"]
+        for name in names:
+            test_file = tmp_path / name
+            test_file.parent.mkdir(exist_ok=True)
+            test_file.write_text(f'{{"file": "{name}"}}')
+            raw_log_repo.create_from_file(
+                conversation_id=conv.id,
+                agent_type="claude-code",
+                log_format="jsonl",
+                file_path=test_file,
+                store_raw_content=False,
+            )
+        db_session.commit()
+
+        rows = list(raw_log_repo.iter_directory_state(str(tmp_path), batch_size=2))
+
+        assert [row.file_path for row in rows] == sorted(
+            str(tmp_path / name) for name in names
+        )
+        assert all(
+            row.file_mtime == Path(row.file_path).stat().st_mtime for row in rows
+        )
+
+        raw_log_repo.set_file_mtimes({rows[0].id: 123.5})
+        assert raw_log_repo.get(rows[0].id).file_mtime == 123.5
+
     def test_exists_by_file_hash(
         self,
         db_session: Session,
@@ -4,7 +4,15 @@ from pathlib import Path
 
 import pytest
 
-from catsyphon.utils.hashing import calculate_content_hash, calculate_file_hash
+from catsyphon.utils.hashing import (
+    PARTIAL_HASH_BLOCK_SIZE,
+    PartialHashState,
+    advance_partial_hash,
+    calculate_content_hash,
+    calculate_file_hash,
+    calculate_partial_hash,
+    verify_partial_hash,
+)
 
 
 class TestCalculateFileHash:
@@ -219,3 +227,72 @@ class TestHashConsistency:
         content_hash = calculate_content_hash(jsonl_content)
 
         assert file_hash == content_hash
+
+
+class TestAdvancePartialHash:
+    """Tests for chained, resumable partial hashing."""
+
+    def _write_blocks(self, path: Path, n_bytes: int) -> bytes:
+        data = bytes(i % 251 for i in range(n_bytes))
+        path.write_bytes(data)
+        return data
+
+    def test_matches_plain_hash_below_one_block(self, tmp_path: Path):
+        """Short prefixes hash identically to calculate_partial_hash."""
+        file = tmp_path / "small.jsonl"
+        file.write_text('{"a": 1}\n{"b": 2}\n')
+
+        partial_hash, state = advance_partial_hash(file, 9)
+
+        assert partial_hash == calculate_partial_hash(file, 9)
+        assert state.blocks == 0
+        assert state.resume_offset == 0
+
+    def test_resumed_hash_equals_from_scratch(self, tmp_path: Path):
+        """Resuming across block boundaries gives the same chained hash."""
+        file = tmp_path / "big.jsonl"
+        total = int(PARTIAL_HASH_BLOCK_SIZE * 2.5)
+        self._write_blocks(file, total)
+
+        first_hash, state = advance_partial_hash(file, PARTIAL_HASH_BLOCK_SIZE + 10)
+        resumed_hash, resumed_state = advance_partial_hash(file, total, state)
+        scratch_hash, scratch_state = advance_partial_hash(file, total)
+
+        assert state.blocks == 1
+        assert resumed_hash == scratch_hash
+        assert resumed_state == scratch_state
+        assert resumed_state.blocks == 2
+        assert first_hash != resumed_hash
+
+    def test_state_beyond_offset_is_ignored(self, tmp_path: Path):
+        """A state past the requested offset restarts from byte 0."""
+        file = tmp_path / "big.jsonl"
+        self._write_blocks(file, PARTIAL_HASH_BLOCK_SIZE * 2)
+
+        _, state = advance_partial_hash(file, PARTIAL_HASH_BLOCK_SIZE * 2)
+        partial_hash, _ = advance_partial_hash(file, 100, state)
+
+        assert partial_hash == calculate_partial_hash(file, 100)
+
+    def test_state_round_trips_through_dict(self):
+        """State serializes for storage and rejects malformed input."""
+        state = PartialHashState(blocks=3, chain="ab" * 32)
+
+        assert PartialHashState.from_dict(state.to_dict()) == state
+        assert PartialHashState.from_dict(None) is None
+        assert PartialHashState.from_dict({"blocks": "x"}) is None
+
+    def test_verify_detects_changes_anywhere_in_prefix(self, tmp_path: Path):
+        """Verification re-hashes the whole prefix, not just its ends."""
+        file = tmp_path / "big.jsonl"
+        data = self._write_blocks(file, PARTIAL_HASH_BLOCK_SIZE * 2 + 500)
+        offset = len(data)
+        partial_hash, _ = advance_partial_hash(file, offset)
+
+        assert verify_partial_hash(file, offset, partial_hash)
+
+        for position in (0, PARTIAL_HASH_BLOCK_SIZE + 10, offset - 1):
+            edited = bytearray(data)
+            edited[position] ^= 0xFF
+            file.write_bytes(bytes(edited))
+            assert not verify_partial_hash(file, offset, partial_hash)
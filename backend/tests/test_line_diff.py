@@ -0,0 +1,76 @@
+"""Tests for line diff counting."""
+
+import random
+
+import pytest
+
+from catsyphon.utils import line_diff
+from catsyphon.utils.line_diff import diff_counts, diff_line_counts
+
+
+def _lcs_counts(old: list[str], new: list[str]) -> tuple[int, int]:
+    """Reference (added, deleted) from a dynamic-programming LCS."""
+    lengths = [[0] * (len(new) + 1) for _ in range(len(old) + 1)]
+    for i, a in enumerate(old):
+        for j, b in enumerate(new):
+            lengths[i + 1][j + 1] = (
+                lengths[i][j] + 1
+                if a == b
+                else max(lengths[i][j + 1], lengths[i + 1][j])
+            )
+    common = lengths[len(old)][len(new)]
+    return len(new) - common, len(old) - common
+
+
+class TestDiffLineCounts:
+    """Tests for diff_line_counts."""
+
+    def test_identical(self):
+        assert diff_line_counts("a\nb\n", "a\nb\n") == (0, 0)
+
+    def test_empty_sides(self):
+        assert diff_line_counts("", "a\nb\nc") == (3, 0)
+        assert diff_line_counts("a\nb", "") == (0, 2)
+
+    def test_single_line_change_with_context(self):
+        old = "def f():\n    x = 1\n    return x\n"
+        new = "def f():\n    x = 2\n    return x\n"
+
+        assert diff_line_counts(old, new) == (1, 1)
+
+    def test_insertion_and_deletion(self):
+        old = "a\nb\nc\nd"
+        new = "a\nx\nb\nd"
+
+        assert diff_line_counts(old, new) == (1, 1)
+
+    def test_moved_block(self):
+        old = "a\nb\nc\nd\ne"
+        new = "d\ne\na\nb\nc"
+
+        assert diff_line_counts(old, new) == (2, 2)
+
+    def test_matches_reference_lcs(self):
+        rng = random.Random(7)
+        for _ in range(500):
+            old = [rng.choice("abcdef") for _ in range(rng.randint(0, 25))]
+            new = [rng.choice("abcdef") for _ in range(rng.randint(0, 25))]
+
+            assert diff_counts(old, new) == _lcs_counts(old, new)
+
+    def test_large_dissimilar_input_uses_fallback(self, monkeypatch):
+        monkeypatch.setattr(line_diff, "MAX_EDIT_COST", 4)
+        old = ["a", "b", "c", "d", "e", "f"]
+        new = ["f", "e", "d", "c", "b", "a"]
+
+        # Multiset fallback treats every shared line as kept
+        assert diff_counts(old, new) == (0, 0)
+
+    @pytest.mark.parametrize("size", [2_000, 20_000])
+    def test_large_edit_is_fast(self, size):
+        old = [f"line {i}" for i in range(size)]
+        new = list(old)
+        new[size // 2] = "changed"
+        new.insert(size // 3, "inserted")
+
+        assert diff_counts(old, new) == (2, 1)
@@ -296,6 +296,25 @@ class TestClaudeCodeParseMessages:
         total = len(chunk1.messages) + len(chunk2.messages)
         assert total == 10  # All messages accounted for
 
+    def test_resumed_hash_state_matches_full_hash(self, tmp_path):
+        from catsyphon.parsers.claude_code import ClaudeCodeParser
+        from catsyphon.parsers.incremental import parse_messages_resumable
+        from catsyphon.utils.hashing import advance_partial_hash
+
+        log_file = _write_claude_log(tmp_path, num_messages=10)
+        parser = ClaudeCodeParser()
+
+        chunk1 = parser.parse_messages(log_file, offset=0, limit=3)
+        chunk2 = parse_messages_resumable(
+            parser, log_file, chunk1.next_offset, chunk1.hash_state
+        )
+
+        expected_hash, expected_state = advance_partial_hash(
+            log_file, chunk2.next_offset
+        )
+        assert chunk2.partial_hash == expected_hash
+        assert chunk2.hash_state == expected_state
+
     def test_empty_file_returns_empty_chunk(self, tmp_path):
         from catsyphon.parsers.claude_code import ClaudeCodeParser
 
@@ -208,6 +208,19 @@ class TestClaudeCodeParserIncremental:
         assert len(result.new_messages) == 1
         assert result.new_messages[0].content == "Valid"
 
+    def test_parse_incremental_rejects_non_utf8(
+        self, parser: ClaudeCodeParser, tmp_path: Path
+    ):
+        """Test that bytes which are not UTF-8 raise ParseFormatError."""
+        log_file = tmp_path / "test.jsonl"
+        log_file.write_bytes(
+            b'{"sessionId":"test-123","type":"user","message":{"content":"\xff"}}\n'
+            b'{"sessionId":"test-123","type":"user"}\n'
+        )
+
+        with pytest.raises(ParseFormatError, match="Cannot read file"):
+            parser.parse_incremental(log_file, 0, 0)
+
     def test_parse_incremental_tracks_timestamp(
         self,
         parser: ClaudeCodeParser,
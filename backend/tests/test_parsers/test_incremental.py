@@ -17,6 +17,7 @@ from catsyphon.parsers.incremental import (
     calculate_partial_hash,
     detect_file_change_type,
 )
+from catsyphon.utils.hashing import PARTIAL_HASH_BLOCK_SIZE, advance_partial_hash
 
 
 class TestCalculatePartialHash:
@@ -242,6 +243,50 @@ class TestDetectFileChangeType:
         # Should still detect as append (size check only)
         assert change_type == ChangeType.APPEND
 
+    def test_append_and_rewrite_with_hash_state(self, tmp_path: Path):
+        """Chained hash state keeps APPEND/REWRITE semantics."""
+        test_file = tmp_path / "large.jsonl"
+        line = '{"message": "' + "x" * 200 + '"}\n'
+        initial = line * (PARTIAL_HASH_BLOCK_SIZE // len(line) + 50)
+        test_file.write_text(initial, encoding="utf-8")
+
+        initial_size = test_file.stat().st_size
+        initial_hash, state = advance_partial_hash(test_file, initial_size)
+
+        assert (
+            detect_file_change_type(
+                test_file, initial_size, initial_size, initial_hash, state
+            )
+            == ChangeType.UNCHANGED
+        )
+
+        test_file.write_text(initial + line, encoding="utf-8")
+        assert (
+            detect_file_change_type(
+                test_file, initial_size, initial_size, initial_hash, state
+            )
+            == ChangeType.APPEND
+        )
+
+        test_file.write_text("Z" + initial[1:] + line, encoding="utf-8")
+        assert (
+            detect_file_change_type(
+                test_file, initial_size, initial_size, initial_hash, state
+            )
+            == ChangeType.REWRITE
+        )
+
+        # In-place edit in the middle, past the first block
+        middle = PARTIAL_HASH_BLOCK_SIZE + 7
+        edited = initial[:middle] + "Z" + initial[middle + 1 :]
+        test_file.write_text(edited, encoding="utf-8")
+        assert (
+            detect_file_change_type(
+                test_file, initial_size, initial_size, initial_hash, state
+            )
+            == ChangeType.REWRITE
+        )
+
 
 class TestIncrementalParseResult:
     """Tests for IncrementalParseResult dataclass."""
@@ -9,9 +9,11 @@ import pytest
 from catsyphon.models.parsed import ParsedConversation
 from catsyphon.parsers.base import ParseFormatError
 from catsyphon.parsers.claude_code import ClaudeCodeParser
+from catsyphon.parsers.codex import CodexParser
 from catsyphon.parsers.incremental import IncrementalParser
 from catsyphon.parsers.registry import ParserRegistry, get_default_registry
-from catsyphon.parsers.types import ParseResult
+from catsyphon.parsers.sniff import FileSample
+from catsyphon.parsers.types import ParseResult, ProbeResult
 
 # Get the fixtures directory
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
@@ -221,6 +223,121 @@ class TestIncrementalParserFinding:
         assert hasattr(parser, "supports_incremental")
 
 
+class _CountingClaudeParser(ClaudeCodeParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples: list[FileSample] = []
+
+    def probe_sample(self, sample: FileSample) -> ProbeResult:
+        self.samples.append(sample)
+        return super().probe_sample(sample)
+
+
+class _CountingCodexParser(CodexParser):
+    def __init__(self) -> None:
+        super().__init__()
+        self.samples: list[FileSample] = []
+
+    def probe_sample(self, sample: FileSample) -> ProbeResult:
+        self.samples.append(sample)
+        return super().probe_sample(sample)
+
+
+class TestFormatSniffing:
+    """Tests for shared-sample probing and the probe cache."""
+
+    @pytest.fixture
+    def parsers(self):
+        claude = _CountingClaudeParser()
+        codex = _CountingCodexParser()
+        registry = ParserRegistry()
+        registry.register(claude)
+        registry.register(codex)
+        return registry, claude, codex
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        log_file = tmp_path / "session.jsonl"
+        log_file.write_bytes((FIXTURES_DIR / "minimal_conversation.jsonl").read_bytes())
+        return log_file
+
+    def test_parsers_share_one_sample(self, parsers, log_file):
+        registry, claude, codex = parsers
+
+        parser = registry.find_chunked_parser(log_file)
+
+        assert parser is claude
+        # Codex has the higher priority, so it is probed first and rejects
+        assert len(codex.samples) == 1
+        assert len(claude.samples) == 1
+        assert codex.samples[0] is claude.samples[0]
+
+    def test_unchanged_file_is_not_probed_again(self, parsers, log_file):
+        registry, claude, codex = parsers
+        registry.find_chunked_parser(log_file)
+
+        assert registry.find_parser(log_file) is claude
+        assert len(claude.samples) == 1
+        assert len(codex.samples) == 1
+
+        result = registry.parse_with_metadata(log_file)
+
+        assert result.parser_name == "claude-code"
+        assert result.conversation.metadata["parser"]["reasons"] == [
+            "sessionId+version found"
+        ]
+        assert len(codex.samples) == 1
+
+    def test_appended_file_is_not_probed_again(self, parsers, log_file):
+        registry, claude, codex = parsers
+        registry.find_chunked_parser(log_file)
+
+        with log_file.open("a") as f:
+            f.write('{"type": "user", "sessionId": "x", "version": "2.0.0"}\n')
+
+        assert registry.find_chunked_parser(log_file) is claude
+        assert len(claude.samples) == 1
+        assert len(codex.samples) == 1
+
+    def test_rewritten_file_is_probed_again(self, parsers, log_file):
+        registry, claude, codex = parsers
+        registry.find_chunked_parser(log_file)
+
+        log_file.write_text(
+            '{"type": "session_meta", "payload": {"originator": "codex_cli_rs"}}\n'
+            * 200
+        )
+
+        assert registry.find_chunked_parser(log_file) is codex
+        assert len(codex.samples) == 2
+
+    def test_parser_hint_skips_probing(self, parsers, log_file):
+        registry, claude, codex = parsers
+
+        parser = registry.find_chunked_parser(log_file, parser_hint="claude-code")
+
+        assert parser is claude
+        assert claude.samples == []
+        assert codex.samples == []
+
+    def test_unknown_parser_hint_falls_back_to_probing(self, parsers, log_file):
+        registry, claude, codex = parsers
+
+        parser = registry.find_chunked_parser(log_file, parser_hint="missing")
+
+        assert parser is claude
+        assert len(claude.samples) == 1
+
+    def test_sample_drops_partial_last_line(self, tmp_path):
+        log_file = tmp_path / "big.jsonl"
+        log_file.write_text('{"a": 1}\n{"b": 2}\n{"c": ')
+
+        sample = FileSample(log_file, size=12)
+
+        assert not sample.complete
+        assert list(sample.records()) == [{"a": 1}]
+
+
 class TestDefaultRegistry:
     """Tests for default global registry."""
 
@@ -6,10 +6,13 @@ from datetime import datetime
 
 import pytest
 
+from catsyphon.parsers import utils
 from catsyphon.parsers.utils import (
+    JsonlReader,
     build_message_tree,
     extract_text_content,
     extract_thinking_content,
+    loads_json,
     match_tool_calls_with_results,
     parse_iso_timestamp,
     safe_get_nested,
@@ -366,3 +369,112 @@ class TestSafeGetNested:
         result = safe_get_nested(data, "missing", default=None)
 
         assert result is None
+
+
+class TestJsonlReader:
+    """Tests for the buffered JSONL reader."""
+
+    def test_lines_carry_exact_byte_offsets(self, tmp_path):
+        """Offsets are byte positions, including for multi-byte UTF-8."""
+        log_file = tmp_path / "log.jsonl"
+        content = '{"text": "héllo ✓"}\n\n{"n": 2}\r\n'.encode()
+        log_file.write_bytes(content)
+
+        with JsonlReader(log_file) as reader:
+            lines = list(reader)
+
+        assert [line.line_number for line in lines] == [1, 2, 3]
+        assert [line.text for line in lines][1] == b""
+        assert lines[0].loads() == {"text": "héllo ✓"}
+        assert lines[1].offset == lines[0].end == content.index(b"\n") + 1
+        assert lines[2].loads() == {"n": 2}
+        assert lines[2].end == len(content)
+        assert all(line.complete for line in lines)
+
+    def test_resumes_from_offset(self, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_bytes(b'{"a": 1}\n{"b": 2}\n')
+
+        with JsonlReader(log_file, start_offset=9, start_line=1) as reader:
+            lines = list(reader)
+
+        assert len(lines) == 1
+        assert lines[0].line_number == 2
+        assert lines[0].loads() == {"b": 2}
+
+    def test_partial_trailing_line_is_flagged(self, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_bytes(b'{"a": 1}\n{"b": ')
+
+        with JsonlReader(log_file) as reader:
+            lines = list(reader)
+
+        assert lines[-1].complete is False
+        assert lines[-1].offset == 9
+        assert lines[-1].end == reader.size
+
+    def test_empty_file(self, tmp_path):
+        log_file = tmp_path / "empty.jsonl"
+        log_file.write_bytes(b"")
+
+        with JsonlReader(log_file) as reader:
+            assert list(reader) == []
+
+    def test_lines_span_read_windows(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "JSONL_READ_SIZE", 4)
+        log_file = tmp_path / "log.jsonl"
+        content = b'{"a": 1}\n{"text": "long line"}\n{"b": '
+        log_file.write_bytes(content)
+
+        with JsonlReader(log_file) as reader:
+            lines = list(reader)
+
+        assert [line.text for line in lines] == [
+            b'{"a": 1}',
+            b'{"text": "long line"}',
+            b'{"b":',
+        ]
+        assert [line.end for line in lines] == [9, 31, len(content)]
+        assert [line.complete for line in lines] == [True, True, False]
+
+    def test_ignores_bytes_appended_after_open(self, tmp_path):
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_bytes(b'{"a": 1}\n')
+
+        with JsonlReader(log_file) as reader:
+            with log_file.open("ab") as f:
+                f.write(b'{"b": 2}\n')
+            lines = list(reader)
+
+        assert [line.loads() for line in lines] == [{"a": 1}]
+
+    def test_truncation_after_open_ends_iteration(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(utils, "JSONL_READ_SIZE", 8)
+        log_file = tmp_path / "log.jsonl"
+        log_file.write_bytes(b'{"a": 1}\n{"b": 2}\n{"c": 3}\n')
+
+        with JsonlReader(log_file) as reader:
+            lines = iter(reader)
+            first = next(lines)
+            log_file.write_bytes(b"")
+            rest = list(lines)
+
+        assert first.loads() == {"a": 1}
+        assert all(line.end <= reader.size for line in rest)
+        assert reader.size < 27
+
+
+class TestLoadsJson:
+    """Tests for loads_json decoder selection."""
+
+    def test_matches_stdlib_results(self):
+        assert loads_json(b'{"a": [1, 2.5, "x"]}') == {"a": [1, 2.5, "x"]}
+
+    def test_falls_back_for_non_standard_json(self):
+        result = loads_json(b'{"x": NaN}')
+
+        assert result["x"] != result["x"]
+
+    def test_invalid_json_raises_value_error(self):
+        with pytest.raises(ValueError):
+            loads_json(b'{"a": ')
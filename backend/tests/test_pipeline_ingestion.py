@@ -12,6 +12,7 @@ from catsyphon.db.repositories import (
     EpochRepository,
     IngestionJobRepository,
     MessageRepository,
+    PlanRepository,
     ProjectRepository,
     RawLogRepository,
 )
@@ -20,6 +21,8 @@ from catsyphon.models.parsed import (
     CodeChange,
     ParsedConversation,
     ParsedMessage,
+    PlanInfo,
+    PlanOperation,
     ToolCall,
 )
 from catsyphon.parsers.types import ParseResult
@@ -263,6 +266,32 @@ class TestBasicIngestion:
         assert epochs[0].sequence == 0
         assert epochs[0].conversation_id == conversation.id
 
+    def test_ingest_stores_plans(self, db_session: Session):
+        """Plans are written to the plans table as well as extra_data."""
+        parsed = ParsedConversation(
+            agent_type="claude-code",
+            agent_version="2.0.17",
+            start_time=datetime.now(UTC),
+            end_time=None,
+            messages=[],
+            plans=[
+                PlanInfo(
+                    plan_file_path="/plans/a.md",
+                    status="approved",
+                    operations=[
+                        PlanOperation(operation_type="create", file_path="/plans/a.md")
+                    ],
+                )
+            ],
+        )
+
+        conversation = ingest_conversation(db_session, parsed)
+
+        [plan] = PlanRepository(db_session).get_for_conversation(conversation.id)
+        assert plan.plan_file_path == "/plans/a.md"
+        assert plan.status == "approved"
+        assert [it.operation_type for it in plan.iterations] == ["create"]
+
 
 class TestMessageIngestion:
     """Tests for message ingestion."""
@@ -551,6 +580,29 @@ class TestRawLogIngestion:
         assert raw_logs[0].log_format == "jsonl"
         assert str(log_file) in raw_logs[0].file_path
 
+    def test_ingest_records_parser_on_raw_log(self, db_session: Session, tmp_path):
+        """The parser that handled the file is kept for later appends."""
+        log_file = tmp_path / "conversation.jsonl"
+        log_file.write_text('{"test": "data"}\n')
+
+        parsed = ParsedConversation(
+            agent_type="claude-code",
+            agent_version="2.0.17",
+            start_time=datetime.now(UTC),
+            end_time=None,
+            messages=[],
+        )
+        parse_result = ParseResult(
+            conversation=parsed, parser_name="claude-code", parser_version="1.0.0"
+        )
+
+        conversation = ingest_conversation(
+            db_session, parsed, file_path=log_file, parse_result=parse_result
+        )
+
+        raw_logs = RawLogRepository(db_session).get_by_conversation(conversation.id)
+        assert raw_logs[0].parser_name == "claude-code"
+
     def test_ingest_raw_log_content(self, db_session: Session, tmp_path):
         """Test that full JSONL content is preserved."""
         # Create a log file with actual content
@@ -1294,6 +1346,64 @@ class TestHierarchicalConversationIngestion:
         agents = [c for c in all_convs if c.conversation_type == "agent"]
         assert all(a.parent_conversation_id is not None for a in agents)
 
+    def test_link_orphaned_agents_records_spawning_message(
+        self, db_session: Session, sample_workspace
+    ):
+        """Test that linked agents point at the parent's latest prior Task call."""
+        now = datetime.now(UTC)
+
+        agent_parsed = ParsedConversation(
+            agent_type="claude-code",
+            agent_version="2.0.28",
+            start_time=now + timedelta(minutes=5),
+            end_time=now + timedelta(minutes=6),
+            session_id="agent-spawned",
+            conversation_type="agent",
+            parent_session_id="spawning-parent",
+            agent_metadata={
+                "agent_id": "agent-spawned",
+                "parent_session_id": "spawning-parent",
+            },
+            messages=[
+                ParsedMessage(
+                    role="user",
+                    content="Agent task",
+                    timestamp=now + timedelta(minutes=5),
+                )
+            ],
+        )
+        ingest_conversation(db_session, agent_parsed)
+        db_session.commit()
+
+        def task_message(minutes: int) -> ParsedMessage:
+            return ParsedMessage(
+                role="assistant",
+                content="Delegating",
+                timestamp=now + timedelta(minutes=minutes),
+                tool_calls=[ToolCall(tool_name="Task", parameters={})],
+            )
+
+        parent_parsed = ParsedConversation(
+            agent_type="claude-code",
+            agent_version="2.0.28",
+            start_time=now,
+            end_time=now + timedelta(minutes=10),
+            session_id="spawning-parent",
+            conversation_type="main",
+            messages=[task_message(1), task_message(4), task_message(8)],
+        )
+        parent = ingest_conversation(db_session, parent_parsed)
+        db_session.commit()
+
+        assert link_orphaned_agents(db_session, sample_workspace.id) == 1
+        db_session.commit()
+
+        spawning = sorted(parent.messages, key=lambda m: m.sequence)[1]
+        agent = ConversationRepository(db_session).get_by_session_id(
+            "agent-spawned", sample_workspace.id
+        )
+        assert agent.agent_metadata["parent_message_id"] == str(spawning.id)
+
     def test_link_orphaned_agents_skips_already_linked(
         self, db_session: Session, sample_workspace
     ):
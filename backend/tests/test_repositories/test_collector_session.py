@@ -0,0 +1,365 @@
+"""Tests for CollectorSessionRepository."""
+
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories.collector_session import CollectorSessionRepository
+from catsyphon.db.repositories.rollup import RollupRepository
+from catsyphon.models.db import (
+    ConversationRollup,
+    ConversationType,
+    Message,
+    ProjectDailyRollup,
+    Workspace,
+)
+from catsyphon.pipeline.orphan_policy import (
+    KEY_FIRST_ORPHANED_AT,
+    KEY_LINKING_ATTEMPTS,
+    MAX_LINKING_ATTEMPTS,
+    MAX_ORPHAN_AGE_HOURS,
+)
+
+
+class TestLinkOrphanedCollectors:
+    """Test pending-parent indexed orphan linking."""
+
+    def test_child_created_before_parent_records_pending_parent(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """A child whose parent is missing stores the parent's session_id."""
+        repo = CollectorSessionRepository(db_session)
+
+        child, created = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-1",
+        )
+
+        assert created is True
+        assert child.parent_conversation_id is None
+        assert child.pending_parent_session_id == "parent-1"
+
+    def test_child_created_after_parent_has_no_pending_parent(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """A child linked at creation never enters the pending index."""
+        repo = CollectorSessionRepository(db_session)
+
+        parent, _ = repo.get_or_create_session(
+            collector_session_id="parent-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+        )
+        child, _ = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-1",
+        )
+
+        assert child.parent_conversation_id == parent.id
+        assert child.pending_parent_session_id is None
+
+    def test_parent_arrival_links_only_its_children(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Linking by parent_session_id leaves unrelated orphans untouched."""
+        repo = CollectorSessionRepository(db_session)
+
+        children = [
+            repo.get_or_create_session(
+                collector_session_id=f"child-{i}",
+                workspace_id=sample_workspace.id,
+                agent_type="claude-code",
+                parent_session_id="parent-1",
+            )[0]
+            for i in range(3)
+        ]
+        other, _ = repo.get_or_create_session(
+            collector_session_id="other-child",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-2",
+        )
+        parent, _ = repo.get_or_create_session(
+            collector_session_id="parent-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            working_directory="/tmp/project-a",
+        )
+
+        linked = repo.link_orphaned_collectors(
+            sample_workspace.id, parent_session_id="parent-1"
+        )
+
+        assert linked == 3
+        for child in children:
+            db_session.refresh(child)
+            assert child.parent_conversation_id == parent.id
+            assert child.pending_parent_session_id is None
+            assert child.conversation_type == ConversationType.AGENT
+            assert child.project_id == parent.project_id
+
+        db_session.refresh(other)
+        assert other.parent_conversation_id is None
+        assert other.pending_parent_session_id == "parent-2"
+        assert "_linking_attempts" not in other.extra_data
+
+    def test_linking_moves_child_rollup_to_parent_project(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """A child inheriting the parent's project is counted in its buckets."""
+        repo = CollectorSessionRepository(db_session)
+
+        child, _ = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-1",
+        )
+        RollupRepository(db_session).refresh(child)
+        parent, _ = repo.get_or_create_session(
+            collector_session_id="parent-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            working_directory="/tmp/project-a",
+        )
+        assert parent.project_id is not None
+
+        repo.link_orphaned_collectors(sample_workspace.id)
+
+        rollup = db_session.get(ConversationRollup, child.id)
+        assert rollup is not None
+        assert rollup.project_id == parent.project_id
+        daily = (
+            db_session.query(ProjectDailyRollup)
+            .filter(ProjectDailyRollup.project_id == parent.project_id)
+            .one()
+        )
+        assert daily.session_count == 1
+
+    def test_missing_parent_records_attempt_on_waiting_orphans(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """A missing parent only bumps attempt counters of its own orphans."""
+        repo = CollectorSessionRepository(db_session)
+
+        child, _ = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-1",
+        )
+        other, _ = repo.get_or_create_session(
+            collector_session_id="other-child",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-2",
+        )
+
+        linked = repo.link_orphaned_collectors(
+            sample_workspace.id, parent_session_id="parent-1"
+        )
+
+        assert linked == 0
+        assert child.extra_data["_linking_attempts"] == 1
+        assert "_linking_attempts" not in other.extra_data
+
+    def test_workspace_sweep_links_arrived_parents(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Without a parent_session_id every pending parent is retried."""
+        repo = CollectorSessionRepository(db_session)
+
+        child, _ = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-1",
+        )
+        waiting, _ = repo.get_or_create_session(
+            collector_session_id="child-2",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="parent-2",
+        )
+        parent, _ = repo.get_or_create_session(
+            collector_session_id="parent-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+        )
+
+        linked = repo.link_orphaned_collectors(sample_workspace.id)
+
+        assert linked == 1
+        db_session.refresh(child)
+        assert child.parent_conversation_id == parent.id
+        assert waiting.parent_conversation_id is None
+        assert waiting.extra_data["_linking_attempts"] == 1
+
+    def test_repeated_sweeps_retire_orphan_whose_parent_never_arrives(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Periodic sweeps carry an orphan to the permanent-orphan policy."""
+        repo = CollectorSessionRepository(db_session)
+        orphan, _ = repo.get_or_create_session(
+            collector_session_id="child-1",
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            parent_session_id="never-arrives",
+        )
+
+        repo.link_orphaned_collectors(sample_workspace.id)
+        # Age the orphan past MAX_ORPHAN_AGE_HOURS
+        first_seen = datetime.now(timezone.utc) - timedelta(
+            hours=MAX_ORPHAN_AGE_HOURS + 1
+        )
+        orphan.extra_data = {
+            **orphan.extra_data,
+            KEY_FIRST_ORPHANED_AT: first_seen.isoformat(),
+        }
+        for _ in range(MAX_LINKING_ATTEMPTS - 2):
+            repo.link_orphaned_collectors(sample_workspace.id)
+        assert orphan.permanently_orphaned is False
+
+        repo.link_orphaned_collectors(sample_workspace.id)
+
+        assert orphan.permanently_orphaned is True
+        assert orphan.pending_parent_session_id is None
+        assert orphan.extra_data[KEY_LINKING_ATTEMPTS] == MAX_LINKING_ATTEMPTS
+
+
+def _events(count: int, offset: int = 0) -> list[tuple]:
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    events = []
+    for i in range(offset, offset + count):
+        emitted_at = base + timedelta(seconds=i)
+        if i % 2:
+            data = {
+                "tool_name": "Read",
+                "tool_use_id": f"tool-{i}",
+                "parameters": {"file_path": f"/src/{i}.py"},
+            }
+            events.append(("tool_call", emitted_at, emitted_at, data, f"hash-{i}"))
+        else:
+            data = {
+                "author_role": "assistant",
+                "message_type": "response",
+                "content": f"message {i}",
+                "model": "claude-sonnet-4",
+                "token_usage": {"input_tokens": 10, "output_tokens": 5},
+            }
+            events.append(("message", emitted_at, emitted_at, data, f"hash-{i}"))
+    return events
+
+
+class TestAddMessagesBulk:
+    """Test the set-based collector message insert path."""
+
+    _COLUMNS = (
+        "sequence",
+        "role",
+        "content",
+        "timestamp",
+        "emitted_at",
+        "observed_at",
+        "author_role",
+        "message_type",
+        "thinking_content",
+        "tool_calls",
+        "tool_results",
+        "code_changes",
+        "entities",
+        "extra_data",
+        "event_hash",
+        "raw_data",
+    )
+
+    def test_bulk_rows_match_add_message(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Bulk-inserted messages have exactly the columns add_message writes."""
+        repo = CollectorSessionRepository(db_session)
+        single, _ = repo.get_or_create_session(
+            collector_session_id="single", workspace_id=sample_workspace.id
+        )
+        bulk, _ = repo.get_or_create_session(
+            collector_session_id="bulk", workspace_id=sample_workspace.id
+        )
+        events = _events(6)
+
+        for event_type, emitted_at, observed_at, data, event_hash in events:
+            repo.add_message(
+                conversation=single,
+                event_type=event_type,
+                emitted_at=emitted_at,
+                observed_at=observed_at,
+                data=data,
+                event_hash=event_hash,
+            )
+        inserted = repo.add_messages_bulk(bulk, events)
+        db_session.flush()
+        db_session.expire_all()
+
+        assert inserted == 6
+
+        def rows(conversation_id):
+            messages = (
+                db_session.query(Message)
+                .filter(Message.conversation_id == conversation_id)
+                .order_by(Message.emitted_at)
+                .all()
+            )
+            return [
+                {column: getattr(m, column) for column in self._COLUMNS}
+                for m in messages
+            ]
+
+        assert rows(bulk.id) == rows(single.id)
+
+    def test_existing_event_hashes_are_skipped(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Events already stored for the conversation hit ON CONFLICT."""
+        repo = CollectorSessionRepository(db_session)
+        conversation, _ = repo.get_or_create_session(
+            collector_session_id="bulk", workspace_id=sample_workspace.id
+        )
+
+        assert repo.add_messages_bulk(conversation, _events(4)) == 4
+        assert repo.add_messages_bulk(conversation, _events(4, offset=2)) == 2
+        assert (
+            db_session.query(Message)
+            .filter(Message.conversation_id == conversation.id)
+            .count()
+            == 6
+        )
+
+    def test_duplicate_hashes_within_batch_insert_once(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Repeated events in one batch produce a single message."""
+        repo = CollectorSessionRepository(db_session)
+        conversation, _ = repo.get_or_create_session(
+            collector_session_id="bulk", workspace_id=sample_workspace.id
+        )
+        events = _events(3)
+
+        assert repo.add_messages_bulk(conversation, events + events[:1]) == 3
+
+    def test_same_hash_allowed_across_conversations(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        """Deduplication is scoped to the conversation."""
+        repo = CollectorSessionRepository(db_session)
+        first, _ = repo.get_or_create_session(
+            collector_session_id="first", workspace_id=sample_workspace.id
+        )
+        second, _ = repo.get_or_create_session(
+            collector_session_id="second", workspace_id=sample_workspace.id
+        )
+
+        assert repo.add_messages_bulk(first, _events(2)) == 2
+        assert repo.add_messages_bulk(second, _events(2)) == 2
@@ -0,0 +1,97 @@
+"""Tests for MessageRepository token counting and spawning-message lookup."""
+
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from catsyphon.canonicalization.tokens import message_token_counts
+from catsyphon.db.repositories import MessageRepository
+from catsyphon.models.db import Conversation, Epoch, Message
+
+
+def _message_data(epoch: Epoch, sequence: int, **fields) -> dict:
+    return {
+        "epoch_id": epoch.id,
+        "conversation_id": epoch.conversation_id,
+        "role": "assistant",
+        "timestamp": datetime.now(UTC),
+        "sequence": sequence,
+        "content": "",
+        **fields,
+    }
+
+
+def test_bulk_create_stores_token_counts(
+    db_session: Session, sample_conversation: Conversation, sample_epoch: Epoch
+):
+    created = MessageRepository(db_session).bulk_create(
+        [
+            _message_data(
+                sample_epoch,
+                0,
+                content="Hello there",
+                thinking_content="Let me think about this",
+            ),
+            _message_data(sample_epoch, 1, content=""),
+        ]
+    )
+
+    assert (
+        created[0].content_tokens
+        == message_token_counts("Hello there", None)["content_tokens"]
+    )
+    assert created[0].thinking_tokens > 0
+    assert created[1].content_tokens == 0
+    assert created[1].thinking_tokens is None
+
+
+def test_backfill_token_counts_fills_missing_counts_in_batches(
+    db_session: Session, sample_conversation: Conversation, sample_epoch: Epoch
+):
+    for sequence in range(3):
+        db_session.add(
+            Message(**_message_data(sample_epoch, sequence, content="some words"))
+        )
+    db_session.flush()
+
+    batches = list(MessageRepository(db_session).backfill_token_counts(batch_size=2))
+
+    assert batches == [2, 1]
+    counts = {m.content_tokens for m in db_session.query(Message)}
+    assert counts == {message_token_counts("some words", None)["content_tokens"]}
+    assert list(MessageRepository(db_session).backfill_token_counts()) == []
+
+
+def test_find_spawning_message_returns_latest_task_call_before_start(
+    db_session: Session, sample_conversation: Conversation, sample_epoch: Epoch
+):
+    base = datetime(2025, 1, 1, tzinfo=UTC)
+    task = [{"tool_name": "Task", "parameters": {}}]
+    created = MessageRepository(db_session).bulk_create(
+        [
+            _message_data(sample_epoch, 0, timestamp=base, tool_calls=task),
+            _message_data(
+                sample_epoch,
+                1,
+                timestamp=base + timedelta(minutes=1),
+                tool_calls=[{"tool_name": "Read", "parameters": {}}],
+            ),
+            _message_data(
+                sample_epoch, 2, timestamp=base + timedelta(minutes=2), tool_calls=task
+            ),
+            _message_data(
+                sample_epoch, 3, timestamp=base + timedelta(minutes=4), tool_calls=task
+            ),
+        ]
+    )
+    repo = MessageRepository(db_session)
+
+    assert [m.spawns_agent for m in created] == [True, False, True, True]
+    assert (
+        repo.find_spawning_message(sample_conversation.id, base + timedelta(minutes=3))
+        == created[2].id
+    )
+    assert (
+        repo.find_spawning_message(sample_conversation.id, base - timedelta(minutes=1))
+        is None
+    )
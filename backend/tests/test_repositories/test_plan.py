@@ -0,0 +1,176 @@
+"""Tests for PlanRepository."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories.plan import PlanRepository
+from catsyphon.models.db import Conversation, Plan, PlanIteration, Project, Workspace
+from catsyphon.services.ingestion_service import CollectorEvent, IngestionService
+
+
+def _plan(path: str, status: str = "active", operations: int = 0) -> dict:
+    return {
+        "plan_file_path": path,
+        "initial_content": "# Plan",
+        "final_content": "# Plan v2",
+        "status": status,
+        "iteration_count": operations or 1,
+        "operations": [
+            {
+                "operation_type": "create" if i == 0 else "edit",
+                "file_path": path,
+                "timestamp": "2025-01-15T10:00:00.000Z",
+                "message_index": i,
+            }
+            for i in range(operations)
+        ],
+        "entry_message_index": 0,
+        "exit_message_index": 4,
+        "related_agent_session_ids": ["agent-1"],
+    }
+
+
+def _conversation(
+    db_session: Session,
+    workspace: Workspace,
+    start_time: datetime,
+    project: Project | None = None,
+) -> Conversation:
+    conversation = Conversation(
+        id=uuid.uuid4(),
+        workspace_id=workspace.id,
+        project_id=project.id if project else None,
+        agent_type="claude-code",
+        start_time=start_time,
+        extra_data={"session_id": str(uuid.uuid4())},
+    )
+    db_session.add(conversation)
+    db_session.flush()
+    return conversation
+
+
+class TestReplaceForConversation:
+    def test_stores_plans_and_iterations(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        conversation = _conversation(db_session, sample_workspace, datetime.now(UTC))
+        repo = PlanRepository(db_session)
+
+        plans = repo.replace_for_conversation(
+            conversation, [_plan("/p/a.md", "approved", operations=2), _plan("/p/b.md")]
+        )
+
+        assert [p.plan_index for p in plans] == [0, 1]
+        [first, second] = repo.get_for_conversation(conversation.id)
+        assert first.status == "approved"
+        assert first.workspace_id == sample_workspace.id
+        assert first.related_agent_session_ids == ["agent-1"]
+        assert [it.operation_type for it in first.iterations] == ["create", "edit"]
+        assert first.iterations[0].timestamp is not None
+        assert second.iterations == []
+
+    def test_replaces_previous_rows(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        conversation = _conversation(db_session, sample_workspace, datetime.now(UTC))
+        repo = PlanRepository(db_session)
+        repo.replace_for_conversation(
+            conversation, [_plan("/p/a.md", operations=2), _plan("/p/b.md")]
+        )
+
+        repo.replace_for_conversation(conversation, [_plan("/p/c.md", "abandoned")])
+
+        [plan] = repo.get_for_conversation(conversation.id)
+        assert plan.plan_file_path == "/p/c.md"
+        assert db_session.query(Plan).count() == 1
+        assert db_session.query(PlanIteration).count() == 0
+
+        repo.replace_for_conversation(conversation, None)
+        assert repo.get_for_conversation(conversation.id) == []
+
+
+class TestQueries:
+    def test_list_page_filters_and_paginates(
+        self,
+        db_session: Session,
+        sample_workspace: Workspace,
+        sample_project: Project,
+    ):
+        repo = PlanRepository(db_session)
+        now = datetime.now(UTC)
+        older = _conversation(db_session, sample_workspace, now - timedelta(days=2))
+        newer = _conversation(db_session, sample_workspace, now, sample_project)
+        repo.replace_for_conversation(older, [_plan("/p/old.md", "approved")])
+        repo.replace_for_conversation(
+            newer, [_plan("/p/new-1.md", "approved"), _plan("/p/new-2.md")]
+        )
+
+        rows, total = repo.list_page(sample_workspace.id, limit=2)
+        assert total == 3
+        assert [r.plan_file_path for r in rows] == ["/p/new-1.md", "/p/new-2.md"]
+        assert rows[0].project_name == sample_project.name
+
+        rows, total = repo.list_page(sample_workspace.id, offset=2, limit=2)
+        assert [r.plan_file_path for r in rows] == ["/p/old.md"]
+
+        rows, total = repo.list_page(sample_workspace.id, status="approved")
+        assert total == 2
+        assert {r.plan_file_path for r in rows} == {"/p/new-1.md", "/p/old.md"}
+
+        rows, total = repo.list_page(sample_workspace.id, project_id=sample_project.id)
+        assert total == 2
+
+        rows, total = repo.list_page(
+            sample_workspace.id, start_date=now - timedelta(days=1)
+        )
+        assert total == 2
+
+    def test_stats(self, db_session: Session, sample_workspace: Workspace):
+        repo = PlanRepository(db_session)
+        now = datetime.now(UTC)
+        first = _conversation(db_session, sample_workspace, now)
+        second = _conversation(db_session, sample_workspace, now)
+        _conversation(db_session, sample_workspace, now)
+        repo.replace_for_conversation(
+            first, [_plan("/p/a.md", "approved"), _plan("/p/b.md")]
+        )
+        repo.replace_for_conversation(second, [_plan("/p/c.md", "approved")])
+
+        total, by_status, conversations = repo.stats(sample_workspace.id)
+
+        assert total == 3
+        assert by_status == {"approved": 2, "active": 1}
+        assert conversations == 2
+
+
+def test_session_end_plans_populate_table(
+    db_session: Session, sample_workspace: Workspace
+):
+    service = IngestionService(db_session)
+    now = datetime.now(UTC)
+    events = [
+        CollectorEvent(
+            type="session_start",
+            emitted_at=now,
+            observed_at=now,
+            event_hash="a" * 32,
+            data={"agent_type": "claude-code"},
+        ),
+        CollectorEvent(
+            type="session_end",
+            emitted_at=now + timedelta(minutes=1),
+            observed_at=now + timedelta(minutes=1),
+            event_hash="b" * 32,
+            data={"outcome": "success", "plans": [_plan("/p/a.md", operations=1)]},
+        ),
+    ]
+
+    outcome = service.process_events(
+        session_id="plans-session", workspace_id=sample_workspace.id, events=events
+    )
+
+    [plan] = PlanRepository(db_session).get_for_conversation(outcome.conversation_id)
+    assert plan.plan_file_path == "/p/a.md"
+    assert len(plan.iterations) == 1
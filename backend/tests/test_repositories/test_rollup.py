@@ -0,0 +1,294 @@
+"""Tests for RollupRepository."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories.rollup import RollupRepository, rollup_day
+from catsyphon.models.db import (
+    Conversation,
+    ConversationRollup,
+    Epoch,
+    FileTouched,
+    Message,
+    Project,
+    ProjectDailyRollup,
+    Workspace,
+)
+from catsyphon.services.ingestion_service import CollectorEvent, IngestionService
+
+
+def _add_activity(
+    db_session: Session,
+    conversation: Conversation,
+    messages: int,
+    lines_added: int = 0,
+    change_offset: timedelta = timedelta(minutes=3),
+) -> tuple[list[uuid.UUID], list[uuid.UUID]]:
+    """Add messages and a file change; returns their (message, file) IDs."""
+    epoch = Epoch(
+        id=uuid.uuid4(),
+        conversation_id=conversation.id,
+        sequence=0,
+        start_time=conversation.start_time,
+    )
+    db_session.add(epoch)
+    message_ids: list[uuid.UUID] = []
+    file_ids: list[uuid.UUID] = []
+    for i in range(messages):
+        message_ids.append(uuid.uuid4())
+        db_session.add(
+            Message(
+                id=message_ids[-1],
+                epoch_id=epoch.id,
+                conversation_id=conversation.id,
+                role="user" if i % 2 == 0 else "assistant",
+                content=f"message {i}",
+                timestamp=conversation.start_time + timedelta(seconds=i),
+                sequence=i,
+            )
+        )
+    if lines_added:
+        file_ids.append(uuid.uuid4())
+        db_session.add(
+            FileTouched(
+                id=file_ids[-1],
+                conversation_id=conversation.id,
+                epoch_id=epoch.id,
+                file_path="src/app.py",
+                lines_added=lines_added,
+                lines_deleted=1,
+                timestamp=conversation.start_time + change_offset,
+            )
+        )
+    db_session.flush()
+    return message_ids, file_ids
+
+
+def _daily(db_session: Session, project_id: uuid.UUID) -> list[ProjectDailyRollup]:
+    db_session.expire_all()
+    return (
+        db_session.query(ProjectDailyRollup)
+        .filter(ProjectDailyRollup.project_id == project_id)
+        .all()
+    )
+
+
+class TestRollupRepository:
+    """Test conversation and project-day rollup maintenance."""
+
+    def test_refresh_computes_conversation_totals(
+        self, db_session: Session, sample_conversation: Conversation
+    ):
+        _add_activity(db_session, sample_conversation, messages=5, lines_added=10)
+
+        rollup = RollupRepository(db_session).refresh(sample_conversation)
+
+        assert rollup.message_count == 5
+        assert rollup.user_message_count == 3
+        assert rollup.assistant_message_count == 2
+        assert rollup.lines_added == 10
+        assert rollup.lines_deleted == 1
+        assert rollup.first_change_latency_seconds == 180.0
+        assert rollup.day == rollup_day(sample_conversation.start_time)
+
+    def test_project_day_bucket_accumulates_conversations(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        other = Conversation(
+            workspace_id=sample_conversation.workspace_id,
+            project_id=sample_project.id,
+            agent_type="claude-code",
+            start_time=sample_conversation.start_time,
+        )
+        db_session.add(other)
+        _add_activity(db_session, sample_conversation, messages=4, lines_added=10)
+        _add_activity(db_session, other, messages=2)
+
+        repo = RollupRepository(db_session)
+        repo.refresh(sample_conversation)
+        repo.refresh(other)
+
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.session_count == 2
+        assert bucket.message_count == 6
+        assert bucket.lines_added == 10
+        assert bucket.first_change_sessions == 1
+
+    def test_refresh_is_idempotent(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        repo = RollupRepository(db_session)
+        _add_activity(db_session, sample_conversation, messages=2)
+        repo.refresh(sample_conversation)
+        repo.refresh(sample_conversation)
+
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.session_count == 1
+        assert bucket.message_count == 2
+
+    def test_refresh_applies_only_new_activity(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        repo = RollupRepository(db_session)
+        _add_activity(db_session, sample_conversation, messages=2)
+        repo.refresh(sample_conversation)
+
+        _add_activity(db_session, sample_conversation, messages=3, lines_added=7)
+        repo.refresh(sample_conversation)
+
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.session_count == 1
+        assert bucket.message_count == 5
+        assert bucket.lines_added == 7
+
+    def test_add_applies_batch_rows_only(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        repo = RollupRepository(db_session)
+        _add_activity(
+            db_session,
+            sample_conversation,
+            messages=2,
+            lines_added=5,
+            change_offset=timedelta(minutes=10),
+        )
+        repo.refresh(sample_conversation)
+
+        message_ids, file_ids = _add_activity(
+            db_session,
+            sample_conversation,
+            messages=3,
+            lines_added=7,
+            change_offset=timedelta(minutes=2),
+        )
+        # Rows outside the batch are not rescanned
+        _add_activity(db_session, sample_conversation, messages=4)
+        rollup = repo.add(sample_conversation, message_ids, file_ids)
+
+        assert rollup.message_count == 5
+        assert rollup.user_message_count == 3
+        assert rollup.lines_added == 12
+        assert rollup.lines_deleted == 2
+        assert rollup.first_change_latency_seconds == 120.0
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.session_count == 1
+        assert bucket.message_count == 5
+        assert bucket.lines_added == 12
+        assert bucket.first_change_latency_seconds == 120.0
+
+        repo.refresh(sample_conversation)
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.message_count == 9
+
+    def test_add_without_rollup_refreshes(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        _add_activity(db_session, sample_conversation, messages=2)
+
+        rollup = RollupRepository(db_session).add(sample_conversation)
+
+        assert rollup.message_count == 2
+        [bucket] = _daily(db_session, sample_project.id)
+        assert bucket.session_count == 1
+
+    def test_moving_conversation_moves_bucket(
+        self,
+        db_session: Session,
+        sample_workspace: Workspace,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        repo = RollupRepository(db_session)
+        _add_activity(db_session, sample_conversation, messages=2)
+        repo.refresh(sample_conversation)
+
+        other_project = Project(
+            workspace_id=sample_workspace.id,
+            name="Other",
+            directory_path="/tmp/other",
+        )
+        db_session.add(other_project)
+        db_session.flush()
+        sample_conversation.project_id = other_project.id
+        repo.refresh(sample_conversation)
+
+        assert _daily(db_session, sample_project.id) == []
+        [bucket] = _daily(db_session, other_project.id)
+        assert bucket.message_count == 2
+
+    def test_remove_subtracts_and_drops_empty_bucket(
+        self,
+        db_session: Session,
+        sample_conversation: Conversation,
+        sample_project: Project,
+    ):
+        repo = RollupRepository(db_session)
+        _add_activity(db_session, sample_conversation, messages=2)
+        repo.refresh(sample_conversation)
+
+        repo.remove(sample_conversation.id)
+
+        assert db_session.get(ConversationRollup, sample_conversation.id) is None
+        assert _daily(db_session, sample_project.id) == []
+
+
+class TestIngestMaintainsRollups:
+    """Test that ingestion paths keep rollups current."""
+
+    def test_process_events_refreshes_rollup(
+        self, db_session: Session, sample_workspace: Workspace
+    ):
+        service = IngestionService(db_session)
+        now = datetime.now(UTC)
+        start = CollectorEvent(
+            type="session_start",
+            emitted_at=now,
+            observed_at=now,
+            event_hash="a" * 32,
+            data={"agent_type": "claude-code", "working_directory": "/p"},
+        )
+        messages = [
+            CollectorEvent(
+                type="message",
+                emitted_at=now + timedelta(seconds=i),
+                observed_at=now + timedelta(seconds=i),
+                event_hash=f"{i:032d}",
+                data={"author_role": "human", "content": f"hello {i}"},
+            )
+            for i in range(1, 4)
+        ]
+
+        outcome = service.process_events(
+            session_id="rollup-session",
+            workspace_id=sample_workspace.id,
+            events=[start, messages[0]],
+        )
+        service.process_events(
+            session_id="rollup-session",
+            workspace_id=sample_workspace.id,
+            events=messages[1:],
+        )
+
+        rollup = db_session.get(ConversationRollup, outcome.conversation_id)
+        conversation = db_session.get(Conversation, outcome.conversation_id)
+        assert rollup.message_count == 3
+        [bucket] = _daily(db_session, conversation.project_id)
+        assert bucket.session_count == 1
+        assert bucket.message_count == 3
@@ -0,0 +1,180 @@
+"""Tests for MessageSearchRepository."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories import CollectorSessionRepository
+from catsyphon.db.repositories.search import MessageSearchRepository, _fts5_query
+from catsyphon.models.db import Conversation, Epoch, Message, Project, Workspace
+
+
+def _conversation(
+    db_session: Session, workspace: Workspace, project: Project | None = None
+) -> Conversation:
+    conversation = Conversation(
+        id=uuid.uuid4(),
+        workspace_id=workspace.id,
+        project_id=project.id if project else None,
+        agent_type="claude-code",
+        start_time=datetime.now(UTC),
+    )
+    db_session.add(conversation)
+    db_session.add(
+        Epoch(conversation=conversation, sequence=0, start_time=datetime.now(UTC))
+    )
+    db_session.flush()
+    return conversation
+
+
+def _message(
+    db_session: Session,
+    conversation: Conversation,
+    content: str,
+    minutes: int = 0,
+    **kwargs,
+) -> Message:
+    message = Message(
+        epoch_id=conversation.epochs[0].id,
+        conversation_id=conversation.id,
+        role="assistant",
+        content=content,
+        timestamp=datetime(2025, 1, 1, tzinfo=UTC) + timedelta(minutes=minutes),
+        sequence=minutes,
+        **kwargs,
+    )
+    db_session.add(message)
+    db_session.flush()
+    return message
+
+
+def test_fts5_query_quotes_terms():
+    assert _fts5_query('flaky "migration" OR') == '"flaky" """migration""" "OR"'
+
+
+def test_matches_content_tool_parameters_and_thinking(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    in_content = _message(db_session, conversation, "Fixed the flaky migration test")
+    in_tool = _message(
+        db_session,
+        conversation,
+        "",
+        minutes=1,
+        tool_calls=[{"tool_name": "Bash", "parameters": {"command": "alembic"}}],
+    )
+    in_thinking = _message(
+        db_session,
+        conversation,
+        "Done",
+        minutes=2,
+        thinking_content="The deadlock comes from the scheduler",
+    )
+    _message(db_session, conversation, "Unrelated", minutes=3)
+    repo = MessageSearchRepository(db_session)
+
+    [hit] = repo.search(sample_workspace.id, "flaky migrations")
+    assert hit.message_id == in_content.id
+    assert hit.conversation_id == conversation.id
+    assert "<mark>flaky</mark>" in hit.snippet
+
+    [hit] = repo.search(sample_workspace.id, "alembic")
+    assert hit.message_id == in_tool.id
+
+    [hit] = repo.search(sample_workspace.id, "deadlock")
+    assert hit.message_id == in_thinking.id
+
+    assert repo.search(sample_workspace.id, "   ") == []
+
+
+def test_index_follows_updates_and_deletes(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    message = _message(db_session, conversation, "original wording")
+    repo = MessageSearchRepository(db_session)
+
+    message.content = "rewritten wording"
+    db_session.flush()
+    assert repo.search(sample_workspace.id, "original") == []
+    assert len(repo.search(sample_workspace.id, "rewritten")) == 1
+
+    db_session.delete(message)
+    db_session.flush()
+    assert repo.search(sample_workspace.id, "rewritten") == []
+
+
+def test_filters_by_workspace_and_project(
+    db_session: Session, sample_workspace: Workspace, sample_project: Project
+):
+    other_workspace = Workspace(
+        id=uuid.uuid4(),
+        organization_id=sample_workspace.organization_id,
+        name="Other",
+        slug=f"other-{uuid.uuid4().hex[:8]}",
+    )
+    db_session.add(other_workspace)
+    in_project = _conversation(db_session, sample_workspace, sample_project)
+    no_project = _conversation(db_session, sample_workspace)
+    elsewhere = _conversation(db_session, other_workspace)
+    for conversation in (in_project, no_project, elsewhere):
+        _message(db_session, conversation, "retry the webhook")
+    repo = MessageSearchRepository(db_session)
+
+    hits = repo.search(sample_workspace.id, "webhook")
+    assert {h.conversation_id for h in hits} == {in_project.id, no_project.id}
+
+    [hit] = repo.search(sample_workspace.id, "webhook", project_id=sample_project.id)
+    assert hit.conversation_id == in_project.id
+    assert hit.project_id == sample_project.id
+
+
+def test_keyset_pages_cover_all_hits_once(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    for i in range(5):
+        _message(db_session, conversation, "cache " * (i + 1), minutes=i)
+    repo = MessageSearchRepository(db_session)
+
+    for sort, key in (("relevance", "rank"), ("recent", "timestamp")):
+        seen = []
+        after = None
+        while True:
+            page = repo.search(
+                sample_workspace.id, "cache", sort=sort, after=after, limit=2
+            )
+            if not page:
+                break
+            seen.extend(page)
+            after = (getattr(page[-1], key), page[-1].message_id)
+
+        assert len({h.message_id for h in seen}) == 5
+        keys = [getattr(h, key) for h in seen]
+        assert keys == sorted(keys, reverse=True)
+
+
+def test_bulk_inserted_messages_are_searchable(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    now = datetime.now(UTC)
+    CollectorSessionRepository(db_session).add_messages_bulk(
+        conversation,
+        [
+            ("message", now, now, {"author_role": "human", "content": "ship it"}, "h1"),
+            (
+                "tool_call",
+                now,
+                now,
+                {"tool_name": "Grep", "parameters": {"pattern": "TODO-cleanup"}},
+                "h2",
+            ),
+        ],
+    )
+
+    repo = MessageSearchRepository(db_session)
+    assert len(repo.search(sample_workspace.id, "ship")) == 1
+    assert len(repo.search(sample_workspace.id, "cleanup")) == 1
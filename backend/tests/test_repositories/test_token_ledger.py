@@ -0,0 +1,171 @@
+"""Tests for TokenLedgerRepository."""
+
+import uuid
+from datetime import UTC, date, datetime
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from catsyphon.db.repositories import (
+    CollectorSessionRepository,
+    TokenLedgerRepository,
+)
+from catsyphon.db.repositories.token_ledger import usage_counts
+from catsyphon.llm.pricing import estimate_cost_from_model
+from catsyphon.models.db import Conversation, Epoch, Project, TokenLedger, Workspace
+
+
+def _conversation(
+    db_session: Session, workspace: Workspace, project: Project | None = None
+) -> Conversation:
+    conversation = Conversation(
+        id=uuid.uuid4(),
+        workspace_id=workspace.id,
+        project_id=project.id if project else None,
+        agent_type="claude-code",
+        start_time=datetime.now(UTC),
+    )
+    db_session.add(conversation)
+    db_session.add(
+        Epoch(conversation=conversation, sequence=0, start_time=datetime.now(UTC))
+    )
+    db_session.flush()
+    return conversation
+
+
+def _usage(model: str, input_tokens: int, output_tokens: int, **extra) -> dict:
+    return {
+        "model": model,
+        "token_usage": {
+            "input_tokens": input_tokens,
+            "output_tokens": output_tokens,
+            **extra,
+        },
+    }
+
+
+def test_usage_counts_accepts_provider_key_names():
+    counts = usage_counts(
+        {
+            "input_tokens": 10,
+            "output_tokens": "5",
+            "cache_read_input_tokens": 7,
+            "cache_creation_input_tokens": None,
+        }
+    )
+
+    assert counts == {
+        "input_tokens": 10,
+        "output_tokens": 5,
+        "cache_read_tokens": 7,
+        "cache_creation_tokens": 0,
+    }
+
+
+def test_record_upserts_per_model_and_day(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    repo = TokenLedgerRepository(db_session)
+    day1 = datetime(2025, 1, 1, 23, 0, tzinfo=UTC)
+    day2 = datetime(2025, 1, 2, 1, 0, tzinfo=UTC)
+
+    recorded = repo.record(
+        conversation,
+        [
+            (_usage("claude-sonnet-4", 100, 10, cache_read_tokens=50), day1),
+            (_usage("claude-sonnet-4", 200, 20), day1),
+            (_usage("claude-sonnet-4", 1, 1), day2),
+            ({"model": "claude-sonnet-4"}, day1),  # no token_usage
+            (None, day1),
+        ],
+    )
+    repo.record(conversation, [(_usage("claude-sonnet-4", 1000, 100), day1)])
+
+    assert recorded == 3
+    rows = {
+        row.day: row
+        for row in db_session.query(TokenLedger).filter_by(
+            conversation_id=conversation.id
+        )
+    }
+    assert set(rows) == {date(2025, 1, 1), date(2025, 1, 2)}
+    assert rows[date(2025, 1, 1)].message_count == 3
+    assert rows[date(2025, 1, 1)].input_tokens == 1300
+    assert rows[date(2025, 1, 1)].output_tokens == 130
+    assert rows[date(2025, 1, 1)].cache_read_tokens == 50
+    assert rows[date(2025, 1, 2)].input_tokens == 1
+
+    repo.clear(conversation.id)
+    assert db_session.query(TokenLedger).count() == 0
+
+
+def test_bulk_collector_insert_records_only_new_messages(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    now = datetime(2025, 1, 1, tzinfo=UTC)
+    data = {
+        "author_role": "assistant",
+        "content": "done",
+        **_usage("claude-sonnet-4", 100, 10),
+    }
+    repo = CollectorSessionRepository(db_session)
+
+    repo.add_messages_bulk(conversation, [("message", now, now, data, "h1")])
+    # Re-sent event is deduplicated and must not be counted again
+    repo.add_messages_bulk(
+        conversation,
+        [("message", now, now, data, "h1"), ("message", now, now, data, "h2")],
+    )
+
+    row = db_session.query(TokenLedger).one()
+    assert row.message_count == 2
+    assert row.input_tokens == 200
+
+
+def test_totals_filters_by_project_and_day(
+    db_session: Session, sample_workspace: Workspace, sample_project: Project
+):
+    in_project = _conversation(db_session, sample_workspace, sample_project)
+    elsewhere = _conversation(db_session, sample_workspace)
+    repo = TokenLedgerRepository(db_session)
+    old = datetime(2024, 12, 1, tzinfo=UTC)
+    recent = datetime(2025, 1, 5, tzinfo=UTC)
+    repo.record(in_project, [(_usage("claude-sonnet-4", 10, 1), old)])
+    repo.record(in_project, [(_usage("claude-sonnet-4", 20, 2), recent)])
+    repo.record(in_project, [(_usage("gpt-4o", 30, 3), recent)])
+    repo.record(elsewhere, [(_usage("claude-sonnet-4", 40, 4), recent)])
+
+    rows = repo.totals(
+        sample_workspace.id, project_id=sample_project.id, since=date(2025, 1, 1)
+    )
+
+    assert [(r.model, r.day, r.input_tokens) for r in rows] == [
+        ("claude-sonnet-4", date(2025, 1, 5), 20),
+        ("gpt-4o", date(2025, 1, 5), 30),
+    ]
+    workspace_rows = repo.totals(sample_workspace.id, since=date(2025, 1, 1))
+    assert sum(r.input_tokens for r in workspace_rows) == 90
+
+
+def test_totals_returns_int_sums_for_pricing(
+    db_session: Session, sample_workspace: Workspace
+):
+    conversation = _conversation(db_session, sample_workspace)
+    repo = TokenLedgerRepository(db_session)
+    day = datetime(2025, 1, 5, tzinfo=UTC)
+    repo.record(conversation, [(_usage("claude-sonnet-4-6", 1, 1), day)])
+    # Stand in for PostgreSQL's numeric sums: SQLite sums stored REALs as floats
+    db_session.execute(
+        update(TokenLedger).values(input_tokens=1_000_000.5, output_tokens=0.5)
+    )
+
+    (row,) = repo.totals(sample_workspace.id)
+
+    assert (row.input_tokens, row.output_tokens) == (1_000_000, 0)
+    assert all(isinstance(row[i], int) for i in range(2, len(row)))
+    assert estimate_cost_from_model(
+        row.model, row.input_tokens, row.output_tokens
+    ) == pytest.approx(3.0)
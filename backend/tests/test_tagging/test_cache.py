@@ -1,5 +1,8 @@
-"""Tests for file-based tag cache."""
+"""Tests for the SQLite-backed tag cache."""
 
+import copy
+import json
+import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 
@@ -23,6 +26,15 @@ def tag_cache(temp_cache_dir: Path) -> TagCache:
     return TagCache(cache_dir=temp_cache_dir, ttl_days=30)
 
 
+def _age_entries(cache: TagCache, days: float, limit: int = -1) -> None:
+    """Backdate the write time of cached entries (all by default)."""
+    cache._conn.execute(
+        "UPDATE tag_cache SET cached_at = cached_at - ? "
+        "WHERE key IN (SELECT key FROM tag_cache LIMIT ?)",
+        (days * 86400, limit),
+    )
+
+
 @pytest.fixture
 def sample_conversation() -> ParsedConversation:
     """Create a sample parsed conversation."""
@@ -167,30 +179,15 @@ class TestTagCache:
         cached_tags = cache.get(sample_conversation)
         assert cached_tags is not None
 
-        # Manually modify cached file's timestamp to make it expired
-        cache_files = list(temp_cache_dir.glob("*.json"))
-        assert len(cache_files) == 1
-        cache_file = cache_files[0]
-
-        # Read and modify the cached data to be 2 days old
-        import json
-
-        with open(cache_file, "r") as f:
-            data = json.load(f)
-
-        # Set cached_at to 2 days ago (beyond 1-day TTL)
-        expired_time = datetime.now(timezone.utc) - timedelta(days=2)
-        data["cached_at"] = expired_time.isoformat()
-
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        # Make the entry 2 days old (beyond 1-day TTL)
+        _age_entries(cache, days=2)
 
         # Should be cache miss due to expiration
         cached_tags = cache.get(sample_conversation)
         assert cached_tags is None
 
-        # Cache file should be deleted
-        assert not cache_file.exists()
+        # Expired entry should be deleted
+        assert cache.stats()["total"] == 0
 
     def test_clear_expired(
         self,
@@ -209,30 +206,17 @@ class TestTagCache:
         sample_conversation.messages[0].content = "Different content"
         cache.set(sample_conversation, sample_tags)
 
-        # Verify we have 2 cache files
-        cache_files = list(temp_cache_dir.glob("*.json"))
-        assert len(cache_files) == 2
+        assert cache.stats()["total"] == 2
 
         # Manually expire one of them
-        import json
-
-        cache_file = cache_files[0]
-        with open(cache_file, "r") as f:
-            data = json.load(f)
-
-        expired_time = datetime.now(timezone.utc) - timedelta(days=2)
-        data["cached_at"] = expired_time.isoformat()
-
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        _age_entries(cache, days=2, limit=1)
 
         # Clear expired entries
         removed = cache.clear_expired()
         assert removed == 1
 
-        # Only 1 cache file should remain
-        remaining_files = list(temp_cache_dir.glob("*.json"))
-        assert len(remaining_files) == 1
+        # Only 1 entry should remain
+        assert cache.stats() == {"total": 1, "valid": 1, "expired": 0}
 
     def test_cache_stats_empty(self, tag_cache: TagCache):
         """Test cache stats for empty cache."""
@@ -275,43 +259,91 @@ class TestTagCache:
         cache.set(sample_conversation, sample_tags)
 
         # Manually expire one
-        import json
-
-        cache_files = list(temp_cache_dir.glob("*.json"))
-        cache_file = cache_files[0]
-        with open(cache_file, "r") as f:
-            data = json.load(f)
-
-        expired_time = datetime.now(timezone.utc) - timedelta(days=2)
-        data["cached_at"] = expired_time.isoformat()
-
-        with open(cache_file, "w") as f:
-            json.dump(data, f)
+        _age_entries(cache, days=2, limit=1)
 
         stats = cache.stats()
         assert stats["total"] == 2
         assert stats["valid"] == 1
         assert stats["expired"] == 1
 
-    def test_cache_handles_corrupted_files(
+    def test_migrates_legacy_json_files(
+        self,
+        tmp_path: Path,
+        temp_cache_dir: Path,
+        sample_conversation: ParsedConversation,
+        sample_tags: ConversationTags,
+    ):
+        """Test that a one-file-per-entry cache is imported once and removed."""
+        key = TagCache(tmp_path / "keys")._compute_cache_key(sample_conversation)
+        fresh = datetime.now(timezone.utc).isoformat()
+        old = (datetime.now(timezone.utc) - timedelta(days=40)).isoformat()
+        (temp_cache_dir / f"{key}.json").write_text(
+            json.dumps({"cached_at": fresh, "tags": sample_tags.to_dict()})
+        )
+        (temp_cache_dir / "old.json").write_text(
+            json.dumps({"cached_at": old, "tags": sample_tags.to_dict()})
+        )
+        (temp_cache_dir / "corrupted.json").write_text("invalid json content {{{")
+
+        cache = TagCache(cache_dir=temp_cache_dir, ttl_days=30)
+
+        assert list(temp_cache_dir.glob("*.json")) == []
+        assert cache.stats() == {"total": 2, "valid": 1, "expired": 1}
+        cached = cache.get(sample_conversation)
+        assert cached is not None
+        assert cached.intent == sample_tags.intent
+
+    def test_get_many_batches_lookups(
         self,
         tag_cache: TagCache,
+        sample_conversation: ParsedConversation,
+        sample_tags: ConversationTags,
+    ):
+        """Test batched lookups return hits and misses in order."""
+        tag_cache.set(sample_conversation, sample_tags)
+        other = copy.deepcopy(sample_conversation)
+        other.messages[0].content = "Uncached"
+
+        results = tag_cache.get_many([other, sample_conversation, other])
+
+        assert results[0] is None and results[2] is None
+        assert results[1] is not None
+        assert results[1].intent == sample_tags.intent
+
+    def test_evicts_least_recently_used_beyond_max_entries(
+        self,
         temp_cache_dir: Path,
         sample_conversation: ParsedConversation,
+        sample_tags: ConversationTags,
     ):
-        """Test that cache handles corrupted files gracefully."""
-        # Create a corrupted cache file
-        corrupted_file = temp_cache_dir / "corrupted.json"
-        corrupted_file.write_text("invalid json content {{{")
+        """Test that the cache is bounded by evicting least recently read."""
+        cache = TagCache(cache_dir=temp_cache_dir, ttl_days=30, max_entries=2)
+        conversations = []
+        for i in range(3):
+            conversation = copy.deepcopy(sample_conversation)
+            conversation.messages[0].content = f"Message {i}"
+            cache.set(conversation, sample_tags)
+            conversations.append(conversation)
+            time.sleep(0.01)
+        cache.get(conversations[0])  # Most recently read now
 
-        # Should not crash when getting cache stats
-        stats = tag_cache.stats()
-        assert stats["total"] == 1
-        assert stats["expired"] == 1  # Corrupted files treated as expired
+        cache._evict()
+
+        assert cache.stats()["total"] == 2
+        assert cache.get(conversations[0]) is not None
+        assert cache.get(conversations[1]) is None
+
+    def test_clear_removes_all_entries(
+        self,
+        tag_cache: TagCache,
+        sample_conversation: ParsedConversation,
+        sample_tags: ConversationTags,
+    ):
+        """Test clearing the whole cache."""
+        tag_cache.set(sample_conversation, sample_tags)
 
-        # Should not crash when clearing expired
-        removed = tag_cache.clear_expired()
-        assert removed >= 0  # May or may not remove corrupted file
+        assert tag_cache.clear() == 1
+        assert tag_cache.get(sample_conversation) is None
 
     def test_compute_cache_key_consistency(
         self, tag_cache: TagCache, sample_conversation: ParsedConversation
@@ -0,0 +1,105 @@
+"""Tests for the tagging worker, job queue batch claims and LLM rate limiting."""
+
+import threading
+import time
+import uuid
+from datetime import UTC, datetime
+
+from sqlalchemy.orm import Session
+
+from catsyphon.llm.rate_limit import TokenBucket
+from catsyphon.models.db import Conversation, TaggingJob, TaggingJobStatus
+from catsyphon.tagging.job_queue import TaggingJobQueue
+from catsyphon.tagging.worker import TaggingWorker
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.now += seconds
+
+
+def test_token_bucket_allows_burst_then_paces():
+    clock = FakeClock()
+    bucket = TokenBucket(rate_per_minute=60, burst=2, clock=clock, sleep=clock.sleep)
+
+    assert bucket.acquire()
+    assert bucket.acquire()
+    assert clock.now == 0.0
+
+    # Bucket empty: the third request waits one refill interval (1s at 60/min)
+    assert bucket.acquire()
+    assert clock.now == 1.0
+    assert bucket.try_acquire() == 1.0
+    assert not bucket.acquire(timeout=0.5)
+
+
+def test_claim_batch_claims_disjoint_jobs_in_priority_order(
+    db_session: Session, sample_workspace
+):
+    queue = TaggingJobQueue(db_session)
+    job_ids = []
+    for priority in (2, 0, 1):
+        conversation = Conversation(
+            workspace_id=sample_workspace.id,
+            agent_type="claude-code",
+            start_time=datetime.now(UTC),
+        )
+        db_session.add(conversation)
+        db_session.flush()
+        job_ids.append(queue.enqueue(conversation.id, priority=priority))
+
+    first = queue.claim_batch(2)
+    second = queue.claim_batch(2)
+
+    assert [job.priority for job in first] == [0, 1]
+    assert [job.id for job in second] == [job_ids[0]]
+    assert all(
+        job.status == TaggingJobStatus.PROCESSING.value and job.attempts == 1
+        for job in first + second
+    )
+    assert queue.claim_batch(2) == []
+    assert db_session.query(TaggingJob).count() == 3
+
+
+def test_concurrent_worker_keeps_jobs_in_flight():
+    worker = TaggingWorker(poll_interval=0.01, concurrency=3)
+    worker._get_pipeline = lambda: object()
+    pending = [(uuid.uuid4(), uuid.uuid4()) for _ in range(7)]
+    claim_limits: list[int] = []
+    processed: list[uuid.UUID] = []
+    lock = threading.Lock()
+    active = 0
+    peak = 0
+
+    def claim_jobs(limit: int):
+        claim_limits.append(limit)
+        with lock:
+            batch = pending[:limit]
+            del pending[:limit]
+        return batch
+
+    def process_job(job_id, conversation_id):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.05)
+        with lock:
+            active -= 1
+            processed.append(job_id)
+            if len(processed) == 7:
+                worker.stop()
+
+    worker._claim_jobs = claim_jobs
+    worker._process_job = process_job
+    worker._run_concurrent()
+
+    assert len(processed) == 7
+    assert peak == 3
+    assert max(claim_limits) == 3
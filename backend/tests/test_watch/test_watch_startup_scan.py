@@ -1,5 +1,8 @@
 """Tests for watch daemon startup scan functionality."""
 
+import os
+import threading
+import time
 import uuid
 from datetime import datetime
 from pathlib import Path
@@ -9,7 +12,7 @@ import pytest
 
 from catsyphon.models.db import RawLog
 from catsyphon.parsers.incremental import ChangeType
-from catsyphon.watch import ApiIngestionConfig, WatcherDaemon
+from catsyphon.watch import ApiIngestionConfig, WatcherDaemon, _iter_jsonl_sorted
 
 
 @pytest.fixture
@@ -104,7 +107,7 @@ class TestStartupScan:
 
         # Setup mock repository
         mock_repo = Mock()
-        mock_repo.get_files_in_directory.return_value = []
+        mock_repo.iter_directory_state.return_value = []
         mock_repo_class.return_value = mock_repo
 
         # Setup mock collector client
@@ -117,7 +120,7 @@ class TestStartupScan:
         daemon._scan_existing_files()
 
         # Verify
-        mock_repo.get_files_in_directory.assert_called_once_with(str(temp_watch_dir))
+        mock_repo.iter_directory_state.assert_called_once_with(str(temp_watch_dir))
         daemon.event_handler._process_file.assert_not_called()
 
     @patch("catsyphon.collector_client.CollectorClient")
@@ -141,7 +144,7 @@ class TestStartupScan:
 
         # Setup mock repository
         mock_repo = Mock()
-        mock_repo.get_files_in_directory.return_value = mock_raw_logs
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
         mock_repo_class.return_value = mock_repo
 
         mock_detect_change.return_value = ChangeType.UNCHANGED
@@ -178,7 +181,7 @@ class TestStartupScan:
 
         mock_repo = Mock()
         # Return all 3 raw logs as tracked so Phase 3 finds no new files
-        mock_repo.get_files_in_directory.return_value = mock_raw_logs
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
         mock_repo_class.return_value = mock_repo
 
         # Only file1 has APPEND change; others unchanged
@@ -226,7 +229,7 @@ class TestStartupScan:
 
         mock_repo = Mock()
         # Return all 3 raw logs as tracked so Phase 3 finds no new files
-        mock_repo.get_files_in_directory.return_value = mock_raw_logs
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
         mock_repo_class.return_value = mock_repo
 
         # Only file1 has REWRITE change; others unchanged
@@ -275,7 +278,7 @@ class TestStartupScan:
         mock_repo = Mock()
         # Return all 3 raw logs as tracked; file2/file3 still on disk but tracked,
         # so Phase 3 won't find them as new. file1 is deleted.
-        mock_repo.get_files_in_directory.return_value = mock_raw_logs
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
         mock_repo_class.return_value = mock_repo
 
         # file2 and file3 are unchanged
@@ -313,7 +316,7 @@ class TestStartupScan:
         mock_db_session.return_value.__enter__.return_value = mock_session
 
         mock_repo = Mock()
-        mock_repo.get_files_in_directory.return_value = mock_raw_logs
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
         mock_repo_class.return_value = mock_repo
         mock_collector_client.return_value = Mock()
 
@@ -333,6 +336,75 @@ class TestStartupScan:
         # Verify only changed files (2 and 3) were processed
         assert daemon.event_handler._process_file.call_count == 2
 
+    @patch("catsyphon.collector_client.CollectorClient")
+    @patch("catsyphon.parsers.incremental.detect_file_change_type")
+    @patch("catsyphon.db.repositories.raw_log.RawLogRepository")
+    @patch("catsyphon.db.connection.db_session")
+    def test_scan_checks_only_files_whose_size_or_mtime_moved(
+        self,
+        mock_db_session,
+        mock_repo_class,
+        mock_detect_change,
+        mock_collector_client,
+        temp_watch_dir,
+        mock_raw_logs,
+        mock_api_config,
+    ):
+        """Test tracked files matching recorded size and mtime are not hashed."""
+        mock_session = Mock()
+        mock_db_session.return_value.__enter__.return_value = mock_session
+
+        file1, file2, file3 = (Path(raw_log.file_path) for raw_log in mock_raw_logs)
+        mock_raw_logs[0].file_mtime = file1.stat().st_mtime
+        mock_raw_logs[1].file_mtime = file2.stat().st_mtime - 60
+        # file3 has no recorded mtime; untracked files sort between them
+        (temp_watch_dir / "file1").mkdir()
+        nested = temp_watch_dir / "file1" / "nested.jsonl"
+        nested.write_text("new")
+        untracked = temp_watch_dir / "file2-new.jsonl"
+        untracked.write_text("new")
+
+        mock_repo = Mock()
+        mock_repo.iter_directory_state.return_value = mock_raw_logs
+        mock_repo_class.return_value = mock_repo
+        mock_detect_change.return_value = ChangeType.UNCHANGED
+        mock_collector_client.return_value = Mock()
+
+        daemon = WatcherDaemon(directory=temp_watch_dir, api_config=mock_api_config)
+        daemon.event_handler = Mock()
+
+        daemon._scan_existing_files()
+
+        assert [call.args[0] for call in mock_detect_change.call_args_list] == [
+            file2,
+            file3,
+        ]
+        processed = {
+            call.args[0] for call in daemon.event_handler._process_file.call_args_list
+        }
+        assert processed == {nested, untracked}
+        mock_repo.set_file_mtimes.assert_called_once_with(
+            {
+                mock_raw_logs[1].id: file2.stat().st_mtime,
+                mock_raw_logs[2].id: file3.stat().st_mtime,
+            }
+        )
+
+    def test_directory_walk_yields_paths_in_string_order(self, temp_watch_dir):
+        """Test the scan walk matches the order tracked paths are streamed in."""
+        for name in ("a.jsonl", "a-b.jsonl", "a/x.jsonl", "a0/y.jsonl", "b.txt"):
+            path = temp_watch_dir / name
+            path.parent.mkdir(exist_ok=True)
+            path.write_text("{}")
+        (temp_watch_dir / "dir.jsonl").mkdir()
+
+        paths = [entry.path for entry in _iter_jsonl_sorted(temp_watch_dir)]
+
+        assert paths == sorted(
+            str(temp_watch_dir / name)
+            for name in ("a.jsonl", "a-b.jsonl", "a/x.jsonl", "a0/y.jsonl")
+        )
+
     @patch("catsyphon.collector_client.CollectorClient")
     @patch("catsyphon.db.connection.db_session")
     def test_scan_handles_exceptions_gracefully(
@@ -355,6 +427,142 @@ class TestStartupScan:
         daemon.event_handler._process_file.assert_not_called()
 
 
+class TestParallelStartupScan:
+    """Tests for the bounded worker pool used by the startup scan."""
+
+    @patch("catsyphon.collector_client.CollectorClient")
+    @patch("catsyphon.db.repositories.raw_log.RawLogRepository")
+    @patch("catsyphon.db.connection.db_session")
+    def test_scan_bounds_concurrency_and_reports_progress(
+        self,
+        mock_db_session,
+        mock_repo_class,
+        mock_collector_client,
+        temp_watch_dir,
+        mock_api_config,
+    ):
+        """New files run on the pool, never exceeding the worker count."""
+        mock_db_session.return_value.__enter__.return_value = Mock()
+        mock_repo = Mock()
+        mock_repo.iter_directory_state.return_value = []
+        mock_repo_class.return_value = mock_repo
+        mock_collector_client.return_value = Mock()
+
+        for i in range(12):
+            (temp_watch_dir / f"session-{i}.jsonl").write_text("{}\n")
+
+        daemon = WatcherDaemon(directory=temp_watch_dir, api_config=mock_api_config)
+        daemon._scan_workers = 3
+        daemon.event_handler = Mock()
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def process(fp, skip_debounce=False):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        daemon.event_handler._process_file.side_effect = process
+
+        daemon._scan_existing_files()
+
+        assert daemon.event_handler._process_file.call_count == 12
+        assert 1 < peak <= 3
+        stats = daemon.stats.to_dict()
+        assert stats["scan_files_queued"] == 12
+        assert stats["scan_files_completed"] == 12
+        assert stats["scan_completed_at"] is not None
+        assert stats["scan_files_per_second"] > 0
+
+    @patch("catsyphon.collector_client.CollectorClient")
+    @patch("catsyphon.db.repositories.raw_log.RawLogRepository")
+    @patch("catsyphon.db.connection.db_session")
+    def test_scan_skips_debounce_only_for_quiet_files(
+        self,
+        mock_db_session,
+        mock_repo_class,
+        mock_collector_client,
+        temp_watch_dir,
+        mock_api_config,
+    ):
+        """Files untouched for the quiet period skip the debounce sleep."""
+        mock_db_session.return_value.__enter__.return_value = Mock()
+        mock_repo = Mock()
+        mock_repo.iter_directory_state.return_value = []
+        mock_repo_class.return_value = mock_repo
+        mock_collector_client.return_value = Mock()
+
+        old_file = temp_watch_dir / "old.jsonl"
+        old_file.write_text("{}\n")
+        stale = time.time() - 3600
+        os.utime(old_file, (stale, stale))
+        fresh_file = temp_watch_dir / "fresh.jsonl"
+        fresh_file.write_text("{}\n")
+
+        daemon = WatcherDaemon(directory=temp_watch_dir, api_config=mock_api_config)
+        daemon.event_handler = Mock()
+
+        daemon._scan_existing_files()
+
+        skip_by_path = {
+            c.args[0].name: c.kwargs["skip_debounce"]
+            for c in daemon.event_handler._process_file.call_args_list
+        }
+        assert skip_by_path == {"old.jsonl": True, "fresh.jsonl": False}
+
+    @patch("catsyphon.collector_client.CollectorClient")
+    @patch("catsyphon.db.repositories.raw_log.RawLogRepository")
+    @patch("catsyphon.db.connection.db_session")
+    def test_scan_serializes_when_over_memory_budget(
+        self,
+        mock_db_session,
+        mock_repo_class,
+        mock_collector_client,
+        temp_watch_dir,
+        mock_api_config,
+    ):
+        """Over the RSS budget, files are admitted one at a time."""
+        mock_db_session.return_value.__enter__.return_value = Mock()
+        mock_repo = Mock()
+        mock_repo.iter_directory_state.return_value = []
+        mock_repo_class.return_value = mock_repo
+        mock_collector_client.return_value = Mock()
+
+        for i in range(5):
+            (temp_watch_dir / f"session-{i}.jsonl").write_text("{}\n")
+
+        daemon = WatcherDaemon(directory=temp_watch_dir, api_config=mock_api_config)
+        daemon._scan_workers = 4
+        daemon._scan_memory_budget_bytes = 1  # Always over budget
+        daemon.event_handler = Mock()
+
+        lock = threading.Lock()
+        in_flight = 0
+        peak = 0
+
+        def process(fp, skip_debounce=False):
+            nonlocal in_flight, peak
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.01)
+            with lock:
+                in_flight -= 1
+
+        daemon.event_handler._process_file.side_effect = process
+
+        daemon._scan_existing_files()
+
+        assert daemon.event_handler._process_file.call_count == 5
+        assert peak == 1
+
+
 class TestStartupScanIntegration:
     """Integration tests for startup scan in daemon lifecycle."""
 
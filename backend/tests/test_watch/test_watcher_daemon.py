@@ -1,6 +1,7 @@
 """Tests for WatcherDaemon lifecycle and integration."""
 
 import signal
+import uuid
 from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
@@ -311,6 +312,48 @@ class TestRetryLoop:
             assert daemon.event_handler._process_file.call_count <= 1
 
 
+class TestLinkingLoop:
+    """Tests for the background orphan linking loop."""
+
+    @patch("catsyphon.watch.CollectorSessionRepository")
+    @patch("catsyphon.watch.link_orphaned_agents")
+    @patch("catsyphon.watch.db_session")
+    @patch("catsyphon.collector_client.CollectorClient")
+    def test_linking_loop_sweeps_collector_orphans(
+        self,
+        mock_collector_client,
+        mock_db_session,
+        mock_link_agents,
+        mock_repo_class,
+        temp_watch_dir,
+        mock_api_config,
+    ):
+        """Test each pass also retries every pending collector parent."""
+        mock_collector_client.return_value = Mock()
+        workspace_id = uuid.uuid4()
+        daemon = WatcherDaemon(
+            directory=temp_watch_dir,
+            api_config=mock_api_config,
+            workspace_id=workspace_id,
+        )
+        session = mock_db_session.return_value.__enter__.return_value
+        mock_link_agents.return_value = 0
+
+        def sweep(workspace):
+            daemon.shutdown_event.set()
+            return 2
+
+        mock_repo_class.return_value.link_orphaned_collectors.side_effect = sweep
+
+        daemon._linking_loop()
+
+        mock_repo_class.assert_called_once_with(session)
+        mock_repo_class.return_value.link_orphaned_collectors.assert_called_once_with(
+            workspace_id
+        )
+        session.commit.assert_called_once()
+
+
 class TestChunkedParsingGuards:
     """Tests for chunked parsing loop safety guards."""
 
@@ -212,6 +212,7 @@ export interface ConversationListResponse {
   page: number;
   page_size: number;
   pages: number;
+  next_cursor?: string | null;
 }
 
 // ===== Stats Types =====
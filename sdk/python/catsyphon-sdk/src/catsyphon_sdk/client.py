@@ -3,6 +3,9 @@ Collector client implementations for CatSyphon SDK.
 
 Provides both synchronous and asynchronous clients for interacting
 with the CatSyphon Collector API.
+
+Event batches are sent as plain JSON until a server response advertises
+compressed or binary formats; see ``catsyphon_sdk.wire_format``.
 """
 
 import logging
@@ -28,6 +31,7 @@ from catsyphon_sdk.retry import (
     RetryConfig,
     check_response,
 )
+from catsyphon_sdk.wire_format import WireFormat
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +102,7 @@ class CollectorClient:
             retry_config=retry_config or RetryConfig(),
         )
         self._client: Optional[httpx.Client] = None
+        self._wire_format = WireFormat()
 
     @classmethod
     def register(
@@ -217,7 +222,6 @@ class CollectorClient:
                 headers={
                     "Authorization": f"Bearer {self.config.api_key}",
                     "X-Collector-ID": self.config.collector_id,
-                    "Content-Type": "application/json",
                 },
                 timeout=self.config.timeout,
             )
@@ -255,15 +259,23 @@ class CollectorClient:
             NonRetryableError: On permanent failures
         """
         # Convert events to JSON-safe dicts
-        events_data = [e.model_dump_json_safe() for e in events]
+        payload = {
+            "session_id": session_id,
+            "events": [e.model_dump_json_safe() for e in events],
+        }
 
+        content, headers = self._wire_format.encode(payload)
         response = self.client.post(
-            "/collectors/events",
-            json={
-                "session_id": session_id,
-                "events": events_data,
-            },
+            "/collectors/events", content=content, headers=headers
         )
+        if response.status_code == 415 and not self._wire_format.is_plain:
+            # Server no longer accepts the negotiated format; resend as JSON
+            self._wire_format = WireFormat()
+            content, headers = self._wire_format.encode(payload)
+            response = self.client.post(
+                "/collectors/events", content=content, headers=headers
+            )
+        self._wire_format = WireFormat.from_response(response, self._wire_format)
 
         check_response(response, self.config.retry_config)
         return EventsResponse.model_validate(response.json())
@@ -369,6 +381,7 @@ class AsyncCollectorClient:
             retry_config=retry_config or RetryConfig(),
         )
         self._client: Optional[httpx.AsyncClient] = None
+        self._wire_format = WireFormat()
 
     @classmethod
     async def register(
@@ -458,7 +471,6 @@ class AsyncCollectorClient:
                 headers={
                     "Authorization": f"Bearer {self.config.api_key}",
                     "X-Collector-ID": self.config.collector_id,
-                    "Content-Type": "application/json",
                 },
                 timeout=self.config.timeout,
             )
@@ -482,15 +494,22 @@ class AsyncCollectorClient:
         events: list[Event],
     ) -> EventsResponse:
         """Send a batch of events for a session."""
-        events_data = [e.model_dump_json_safe() for e in events]
+        payload = {
+            "session_id": session_id,
+            "events": [e.model_dump_json_safe() for e in events],
+        }
 
+        content, headers = self._wire_format.encode(payload)
         response = await self.client.post(
-            "/collectors/events",
-            json={
-                "session_id": session_id,
-                "events": events_data,
-            },
+            "/collectors/events", content=content, headers=headers
         )
+        if response.status_code == 415 and not self._wire_format.is_plain:
+            self._wire_format = WireFormat()
+            content, headers = self._wire_format.encode(payload)
+            response = await self.client.post(
+                "/collectors/events", content=content, headers=headers
+            )
+        self._wire_format = WireFormat.from_response(response, self._wire_format)
 
         check_response(response, self.config.retry_config)
         return EventsResponse.model_validate(response.json())
@@ -0,0 +1,105 @@
+"""
+Request body encoding for event batches.
+
+The server advertises the formats it accepts for ``POST /collectors/events``
+in ``Accept-Post`` (media types) and ``Accept-Encoding`` (content codings)
+response headers. Clients start with plain JSON and switch to the most
+compact format both sides support: msgpack and zstd when the optional
+``msgpack``/``zstandard`` packages are installed (``catsyphon-sdk[fast]``),
+gzip otherwise.
+"""
+
+import gzip
+import json
+from dataclasses import dataclass
+from typing import Any, Optional
+
+import httpx
+
+try:
+    import msgpack
+
+    MSGPACK_AVAILABLE = True
+except ImportError:
+    MSGPACK_AVAILABLE = False
+
+try:
+    import zstandard
+
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+JSON_CONTENT_TYPE = "application/json"
+MSGPACK_CONTENT_TYPE = "application/msgpack"
+
+# Batches smaller than this are not worth compressing
+MIN_COMPRESS_BYTES = 1024
+
+
+def _parse_header_list(value: Optional[str]) -> list[str]:
+    if not value:
+        return []
+    return [
+        item.split(";", 1)[0].strip().lower() for item in value.split(",") if item
+    ]
+
+
+@dataclass(frozen=True)
+class WireFormat:
+    """A (media type, content coding) pair used to send event batches."""
+
+    content_type: str = JSON_CONTENT_TYPE
+    content_encoding: str = "identity"
+
+    @classmethod
+    def negotiate(
+        cls, accept_post: Optional[str], accept_encoding: Optional[str]
+    ) -> "WireFormat":
+        """Pick the best format both the SDK and the server support."""
+        server_types = _parse_header_list(accept_post)
+        server_encodings = _parse_header_list(accept_encoding)
+
+        content_type = JSON_CONTENT_TYPE
+        if MSGPACK_AVAILABLE and MSGPACK_CONTENT_TYPE in server_types:
+            content_type = MSGPACK_CONTENT_TYPE
+
+        content_encoding = "identity"
+        if ZSTD_AVAILABLE and "zstd" in server_encodings:
+            content_encoding = "zstd"
+        elif "gzip" in server_encodings:
+            content_encoding = "gzip"
+
+        return cls(content_type=content_type, content_encoding=content_encoding)
+
+    @classmethod
+    def from_response(
+        cls, response: httpx.Response, current: "WireFormat"
+    ) -> "WireFormat":
+        """Format advertised by ``response``, or ``current`` if it has none."""
+        accept_post = response.headers.get("accept-post")
+        accept_encoding = response.headers.get("accept-encoding")
+        if accept_post is None and accept_encoding is None:
+            return current
+        return cls.negotiate(accept_post, accept_encoding)
+
+    @property
+    def is_plain(self) -> bool:
+        return self == WireFormat()
+
+    def encode(self, payload: dict[str, Any]) -> tuple[bytes, dict[str, str]]:
+        """Encode a request body; returns the bytes and request headers."""
+        if self.content_type == MSGPACK_CONTENT_TYPE:
+            body = msgpack.packb(payload)
+        else:
+            body = json.dumps(payload, separators=(",", ":")).encode()
+        headers = {"Content-Type": self.content_type}
+
+        if self.content_encoding == "identity" or len(body) < MIN_COMPRESS_BYTES:
+            return body, headers
+        if self.content_encoding == "zstd":
+            body = zstandard.ZstdCompressor(level=3).compress(body)
+        else:
+            body = gzip.compress(body, compresslevel=6)
+        headers["Content-Encoding"] = self.content_encoding
+        return body, headers
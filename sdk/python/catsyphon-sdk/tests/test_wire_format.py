@@ -0,0 +1,121 @@
+"""Tests for event batch wire format negotiation."""
+
+import gzip
+import json
+
+import httpx
+import msgpack
+import zstandard
+
+from catsyphon_sdk.client import CollectorClient
+from catsyphon_sdk.models import Event, EventType
+from catsyphon_sdk.wire_format import WireFormat
+
+ADVERTISED = {
+    "Accept-Post": "application/msgpack, application/json",
+    "Accept-Encoding": "zstd, gzip",
+}
+
+
+def _decode(request: httpx.Request) -> dict:
+    body = request.content
+    encoding = request.headers.get("content-encoding")
+    if encoding == "zstd":
+        body = zstandard.ZstdDecompressor().stream_reader(body).read()
+    elif encoding == "gzip":
+        body = gzip.decompress(body)
+    if request.headers["content-type"] == "application/msgpack":
+        return msgpack.unpackb(body)
+    return json.loads(body)
+
+
+def _events(count: int) -> list[Event]:
+    return [
+        Event(
+            sequence=i + 1,
+            type=EventType.MESSAGE,
+            data={"author_role": "human", "content": "x" * 2000},
+        )
+        for i in range(count)
+    ]
+
+
+def _accepted(count: int, **kwargs) -> httpx.Response:
+    return httpx.Response(
+        202,
+        json={
+            "accepted": count,
+            "last_sequence": count,
+            "conversation_id": "00000000-0000-0000-0000-000000000001",
+        },
+        **kwargs,
+    )
+
+
+def _client(handler) -> CollectorClient:
+    client = CollectorClient(
+        server_url="http://catsyphon.test", collector_id="c-1", api_key="cs_test"
+    )
+    client._client = httpx.Client(
+        base_url="http://catsyphon.test", transport=httpx.MockTransport(handler)
+    )
+    return client
+
+
+class TestWireFormat:
+    """Tests for WireFormat negotiation and encoding."""
+
+    def test_defaults_to_plain_json(self):
+        assert WireFormat.negotiate(None, None).is_plain
+
+    def test_prefers_compact_formats(self):
+        fmt = WireFormat.negotiate(ADVERTISED["Accept-Post"], "gzip")
+
+        assert fmt.content_type == "application/msgpack"
+        assert fmt.content_encoding == "gzip"
+
+    def test_small_bodies_not_compressed(self):
+        _, headers = WireFormat("application/json", "gzip").encode({"a": 1})
+
+        assert "Content-Encoding" not in headers
+
+
+class TestSendEventsNegotiation:
+    """Tests for CollectorClient.send_events format upgrades."""
+
+    def test_upgrades_after_advertisement(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return _accepted(len(_decode(request)["events"]), headers=ADVERTISED)
+
+        with _client(handler) as client:
+            client.send_events("session-1", _events(3))
+            client.send_events("session-1", _events(3))
+
+        assert requests[0].headers["content-type"] == "application/json"
+        assert requests[1].headers["content-type"] == "application/msgpack"
+        assert requests[1].headers["content-encoding"] == "zstd"
+        assert len(_decode(requests[1])["events"]) == 3
+
+    def test_falls_back_to_json_on_415(self):
+        requests: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            if request.headers["content-type"] != "application/json":
+                return httpx.Response(415, json={"detail": "unsupported"})
+            return _accepted(3)
+
+        with _client(handler) as client:
+            client._wire_format = WireFormat.negotiate(
+                ADVERTISED["Accept-Post"], ADVERTISED["Accept-Encoding"]
+            )
+            response = client.send_events("session-1", _events(3))
+
+        assert response.accepted == 3
+        assert [r.headers["content-type"] for r in requests] == [
+            "application/msgpack",
+            "application/json",
+        ]